@@ -46,7 +46,9 @@
 
 import configparser
 import argparse
+import concurrent.futures
 import hashlib
+import heapq
 import logging
 import os
 import random
@@ -59,6 +61,7 @@
 parser = argparse.ArgumentParser()
 parser.add_argument('-t', '--test', help="run unittests", action="store_true")
 parser.add_argument('-n', help="run N times", type=int, default=0)
+parser.add_argument('-j', help="run N games at the same time", type=int, default=1)
 args = parser.parse_args()
 
 logging.basicConfig(format='%(relativeCreated)10.0f %(levelname)8s %(message)s', level=logging.NOTSET)
@@ -102,19 +105,45 @@ def __init__(self, cfgfile=CFG_FILE):
             if pname not in [p['name'] for p in self.players]:
                 logger.debug('Removing %s from data base, because he is not among the current players.' % (pname))
                 self.dbwrapper.remove_player(pname)
+        hashes = self.hash_players()
         # add new players into db
         for pname, path in [[p['name'], p['path']] for p in self.players]:
             if pname not in self.dbwrapper.get_players():
                 logger.debug('Adding %s to data base.' % pname)
-                self.dbwrapper.add_player(pname, hashdir(path))
+                self.dbwrapper.add_player(pname, hashes[path])
         # reset players where the directory hash changed
         for player in self.players:
             path = player['path']
             name = player['name']
-            if hashdir(path) != self.dbwrapper.get_player_hash(name):
+            if hashes[path] != self.dbwrapper.get_player_hash(name):
                 logger.debug('Resetting %s because his directory hash changed.' % name)
                 self.dbwrapper.remove_player(name)
-                self.dbwrapper.add_player(name, hashdir(path))
+                self.dbwrapper.add_player(name, hashes[path])
+
+
+    def hash_players(self, max_workers=8):
+        """Calculate the directory hashes of all players.
+
+        The directories are hashed in a thread pool. A directory where
+        no file changed its size or modification time since the last
+        start is not read again; its hash is taken from the data base.
+
+        Returns
+        -------
+        hashes : dict
+            maps the path of every player to its directory hash
+
+        """
+        cache = self.dbwrapper.get_hash_cache()
+        paths = [p['path'] for p in self.players]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            hashed = executor.map(lambda path: hashdir_cached(path, cache.get(path)), paths)
+            hashes = {}
+            for path, (signature, digest) in zip(paths, hashed):
+                hashes[path] = digest
+                if cache.get(path) != (signature, digest):
+                    self.dbwrapper.set_hash_cache(path, signature, digest)
+        return hashes
 
 
     def run_game(self, p1, p2):
@@ -128,6 +157,32 @@ def run_game(self, p1, p2):
         p1, p2 : int
             the indices of the players
 
+        Returns
+        -------
+        stored : bool
+            False if the outcome of the game could not be found
+
+        """
+        return self.store_game(p1, p2, self.play_game(p1, p2))
+
+
+    def play_game(self, p1, p2):
+        """Play a single game in a ``pelitagame`` process.
+
+        This method does not touch the data base and can therefore be
+        called from other threads.
+
+        Parameters
+        ----------
+        p1, p2 : int
+            the indices of the players
+
+        Returns
+        -------
+        outcome : tuple or None
+            ``(result, std_out, std_err)`` or None if the outcome of the
+            game could not be found
+
         """
         left, right = [self.players[i]['path'] for i in (p1, p2)]
         proc_args = [self.pelita_exe, left, right]
@@ -145,18 +200,37 @@ def run_game(self, p1, p2):
             logger.error("STDERR: \n%s" % std_err)
             logger.error("STDOUT: \n%s" % std_out)
             logger.error("Ignoring the result.")
-            return
+            return None
+        return result, std_out, std_err
+
+
+    def store_game(self, p1, p2, outcome):
+        """Store the outcome of a game as returned by ``play_game``.
+
+        Returns
+        -------
+        stored : bool
+            False if there was no outcome
+
+        """
+        if outcome is None:
+            return False
+        result, std_out, std_err = outcome
         p1_name, p2_name = self.players[p1]['name'], self.players[p2]['name']
         self.dbwrapper.add_gameresult(p1_name, p2_name, result, std_out, std_err)
+        return True
 
 
-    def start(self, n):
+    def start(self, n, jobs=1):
         """Start the Engine.
 
         This method will start and infinite loop, testing each agent
         randomly against another one. The result is printed after each
         game.
 
+        With ``jobs`` > 1 as many games are played at the same time.
+        Only this thread writes to the data base.
+
         Currently the only way to stop the engine is via CTRL-C.
 
         Examples
@@ -165,30 +239,36 @@ def start(self, n):
         >>> ci.start()
 
         """
-        import itertools
-        loop = itertools.repeat(None) if n == 0 else itertools.repeat(None, n)
-
-        for _ in  loop:
-            # choose the player with the least number of played game,
-            # mix him with another random player
-            # mis the sides and let them play
-            game_count = [[sum(self.get_results(i)), i] for i in range(len(self.players))]
-            players_sorted = [idx for count, idx in sorted(game_count)]
-            a, rest = players_sorted[0], players_sorted[1:]
-            b = random.choice(rest)
-            players = [a, b]
-            random.shuffle(players)
-            self.run_game(players[0], players[1])
-            self.pretty_print_results()
-            print('------------------------------')
+        game_counts = [sum(self.get_results(i)) for i in range(len(self.players))]
+        scheduler = MatchScheduler(game_counts)
+        scheduled = 0
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+            running = {}
+            while True:
+                # keep all workers busy
+                while len(running) < jobs and (n == 0 or scheduled < n):
+                    players = list(scheduler.next_match())
+                    random.shuffle(players)
+                    running[executor.submit(self.play_game, *players)] = players
+                    scheduled += 1
+                if not running:
+                    break
+
+                done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    p1, p2 = running.pop(future)
+                    if not self.store_game(p1, p2, future.result()):
+                        scheduler.cancel(p1, p2)
+                    self.pretty_print_results()
+                    print('------------------------------')
 
 
     def get_results(self, idx, idx2=None):
         """Get the results so far.
 
-        This method goes through the internal list of of all game
-        results and calculates the result for the player with index
-        ``idx`` against everyone else.
+        This method returns the number of wins, losses and draws for the
+        player with index ``idx`` against everyone else.
 
         If the optional argument ``idx2`` is given only the results of
         the players ``idx`` vs ``idx2`` are returned.
@@ -224,26 +304,17 @@ def get_results(self, idx, idx2=None):
         (2, 0, 0)
 
         """
-        win, loss, draw = 0, 0, 0
         p1_name = self.players[idx]['name']
         p2_name = None if idx2 == None else self.players[idx2]['name']
-        relevant_results = self.dbwrapper.get_results(p1_name, p2_name)
-        for p1, p2, r, std_out, std_err in relevant_results:
-            if (idx2 is None and p1_name == p1) or (idx2 is not None and p1_name == p1 and p2_name == p2):
-                if r == 0: win += 1
-                elif r == 1: loss += 1
-                elif r == -1: draw += 1
-            if (idx2 is None and p1_name == p2) or (idx2 is not None and p1_name == p2 and p2_name == p1):
-                if r == 1: win += 1
-                elif r == 0: loss += 1
-                elif r == -1: draw += 1
-        return win, loss, draw
+        return self.dbwrapper.get_wins_losses(p1_name, p2_name)
 
 
     def pretty_print_results(self):
         """Pretty print the current results.
 
         """
+        # a single query for the whole table
+        pair_results = self.dbwrapper.get_pair_results()
         print('                                       ' + ''.join("%14s" % p['name'] for p in self.players))
         result = []
         for idx, p in enumerate(self.players):
@@ -252,7 +323,7 @@ def pretty_print_results(self):
             result.append([score, p['name']])
             print('%13s (%6.2f): %3d,%3d,%3d\t' % (p['name'], score, win, loss, draw), end=' ')
             for idx2, p2 in enumerate(self.players):
-                win, loss, draw = self.get_results(idx, idx2)
+                win, loss, draw = pair_results.get((p['name'], p2['name']), (0, 0, 0))
                 print('  %3d,%3d,%3d' % (win, loss, draw), end=' ')
             print()
         print()
@@ -261,6 +332,53 @@ def pretty_print_results(self):
             print("%15s %6.2f" % (name, score))
 
 
+class MatchScheduler:
+    """Chooses the players of the next game.
+
+    The first player is always the one with the least number of games
+    (including the games which are still running), the second one is
+    chosen randomly among the others. The numbers of games are kept in a
+    priority queue which is updated with every scheduled game.
+
+    Parameters
+    ----------
+    game_counts : list of int
+        the number of games played so far by each player
+
+    """
+
+    def __init__(self, game_counts):
+        self.game_counts = list(game_counts)
+        self.queue = [(count, idx) for idx, count in enumerate(self.game_counts)]
+        heapq.heapify(self.queue)
+
+    def _update(self, idx, change):
+        self.game_counts[idx] += change
+        # the old entry stays in the queue and is skipped in next_match
+        heapq.heappush(self.queue, (self.game_counts[idx], idx))
+
+    def next_match(self):
+        """Return the indices of the players of the next game.
+
+        The first one has the least number of games so far.
+
+        """
+        while True:
+            count, a = self.queue[0]
+            if count == self.game_counts[a]:
+                break
+            heapq.heappop(self.queue)
+        b = random.choice([idx for idx in range(len(self.game_counts)) if idx != a])
+        self._update(a, 1)
+        self._update(b, 1)
+        return a, b
+
+    def cancel(self, a, b):
+        """Do not count a game which has no result."""
+        self._update(a, -1)
+        self._update(b, -1)
+
+
 class DB_Wrapper:
     """Wrapper around the games data base."""
 
@@ -284,21 +402,85 @@ def __init__(self, dbfile):
     def create_tables(self):
         """Create tables.
 
-        This is a no-op if the tables already exist.
+        This is a no-op if the tables already exist. Data bases which
+        still store the output of the games in the ``games`` table are
+        converted.
+
+        The ``results`` table holds the number of wins, losses and draws
+        for every pair of players (once from the view of each player) and
+        is updated with every new game, so that no query has to go
+        through all games.
 
         """
+        columns = [row[1] for row in self.cursor.execute("PRAGMA table_info(games)")]
+        migrate = 'stdout' in columns
+        if migrate:
+            logger.info('Converting the games table of %s.' % self.db_file)
+            self.cursor.execute("ALTER TABLE games RENAME TO games_old")
+        self.cursor.execute("""
+        CREATE TABLE IF NOT EXISTS players
+        (name text PRIMARY KEY, hash text)
+        """)
         self.cursor.execute("""
         CREATE TABLE IF NOT EXISTS games
-        (player1 text, player2 text, result int, stdout text, stderr text,
+        (id integer PRIMARY KEY, player1 text, player2 text, result int,
         FOREIGN KEY(player1) REFERENCES players(name) ON DELETE CASCADE,
         FOREIGN KEY(player2) REFERENCES players(name) ON DELETE CASCADE)
         """)
         self.cursor.execute("""
-        CREATE TABLE IF NOT EXISTS players
-        (name text PRIMARY KEY, hash text)
+        CREATE INDEX IF NOT EXISTS games_players
+        ON games (player1, player2)
+        """)
+        self.cursor.execute("""
+        CREATE INDEX IF NOT EXISTS games_player2
+        ON games (player2)
+        """)
+        self.cursor.execute("""
+        CREATE TABLE IF NOT EXISTS game_output
+        (game_id integer PRIMARY KEY, stdout text, stderr text,
+        FOREIGN KEY(game_id) REFERENCES games(id) ON DELETE CASCADE)
+        """)
+        self.cursor.execute("""
+        CREATE TABLE IF NOT EXISTS results
+        (player1 text, player2 text, win int, loss int, draw int,
+        PRIMARY KEY(player1, player2),
+        FOREIGN KEY(player1) REFERENCES players(name) ON DELETE CASCADE,
+        FOREIGN KEY(player2) REFERENCES players(name) ON DELETE CASCADE)
+        """)
+        self.cursor.execute("""
+        CREATE INDEX IF NOT EXISTS results_player2
+        ON results (player2)
         """)
+        self.cursor.execute("""
+        CREATE TABLE IF NOT EXISTS hash_cache
+        (path text PRIMARY KEY, signature text, hash text)
+        """)
+        if migrate:
+            self.cursor.execute("""
+            INSERT INTO games (id, player1, player2, result)
+            SELECT rowid, player1, player2, result FROM games_old
+            """)
+            self.cursor.execute("""
+            INSERT INTO game_output (game_id, stdout, stderr)
+            SELECT rowid, stdout, stderr FROM games_old
+            """)
+            self.cursor.execute("DROP TABLE games_old")
+            self.rebuild_results()
         self.connection.commit()
 
+    def rebuild_results(self):
+        """Recalculate the ``results`` table from all games."""
+        self.cursor.execute("DELETE FROM results")
+        # every game counts once from the view of each of its players
+        self.cursor.execute("""
+        INSERT INTO results (player1, player2, win, loss, draw)
+        SELECT p1, p2, sum(result = 0), sum(result = 1), sum(result = -1)
+        FROM (SELECT player1 AS p1, player2 AS p2, result FROM games
+              UNION ALL
+              SELECT player2, player1, CASE result WHEN -1 THEN -1 ELSE 1 - result END FROM games)
+        GROUP BY p1, p2
+        """)
+
     def get_players(self):
         """Get players from the database.
 
@@ -365,6 +547,8 @@ def remove_player(self, pname):
         """
         self.cursor.execute("""DELETE FROM games
         WHERE player1 = ? or player2 = ?""", (pname, pname))
+        self.cursor.execute("""DELETE FROM results
+        WHERE player1 = ? or player2 = ?""", (pname, pname))
         self.cursor.execute("""DELETE FROM players
         WHERE name = ?""", (pname,))
         self.connection.commit()
@@ -372,6 +556,8 @@ def remove_player(self, pname):
     def add_gameresult(self, p1_name, p2_name, result, std_out, std_err):
         """Add a new game result to the database.
 
+        The ``results`` table is updated in the same transaction.
+
         Parameters
         ----------
         p1_name, p2_name : str
@@ -383,16 +569,46 @@ def add_gameresult(self, p1_name, p2_name, result, std_out, std_err):
         std_out, std_err : str
             STDOUT and STDERR of the game
 
+        Returns
+        -------
+        game_id : int
+            the id of the game (see ``get_game_output``)
+
         """
         self.cursor.execute("""
-        INSERT INTO games
-        VALUES (?, ?, ?, ?, ?)
-        """, [p1_name, p2_name, result, std_out, std_err])
+        INSERT INTO games (player1, player2, result)
+        VALUES (?, ?, ?)
+        """, [p1_name, p2_name, result])
+        game_id = self.cursor.lastrowid
+        self.cursor.execute("""
+        INSERT INTO game_output (game_id, stdout, stderr)
+        VALUES (?, ?, ?)
+        """, [game_id, std_out, std_err])
+        p1_outcome = {0: (1, 0, 0), 1: (0, 1, 0), -1: (0, 0, 1)}[result]
+        p2_outcome = (p1_outcome[1], p1_outcome[0], p1_outcome[2])
+        for player, opponent, (win, loss, draw) in [(p1_name, p2_name, p1_outcome),
+                                                    (p2_name, p1_name, p2_outcome)]:
+            self.cursor.execute("""
+            INSERT OR IGNORE INTO results
+            VALUES (?, ?, 0, 0, 0)
+            """, [player, opponent])
+            self.cursor.execute("""
+            UPDATE results
+            SET win = win + ?, loss = loss + ?, draw = draw + ?
+            WHERE player1 = ? and player2 = ?
+            """, [win, loss, draw, player, opponent])
+            if p1_name == p2_name:
+                # a game against oneself is counted only once
+                break
         self.connection.commit()
+        return game_id
 
     def get_results(self, p1_name, p2_name=None):
         """Get all games involving player1 (AND player2 if specified).
 
+        This reads every matching game together with its output. Use
+        ``get_wins_losses`` for the number of wins, losses and draws.
+
         Parameters
         ----------
         p1_name : str
@@ -406,20 +622,165 @@ def get_results(self, p1_name, p2_name=None):
         -------
         relevant_results : list of gameresults
 
+        """
+        query = """
+        SELECT player1, player2, result, stdout, stderr
+        FROM games LEFT JOIN game_output ON games.id = game_output.game_id
         """
         if p2_name is None:
-            self.cursor.execute("""
-            SELECT * FROM games
+            self.cursor.execute(query + """
             WHERE player1 = ? or player2 = ?""", (p1_name, p1_name))
             relevant_results = self.cursor.fetchall()
         else:
-            self.cursor.execute("""
-            SELECT * FROM games
+            self.cursor.execute(query + """
             WHERE (player1 = :p1 and player2 = :p2) or (player1 = :p2 and player2 = :p1)""",
             dict(p1=p1_name, p2=p2_name))
             relevant_results = self.cursor.fetchall()
         return relevant_results
 
+    def get_wins_losses(self, p1_name, p2_name=None):
+        """Get the number of wins, losses and draws of player 1.
+
+        Parameters
+        ----------
+        p1_name : str
+            the name of player 1
+        p2_name : str, optional
+            the name of player 2, if specified only the games of player
+            1 against player 2 are counted
+
+        Returns
+        -------
+        win, loss, draw : int
+
+        """
+        if p2_name is None:
+            row = self.cursor.execute("""
+            SELECT sum(win), sum(loss), sum(draw)
+            FROM results
+            WHERE player1 = ?""", (p1_name,)).fetchone()
+        else:
+            row = self.cursor.execute("""
+            SELECT win, loss, draw
+            FROM results
+            WHERE player1 = ? and player2 = ?""", (p1_name, p2_name)).fetchone()
+        if row is None or row[0] is None:
+            return 0, 0, 0
+        return tuple(row)
+
+    def get_pair_results(self):
+        """Get the number of wins, losses and draws for all pairs of players.
+
+        Returns
+        -------
+        pair_results : dict
+            maps ``(p1_name, p2_name)`` to ``(win, loss, draw)`` of
+            player 1 against player 2
+
+        """
+        rows = self.cursor.execute("""
+        SELECT player1, player2, win, loss, draw FROM results""")
+        return {(p1, p2): (win, loss, draw) for p1, p2, win, loss, draw in rows}
+
+    def get_game_output(self, game_id):
+        """Get STDOUT and STDERR of a game.
+
+        Raises
+        ------
+        ValueError : if there is no output for the game
+
+        """
+        row = self.cursor.execute("""
+        SELECT stdout, stderr
+        FROM game_output
+        WHERE game_id = ?""", (game_id,)).fetchone()
+        if row is None:
+            raise ValueError('No output for game %s in data base.' % game_id)
+        return tuple(row)
+
+
+    def get_hash_cache(self):
+        """Get the cached directory hashes.
+
+        Returns
+        -------
+        cache : dict
+            maps a directory to ``(signature, hash)``, see ``hashdir_cached``
+
+        """
+        rows = self.cursor.execute("""SELECT path, signature, hash FROM hash_cache""")
+        return {path: (signature, h) for path, signature, h in rows}
+
+    def set_hash_cache(self, path, signature, h):
+        """Store the hash of a directory and the signature of its files."""
+        self.cursor.execute("""
+        INSERT OR REPLACE INTO hash_cache
+        VALUES (?, ?, ?)
+        """, [path, signature, h])
+        self.connection.commit()
+
+
+def _dir_files(pathname):
+    # all files below pathname in the order in which they are hashed
+    files = []
+    for path, root, filenames in os.walk(pathname):
+        for filename in filenames:
+            files.append(os.sep.join([path, filename]))
+    files.sort()
+    return [filename for filename in files if not filename.endswith('.pyc')]
+
+
+def dir_signature(files):
+    """Calculate the SHA1 of the names, sizes and modification times of files.
+
+    Parameters
+    ----------
+    files : list of str
+        the files to check
+
+    Returns
+    -------
+    hexdigest : str
+        the SHA1
+
+    """
+    sha1 = hashlib.sha1()
+    for filename in files:
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            stat = None
+        entry = '%s\0%s\0%s\n' % (filename,
+                                   stat and stat.st_mtime_ns,
+                                   stat and stat.st_size)
+        sha1.update(entry.encode('utf-8', 'surrogateescape'))
+    return sha1.hexdigest()
+
+
+def hashdir_cached(pathname, cached=None):
+    """Calculate the SHA1 sum of the contents of a directory, unless
+    nothing changed since the last time.
+
+    Parameters
+    ----------
+    pathname : str
+        the path of the directory to check
+    cached : tuple, optional
+        ``(signature, hexdigest)`` as returned by an earlier call
+
+    Returns
+    -------
+    signature, hexdigest : str
+        the SHA1 of the names, sizes and modification times of the
+        files and the SHA1 of their contents (see ``hashdir``)
+
+    """
+    files = _dir_files(pathname)
+    signature = dir_signature(files)
+    if cached is not None and cached[0] == signature:
+        return cached
+    return signature, _hash_files(files)
+
 
 def hashdir(pathname):
     """Calculate the SHA1 sum of the contents of a directory.
@@ -445,15 +806,12 @@ def hashdir(pathname):
     'cac36aaf1c64d7f93c9d874471f23de1cbfd5249'
 
     """
-    files = []
-    for path, root, filenames in os.walk(pathname):
-        for filename in filenames:
-            files.append(os.sep.join([path, filename]))
-    files.sort()
+    return _hash_files(_dir_files(pathname))
+
+
+def _hash_files(files):
     sha1 = hashlib.sha1()
     for filename in files:
-        if filename.endswith('.pyc'):
-            continue
         try:
             with open(filename, 'rb') as fh:
                 while 1:
@@ -467,6 +825,60 @@ def hashdir(pathname):
     return sha1.hexdigest()
 
 
+class Test_hashdir(unittest.TestCase):
+    """Tests for the cached directory hashes."""
+
+    def test_hashdir_cached(self):
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'player.py')
+            with open(filename, 'w') as f:
+                f.write('a')
+            signature, h = hashdir_cached(tmpdir)
+            self.assertEqual(h, hashdir(tmpdir))
+            # unchanged files are not read again
+            self.assertEqual(hashdir_cached(tmpdir, (signature, 'cached')), (signature, 'cached'))
+            with open(filename, 'w') as f:
+                f.write('bb')
+            signature2, h2 = hashdir_cached(tmpdir, (signature, h))
+            self.assertNotEqual(signature, signature2)
+            self.assertEqual(h2, hashdir(tmpdir))
+            self.assertNotEqual(h, h2)
+
+    def test_hash_cache(self):
+        wrapper = DB_Wrapper(':memory:')
+        self.assertEqual(wrapper.get_hash_cache(), {})
+        wrapper.set_hash_cache('p1', 's1', 'h1')
+        wrapper.set_hash_cache('p1', 's2', 'h2')
+        self.assertEqual(wrapper.get_hash_cache(), {'p1': ('s2', 'h2')})
+
+
+class Test_MatchScheduler(unittest.TestCase):
+    """Tests for the MatchScheduler class."""
+
+    def test_least_played_first(self):
+        scheduler = MatchScheduler([3, 0, 5, 1])
+        a, b = scheduler.next_match()
+        self.assertEqual(a, 1)
+        self.assertNotEqual(b, 1)
+        self.assertEqual(sum(scheduler.game_counts), 11)
+
+    def test_balanced(self):
+        scheduler = MatchScheduler([0] * 5)
+        for _ in range(100):
+            counts = list(scheduler.game_counts)
+            a, b = scheduler.next_match()
+            self.assertEqual(counts[a], min(counts))
+            self.assertEqual(sum(scheduler.game_counts), sum(counts) + 2)
+
+    def test_cancel(self):
+        scheduler = MatchScheduler([0, 2, 2])
+        a, b = scheduler.next_match()
+        scheduler.cancel(a, b)
+        self.assertEqual(scheduler.game_counts, [0, 2, 2])
+        self.assertEqual(scheduler.next_match()[0], 0)
+
+
 class Test_DB_Wrapper(unittest.TestCase):
     """Tests for the DB_Wrapper class."""
 
@@ -540,6 +952,46 @@ def test_get_results(self):
         results = self.wrapper.get_results('p1')
         self.assertEqual(len(results), 2)
 
+    def test_get_wins_losses(self):
+        for p in ['p1', 'p2', 'p3']:
+            self.wrapper.add_player(p, 'h')
+        self.assertEqual(self.wrapper.get_wins_losses('p1'), (0, 0, 0))
+        self.wrapper.add_gameresult('p1', 'p2', 0, '', '')
+        self.wrapper.add_gameresult('p2', 'p1', 0, '', '')
+        self.wrapper.add_gameresult('p2', 'p1', -1, '', '')
+        game_id = self.wrapper.add_gameresult('p3', 'p1', 1, 'out', 'err')
+        self.assertEqual(self.wrapper.get_wins_losses('p1'), (2, 1, 1))
+        self.assertEqual(self.wrapper.get_wins_losses('p1', 'p2'), (1, 1, 1))
+        self.assertEqual(self.wrapper.get_wins_losses('p2', 'p1'), (1, 1, 1))
+        self.assertEqual(self.wrapper.get_wins_losses('p3', 'p1'), (0, 1, 0))
+        self.assertEqual(self.wrapper.get_wins_losses('p3', 'p2'), (0, 0, 0))
+        self.assertEqual(self.wrapper.get_pair_results()[('p1', 'p3')], (1, 0, 0))
+        self.assertEqual(self.wrapper.get_game_output(game_id), ('out', 'err'))
+        # the materialized results agree with the games
+        expected = self.wrapper.get_pair_results()
+        self.wrapper.rebuild_results()
+        self.assertEqual(self.wrapper.get_pair_results(), expected)
+        self.wrapper.remove_player('p2')
+        self.assertEqual(self.wrapper.get_wins_losses('p1'), (1, 0, 0))
+        self.assertEqual(self.wrapper.get_wins_losses('p2'), (0, 0, 0))
+
+    def test_migrate_old_games_table(self):
+        connection = sqlite3.connect(':memory:')
+        connection.execute("PRAGMA foreign_keys = ON;")
+        connection.execute("""CREATE TABLE games
+        (player1 text, player2 text, result int, stdout text, stderr text)""")
+        connection.execute("CREATE TABLE players (name text PRIMARY KEY, hash text)")
+        connection.executemany("INSERT INTO players VALUES (?, ?)", [('p1', 'h'), ('p2', 'h')])
+        connection.executemany("INSERT INTO games VALUES (?, ?, ?, ?, ?)",
+                               [('p1', 'p2', 0, 'a', 'b'), ('p2', 'p1', -1, 'c', 'd')])
+        self.wrapper.connection = connection
+        self.wrapper.cursor = connection.cursor()
+        self.wrapper.create_tables()
+        self.assertEqual(sorted(self.wrapper.get_results('p1')),
+                         [('p1', 'p2', 0, 'a', 'b'), ('p2', 'p1', -1, 'c', 'd')])
+        self.assertEqual(self.wrapper.get_wins_losses('p1'), (1, 0, 1))
+        self.assertEqual(self.wrapper.get_wins_losses('p2'), (0, 1, 1))
+
     def test_get_player_hash(self):
         self.wrapper.add_player('p1', 'h1')
         self.wrapper.add_player('p2', 'h2')
@@ -554,6 +1006,6 @@ def test_get_player_hash(self):
         unittest.main(argv=sys.argv[:1], verbosity=2)
     else:
         ci_engine = CI_Engine()
-        ci_engine.start(args.n)
+        ci_engine.start(args.n, args.j)
 
 
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+""" Benchmarks the path searches of AdjacencyList on the big layouts. """
+
+import random
+
+from pelita.datamodel import CTFUniverse
+from pelita.graph import AdjacencyList, NoPathException
+from pelita.layout import get_available_layouts, get_layout_by_name
+
+NUM_LAYOUTS = 10
+NUM_QUERIES = 20
+
+def prepare_queries(seed=0):
+    rnd = random.Random(seed)
+    queries = []
+    for layout_name in sorted(get_available_layouts(filter='big'))[:NUM_LAYOUTS]:
+        universe = CTFUniverse.create(get_layout_by_name(layout_name), 4)
+        adjacency = AdjacencyList(universe.free_positions())
+        positions = sorted(adjacency)
+        pairs = [(rnd.choice(positions), rnd.choice(positions)) for _ in range(NUM_QUERIES)]
+        queries.append((adjacency, pairs))
+    return queries
+
+QUERIES = prepare_queries()
+
+def run_bfs():
+    for adjacency, pairs in QUERIES:
+        for initial, target in pairs:
+            try:
+                adjacency.bfs(initial, [target])
+            except NoPathException:
+                pass
+
+def run_a_star():
+    for adjacency, pairs in QUERIES:
+        for initial, target in pairs:
+            try:
+                adjacency.a_star(initial, target)
+            except NoPathException:
+                pass
+
+def run_distance_table():
+    for adjacency, pairs in QUERIES:
+        table = adjacency.distance_table
+        for initial, target in pairs:
+            try:
+                table.path(initial, target)
+            except NoPathException:
+                pass
+
+if __name__ == '__main__':
+    import timeit
+    REPEAT = 5
+    NUMBER = 1
+    # build (or load) the distance tables before timing them
+    run_distance_table()
+    for bench in [run_bfs, run_a_star, run_distance_table]:
+        result = min(timeit.repeat(bench, repeat=REPEAT, number=NUMBER))
+        print("{}: fastest out of {}: {}".format(bench.__name__, REPEAT, result))
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Generate many mazes in parallel and write them to a layout pack.
+
+Every maze is checked before it is written: all free tiles must be
+connected and all food must be reachable by the bots of both teams. If
+a maze fails the check, another seed is tried.
+
+The seeds are assigned as in create_all_mazes.sh, so that
+
+    ./create_layout_pack.py -n 100 -o layouts.pack
+
+uses the same seeds as the layouts in this directory. The pack can be
+read with `pelita.layout.read_layout_pack`.
+"""
+
+import argparse
+import multiprocessing
+import sys
+
+from pelita.datamodel import CTFUniverse, UniverseException
+from pelita.layout import LayoutEncodingException, write_layout_pack
+
+from maze_generator import get_new_maze
+
+# height, width and food per team of each size class
+SIZES = {
+    'normal': (16, 32, 30),
+    'small': (8, 18, 10),
+    'big': (32, 64, 60),
+}
+
+SEED_STEP = 27
+
+# the seed for the next attempt if a maze is rejected
+RETRY_STEP = 1000003
+
+
+def check_layout(layout_str):
+    """Return the problems of a layout (an empty list if there are none)."""
+    try:
+        universe = CTFUniverse.create(layout_str, 4)
+    except (LayoutEncodingException, UniverseException) as e:
+        return [str(e)]
+
+    problems = []
+    free = {pos for pos, wall in universe.maze.items() if not wall}
+    reachable = dict(universe.reachable([universe.bots[0].initial_pos]))
+    if set(reachable) != free:
+        problems.append("%i free tiles are not connected" % len(free - set(reachable)))
+
+    for team in universe.teams:
+        positions = [bot.initial_pos for bot in universe.team_bots(team.index)]
+        reachable = dict(universe.reachable(positions))
+        unreachable = [pos for pos in universe.food if pos not in reachable]
+        if unreachable:
+            problems.append("team %i cannot reach the food at %s" % (team.index, unreachable))
+        if not universe.enemy_food(team.index):
+            problems.append("team %i has no food to eat" % team.index)
+    return problems
+
+
+def generate(task):
+    """Generate a single valid layout.
+
+    task -- (name, size, dead_ends, seed, max_attempts)
+
+    Returns the name, the seed which was used, the layout and the number
+    of rejected mazes.
+    """
+    name, size, dead_ends, seed, max_attempts = task
+    height, width, nfood = SIZES[size]
+    for attempt in range(max_attempts):
+        attempt_seed = seed + attempt * RETRY_STEP
+        layout_str = get_new_maze(height, width, nfood=nfood, seed=attempt_seed,
+                                  dead_ends=dead_ends).decode() + '\n'
+        if not check_layout(layout_str):
+            return name, attempt_seed, layout_str, attempt
+    raise ValueError("No valid maze for %s after %i attempts." % (name, max_attempts))
+
+
+def make_tasks(number, sizes, dead_ends, seed, max_attempts):
+    digits = max(3, len(str(number)))
+    tasks = []
+    for size in sizes:
+        for count in range(1, number + 1):
+            seed += SEED_STEP
+            for with_dead_ends in dead_ends:
+                name = 'layout_%s_%s_dead_ends_%0*i' % (size, 'with' if with_dead_ends else 'without',
+                                                        digits, count)
+                tasks.append((name, size, with_dead_ends, seed, max_attempts))
+    return tasks
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--number', type=int, default=100,
+                        help='number of layouts per size class (default: 100)')
+    parser.add_argument('--size', choices=sorted(SIZES), action='append', dest='sizes',
+                        help='the size classes to generate (default: normal, small and big)')
+    parser.add_argument('--dead-ends', choices=['with', 'without', 'both'], default='both',
+                        help='generate layouts with or without dead ends (default: both)')
+    parser.add_argument('--seed', type=int, default=39285,
+                        help='the base seed (default: 39285)')
+    parser.add_argument('--max-attempts', type=int, default=10,
+                        help='number of seeds to try for each layout (default: 10)')
+    parser.add_argument('--processes', '-j', type=int, default=None,
+                        help='number of worker processes (default: number of CPUs)')
+    parser.add_argument('--output', '-o', default='layouts.pack',
+                        help='the layout pack to write (default: layouts.pack)')
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or ['normal', 'small', 'big']
+    dead_ends = {'with': [True], 'without': [False], 'both': [False, True]}[args.dead_ends]
+    tasks = make_tasks(args.number, sizes, dead_ends, args.seed, args.max_attempts)
+
+    layouts = []
+    rejected = 0
+    with multiprocessing.Pool(args.processes) as pool:
+        chunksize = max(1, len(tasks) // (4 * (args.processes or multiprocessing.cpu_count())))
+        for name, seed, layout_str, attempts in pool.imap(generate, tasks, chunksize=chunksize):
+            if attempts:
+                print('%s: rejected %i maze(s), using seed %i' % (name, attempts, seed), file=sys.stderr)
+            rejected += attempts
+            layouts.append((name, layout_str))
+
+    write_layout_pack(args.output, layouts)
+    print('Wrote %i layouts to %s (%i mazes rejected).' % (len(layouts), args.output, rejected))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
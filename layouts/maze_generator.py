@@ -11,6 +11,10 @@
 Players 1,3 always start in the bottom left; 2,4 in the top right
 Food is placed randomly (though not too close to the pacmen starting positions)
 
+Dead ends are found for the whole maze at once by counting the free
+neighbours of every tile, and all of them are removed before looking
+again. No graph has to be built.
+
 Notes:
 the final map includes a symmetric, flipped copy
 the first wall has k gaps, the next wall has k/2 gaps, etc. (min=1)
@@ -20,7 +24,6 @@
 """
 
 import numpy
-import networkx as nx
 
 from pelita.datamodel import north, south, east, west
 
@@ -158,62 +161,54 @@ def _add_wall(maze, ngaps, vertical):
             _add_wall(sub_maze, max(1, ngaps // 2), not vertical)
 
 
-def walls_to_graph(maze):
-    """Transform a maze in a graph.
-
-    The data on the nodes correspond to their coordinates, data on edges is
-    the actions to take to transition to that edge.
+def free_neighbours(free):
+    """Return the number of free neighbours of every tile.
 
-    Returns:
-    graph -- a Graph
-    first_node -- the first node in the Graph
+    free -- 2D boolean array, True for tiles which are not walls
     """
+    # tiles outside of the array count as walls
+    padded = numpy.pad(free, 1, mode='constant', constant_values=False).astype(numpy.int8)
+    return (padded[1:-1, :-2] + padded[1:-1, 2:]
+            + padded[:-2, 1:-1] + padded[2:, 1:-1])
 
-    h, w = maze.shape
-
-    graph = nx.Graph()
-    # define nodes for maze
-    for x in range(w):
-        for y in range(h):
-            if maze[y, x] != W:
-                graph.add_node((x, y))
 
-    directions = [west, east, north, south]
-
-    # add edges
-    nodes = graph.nodes()
-    for pos in nodes:
-        for dir_ in directions:
-            neighbor = (pos[0] + dir_[0], pos[1] + dir_[1])
-            if neighbor in nodes:
-                graph.add_edge(pos, neighbor, data=[dir_])
-
-    return graph, nodes[0]
+def find_dead_ends(maze):
+    """Find all dead ends in a maze.
 
+    Returns the positions (x, y) of all free tiles with exactly one
+    free neighbour, in row-major order.
+    """
 
-def find_dead_ends(graph, start_node, width):
-    """Find dead ends in a graph."""
+    free = maze != W
+    dead_ends = free & (free_neighbours(free) == 1)
+    # do not consider dead ends on the right side of the maze, as those
+    # represents passages to the enemy's side
+    dead_ends[:, -1] = False
+    ys, xs = numpy.nonzero(dead_ends)
+    return list(zip(xs.tolist(), ys.tolist()))
 
-    dead_ends = []
-    def collect_dead_ends(node):
-        x = node[0]
-        # do not consider dead ends on the right side of the maze, as those
-        # represents passages to the enemy's side
-        if graph.degree(node) == 1 and x < width - 1:
-            dead_ends.append(node)
 
-    for node in nx.bfs_successors(graph, start_node):
-        collect_dead_ends(node)
+def _free_dirs(pos, maze):
+    h, w = maze.shape
+    free_dirs = []
+    for dir_ in [west, east, north, south]:
+        x, y = pos[0] + dir_[0], pos[1] + dir_[1]
+        if 0 <= x < w and 0 <= y < h and maze[y, x] != W:
+            free_dirs.append(dir_)
+    return free_dirs
 
-    return dead_ends
 
+def remove_dead_end(pos, maze):
+    """Remove one dead end in a maze.
 
-def remove_dead_end(dead_node, maze):
-    """Remove one dead end in a maze."""
+    Returns False if the tile is not a dead end (anymore).
+    """
 
     h, w = maze.shape
-    pos = dead_node.data
-    free_dir = dead_node.get_edges_out()[0].data[0]
+    free_dirs = _free_dirs(pos, maze)
+    if len(free_dirs) != 1:
+        return False
+    free_dir = free_dirs[0]
 
     # first, try to pierce the wall straight ahead
     # this might not be possible if we are on the borders of the maze
@@ -232,20 +227,26 @@ def remove_dead_end(dead_node, maze):
             and pierce_y >= 0
             and pierce_y < h):
             maze[pierce_y, pierce_x] = E
-            break
+            return True
+    return False
 
 
 def remove_all_dead_ends(maze):
+    """Remove all dead ends in the left half of the maze.
+
+    All dead ends found in one pass are removed together. A dead end
+    which was already opened by removing one of the others is skipped.
+    """
     height, width = maze.shape
+    half = maze[1:height - 1, 1:width // 2]
     while True:
-        maze_graph, start_node = walls_to_graph(maze[1:height - 1,
-                                                     1:width // 2])
-        dead_ends = find_dead_ends(maze_graph,
-                                   start_node, width // 2 - 1)
-        if len(dead_ends) == 0:
+        dead_ends = find_dead_ends(half)
+        if not dead_ends:
             break
-
-        remove_dead_end(dead_ends[0], maze[1:height - 1, 1:width // 2])
+        removed = [remove_dead_end(pos, half) for pos in dead_ends]
+        if not any(removed):
+            # cannot happen for mazes made by get_new_maze
+            raise ValueError("Dead ends cannot be removed.")
 
 
 def add_pacman_stuff(maze, max_food):
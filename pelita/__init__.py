@@ -1,4 +1,5 @@
-from . import (containers,
+from . import (batch,
+               containers,
                datamodel,
                game_master,
                layout,
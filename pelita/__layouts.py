@@ -1,3213 +0,0 @@
-### This file is auto-generated. DO NOT EDIT! ###
-layout_big_with_dead_ends_001 = """eJylVUlyBCEMu/crqNJdlWT+/7ew2LJM3xIyNemBRottDPC/8WDkYD4gPzY4XmO98AkA1jvaiv1/
-coyio57i7e8J4EPvD/sd4EEy5zi3M7HTAvMbqc4sdP0Lon48qTfmGItHJfKx64zZZXIBsNHhuJ84
-IafT82weCKULALg51kYi5VwG6JTcACUAPGsN8KgKFjfEqoOe8xMlw6VEMF1lraw0Xuohh8E8bG1+
-ajcjBkNsDH5LI7wmK/6arhiYCyRIzBU9aVnKLBBs0CgVkIJTFIz41qoUbAwaewEwzAZx5p8dIGKw
-pfKyQKNFlvpRFQAy1hWo5jGMHzsPLwsbLAst/1bNKQaugLHjspC0ilcLotpDHadV6gFwjIYWVimP
-y4Knuiyo5Ara3qopQVQMspCoRBAYvXirxbVepXVP40Gug0MTMhRmd7EVoHrlANy/jKmUNywcd5Wy
-4JiFprH7yT5/PG3iOrZKo3Wpdwfb5ipL7oABUPG/OSLf1d6zIesA+s10R8nEqEHAboAM4oEno4zz
-lqr23ntVD8UE+EpJOer+ShcprQ6ovibAzxiX9Fu/tuK9eN2NfxjPLyjZEgQ=
-"""
-layout_big_with_dead_ends_002 = """eJylVUFyxDAIu/sVzHBn2u7//9bYICGSnFrvbHZjO0II4bj/byw3C7Prev0G/p0Lf8aIcffZAAdo
-P73Xwnub7I35HMf3ATgfPNHkrr852xO1blzfKRzaElcGM9GFcF2/AArJG7pHHBbeD3he3XF3RASD
-QBalp70AlMwVCyl0mjUvFB2yQGyChDI491OCGNUsHSAjRd0ajNynCgKAKpzEECGKgaGUwzmaSTj3
-yD6tAqTJCKdUHiUrLSFVGFY2mqlzgAZVhSgM+aZwDRAjBZYDZawM3Wi3ml0sDDtpo3WZJPnwMhEV
-TgCoHz6GkYGwLqYix/JmaLXunSuMdPN4dEMBoIOmX1tWmMiDGV5OT2FDGMAbKpdYGb2NXAJbsheU
-NXpllnGQ7LrDymJuynGCppPoK8qSANmNw5iSfDfT0+J9iKUP4I1gYzh9R4Uf3Wa0sk6ytxXgftiF
-9PbqMqEwEqetTCodLE+i1YcTQW4nUvo6eA4Z4guD8pJWQQGeHkfMUQXrw8Zah3sNQCADxTjWW3xN
-k71NmRvg9MKXvQ59mcmLLqXbirCZfl7ozaGZON4ZMPiw8l/G+gXfmBHy
-"""
-layout_big_with_dead_ends_003 = """eJylVUFyxDAIu+cVzHDXbNv//61rEAJ7k0vr7iaN7QghZNb9f+NyM/P4rC8sBp8+B95/nrvi8kMA
-jFeI8X6KuRjroQYj5StfBHDka7FXO3NpIWJyMMGZUsD6FDdScSXhM7rQGHIBQHB1MzHovZknGhE2
-RTSlxk1QCgJpfq1iaTASH//iUBMH0XVrBkQVG28VbitqpQGkV+WX0awYEO2OZGvQMTxzdBsaaL10
-rEk/NTCJD4IYC9D47VtvEbdZuUBlX8AVJcqTjglZJ0Duk9lAO4wURq61NHxQATcfutMSlV9e1lzE
-WgAU37Q1UEqq28ScabWRHjXQ6XOKQWin1OWDcHqfg4SMpUqPsBjZTgbe4uyC0dP50AXpsl1p8GDj
-xhPmW0GeNNh8sM/SdoMKKPXRchJgwO5d5agCRn7TiXNsR0abUU3HvMQvADrxYdyf7NFMKoW9Q2Tf
-mA7G02GWiELVqe3mTiTFBQa10oBt1QWDhpX441I3iMHRqifHFrz50dpi0D8/508IlMLWcmIVpcEr
-tdXpG2WUUl3RTl4MvoeKstxdRVvh9u1ppD+M6xdlmhHU
-"""
-layout_big_with_dead_ends_004 = """eJylVEuO7EAI2+cUSN5b897c/26TFB8Dnc1oqqV0UlAG7ALgb+uC9QXGEwZ9mp5mbHv27QC0uWAH
-AAbb60R18PsP/24A2M7KMeIHk93C6NDu10pAZXK/lSNs5FExGHk6ANO77Dh4aGeU/HMAJgB2Ehhh
-VQKbyWlF+jnAYZURjjLNpCYRAFTCNPdsk0SBL8kRHAwL0xpc37r34tMpqXtKGKiOwJRqke/JJ88n
-yybj4UFK6h68rXYP3opPyULGKDf27hwoN+eAVT8rfirBCsn2eV75moE9AfKMl4AWcctaHEwuI2EV
-3Mq2fqJf5c2P3PNa7NODxM8MqRLc9ynto+JDIhcyK3pyqmuhzqE1Eps4mTAz69z7SLORuPmZdI7h
-REj24MDnzIHj4KHRms3ErYSaCVuKA1hNwUGKCHsAgu9lCcTs6c/iY++K+cjNUhslqQRKg+SBLIDY
-j1Q1xsZ0q4aQoAJANc0m0qfrHO8VRSW0id2YNJVAKdmU6PcgHAcR6x688HjhKxslDtpeBfCq1YX/
-lW7ritaOzE6gPhv6y0j73bp+ACjZEgQ=
-"""
-layout_big_with_dead_ends_005 = """eJylVUtyxSAM2+cUntFe08/979bgHzK0q9LOS0JASLbsAP8bD8yMtsa6e2/9sqZ8FvHoU9z3sRz2
-HQDxjNjTAP3Gh18KdS3w158vwNqJPD3PHBxZBMANRMddO5MBTgnFsWAs/oaEBHCyzJWEEEhKydg5
-i5wGOLGbElCkDBEcv6RQ5tSj2zNygExYEPTtUH3CAJ0BazT4sews2NDmx4SmFQNSooW9ambBtqKO
-+gsiMUgDUNl7giGsS17oqTQeCTpHk8AI8gYQo5mSr8POwVx9MxD/Mv+HfZsndx46C3f0+p7FRmdF
-AkYhMcrkOnBkwryYBgCvFbKvEVkqOSS0/SR2XRm3ojaT/4oPrgOjaDue/VI92wCOxtuOI49Xrk0l
-nFappvPXOBhwH7YDid0Ty+CjErKhjEo4MkElP8VhoTGdmKkfRukYhDNKonh2ZkFbBdNZwsqs7Wfq
-mQDYPZ+WHosQliKMIMv2kcaSEJr2J6I7bqzIsARB/tJUG3tHS/UdpZkAUbTNgvI1mZHXXMXOBx/+
-1Iw5mkofLK2QmugX4GtwDDSp30KVDq+mWd/G/43nB6LXEiI=
-"""
-layout_big_with_dead_ends_006 = """eJylVUuuAzEI2+cUSOyt97n/3d4kYAOZt2sqtTMJAWMDdf9sLbdn4Xztx/PKnf3usYX81UGs38cB
-jqNtaekg38/P2cK5eIW2bfMdCI5J3hEKhXJFwEAX3pduJNIewh0EZYrQjvfWkwLgGWhvoHioeCd6
-sZWALRyYUmW6ZSMSvRMzHiOFQBq8dKvi1erZADq9OIgP4+NKJf2XZAGwqcDgt14gmk4P8m2T2FRA
-KRhZwV23jhfcUizn0dB+qOCoFPp2rwMgLvsVIn1X3q8Ul/g0MdCD7FpSFh0BYZWDp6KaVCLekxg0
-B8wUdFBB8FbvFNNsMG8P67VDS2vJFCJxlVV7EDREwonM032mFIZw2uVAYQF0ppx10BpEtWbNwa2a
-y9BaedJATcmGWG3oFALB+r+yEg0d+BWiCvMQCXGSHHHI7C8cBG4kl9uWesDnqm5jLW8OrEZHnr8b
-GW0SykAccOiAEkuy6sOCIAeYKtzjSpOsskoKawRlOxOD5iWb0u7+9vyDYSXsebxeg7Cic8jM48pz
-1EFXGI3QoT0nQgJOB19e03KUg4bOLNKklTov/xlpqqESqUDo39Y4TMJi+Ydr/QGKcRIc
-"""
-layout_big_with_dead_ends_007 = """eJylVUluxDAMu+cVAngnuvz/b020Uk57qlF0xq5CkxSjAv9bF4wGMwPNP3MRzy4P4H+9D41Z6Zt7
-fT8AUewgABu6nuagNmAWAJ/F4P7Ns/a+KS+DDSo23AMQAhiFiZI7BxA2ztbYFOEAUWpx1iTA8kB5
-WV1jpbgAhqiNC1H5+DLW+HnITQYIkjb+WinXtliLc8eazFUsx6W+Jw5t2lFiMB8O4D+ce9h2qV+J
-3i0JbQNQ1guLqF1de60GKPXSsWTQlihABIINQLFltwt4nfuWZXMxWGvtt61FlCm8AFQm+5sSx6tP
-AtAu/+FXx3y8SevhQQos6r1VtXTPt2rR2wPp4EvCqW6b6L6sKw4HD2u3B2Hsr4SjDq9znxUFwPRR
-GZR5ORLmcYlcA7zX8uvooFgRAIjRoemHPrbmqLxyyuCIKyXX+mLvPiWPS6ZvT4odgM6qqE9xHqQe
-pbTVJ4a2/arU1LOeg5dPhbb4MLPdmiazZ4uMdfFLxnJOE0KCzY45k4WaGMok1nUlN7dHbjl2A3yM
-tbsZ4ptEOhUjM3UDfE1hzNEkO/8/NIB5kAIYQfrXun4ATLgRUA==
-"""
-layout_big_with_dead_ends_008 = """eJylVcuSwzAIu+crmOGu6W7//982NkiAm9M20yaOH0IS2HH/7rrczO4/1m+146aG+2pgtfc4chjx
-eC+ANbDB8kmI3TbOR7wA2MFy5EcMKrJzMHituTcSCGoib11CTPZ90yCJgugVCOwQwBa444h2TLwJ
-EVGrY0l0E6A4lQc0MVcEPUqg4JJQV0eLLFiwU/yQsIgHgEwdaRyuMSsDu5mI4W8PLxsxwigA6+Bz
-SHIsfaSVLJmwrnvgkMoi/qAMrrLFBGj85xpMa5QCOxjEXHB6KcN8VoztQcgsBl2und0xovywDvBJ
-WTaBe7FJUMUuD8C1I0uwzBwN7xBpuUtCJ3XQpWI7u5HdV3rR9sDhWLM4zoJh8Q3gLSsjUyflxmMA
-JCbSmycw8uPUg0GryykXPAUeL48tdD1tEGS1NgLTx+U3isEoHlVZL5onZan92kT1TpNVWTP8KcGa
-hF6nuRmivFvgOvSU9twL3mot6Vv62FNTFbtTIYAuqeKNU72JgL4BzcTxtYhYcG7SOgz0zalAN8Cr
-TMX+cm0JqEIs9+o4y+eug18jUeI496IfJioyxGvWwX+u6w+6wRGq
-"""
-layout_big_with_dead_ends_009 = """eJylVUlywzAMu/sVnMEd0+X/f6skbqDS9tBqEjuyJZAAIQb433hAwmDrMgfOZw3mNH6N8bkA4sXe
-sJB6+I51133ExHk/AGCFqzjcSR2UA2qCbXKFA3j4Oz4gvJTOvjGpPbXXX4O9A98wHzMyADJEr+fW
-1TWIQaVw4u0Vm4InnAyoNFyDUyNW/K5KUTD9Jj0pK6JGie7AcK0XAGki8q1mFQiJFrYJwMjg6MUW
-OQS0IIuSdN/YOCYAY8SjZqECljNEAyhnL2YsAEMDNgX2lgaYVuoFCVDu61C/ZlAccUj3e7RGAdDh
-OKwbhs4yXhrZ9xSmjFW5kfhKqDS4yujiiFZuCieA2TFuEWfinQHRAYbVXinATLSi3QD2ewZtDonU
-LvrJag7A1qDtGtv6QEpr4DSSn4ksdlfO8gxK0Gm1aCjZUjt75hmcR7rbmH4fcZhpx6B7WIELPQpx
-5k8U2jAE1A52IsO6J1XlESLORmn3TE3pxWSm1RTorVog1Lq4nB57I4N+phTkNOEcaQp4ZE8HeJsZ
-g2Ne/xcjfrbUA/BhL6O7ctHBtcRtQxaFP4/nCxzkEkA=
-"""
-layout_big_with_dead_ends_010 = """eJylVUlywDAIu+cVzOiu6fL/vzUxm7DTS+tDgu0YJBAO8L9xwcxoa8BiMF+1UhZjM+bf7uAYrGPA
-eoxh/fq8Hbxu5psRrD1uxolgRfQD8M8o+DENmCDo2At3oTcQhUCMOxuEIMC98mzD8aFh7rSm7Q5Q
-h56NYsKAsQUXyyk8Xy0HjF1mmjp4mLMuFAQ+E3yRzYUHTHiijMekNYVIhE0CmUTzp6ZjlBHhbyV2
-FUkKEnWDTJYgEQ7ouy2wezuCdh2awq4674XJrM5QiNd6i5JZhaO2AQT25sBFVFVqKUtL0v2nA2r/
-SD+GkCJb7oOmHzcFRpK7GVpIBZClnwYoFH7hGhfK0W/qgHsOwqwk7rUZlSsE9AMC4aFcQmL1QGRB
-JqUqjqZNIZmcSgStXoiqI1TpPh1wMisK7qS7SqmyqF6oPtRWXTAkJ3G3OS9G97eUp5TEqm7MeHnb
-aA5eajuCd0nilU3bQlr34wGDkkS9ZLdwV4ZBN8Pst4RPKyYy5Fa2zah/yk5rjgsfvXr+w95v5Yng
-SwNT8Dek+tnOveNC+dO4fgAEfhI6
-"""
-layout_big_with_dead_ends_011 = """eJylVUFy5EAIu88rqOKu2iT//1vGgIRI9rTbVfbYY0wLSeDM/1uvRGjBrn1lH9mnDu2fr3eCePKE
-J426VTROgvDQ+HgQ2KMJxZzqFkJQARUDISsEMW+9U2WH16YDhS8HQXnRnQAxqNP3muhcHgg2VbQQ
-pCPsp8hNkMzhCLAl5EbsefbsK5gKTnbJyGh0xCJ6v4ZDYlpODJGUMVkCnkyUNbqQTjAE3QVDsCUA
-OQIaBxsAyggimEfa2fh82KQdrHi7vgkgBUsyyVIHZDU5qRAcVsNumJHu2EJgga/tjzxEdAJXwbcp
-FOSgn2ivDBpubMjCwEZc35QKyEXAJsHsMd3HNsC6FmSzZASOka0pMB5LVWZMjpW3NIgD5w2T4K9U
-r5WpjCwk/ToXbMAkiX2iTUa3B8cJuGNoGEX+SBDmTBpp3TuGaIpxiKCR8KM/SCcTQJ3V1jqTMcgB
-u1MD0lSA/zv9DkOQl9VNMICxXr0Tp6kZK2v/nW8+BlL2Xz4nlFZWTZqddOvgcY90YJnbfOAI8iLo
-wsDCata5jGwSlmUy7tdFzJ0Snmb6cyk8KtiA4RfPLd0kfrqTRaKmx+/ln2CcifRP6/UNr0gSZA==
-"""
-layout_big_with_dead_ends_012 = """eJylVUGSwzAIu+cVzOiu2d3+/28bGyRI0p7qNoljY5BAjoHv2oEInr913w+9VgNqnGNwDWBNxut0
-AERey7peIp+rF9UZQT2F+D0dlLfR9NpBUehki2AZbQprEGP5Nq8b9JQj8BwyhRACXtGZDhX2NrkR
-cI0UAoKUU8WrhUaVocpBGnJQyADM8V44aMl3E8bIgZhiml8RjAxvCpQDdDTRAOMTgsIP3BDM8lYG
-7wjMLsmfVR5V6Fi0fGL0tiuOKoQUd5j/xDgiIwk7xqUKpgD/UckkLDeFAwQCNwe0Llx9Jx6dr5oV
-XjvAxWiUsWvZCMaGGghq0RuT4UCYfFVgOUh1GOU0umBilioryQuCR56MgJLWzvDIeNwctGRhOWIk
-81brBHNIhTNZtHZKlt3Th6QWMB3srcwK23J35CHu/sAVEFN4s186VliOBb2hpQM+9t8DQZcR5j8R
-tM0HBGbHB4VmLQe854CNqWiwIKeUSxeuQkgH+5tar5fJVY9RhXTMyCr1tmUhYOjmFMWgEJabHEUf
-IbvPXjRbIfipMn46vzwlSfXRt64Df02hG3XcYkTVqavjNnIzfdmOfxBzEf4=
-"""
-layout_big_with_dead_ends_013 = """eJylVUuuAyEM288pImVvvc/97/ZKEhtDu3tI7TBAndgxaeb/xpMRsT49cE8y124fSMx0n/9tgHWu
-R9h3zfq41hd0PdAw3wS4BvylADo4M7B4TybuX3iSFXZST345LcsAOAEwsFkwW4OcJLFCD0DWERfX
-03QKmAwQc+gpBnkELqEmTAHkUMBQSj46A70QBYAWsqIxhmnwOoIGwHo7Cyc2EBkML2yCMUbKnUEq
-qCjM6hAlPE+6iMpwCxEiS0cxpU6aAOY52c3tlXTJbGBw+/ACALZGdG3tTjFg1f1EoUFrF7MJiznO
-316kJXuxfWCFrx2yaO1kqMtkYVW4dzQb7P6A+hL7tdJVwJ1ehG4sBYX4dVLD99n3apuPA4x1XIyt
-DHKXkcX1IuKq5m4sCsMM0orLe0AtWAUcThPjTxTi0E6qyeECUBX8cmAm+9bQR5dClfRUAV1771Us
-jpmvbrlJ0vymrasrlB+TfazevfBv3acoxPievWqMutu5m2zYpIu4uiOUV/fOYB8LdldL39qv/liO
-fq0WuDU4bziLg6rC0c4EAOnpv3gbL4Cv4I1NdS661jwnGcLCFcCPVSZMA4p4x8d5/sl/jucPuz0S
-KA==
-"""
-layout_big_with_dead_ends_014 = """eJylVctuxEAIu+crkLhbbff//60bsHlM9tQiRc3OTMA2Hur+v7jc3O7weNxgz+AZf268MkGkQh2s
-zxiIdR6bYf4tBODBAhDpMFLlB3FGcCPpxb+P3CNZInPEaq13AkFFbLypYFEQNUJV9sgUCXbV4h2p
-TGcTeBXLRRABEtSuW+jjLOJb1xsLksJmPn5Qm/uBo4rjocERWF1oCm5HjU5AfARxwripooWwpQOo
-wROESxIdL46rHamB+UG/0YruWwQkj2Vs+eDDXmjlpQEr6t7gSDB4pXLVQ3jvomGa9LkT6AaMPEbL
-syXLZVXwTQpEEG+TQjammtCwhwEotXywWmw+rEIW/I3dza0BarJQfmcbb12EcVCou1Dk516bF7Ot
-u9P3o4kkr/XBbaQ5bDqgLjxcSkrVhK7bjk96onCasAhRub5jO7aRUP0P87b5TxgjNoLomsSAEKyK
-Im85iMZdGALMnqjBA/zCcKVtvNbr6o8B3HWTInrenxpk/eJR3bLTBqXNSJDAodnVV2t0YQwbCMHX
-x/9ZsbnuT7972lMT6ecxVqexz9Bt0r3ZY/0vcf0C9/4R+A==
-"""
-layout_big_with_dead_ends_015 = """eJylVUmOwzAMu+cVAnQnZvn/36a2RJFOCsyhboHGrkWTlORkfjaujP9GIhCvbbk/r7HmUfPfDYBn
-0GsPj1gP8fqiwwm7P98N0BB4QqXCFkwDZjZELICNn/13zrwn9aWERtrCBoCLCKpZqim0wwoASO7t
-h80gxa9IaqrYhqq9AC1dAEQNMXC7MOz3kyhJggEoXBLC3ImexjIT6/fS4m1EK2DYqNBBGAbc2xqg
-2TCeVBxwSQbgmfKxzUtnUMfW0f3/NYtFyjOC1FllGrNHgLMOyrHOkBdj2b8LxzO2dZ9ZIFmr3l7N
-SZvYTiHVM8yI8JJv2M2AZYI3ACzPnYNEWvqsJ8sexGi5S7DGT7lvesJXB4BV0FrIABMbTONq+HTY
-zkJ6h4F+TQ1BpTywZHup1eESnoUElRmNKABeGaarHWgAXlOVg5mluvHQesCl9j6bbUyczkwx0J6s
-YxEjzQxXN6rDsrkWQRzUwjTQUAEA5oE1Ly+3vPlY9KyQWJ7A0cGUAN4Sffd6HXThaNFScbvhn9c9
-JVjJ394lcR98/aCvtC+ZqDCE9+Qum7cvwAXww3B7Z3bj43n8fexK/Ghcf6JbEaQ=
-"""
-layout_big_with_dead_ends_016 = """eJylVUGOxDAIu+cVSNyt3Z3//20bwIZk5jbRqJq2CTY2UPfv1nLby83jmhc+M8Pz8+cKqxvU8zxg
-LwbQoecFnit2cD7IZQI1ofnvE2Av1BZSsQLMAPxPKIhwphAnilNFGXBuvCFTr/d5s/I1kcxbAyFu
-0DyixCTREwBu5F5ZN7YY2BEVY8sq4sIyL8l9MmDG1iLWy50CkCyRCh0ipo0hcyO055EChjgX+dPj
-0vg0drlUlNBNoMW9lSVRFRJKm6FhRZyKWSM3gzyOAoGiMeYFXxqgNkQKuFC9YO3MiUy9ijGrYzmj
-zkJG58g61wrLVHsfAswsfeplUJV6ILCQYh+qcirBqfXh7awDLxfYHJnVRVcyMKtPAbIbqidm41KG
-CA+z2+Q9OZZXdFzTQBNmeNo2tPPrrTKOmsbQoPco2qjEi3pPj/eJNMoxUjgYsPlHEGtmPvcFKnoq
-X726DYCae/R4tkcOAFWiEAnUAfmuBJwTz2XjVGzQf28/50RkHI8U0ClMDvg4XTV6qeLiOGdzDKEP
-Q1NdDViv/g8XVJmYiJpIU0R+fFjn28YffadsGjVg8zlictBlebz8z5qT5+ezJE8boe1qZpMYVcrf
-rPUPNcYSxA==
-"""
-layout_big_with_dead_ends_017 = """eJylVUtuhUAM23OKSN5bbd/979Yh/wQ2VRHvacQEx3aSAfjfdUHk3HZRb/sj21NEDPIZdP9jAOeS
-hORKYW/BQBDvU1f4VoCGHOkjHxVaLB4jzvMeAE6AkEKPsp8tUXGhSRlwAeygm4GxblLLRLoNw4k0
-wHFie6eKKtRjWkZb0yQUxWYxq4xJNpCYFkhVgdvpxkB3k/VTghbmqU9jtwQE+5bH+8BZTRMOQJqD
-O9NAD+HNPbZ3Dya9jKjGdRfL/b6eEqVMfLYBkUiIdMNBpxQAL/ZUjCMuAhNgE8jJcS8cseaEGwBl
-frRsvCmNzUwyABZDthh5HQIsgFEjYviX58crg2dlgrbZ29a9DUjFPADk0Bfc2/TP/hY7ZWT0waTF
-kICGGSa3ptf7ejkEgJwfJ7AlwucvTRwO1uzWcVYTnpPn/5dXLZGJAXKnyhYZLqaEXZvgWUke+sLN
-IzQY9G3d0CKtr8lO5WXcQVW/dqQzv1pdgigDia4c2sROFz1lWjU5AZTBl7Uk2wHm3zHBwwA2qfAy
-/ig6Ejw1dc+Z6bsUyIuJf72uX6JbEaQ=
-"""
-layout_big_with_dead_ends_018 = """eJylVUluAzEMu88rBPBOdPn/3xpZG+Xm1DpoUs/IlCjSNvC/8cD2YH3HC9zvNcrs+wVQg/lroAcQ
-jeGfjDGb3P748wXAs+L8+TcK3ld5eM7JeLgrsEPBZ68C6JgnBIzYYnHSwTHivykiAFB1MhMXwBqY
-H2SjnPYAWJccsZVs5gSmJtsVULvNROpHiAqbjk8ZQgUAal0r4XQLuNOduGTHzLApTMaQYNGvOWyF
-bgDaeGhKTptEg5J6a/Mg6F/yDGtRQedMJbwCYqmeH3eG0dJIDQhVpylkRPmzW75MkEsjNbsvYiRM
-8KIwKhBjgQuA45215EiarLM0RvrCedrp/Q6mixSse2DD+1kW+1WpCKBOqUoVIDxQcuNu4chT2zB4
-94nUKSEZz/nhPAjRd0T34+OpfUDTjG88dDktmk1vYhugbBp9kFNjzD0ekB5solKBbi5oWTdAHUK9
-W0WFfFHnWWyr2gd6oLAc1Ba7KkisfoR1oOj+iBxdqRhiTLoogH1GDu+tQrIrlVkN0QpGnqQ7dIrN
-bPu4A8InowIlWV4j7JJRIYj8B80PjBfAh1xdJ+fcceI732dGiBI5HnxdFVzkG4Nvo+Ry/eN4fgDs
-CRI0
-"""
-layout_big_with_dead_ends_019 = """eJylVUluAzEMu88rBPBOtM3//9ZYu2y3lzgIBuORKJLyAnw2HggFUoP+og9SriOm8VoANbvABBCF
-5jtdA72U3Op/GwClf7W6Z222J+z/Rl0ASNb2rYNFIiaMC3cA9pzNi5qf3DsDeOkw5u6bZ7DQNdAA
-ZDeIo6q0soX1BqFL2AVuhokWVsIrSX8KWxIskNYODTjIW/kyZPfgsCCXCkJ9iI5k2qoxANXnagX5
-GtkI/oICmCYedtuDjQEVSf3nmjXVDcCbEXTyjbKpqL93obIELkwknUrbWBK4m1gMBOlWMxHG2uug
-PmUXci5CFnNnMKzpJkpjgLDMGbBtj8A1ImI2xgI1gJRU0sI4elz40t6Kga9CZb0KIHtuEijNpb3f
-fiJVdWTPJfwaCytJhFmPCyuATUWUjW01608T+65t7cpBU8Pcex0AyJ1aW7eXPre6lfUucFs9twOF
-26lzmFin1b+nWhHZPZjwvVCijzDjHQDR7CFQOFPi9Ip1AZlduBjWCOtFNyygmfiFy8j7TPMojNm8
-AYPogx/8Wdam+82EHgQ7kT4czy+J9RGe
-"""
-layout_big_with_dead_ends_020 = """eJylVctuBCEMu/MVkXy3+vj/f+tA4pAw9FAVrRZmFhLbcVjgf2PAYM9YX2taH8SK/pa+8idjzM/4
-ngF8z3ME8EUJMB9ZTmUY+rnPQMCZhIFgvqFDonlQnU0QG/KYPBZGvSbZETjAPhjzDOBBUwpiwoED
-eZ7QEr6GELTxFjET8BLAxI2ZqFDIAD1DK2OF55LRC1fQ40YBSeEVd52mS0v+KkCh4N8t50a247u0
-kcvSiU3pLWM3UtWPe5aVFW/6LaqAwhtWZbS62BSCeNaglLE1QgnqCGqynKabIi+PullfhRNfmwwS
-a6bhtlKjdVZh/4Y4RUkvWUryxee08rmJ0Y3TFXbw9C0jtDgq1FWDYKnzt0sWArvkb7TSGqvbtdWD
-DjRfvIAoVGrQSagXRCh9aoljuyTPZY+XKlwHdBEiiN+0Hp1tOX3kpC7K3vy1nY+L6bhQ0khef6l0
-obCvSOg5A6CnSAp3AYKJtxeWM5camSCcqLDEMZoUKz9ZPMeO4LAi9Q557dOBhAbZ+QMfKXT951Kc
-hkCAZEQX8WvL1xuBbxHLTSkpxsn8r2P8AOuNEbY=
-"""
-layout_big_with_dead_ends_021 = """eJylVUtyxTAI2+cUzLDX9HP/uzUYBOK9dNN6nM84jhAgsPv/xuW2B+qKx/10N8e950zc7xYv/dN3
-AIA//DJiNzwRkQsHMz58ksETRG72NJgzGeQ62oVyxs7L2Z4L8FmpiWIzThwGTqJi3A1kcDjHtnvF
-x54E0UHIYDgs+ykuHAJBJKMZDAAnVxl2nCIAKvj5BdYAFQPaoy1h8BrETe7msmKQW5WNMQKHd5B1
-21yvcJnq8G2ozXkx4RLG3gGgHQGoIFQ2rV1gXlKWCWB4AKh7C0+ocZZEJgb+AODQxJtstVLVDUBN
-ahb0yhteMsD7VCMBmHL0P01Csmot9it5DgPvz6IQZAGcCtd0ZC34GzMqTRUiQRwTqIbikNiwekgC
-HdEBmK3JoGK8FOtkbXgAMNZeARjVNC7Uji4sRmkBZC00NjQd7e2KzwJAFtMq4TAEVIegHe0g4kv3
-AzO1sxSrtT6+iSSPEkknw9aqBdqFLixtNydD0w+ylzleGSxy2cu69pAu7B4ZtABpAJnJ02VNhuqA
-K17nDnYMvMXuszL2rtaksHwL4q/nTgB8lNstvDoQoNF/HFGwN8DXuOXJgP0nzyarI2aduxMLFdKf
-xvUDusERqg==
-"""
-layout_big_with_dead_ends_022 = """eJylVVtuwzAM+88pDOif2Nb73221nqQ9YMAmtEViJxQpyazZ/+KxteKzw/y7f7EmsPoB0NZeejUA
-cu2NuRzZb/d1wdarMAL43AA4GERCwGQ1oy9qLxkkt5SAIJIA2JDWiQsy+AXAgM92FAMlYQkAdkIj
-BkU9gVw5PKmpjFHwDoAkrHwgK26up1+uG+PuFIMUmxSnRt0IUHO5u5cE7nYwpid/miHUIPk2Yq2h
-0cqyJTEEkyUfohqgOhPo3assMUY/F+LR8dCkBaAhdUoJBVplhx2JeNIkkgHjQobVJIFcekuSgeS6
-AwmnAkrCvVbP/ga7mkHPx020hJz6eum5yyKuQbnqOJkkUAlXx4pBn1Sisy4GNCjIAzAAmNcmfdTg
-OGA5spp00Yx3MVoCtV7o0zkfkEUnz3oOxG1Qm+FtiSDjFe7jLC+ANsYZ3L4JhSOtGEAkLKHvnQhb
-jYxm5T6HBEjr2xj2PIq/izXOHJyF8KnB/N2EX7Ixlnk+TfWcJZLhduIFkFUv8mMf3K/2rWoWuWvV
-p/5uisEXAdApsKUHgpo7DNhQ/hrPN1kpEZI=
-"""
-layout_big_with_dead_ends_023 = """eJylVUluxDAMu+cVAngnuvz/b40tipad9FDUA0wCLxJJ0Qrwv3EhCAbGL1/GYGzjniTvfbnUF79H
-gJjn5tn7r0aEX8Zb1Ms+PmeAmQMziBC0J4yIiD6Qxy7FjvlUQi3mJG5qufJbgJgskGkqgIGNlcpw
-apMBMkuY8A0VaCgkMHEqMLIiNVgppVjkImqSjDgowAiYLAsEY+UuYVpBXihYNYYLRUiazF+ETgpQ
-AMZundoc2rfwxLYTEnFFQ4FnP5IktNpLQWkwZlgeTQ0UgBWlKMRJIssYOJZCuCunK8CjEBaRW2mM
-MOmM69ZcYcrphKspxlnw2raBIJLjlqIQoM1IJepM8o5NQk6vRl3UCzQem0XeYHJDK11HQAV4eLS0
-h1mXjg8bBRTgdNgWoK5ptpy0iSufATZrWMLqAOUpFrnlO+CkYOu4/panVzjs/+xIz6ve+4fulS64
-LSpvXGenWmbxXTYqZLeBOx3oAA+PzoKvcCz2bYsQAK/dihbHPQtoLaPs+0KB62Q25D2ltlDSXG26
-U8jLoau5UPgjY4u9B6BLatbtScOZCD5wjqje0QrSvnluOUwKXxt9CgF5wrIrCAk8P8bXI/8fx/UD
-ZhYSUg==
-"""
-layout_big_with_dead_ends_024 = """eJylVcuOxDAIu+crkLhb+/j/f9smYDCZ2ctuK820DTW2gdT9f8dyM39Ow3Pq4fHjXo8hC7z6PgB7
-zfON/cpzVMi5iR8uK8BnMIAfiIY/8eTk9ZTrACobASxkZMz+KzLPCQFoBufZctIXY2ZcWlS3bpeJ
-OCmQRqE4txFt44keNlcVJOtJgaZTaijxScN8CiACRvJO6ZO+hQQ0g+AHVwddajkNDLlDAqCZL/n9
-D2m5C6D6r173JlL0o8ZGCQJgChDSXFlnOaG+rDL/GhKcxOgFCTgQ+WgVv1Y2ey0rDGpqdcoAskKf
-lH+0j0sY9gREH0CG6QBUcOb3qtCVx5PBO254GRvV9qBR+qpm3SRmk8W+gNnZvaAMfqkR+R/bx4w5
-7w8D5/xLxbpvRJ3TvwHQ2ehT3LwodwmbANd+2rNkTcS6r7ojdgXX2xkdyWWHlZkXBiCxrKxBkGZn
-F+ztQaeE+W/yx+cDuROGBKHfjsp+zqyzD+iB+me6c6NEc/4pMa+RfZB582sxN1fSlcmqZiDAh7Ye
-4e5vWqy1SnbnBviyKTUNyAsCTKX9+Zgm/uVYP98cEXQ=
-"""
-layout_big_with_dead_ends_025 = """eJylVUluxDAMu+cVAngnuvz/b020Uk4vRT2bY8sSRcoa4H/jgvmggTHLCfxlgM+NdKNzfN8O8JyA
-W+mIg8Szj/v4/Y6QpvE/HcFeK7NA0M5uF0isK87VsRWEY0Jl1cHbuSC5ZEXx3+EisUBjDBaOAUsS
-c28HcQLFL3/JwILE/MxuppN6LNRWP/lwTd7PcZ5BUHKqQVvQEXCQy/SJXuxCKMbkalpIsyllgb3e
-vBwcqPal2joYotRi7jKyvh0wwwo2rjCTAlSprgPFwwntLHRNLmfNYKRg4jJh2O8IJO6MSqGIY5hY
-eMt80LU5/grrhRUm+SkhQlf/KRU4NfGYLhUEo60wpo/ubazXXbDzUOZDiPzN9KoDUefUbRCwLdpL
-1EFfI/S17JaQT7nLQqYqKB7Lu7YOVlWjetI7BRNsQ5kiWLdsTS/I3cxvioPVqKgGg2D1B2tAnQo7
-hXGDtlwc2LtvoXnRhjdGfhfsNZ7/gWI7xAE3d41x1cHRvVnl2i1hxOrJkUI1h+wXdaBq8qx6d/Cx
-1zo4s+a5upuCYJD49WYgWMgGVAhKj5xUzb5u41/H9QPsCRI0
-"""
-layout_big_with_dead_ends_026 = """eJylVcuOxDAIu+crkHxH+/j/f9sGMDjZXlabGU2blIIxhgH+txbsXogvf2AObnwsan0/Dp5l43Df
-pg3Q9jTgJc5i97kRpGGHSQQYBBp0rGr7OHD0MdpHBBCzvIlIYV/owoGhktwv+fOB5dv7PhDsY83z
-QmDoeNs43AWsiKKJO1n0gRgOmt5g3IUDVw68OeozQZCskoYuo5/14YVwykEmWTxs/KawuGbrqItn
-FTw4bQSTQr8iArlkgxtB8riXC9t+YxBRLqm3Ez+LrOavjWC4ynjy5aLlcDrBvP2ulFGnIFEPwVAh
-hivKegdWlLIX4k2fEMOGtrNPtOngdvOL/q4CzkcRC3fXHZrIh56WC8JIPQZ5JzS/olj1HkJIr8CA
-o+wlPcpsFCYcvKhEqAJBsFNSe4ngpr/n1akwo8yo+t25XgPFb6p+NxKIHzeCHj5aKeGlyz/NriOg
-mkn4rxLxjJtOgXNl5gFrMtwRDvW4dcFR1yQqAmF76DQS1sMn+96TY6vJ2Q5kWremdbCzKI0gTv1G
-YJN8c2DCwWmVCD4gf2haAtEy/2bO+lg209cRv1OoDp52HgS6XufBn9b6ARzkEkA=
-"""
-layout_big_with_dead_ends_027 = """eJylVUtyxTAI2/sUzGjP9HP/uzUGJEOS6aJ1O3mObUAS4AD/GwsGu4ZbDri3t9y5DsR//O195OI1
-+d4OwiKW07Jbp9PuwCLu9Yytz0CghQPMztMcDjkwqx/uL3jGGAGFnpEgu80SdHM9FoZhUhCEjAg/
-ocGTXNkOfCKY/CkAHUBQ8mVBIijmoV8I9sRT+t8okPYRxStiAMHWsrSlL08HMfOWPpdeTdZOfJ9x
-InhLHSkYOVeYIWIeW6m99zRYS50lZ8hKni2VWV2SrJgwAY6DNicpJS57IUB7gkTllYLTzkeuzksh
-sANSMjURiXqejTxtER3DewlXOVQiGKkceMm6NGtNAMpdBVALM0hFzmbqsKry2QmNXC8Hnq06eIpD
-mQFXK0dzJmKyPqUMO0gYg91Yc2dv8nYoBMoZ+0cgaTJqwM/EWQfsO6bQ+xU22vNW71kHmRR/yNRb
-CZ2kqfeQCNxMHQqmx1jwicjUKbcrlwgoiXx5F3G2Z2/XpHC/paxpx2J4GYl9PYlrhb2piPpsHK9v
-FHTfpXWnPeCEKFGJ/Y44GLaW3jLYPztmEmHhg5FUnULw4N8o1Df0cvBFxrk8HfjdWj1dd1+/VP82
-1g+7PRIo
-"""
-layout_big_with_dead_ends_028 = """eJylVctyxDAIu/srmOGuabv//2+NjcQjyan1bnYzhIAQwnb/31pu1wdw04K9r+2x/cLV4/owwLa+
-RC+rxVvbdv73K9v2vQNcBshl5/djuOWHyYKIIVwbwfY+ARgFdWMFpla48loH5wls8dDz8bntvDAH
-E4pEKL5wFZTj9ohh5RolJMsQBKFEOKsv0QJPRlhC5N6/SCLipopq5XuB9YbA9c0Anih7KxIMUSAD
-BN6rIw1B19R+A+Y3VHZI7AiYeMjnLk10bOTgVJXtz794WWVH9GTDhKCqF3eCSSZ7QsCkVuJepBtN
-jpyXaFuCsV57lnLvgqghpayzEVJZ6L98GtKpMoUZ0kXzlw7UryaWhhvmfIzKckr25EBVQDSpRyJx
-DtqoeqW9eu8lBXVydJfzGFFrmG7Ss9RQ515SE24IQerzwAFsyrjNGIpSkgimrjl5bqtMXBKdXdBs
-jomdqPqUH9Enby1AsFVts9pQhshOZxNbksiW6ZFieHVt7Hnu3AtXm1zN4yOGtyJZlOBODnr5uY9X
-M+tGcvRZAs+Md0nw9JDqzePwuQJ8hTsFCM1Qk0c/VKo93PyW/2QJwQL6yXVfhSvGyZLEP6/1CwR+
-Ejo=
-"""
-layout_big_with_dead_ends_029 = """eJylVUtyxSAM2+cUntFe08/979aAbVnQXUumrwkfIdnCAP9rD6Ibgutn/3H3UGM1Epzpe+L3C7Ba
-5C+5UWAzgQFivlA9iM9i0BsUg2px0y3IHthfD5jr3oeF7lrCoKWI1G5LQhTavJBoACAO2b/4KYg1
-sdcdy3xNQARKwgWw2BNwCTafmJBunMqCwgKwGSTI23Fk1YmxGUDPJUFBLPSwlHc2EuAUPQyUOxPd
-UzkxwPFYOo4QxkTR8/AgKocUixSfuyAHaER3VKT1WYPIdB8AuTjapbDFDfBam2PlaDeJQX4rqqNP
-Jw5lZS1EM95OmLD2O+QPKhLyQTRQn5ILAKxJCtoGyiwwLnYQQOs4vIE55EsCdfjSxg6Qk1AmnBhn
-2Jf8MZItjqSFTqO7M/9TQXu8cowB1eNuMp3Kep/GqSq3c+0YH24fI9X4TJVZvSQJ4GRRDOhbhp3e
-9sMwoB99VSR2jeHv8jGbjo1Nqt8LWdUtgkdVcwkngPO5T3+6rhiQONKRyx6Fymolu8slrN66U+SX
-6NNoJWM+pzm/gW4rf8RYoa6uCWm0KKSZtz1pKX8Bvk7z9E113qyh6w+m0IL49/b8AKJbEaQ=
-"""
-layout_big_with_dead_ends_030 = """eJylVctuwzAMu+crBOhObOv//9tiPSmlPQwz2sRxbJGmKEf1f+1SkfMD9NxHu58hj3Zm1fArA9jY
-DIF+uoF60cD/LgZnsY/RjIakyIoevq8WAL4LDZTCMrwFer8GhbcAzpHpx0vf25DmwDiCMzkB1HYB
-pZmHi9HCiIwSseW5UoApjotx8KY0+JjGnQF0VlQmBTCZTqOorBjGdGTlQVE7AEhsGWRlsZha3wFi
-1v0H+e70O+H1Ys3INE6dtW7BSgLBeq7NFDG02rs9j2BUtmNKbAEQlRDmUHFLbvNzVrID0yC9oUGT
-wbR7FdlwQt/Ygns8qrKgdgBpiKR6NIA8mLUapC2kqKbQ6CzologW6jt5C/Ia41E9mTYpEuG1cRp1
-FmRaiDpavWWyNIZSLezWRipnszThtTgPnoVCu51uEiq7UY2rUomFa4MVQ3UUEzWUj/0GTmtTyxhX
-G6UqCAMIdMLV1DiHtbJQn4Z9hLqQpGpH9v1dLDawj/A41jN/cTUYNdgKEDOWHfPTwlkJy7WIX0uc
-xFKuo5WBcaj+SC965yk8R9U/xh/S+Md2/QKJ9RGe
-"""
-layout_big_with_dead_ends_031 = """eJylVUFy7TAI2+cUzGjP9P/e/26NAYFIm03rNy/jcWwhJHCAv40LZm41evIYuH/n6eawmHP9MwDM
-fz557zfAAwDIAARAzv4lgBJQLD8AdsLmL18mABDvFsDrKIAYcawZBMBZ835bz/N3sqUKNY/XCQBh
-gNnWqlQ8VBLkUooWgwkc6M1UAWwBFN3Q5AYo1TyPcr78+sbA4+xoMMqn5krkyWBwEXEuraqyOsUj
-qo8LRvWCgpPBNiylAfczu6K+GBDAobGcYaRi0UudW2d4pVhejFlfKXYuTCXEEkWvslQGvdVFNRHR
-paSo0BHRphRGzEcaugTtPhHRfe3Rw0Nnpd8aUMFu/LcUNnAafkEUqTJYVbN6QayVXngyk+4VcctE
-N7nCyGDEynDCeawFYM8UKCJCQGcgYaH1nPbmbF2qXgaPW1t4batk176dPUzBpWu0EokbcSojdHbR
-jXEwx6PtyaBUXFdil0L3Ql+VmwEBpvjSTxGxFto3zDaiuty0LYqn1MWARIfpauj3kQDlsnWjTR0A
-+7v1/PjcAB/KwGh+Xcwexffy5fME+C9U0y82zVsK+jHel+pvxvUFukURLA==
-"""
-layout_big_with_dead_ends_032 = """eJylVTlyADEI6/0KZtRrcvz/b7G5sVMlLna9PoQAwQL/GwtyBkXgb/s+E8gY9F3mCuQ7APY8ARjf
-8Ckgr+W9tPc+N4ABgrgPhk2UhX24aEGNrEKUe8Ctt0+RMB/M17inBpnn+2RTnMvHPKkMCnU6ADVI
-9iBFaGAe8GLQucC8HPDl0rmrRy6ABw5BvRGPgNABnLFTZ9gJ89O1Q81pFIMM9IjbyeEJKCMKsXU2
-mDQSACGa0IiFWUIir5ISwKNhC+STbEjIF52IiVWV2AE8Bf70ZL0AzGvFYOi8J6XZZcdSD4MBUoDj
-YuTkqiJPmx5aefY3OcJ1cDNR1qnECmLn+Lpw12q44PIG5zWvZAvI7CSRQWcAaQweAGkNRVXEDpAM
-5PY9ZO3uGm7i6OKQsqgSKZyRokl5dKaaXLVg8F4rPQsyqitknWpdWZcJ2vVAzIUrm8WACfB0EPHo
-3UAJEEq0LtRasEXB2tod5TKyTmMcndKpT7o+YRVWd8Fy1JI9xfdLo2uqXFbVbSdTLNWZ5KHvFI8S
-P6Q08viphwSBOP584cJX7xP+vEKuRNjPZH3Ur+2vY/0AlmYR4A==
-"""
-layout_big_with_dead_ends_033 = """eJylVUluxDAMu/sVAngnuvz/b3UsiZKcXooayEwS2zRJLQH+NxbMaOfadzHA+Dk35tP+T1981u6f
-7w0Qw1AAjnc2vU48b+Ic2OfDINFy1odvP7C0McgEeK4AYDzHA2JzI/UG8tcrTzU/NNH2RQTISwYl
-5wCUfU1lTN8HdlMZDKjtJcG5BANHY+Gm4xnGhEDgS6oDWHJMQhhrFMZbH8FGangr0XAT7VKRU4YJ
-EJso9kfLwnSvTigAp0LX05Juv2GGMbTDX5cDYgClhRhYMGAeqqAnoTiUihzkYGldcUtIJnj8Amww
-GMVQtwsylo2yWx6yw5tKFcRkMXCfrlXIPKByJKeogJ48sF/5lST350nQJomXByo39MKjGPQszky2
-CmOGUk3EBgNVVRasek2EMZ4rSyp3CiAP7XHu/QAZiVf2NgBNKqkjjLXJfzkBNpWqsWuUiepqreAy
-D/oaNWXPnCX2o31V/4BMZJ3RVKyso9GtxmiNqbmXHFebfulTOrLO8IKtVlwetDE+U6oETAnRN3tX
-Bu9PiGVPNF60FOGFD33U7mIowcT0pq1b+BLakcnbTGZKsmShvsivrvzXsX4AluISXg==
-"""
-layout_big_with_dead_ends_034 = """eJyllV1OxDAMhN/3FJH8PgL2/nejie3x2C1IiGpRm8adfP7F7H/Xy5attXD97fu5sPTprEy24/G8
-f18CqI9EeGiVZl99XgIXwv6Z7Ii5OZ/td/v5yQUHxNlLgwYTS4rD6pBN4BZbhmI2mBUebVUELuAn
-BnEZ80hUEEmw3+JGkGb0Z9EdyKoT+HfbRcu0XsY9qa5sx4gEdGGFEzi/iHzFMstiCLhxujDp5Xhj
-4KSunCCD5GH0W8ZkpD7DvJTAuFpEQQmEdmWF5yiBZAHWIAmY0GXtdYAuEJYRGYlg7Q4XGkH1UqaF
-53YC3AQoPcwlzUXzC4G0v7qAEMKIGKKURSAI2oThLrLaHgjq85G0rLD4jvkLxu7CmAQRQeHLcwgY
-AoRkqbShZFLfLOXogZGF6BflOGs2WPV8pHkKZBTyyaSzV7T26XsRqFlxBmOtbNJXz7uXkBjQrEZX
-byUw7uwUutDH5I/jdBI4YRIgIpzTWsa5TgL6hSKYl9c/shrbUKobD3jZxzQYK9ZjL6/4j3gJfJVq
-iyfN7mN5GeP84MIfr9c3xrYRbg==
-"""
-layout_big_with_dead_ends_035 = """eJylVUmOBDEIu9crkHxHs/z/b1OB2Djp46BqdVbHGEiA/9mDKMvcDRnqmyYi+4/tZb8C6NU9nAYA
-ZO5mAgTgInwbwBrKIZBIdhc5ZAzK+triBcB0liV7mwT2xtV8l7x8zNkCiDkY8gDjQmy0IoXYyJeI
-tYejQQYYQG1KCK8PkAYJUuVsBk+HBKqWn0KA3HxdDkbBGIvjnHmKqHhAFDF50CR88sV4cIha4aJU
-CviOvSu0fuXT08lxUAzxdwCQANE7ITbAMPCWxlPp2x5hlhAAAr0FiY8cO+g+ck7iimL75mMyFU0z
-4NBUAzJc24kg2AsxgPVPOQ8MBit1VqgWvIg9pJRF1SB3puDE4LC0aA7OKe8ObTHAFZ3YUTujewSY
-TFpEae25YrXFqrA8G+H2fXDNahcB+rxU0ZJD1cKwggRWcuGavATpRIJiclOsK5CFbtU+N0cDaJql
-kiqaBrKKTRWtAUyweGdN1gTvBCPRIxmTB7NpSUV4Lp0w6sUQ/NRCi1ovVHmZl4gfOTYieortK9Ae
-kzpJpCK85JrBly52pSd4C2WOC+FFAwP4Ia4ezmlHCPe09UIR4J/2/AGi1xIi
-"""
-layout_big_with_dead_ends_036 = """eJylVUlywzAMu/sVnOEd0+X/f2sskCAk+1Y1aRbLIABCTOb/1pURkQjE/eDK+33er5+/nO8jtvf3
-lt8CWKtektcWAPfNJb7l9XX1uwAaPOfR/1Qsjk9EuQEgDtDdVaoKcccCBFACiWMMpFlXTwat5oPQ
-qsI8YI2uVIAoBqmyIBERKwarD0uC9Ahoc6+QUWBQG1lMJi6w9dRdrQNStjGQq4QpNhnpwvbFb0dC
-jIR54sjOQcYZgO60clbE1oOA0CZ5l+wv1wkgoSvK5sO+4AxiKhf9ORwvqz1xDwYi4O5jUMeTVnc9
-kXUvM1bubkEYP8jA3Cndmd1Ii/pxLm0ehBPDeAEHRYw9IZtLwjMlmgxr84vDIYD3pER5lnOumpbl
-NpIMwutZWroJW7o8dmUifPu+2DbLdnTixwPOkJeU2Fnys2W5VRsV+XyQqX42QE88MO4LoBNhkX9O
-aG/LfTdcQk0G9JGIPhmcpXOuTJhspwdsBLr01gP/jdhHpjFIlUWPhX2a96AnBqQHTGI8a74w0LyU
-7cXgq23b3MtDzWNCjwc/R4b239LWrInTe6A2/nNdf6JbEaQ=
-"""
-layout_big_with_dead_ends_037 = """eJylVUluxDAMu/sVAngnuvz/bx1bu5xBUdQTJBlHpilqMfC/sSCQOig6EbPEntMvdvPvkO8D4MPe
-1IyBwrYo3o/hZzKwNdBvDsh9nVkyAcLwda26wvbH+dnlXNCs1FAUACxOHjtxWpsBzmrzJJ1wn1OD
-8yScHY26wrLI18aIAoo+jmqRqYNXGPdu2xFIMPD/EdPQg5PBULErZQBFQnaLkUiUHmzdUQmahb/A
-GVC9jHW47sWFCq7bre1sD3IDGBq0wRIFjihUMFhmhCiWG6+tbw3GTsqAQ6V8QjyRqrSTwXMGWXFu
-EX8zeoNNnXAXGjN3gJoBb/xzF15YKUs2BX150NRBGBo8ORBxCwZ3gHAyYOFKvwaQS7sLsCq1Wshe
-U7SwPsGhQVNJNZjSBkN56kQjy1YjH9XaNaDVivc7GsHJgAOfhYF4n2l6YTKoVBj9zBuc9bqaUcog
-Ih4b0DYXWJu0Vo1aeqdPBIOpTykD7/Boh4b7tZCKlV5jx4geLBmINGRq8FH0SSeUZDnfXNOqgGrw
-1ftNKU5qT0xQzKy/E+nvY/0AusERqg==
-"""
-layout_big_with_dead_ends_038 = """eJylVctuBCEMu/MVkXy32u7//1uXxHnAaC8t0s4AA8F2TBb4X1swMxpsv/eT5l2zeCO+P5ovNLze
-AQC+fwqgHbkHPjz2039EfPreCPLseILmH6M9j1aYDKoAnGHeA4PlxLOxDogAigVNe8d8VasxWB0Y
-aK4BhgbJwkwsd8cBwsmN5odGFuowpo5BgVD/c1OARMAE4ywUtQLwHtED1CIKu3XqQyAWzbvTFBKB
-yUhhDojCIR8SnnUWhg6oNDqj8oSVK5AKh8ADQWifLyvCSO7TtNYIOixxNEPqc7gSVAJjyTrVqdBs
-CgNWurNzsRGERAQ5yCLPmspZwrVMN1PE3nUtrji1aytBXQCWBhMahpg+RxmjGE47rFZgYh4XpK5Z
-Nw46dRdKbzYbTivPHLO9tzpVIyyGfxJXX4/hOzYCnspJonIiBYvCNREczjk6bB5W5t8TOZCVOaoN
-cnGPMKpcgEm5SsSPTRrU7kCQoZuCnWmKop11MWsbovSWiFosK/OqmCcM1cWr8IZAWdJi+rqP7aau
-cn2lwk6lwYVhIujcFIt+LnyJJfWvdTKpq6si2SaSaRd+VFCfR3PukBrX//BppD+19QuKcRIc
-"""
-layout_big_with_dead_ends_039 = """eJylVUuuw0AI2+cUSN5b73P/u70WsGHS7N5ITdJ0xhgbKPC/dSECQbwuEYy1OHeiH6HHfhG/DRDw
-q1qFzrxGf94X/957vgVwxmVtmJfoQ4Om3xPAEXtpwxungoIN8MJiHCeuPBD39drJxc0AwhdMM2iI
-paNyPEWZPF8BUvlkYG32BpPHlgRSRInRDMgTYCKbUDT5U61rwJ/KJNFo2ZHcm0aGSQBiB9+3DwYh
-K2WkbAyuKjxNod8Iol0qrEtlCOewzCrD6DpEGcp2thgcDYD9CFMoLbZ+gbbjugeV6SPF4rZMbBD3
-AiaU0lyI0W3ID3oW8WYEVAqrN+yGdR0G4wp1atqXg7QQdb0gQUcgQjH4Qe9mMqWBM2RVbAV61/qj
-t8nNIma/uPynWj6G3A6uwhsXJmnXbHu4tL0ZQQOw1csGUclnCiPp2WTuwQtbvqq1ZwbYwXNgNQDX
-zOQyu054rOAE8NuaiewppQ2uQH2bU25OM7CjY1YZ4IkaObCeJi/QzeSArBoegFSE7p5DSNu42ss1
-ElLESUN/OpvCG+DrzNHtOyG5OQ59Afwc0sIlkff1DzurdISG6j/X9QdAwxGM
-"""
-layout_big_with_dead_ends_040 = """eJylVcuSwzAIu+crmOGu2cf//9vGBoRwspddt5O0NQFJFtT9f+tyuxfuV9z76ra39qdamHe37zuB
-LuPF5cEzQL5+LgRw1gHifgciEHhvRl2AeNevm0KmZj2srycFScTFBOS2KiQCawQ75WNl3kIgBCsB
-nKgIB0PyRqDg1qPxBAQY9yGImQBD4IY/TuGdxp0AKxBayG2KaKrRsZJCZNmB4OOe1zok+sR4Tye+
-GGXRCiWWIcqa1l7YHyAiZgzV2QQQlQ8ZB6mi0AdYdi416m0tlWTCYaSIAc9gIyoPvnfElVL1wRpI
-IRE1p/BOxS5D7WbKkpkAEu/dTCGKSYKorO08QJItyCfoiSfDiWIS+p1yDgpsWqmSE8kOs/XJebeG
-l/CMrwTpCYCJKiZHw/0Q1JTN1EKDmimcLWXdsgQ7zMESOCg8V5PS7nLZ9m2kc1DuBVqzGLHDmscc
-KHks4smGgm6NIXMPlEzQKuo0iFo1IoeO1OA3GlZtxAQ6fu2gMMCPOVn8IbPfBAE1wNMLhQA8A0iH
-7mb6OP+uhlH6FLg34y//agTzPin0zpD8+HP9w7p+AIpxEhw=
-"""
-layout_big_with_dead_ends_041 = """eJylVctuBDEIu+crkHy3+vj/f+skQDBML1Uj7c7uJAHbOAT431gwI+35fj60GLAaPH/pv2rOH99P
-ABCyA/TZStHi7aXnJXzJ50ZAz3EQsCHgWbijKuiIE5vWCfdsBHyZQh+MqA8EzrUZUCiMXPLaJoxA
-4NOijaTOVZFZtS0KwR8J7gXh2bhlanGrGKsWh2JVTyaJWjKZuA9Unyo5o2iV7cSaQNwHWVkGcIGF
-gyQTF/tIcxD8UrpT2ipNztDQRDJUABy/ZBh0xWl3h3nFQnM6BeRL3fUqWZicCG1KxCNMOuvKnQUg
-h7uyXggRLevnIqVdrsODeIlUSqIC1Gs5TxJAHVJOzgBZcNhwyXNQxUtCMFKhnBikEARoAvst6dWL
-5zReZlGimx5zVxxkCuONoDmjDkJvU1JiSlTXgNZA17mh1Lsszmxo5hQ6QcWdXQN5uDxNb0wLbfQD
-e70UO8Qhd0cimEB2s89kLYOl5tGHVjVZgV43ADDi3oRoPXHmKQITgpzx3euyrd++qQ8JwRaMuA5X
-ChMG0/HjtrG8Cc+duPCRVr5OKpAaMUyubcp98KXhi0ndqRovph0B+fbB38f6Aa7MEeY=
-"""
-layout_big_with_dead_ends_042 = """eJylVUuOxTAI2/cUSOyt+dz/btMktoF2VjPRU9X0gWOMaTP/t66Me+3LfQV4uxb6DTfA/PPbAKmw
-vO/X4nVi4Qn5WQCptAhBrtu9N5f3EgBysUdG6HRD1KNE6CBFbg1wGOxfKKvSQ8qUOhl+MDQQwDqg
-lZCn6mKm0/beAKzzsDMDpBoUxczBk8EREa2EKAYbqyKbFtcIVx3uSwNgCNIa7HACuIumirplcx0Z
-PHw4MdVsajDKZhdQdShEJbQeHRbYsuKUgGh0Nm846QY4TYvITvUAbCUq+RCctnyKyHQ9MeGhQc1K
-HA0SbtpwYgeonKZAZ1BF9UlsDJqNpBWoQcvRBE/WysRb7HAXuIAWsYujo4/ymg6qDvpALuRgOnm0
-kQAD/zDAQxXZRf7po2yXoZXQfBlDA72esjIpR1frkoc5I944WC2UcnahAGA8v0XoQgL08PWPAF9d
-QLeR201He0ZL8dKgXlGRfnMhikFyKOqtickgrUH3QH1FspVgYTiYlwUoLTA6wvQ2C8swUF8eThwL
-p5mNQbgrWSV8KPa379fJqfnKVGwBfD3SUPvxeZUc/gAPJ/59XT/rERE4
-"""
-layout_big_with_dead_ends_043 = """eJylVcuOxDAIu/crkLhb+/j/f9smgDFt9rIbaTqdQo2xScb9f+ty6wW53l/+jDxvzb5vgFqmNzu6
-rk4U369CcO7Q52IgKfuKSs7Am7Z1mQUwOGVdAbRdApGGrNyfxSCC0kZ83elYLRRHDIESd2vA11g3
-yixyCXBoI+ldXoIToMKIXxl41gcZMBUdLwYLAH4QkmVWC3aKCc/hk45NiVisHm5w5UQ5BCIKlQsn
-jUQozSBAVUsGmBXRD2pixmzmE2pQRskUmHBwawDEdJgCRI8IEyBjwHoxicQC+1iAImJLOzUflJ4m
-BcDJxHjr5R1vQREheeh0lDTGfmKH7kZRezYZpEzIGc1S7flDW6OhrgAu9Ww8ebvLJvpIA/voir8f
-KZ1x6WyQdaH9Pt0i4rTutHVOJvFn2/jesltRL0FNtzs3wLIxR0qPi7KsRASJNDUvgOJ70CgAQAbt
-UDdUDN71yWBPhzRpyWR30iJy2vT45olgkjXcoIhjwwwhrQ5qL3uHT5d/mDRg+f/VKTKbxz15+dfk
-dLr1IdAYL/lz/eO6fgDHMhHs
-"""
-layout_big_with_dead_ends_044 = """eJylVUuOQzEI2+cUlthb87n/3eYRwJCmsxhNpL6m4cUY86nZ/9YyAP55HqZHb2zb/IB4s74d4LFw
-v/Fs/R4tAffzOdm/ze1oQ6zPB8DiHX8yHXMjmdxv48C7QkBy2MwJa7dFn+7+XRAFYJN3HsEwSAf6
-udAMFH5ph8blAGjXQYeuQeMe71jEA7QxZNwxOvTUgDhZtqyNt4VlgrEiW30rBaBuhCX35aJZcgCU
-+2TdWWDzbxdSyE+WbEMDe2UAUqyGhINBEsyaGwAQH2t9io5vVpaogzy7ShmnE4z1wsHTGHf8wPJr
-+NO7LS0FwghhlFXfycDjcMb8Ws/qhdvOUsU4LtkhRxXSb/x43VEFpeqhweH5V8mk79YaVSZL+VB+
-5A9XPiPLU/WhwQuHKp27tM7KW1W1ZazWUBeyimsrcPS7GBhPABE8GSAbaHZfT+WsoD1CrJMRTrvD
-NbYrRUtEbQ8f5NxQFwbrY8yMCWR3Go//Bp7TXFO3OW4G96zEDLwZjLlbuFcpF52c5MpeVoayUJRH
-M3UNSWioFCz/bVCzW7Iu+xiu5zQHDrzgneEzOdAZfL2JAUUfJu3Qm1EwVwh/XusHcY8RmA==
-"""
-layout_big_with_dead_ends_045 = """eJylVUmS4zAMu/sVrMIdNcv//zaRBJBQPLdWJ3Z7EQiAkAL8bDyoM6ADigXuy+vRDMbp7wdgjVpf
-vyoAauK+ZMycgfptBlhvVZfmRtz/4jXrPxKw/1iawMXo3PwMHoKH6UvJAphifuM+fTvAfCQGPCz0
-OWBSpvqb2/2xBBM9tJuPyuBIbOenxJZaYWIzWKqtWXDj/y7V6B+MR/oNYDFbawdh4HyLkv0B4Ngo
-BnVbjqnPwBoTYbd8EAOHINsIh8tFDwAdpPFDXAh70+1pIQZIfcMAMUcqON7BXVgmOhccM694iz8x
-6MR48bhXy58i3cbz3Uw4iNLVDesc9C2kXKFeiKcIyr3TWoBITBM5rQwG1he6lwdnZlanPAnqEZE5
-aDk7RdFodKrAbksvErHaTwSADvw7NuhcfeWtDHDPi5XDiXM0MRc6Txu1NvrVxnI02QzcsGCQO/De
-v7p+bijwplEJoByoC/YtN4+MtL06Ww/hHIRj+Wkt3aIp0YGeHcm5eO/9fhQnoHeABrjmBSm2+Y5q
-R182toTb+ADrYvQ2WBnvB7/qNUs/ZLShJ3S+bE8U5T8h4csBxFkAE6Qygx+O5x8EfhI6
-"""
-layout_big_with_dead_ends_046 = """eJylVUFy7TAI2+cUzLDX9P/e/26tAYFwumr9XjLJ2EFCyNj9b+NxczPE/zzl/9zc6rEH3m+fEcDj
-OgPIT+pjeKwCYjWAV6B/xWCGN+yeQN1wMSkGHPWMeMzfzNjhUzOz+PHNi6hneX6yeRlmZfyeG15E
-dAlni2KsY4BGj3sxtElhM4At/AogajnVQwcoXgs/lLIMAAZoBpmHgwwqXgI0281geyT8QA3SYScQ
-epUzTVDEdy1NUkgR1xpl4GSgxqn4VbhVRqNTNYWyClWOJ9REz742Ep3Y5m19228JulnCilgbafAn
-j0zBSIvwMylGklchUpChvrKUMsS1RaQn0AxM9g80eWFgP6gzCNlw0OAQfBGxDT1ePwSSmKYweWBp
-cPEoB7fhdgtY3nva8t4YQO3K9nEIAiXBagoDsObJkk2WlnSTarfdwK58SygbeAri0hcoxTBYXpf2
-PvPsNaYdaIx0i7Pa45jtJeaz8LHKaFSlNJgSNlH2g2kBtO6ATBnhNzydOJXpw2OfHrITrmPoO8DH
-DmA8w1AtDOyadeoBPkxOgP833v3G9tMMvIn6Olh+N54vluISXg==
-"""
-layout_big_with_dead_ends_047 = """eJylVUtyxTAI2+cUzLDX9HP/u9UG8bPTRadu85w4GIQQjur/xqMQG5xs6PqHTesX/U2acf5eDs4h
-+8LevG7XQ7fH6ehzOcig2H/wBzgCe5lu6dy8+rSuh6/CZG/Z4dX9uG2kVcGRa4sDTQRCI08hNkRk
-aWvdwcYCGRSUMYjWjQdU2j2Z01EFzfJE5mUTT3TA+6Qg87VLuWGjHCFaChbMmdPbShRc79CFwZhC
-kIcsldkEVXx4QaDuIKn2PSglZsmjMm8cdBIZf0cDEgEj7pWXXgh/KbAEGGlKT1NKCCqzCo36LWWg
-nKI0XTrwGj9DGNoF5fQnB0i1BoSB4HiD3KdRxjuGehXwCzrtKRijlWHLOBBcB0qpqgt0kG3TfaBs
-/kb1jFGmNQvuDlISrVkgjQO2paTKor2FCKozKgUEXKEyJTVeB0giiM4YfV7lP3x7+tZ+Wim8INDe
-zu1IS5lUFW4OWlMwCdUR4iDxEkkvGQrBlCp6FUoIZRxUc43ngdI2xDYdlJM6MSQlaAkdUHmkNYH1
-b0i1s4SU96cHicBI/JCeQd3xNGEn8ujvneTj0a/pYH5KEfniqEKW5+6FP47nB358Elg=
-"""
-layout_big_with_dead_ends_048 = """eJylVUtuBSEM288pInlvtX33v1shJMSBWbVIb3jDx9hOyAD/aw9sNFq28QqSGEOQsXr1DrEBnwnA
-3I8AsAkw+9wz/o1mNbY3fU+AmEctit+a4AK1QmFOlYRqKABf6wDI4WRfmxYDbyxjrHXM3TJvgAB0
-DhQirn8ZG8/iGfgPTCwQEkwStj1oQuOsAeAhO5vELBkxRo+QPdf5fihtq0zfzkXRHR6M8FIoQ+is
-41EciCXhDX2PhPkiRnpcUQiXU+0h5JTqJByAZpr6eohVcrbhNwbQQ0wlMHNnT8VSCxPVVZsu+u+F
-zpzo0eTMg1qEWPGys4Bbok8Jykd4+kXUK6ACS3aEsXmjUZIoNDore7kYUI5pQUoAJl7qFpzOQDMl
-JAl2qzx5igMwr6lvTDvbM7ObbFLCxMukQOcp5FoUEkTF293Vcny4DS4J94oqI3EoX6vOkoAqPNtl
-xDPDCGF0erBV3tU9C+3tEjcHKevqW3wHVlmvaVxWhIS4YzulKmw5JVaLBc7ga2ljfrRQKJXx87mL
-XYWME+AnX7V0QAO4Xtc3VySwSfhze34BEHMR/g==
-"""
-layout_big_with_dead_ends_049 = """eJylVUlyxEAIu/sVVHFXZfn/3+JGLKJTOcUz9tj0NAgJsPv/jsdtDryf+DmXuJrHusfpeZHjeztQ
-z3yoBZyTDmTV/fNGwOjL5zHFjuMmLsSUv0+5Q3zp/USrLeHTc1OZ0hkdxF8Sh+fHkoVO4X0qDiQB
-CxJBomqp3RBm09AkIjEw50DAb5kZrdFUUqS0QlmJczgYQCsJVawsAy/vIQhMo74E+MCHkO8JnX/L
-FNpnrSuCo62nJf2fvaDGiQCWUnY9TcFYU+adwIhDFRgynGNXX3FdT3SA8rNUqEg+8Wx6gfggRZAA
-ycGym9zgUmHgg+VXCDqrqT64dSGJ012KNgjSahI/U4CViNZ0KYlUAcuqdYSd1NXtWollRzTjIFAd
-uyAr0EGAKkFInYZSVX2Dmzp704WLRC30RrAYip28bRXCngqPA7atdgCZFEVVhWRbOsCF+nMPy77+
-xUHNJin0v7pZOn1XYtVKo1tTpLehJ45BEAzXbFtf0SO1Pedm+FCFPSN78o04Xi8ZuzgI/Z+eTYmh
-B17oPyaCY6R6BXAqk3Qhv7fYmsp5XC+f18HHrvNIAbv6Vhf48vk6+FoBhETtBchb90bwz+P5ARzk
-EkA=
-"""
-layout_big_with_dead_ends_050 = """eJyllUuOAzEIRPd9CiT2pfnc/24TQwGFs5hFnCiOPw0PqLbdP2uPWzaAfXytB+xh3Oim7XcM7Aaa
-PH04ev3m49mBtr9vAzAFiKc5BbfAWPx2Qui/Ps7OLzy3v/7MFmKgvRSBd8QzFjYv9gDR7BwDtcpH
-T0vvkTpfCw3YsTwOGXmZyg8sDSCTKFiO2igEmrxhjt0Vl6SovDw07EQXkjLAAeNKipozVsF84CSE
-hVMLueWIxDuJoAGytLvLgBKwyhNCJbpLVZpzMQAV9DIAITAqrg24QqkINwFG8khXPnUpUVadGUUa
-gKPd7ySWkEqoiToGbBHUQpgbUXsI/5Yr97987yrYIu0qMJ5EZRouJV5innzJMZApGdyMXKTccGji
-lNwICFLrTcCXQ1V4a7GPhyaoKuQMhu8fMYuQeKjyowSYOdXBfuPszsEcWwwSF8E0DJUocQnpfMEk
-YoWwxIx1qGo1O9IREtaCEAxVl+pmlhe293IsBlDiHRD08bBOfFXeoyJkBvk2xI3imrv3e+cQfBWA
-aM7GWdxK7w+KgZ89Ud1cPuuurStYLpYP2/MHEHMR/g==
-"""
-layout_big_with_dead_ends_051 = """eJylVUmOwzAMu/sVAnQnZvn/3ybWQtFJO5e6QBPYMkVRS9w/W8vtWrDbAnIfcebGx17e/26/AcAD
-WQmJtHTPs7rsARYXvzdAnpUBlx9vm4oa0joAEm44yGPfLWcDlizKbCVZLwy3g4Zxr+n3RlzzC0wY
-wJ8ACGShVUqQ1gXgDMGTnY1+CVDhMlUNsVOUaZQA6cjU4V1Y77gIoCZNY4pjTpnXjIwh7FcEIEzj
-uHuWEEaDt3alAaa6bKIyFdG9aFFyz+p7VFeLnQxwMIAcA8JABKn0t4zhpJqp3RdA2ANRbbADohlg
-NAD1TWHpveQ8NCicEWZN/1Vja9ElALTdiyj6v9o5r5Mgb0QlIjQBR0J5SC6r6oE5hB8Qo0FISxcU
-MxigAIaBMO6iaxmY727nLomRSzSAMBBUeSWA2935szKz0JE5K0+r6sFYB3g2HwWB7JbPFYA61s7u
-fdXd2v450qBpHI95T+Zz0+D0UxEL4vBoWspCvEKJX4WQ6T+4/zNhp+jR7Vz+RSRn87kUwYyDYdDh
-6vC1/pSIZ6UxhhfAF9lSSBkp1E8Gk0uoF8CPVOIcgA9UAz8/wLG//MO1/gCh3xEm
-"""
-layout_big_with_dead_ends_052 = """eJylVFuOxDAI+88pkPi39nH/u20DhkCS2V1popmqpY3BxkT1vTVUROZfBHYVxXx+HsDAsXT+fM93
-BRDf+OzP5dF8Uokw7+QzAZAA2rPNmEIcer7lF/zsAUDJUpKvR+nxCRMUdALIRrVXsEKat6RjtTwA
-ygpwy546BJI2PK+gvM6MaKUwhxDPKaAAWAWNipZtTdwF8HsFqiUOjQspwPK7uoOR5Y2mF7SQnvvI
-Lj8mwNFBeXHvtrhRMAHcK+7VqsgyOdsoC3lkpOyIe2wIRV0EseHUpC2NTk4NEPvB3nV/jhgSHLQP
-T3p2oMbDB1E6pLSv7DyERQznaOPSKrUzgdrAabVlLWUFbEPPvktYS4dnNQptbB1LNwSJ5q9ORxtm
-BWEJNvqffiLjFJH5w605saprMOusBCWrQFl3n5flJ7p9n5ULhZps2fZQV/zg9Q9HlhMAKed2ouCv
-CjJROx3uEtr5568NAGm2pter47VR2TSoJ2sf27OfhlDaSOk0vQK3xVZBzPEy0kekCcJSUjYd1MGT
-BwG+JClcSDtVMGM3+ZqFd9b4AX2EEVw=
-"""
-layout_big_with_dead_ends_053 = """eJylVUluADEIu+cVSL5bXf7/t86wmpleqqZSmybEGDAM8L91YHtx/4v7HswrGGH3j8UzfF8AuI38
-lyWozRYBgL6ytPVjs09lwPIS4OUljmj5KBgwIe1msNZlWXzrwWVNjyO5yx8HSDfN5MmAls4dovcZ
-RAFI6hoAoM2+onbufdwhGF5rYUoWWAwgIfg9mRsNAbBFG0PEsQKA8gyTQU3Lhd4SwLAOAKop5pHz
-vUOpEFVDlV0po6Vx7heDMM5CrowdvzQuv5mqp8ojbmbwmYsjAS1BIZBTysugHQKmUi6fzWiExFUc
-qBYKAA0Zj2irjKy8IXXA4nmKXPjkNm6AwiwljGCbQfHqFnRXHGONTOI+DUlbU2BGgZP5LctVxuor
-z9b03qqfTWuIjm7ks0FFL0ufQ8HzJ3QOpIF6UjQcqytH4Q99HpgEVADdmoLbVZgsVxIrbpl5bTrt
-W8+yNfMoQkAJKIZfN8+kkXgtkxyoFrooA8DZK+boYEILAM6+M/gEqLIWg8fEZgw/Tg5q1vMpqNNF
-o868zMKej9ZHM3AvgI8V9cy8GQVS4d7WF+4C+MJ4gfYju4yyHt/e96ftz+v8AGWaEdQ=
-"""
-layout_big_with_dead_ends_054 = """eJylVEuyhEAI23sKqrKn3uf+d3vakJBW32qcGUdtpEMSAD47DoQdiLxO13n9zhusB+hlPs5++nsm
-OEPA03q3MvM+LEHum53f7zNB2nOHk4lCUGnSllMJsBCs3WZH7paMxnrZcMHQDQcZWg4PHmhpUDM6
-oDkgIhIpuCABJO/23whYaf1PiUbXm4RRMmIhykEQyuUqpHE8ZBeJTmHOu5UnY6tCSocZqX/ZEQW5
-ZCQPvXHuNqMKUGbCYxE3eXYdyYGVhRY8yIwXnRRwRBkEQLfBZZviE0o3liiieoe6PhDaMaaElQus
-3yS9tsmqqrY7EPwogRQ1Et3BqUgogar0QHiSB8tQgsGT1rHjp3L+kDkJUAnEO3R9ayZSelkjZaXK
-JhnZHLoZ/AntuBmlZXwxB69o3v09zr0XBHSCsd/mSRp8he4JzCJsuOnnlA+642vp3kzDMC84dTt8
-81Mr2sw8ODAG9okSRb5Pnirhn1nFF80AMhK4hJnKkVML54LK3aes5AlT4alj6a/RnoNDUZzK+8gK
-a35VbAN9c9iayl9bt04ibFUQV/p9cfATmrrhJoaTKJuZz8jBh8fxB2WaEdQ=
-"""
-layout_big_with_dead_ends_055 = """eJylVUluxDAMu/sVAnQn2s7//9bYIrU4p6IZIHE8tkSRlOP+v2u5wczhz+38bA/iWReQQx/Pzw6w
-49gO0wPENF+VzTgRf+z37ycAFG7DaAgq6RkeEG1OsRdj2klgDAfiitsoxrmZswqwE3QOnoVgwrOl
-csM8Y5PEgwBZMkvY5JKMUUpHs5eszFkISNyhzFspu8LMfWo27wG07cCMOkENA8yNoDiAErxVSMEo
-IUIPJxsZgHULrRAwgDFi4y5NohJKRJN4g9VYdNXgGUALksnODNoEhhreEfQAILwEZKwOVxHlA7qv
-kMrg7mjGeDXZTSLHRSZVKKcIAQqBj5m0ngtBsnpu2bQar5c9ykh+HGJSfRapcSKolkf5NEpG9svF
-tnwgZqRRlYDmg65x074HUBwtkI0uX8GtUaV2HkU0wVxkmheZF4mx4VCmQ6S6R1mHllQTheBljyAA
-dSSlkeqESRXk0xTBUnW2Zt9W505ygPdRZbWYYKrFyJj6ZTXu3JurggtwiHb6RzmwrkKd1LPlfbo4
-+8brI7N6QZX7/oxMFZBb8AT4SsH04Wqfsiw5DaGmlSuW/5QmAwneTdY4CBh4N9Ofr/UL94IReg==
-"""
-layout_big_with_dead_ends_056 = """eJylVUtyxTAI2+cUzLDX9HP/uzUGBLKTbtq0mbz42UIIwXP/33W54f6344LVmvt9W9y4/9zi3bnv
-ewHYgWn7hzwcQerk+qI2fQZAhsTwEEKBE08MqlBtBieNWstNdWdmHkR6yzV74gm+biwSKuQKRt66
-FUCGQgM1/sag9EwA1KcEGEB7YdAs3sQODWI3nsVckTr5KZ9rPa69dGDhRUSeg4seIYOI2NGHBUSd
-OhyZg6suGkwZIjZaQXjxFQnEjs8UxiTt1/SvT4mMqUgZayfSCGBQ0IkBUGlM8Ah7nR1gTUStZKXB
-nR5qBzLFMtIphFXSfXzMVP1V8FIFl86RU6zohj2PGwAkt/YBJLedgdHeR6apQUnq1fhWijn5gnSy
-GTfPtga0Bsmh62A7naMVFoC44nBLyIJWFGKTFoIAZc8g2QXnKl8ohzwDIAeEyeRgb89q95jhLYVO
-Qs6RAbSCjI6u/HW0wsCfZ3a3oWg2g8icrpQZ1gq2gJxWvjUTckCkHt1uu5VkMgyTFFEKNz9Js+e3
-me++t3P1QrWadI6wGBGnjB8j29QDnCC7xo9fwQXw1fFpRzBjn5n4mPMVZAbKX6/rB6LXEiI=
-"""
-layout_big_with_dead_ends_057 = """eJylVctuwzAMu+crBPBObOv//9ti60U57WFYgLSJo9AUKSnA/44LRouD8rsuIMugwfqIa7xuALDQ
-bGCPYDDxFMe+F4O5SsHHPh3aFN36P1KAUL8vGa85wHrshCqm6V2DEf0MODCDPYu3iV6f0oeNpBOF
-h9Y3AJvQ3jlCc3tgpj/2cg0qCTpxX4GKYnbcJaHQYOIHg31FaB6OFJxdqADQfeKZWrkSO5IQFyiE
-CuCOYmRBeEjvkqKYujDKD5pl3YrQW2K2Bi4gG59V+e4BAVnIV+AA6Qs9N7RxbiVNdQ5mHqgMREZY
-dgRSRLSJsUcavhi4pjzkXQwboDBnOUgdRKR1nVV8dVZZmCPAtgtWZWvNIIJMFvZASP0ovRD2E1kF
-T++gt4fvV7eHVmTWcdrANoAKSnHh0dI0TUEbQEleGA0wn25YljZD49S5Z+IsiLOX0RqzH8KiDqTN
-xgbVHSwGx/yRXkg3lFALcI6N2ut6uzrGoG/fs3Zkpy6M9Mc4j87SwW9R3qrB+HJYflBGNZ4mbgZf
-g1EmTdXg41jm0uDnMTatPgpZdR+/v/YYaX8+rl80zhHI
-"""
-layout_big_with_dead_ends_058 = """eJylVUluxDAMu+cVAngnuvz/b/WihbLTSytMxoljUxJFOcD/7AHNDH4tgxEWE9jTXL/bvgcAxqID
-oI/dOs7nAIi1BbDMfc9/XlvrdgLkSsprJiINjpnj9rdnnsNxrQxHmyNYkhHQi6nJQUBXgAdfLUGJ
-DWPhrALabG6CVKEiOE1S0PQXnFADT9Fakq6DNt9eBiZ7AhuP28eqgkopdkkE8+n04WV+BcArB51R
-ulwHgRNgZbl3UMgC264cuYkZUTB0gNpRETSAMIbqM04vo6bA0lsU5RARwoFzUKktciKaCcBQ5HBu
-HiBNxLd7IUjeul+VC/+YcssO3x3ATDsi8KLlPJOx6KukoNc7qiDSQ1Eg6lHWLKIxbyZPndnQ94HC
-vN2qiZpXFVIZp2RKThJBXswqvEuVBVCq+AWgqq3yYzydLSiPz9WfebrAVSvSY/Ngdp8HQtYrB8LP
-inmVkVKW3j8HOHtzmB8olgQ1ESGF5IrsDGgKiA446bA86dHTp2QmHNwfDioH3XEEPAA+ep72Zpc4
-kVk9+HrbkR9TOdJAuyJg6eCv9vwA0i8QtA==
-"""
-layout_big_with_dead_ends_059 = """eJylVUmOwzAMu+cVAngnZqb//9s01krHPVVogyCxKYqiHOC7uGDvWBczrp8EsF7CzvFKgIpxi4AD
-jQVMk4W/ymAkNs98M5j4Toi9pwDAgQMBiB2+YDFYf9sAhL0DOG2SKZCZZGEB0NOVgDuDXZxHF26A
-bcVH3clO3yWw1hPFofnY1l7HSAZMDVKbaOGQm2PfFOBOXCLmc5QkDo32QGyqfiFLILNXuLcF+epU
-8KOhJW1ZtzaGcSxKeZM5G606mwDBPNRU/4O1Izw98ESDtRuJZ0FnCXOIKOaaBphedEHCyseBhDA4
-vNwBDnlsMRBpZ3DOU9WVQyAMOi2nawgh5Fe6rNFu98HozKNGMA0ahXTHA0CqyqqpA5WmWmnTc2D5
-oIQkhQvDSNlVZy/jdgPkWDT5kiEHUWYMOXoL+uq+n0Z2CBKJ+2CidCGzPaRsALVhHqMXzpEs0811
-xiW7BhABMJaM8zQABH43Uj5mna+0DwzGOVwALbfUYQLwkMUBfsRK4xvGsDLl06QTewP8fdS9SxjR
-H+Bp5S/i+gfGthFu
-"""
-layout_big_with_dead_ends_060 = """eJylVUmOxDAIvOcVSNxLs/z/bxNDsdmeU1utdIJxUaxW/Ww9Ku+yhy9dHwoBKPX/pvFKUvC7APre
-RHs1VdePQnUhDHVtyjcBJoP187VeKC5h7pn8CcrBTaG0Uph49RHs4NsFAKfYLTYKCdJ3HdUVGYMw
-6ByGfcIJyo47oAWwtmmme82TREHFM5/JILUs8DIZRCYoz9QkQPqYYbCFME/uFt7giMYAM43TPGi6
-cazInC6M0ww2o80j9D9q0QCcbaYudOhH9254yPrJQnI7IAVIvhadKrb/XNibghmQHU1kBHE7NxXl
-yp4f5vkCsIwd20c1X/CbC3pwjOK8+RXPAdAtZOo6WoXXQopZSHdPTbNeZ7K9VlsWkDo1f6B7gkal
-XVwYRatRidcQjkKyIEaneNdIlmx01laJjpIAfib6tabpMJ/9fnchusB4tzY/hozDeSgLoHNTSPRL
-Z4Bj+tVMrGCHoxWs1n5SYbAP5M2kcWHQqk3yeR2BMz+KrY+0y62xjdYQjivIAb4sthoXRlRCxvOc
-Uh3jBfiprXEdiWSH6bpqsRWcxM304Xr+AK5QEWg=
-"""
-layout_big_with_dead_ends_061 = """eJylVUmSAyEMu/MKV/mumuX/fxsaW7JNMpcZshQBWmgxxP1/bTncovl+Pe/9Aex8dn8PPB2cb1Mv
-Zu17AzwPRhOAb1QOWM363TP7DIANGEsTAOxz17tBEwnwgKYEnGdRbMwajt9QB0DsY9ovgJx3qrGh
-4wGAiz1NrAHr2C9SUoKDOuBWSOnBmRV6Y988OLZ4e2IwcKs8KovsZ4zhH/PjFs4pyqKbwfRIX3T/
-Eoq2PSvilNDDFBlNAlgBqECMkQ4TZXZbtkZhBVrSoxRvY4URP3AY5ArZVqUJ47fLzjoxkjB2ytOD
-VjFTAiLWQ9gJ4C8M+NuzSqRZ0ThSQtrqMlzL0ojBoDzJmRVm8QGdgWKQWhDBeWPaPZhhykl5qOps
-DAgARl4hoRiomjRWdXCoLWn2nvIAgMbm1eVWEmB56sBLz2W4SQJPQqv9AIDOBzeEaGTkRgZx4ir7
-Ne/LWu/Wtp/VeQJDLlq/3hQ8ddajjUPPkkyA91fvnTdl9WMJSrhuSgmgibGhUVKrMUp4ERBuml0A
-jLSVeAHgvZTmAQRmVW3LP0ZhXT1mmfkRoApqA3zV/i//oJSdf7YFQLmQiX9u6wfrjRG2
-"""
-layout_big_with_dead_ends_062 = """eJylVUGS5DAIu/sVruKumt35/98mNgIE6cvUpJJuO05ASDIx+9uxbD8H7rnv+E458j/DOe/1LIEv
-3NXvJ4DZrng59PUz5+BcyAwMYP8cAZgz1pneAkFCsZ7q3FqGRBwJ4MGMqBkAErr+pARojs1ffeUV
-54xJYj2STzgDpw4EBw27IpgMImgsDiiGluCzQrC7ksWcC9G0Chzug4Eg4nBmIaYgknwoBFCf3ACK
-OMEMIOJENweSAmYkflI3zGINwWQKFcCnDNn8QA6Onk/iPU1NUpwZo7EMTeqlwJC3BZXurMlBBnjp
-k5SHNYoDMWM4sZWdmZBZItYEUCVMAAUakrEjiN2xWsUwv8irStgSG8jrVUGV7WJZNoWqUvnd7AfN
-Go3t6irk0jWn6RigH22zZmRsy/rdsA1B7xJFeZTAuqnbkGJ9YKnE+ADGer7YC6lMY0r6SVLwRlBv
-yhLTYgd6JV/3ZHciqxzbNjusWBN5qyH4FIc99T7Wt/wxC/vB5LAzZ0mm8GgU9AnwRYmR0uZnKo0k
-XX32jGX/tRmET+6F3tXLvjs/x28n/vpYPyjZEgQ=
-"""
-layout_big_with_dead_ends_063 = """eJylVTuSw1AI630KZug1+7n/3dYPEAh7u7hIYj8shBDE/bPrcusL+RFfVs89vuESkZ8eEb83wLls
-EJEP4pjgQCBp4jr5TgbM1m94JmcobDFITsjMLwCv+DsgvjY/+V0kUwNM5gYoPOb2FqmDC0CAT4RU
-AVMGtpmcU5iUgC4BBT+SjDDQu4PCNgbc0QVknRnrlyigiOf+LSIKHr76XuU73cJ3Lh+baJkqfzXM
-zOUhH127TVWatytCWadBeT6S3ADYJuCNqugjG4NKotDAFcCxGWR7qiLkS8SkkURhqSLfhZhoGPjw
-YxsdhTtJxAZ52i0C5bYYZ5+CMxVLwAAQkSXOKX2g7NuOvhaEspe620htukhC12ExqBKnvABw8f3q
-lBrUfSQRgJwFaGydIYcLNbPDYM1kivicltoV7eFt6+WvHmfrKY5pmeFpJ7E1UP5cKP/MqEyGroaQ
-9RCrbZIAsJGNaZ+bhEnGjozKcS7Da2Yp3l6bTsf6qpmt7GgOdI/sV9tkYWRgbs8+qPwxowtgi1gN
-k/8M7QuhTKvYAF8t/0qtfwBCEg9+N8DPgK4d6lzvDTILQjp0+YfX9QeKcRIc
-"""
-layout_big_with_dead_ends_064 = """eJylVUlyBCEMu/MKV/muSjL//1sGrzJNckh6NroBWZaFR/V/11I5LrzfiKH9anzGIt2PVF4XgAmm
-2gAYcwbwmQAAbRqRNsCFpTN4fy9LxIa+VnPOJyyU5m0PYpMYAyhRyF+VDB2QyMmm6AARu8Hh8MLc
-OyTv3qmslGhvQO3Q+jIcKD3mJQZQMsbA4ZKG4F7/4G0ASAbSk0TzUkIcDHTHx3slhLnm+FB/3rkG
-9dCJiKteZZ35w14pnTNIzwYAQAa4GYmkXFVlNECl4AAJN6wCq5qcIiIEVJMJzOAHFRY/7GQtnMuT
-9YrMOCWklcsansK2RFe6JWVrXRgcHE8NkHzQQkHpMLFbwg6HBiWUJYgY/tZQZhnVzV73QAPo8EeG
-i2QjIjGohN0Hd4f2knaFpB3UnD9SULmdl7BD7KSzNkSkSj8vVNGk/OVmzxSJwZk/5jnqXgPy+wbA
-CZA6UTGCRjWXduhS3l1uyCoTAK0Qb8J5mGQqQC18nCL2BXXhFe2dTiuJsSfnH02PQsalH6JTA6F+
-s9EfwCPI0q9sBY/4aVH6q32yZCf+6VrfD/cRgA==
-"""
-layout_big_with_dead_ends_065 = """eJylVUFuwzAMu+cVAngntvX/f1tqSRSdNJfNaNM6iClSohTgf+sAERH57StqAwbe99Yiw1fuXidA
-HmOeYQPk6fOKhEIoJtcj58+5vgWQsdn/cgPFomLGTkQA77PGgKVjJIhC2DVzEPUYPgPoyKSJ0TQX
-g9pRSSRSpcK3NDZErMeZAMPGsrHI7GLnRzGbgT5VLVQZWRI25WHRbgBT0DaD0s6gmeWBATcJtQ86
-6cpNVBQawGLFeQpiMArozB4lZIJ1C2MdSWjTfABooeEA5dELHciJjdUJZEewfCErv61VrgSgGADO
-wEzcbpssrIZaAITdq2dCfWg2wtwd3seqy9V1/FDxzG3mOIZ398LYrRV2m042Ut3onTJSSZp+KA8N
-APdxcfeBZeFCB1092WTvBSpCwBmgfJwMx2detZ1BjAR2CzmzSuCDhGnby8wyBtBofmBgCby7ziT4
-lOgqCBlq4LZu0Yoa6N0aWy/krgS2D1UI1JmatzEOOY8ct5k14zHcSBvAKnVGO3ax9vKYd4lN+fbB
-ZOPAV76uFjxhhNSHPdw2CRTAj4duItoCY/F+bRoDy8Ff1/ELKF0Rhg==
-"""
-layout_big_with_dead_ends_066 = """eJylVUGSHDEIu88rqOKuSrL//1vagITcVdnDxtPTPXZjGYRgMv9vfDIi8vk8F84jaj73Z2WW2uas
-PBeybTK+BACkdkZBnztn0ViYU88Utf77ATjrkdq8Hpyjdp5r4ObtQU2F76NDWH+SlsH3dwg7AEzI
-wacQ07iqEGoNBGX8jDb2uN4Ef10e+KUvwmnpBBlsMh8LsKx1NM7ZeGkkygsCYGCGHzmd60U6am1h
-FvLKS6w/0kEPLEFCOgB5eIHOtZyvmK6zO21JAB1EORgAkPSGZEpbAujMQIkt15NkvjNbpJwNOS8/
-wwVJ4VYvBvqQ9nvukJBW0TffOnvzeeGyFi66VzTrhOEyN5EbwvpEa1y4ZctYyU5sCGXUUjKyVu8g
-71gPMBtUzu8eMM9UnWYL1RnKqYWoEn9Lxfy3M8RMa89I9BKA+R9Tea/k9AaF4N3krhnqRTUGyi29
-oUyb+a6Cg2QiTLVdC/hXw7Dd7C+rBQG4gO4KDra0d2bHcoRkxGSYcK90To9dpzBp634w+M1LMnnT
-0e1gDSlx06i9nnO6YP8v4eaoEH61LtT5Swb8IyAjCow8Wgh/rBdhQrael9sJBIB1WDr48fj8BXIL
-EhY=
-"""
-layout_big_with_dead_ends_067 = """eJylVUtyxTAI2/sUzLBn+rn/3ZoAEqLJqnU7feXFyELIxP1/67i56YrH/359uNW2MO+fjP07AXTZ
-I6iE6zcyMgWwzwsgXE6MOjVq2727t1s0tYwDDIwA0ZXcfEHdmJIJ5NecKjx9zlsNZNbbmws4lSDN
-wId5flBKljB/GDcAvuoSNpUw5U4GGdd+ADCJtYMTYjCI5BxLxDu195eISwYCjPSi1tk2YgJEkIIE
-QJ6flvfFQIYywY0AetpYGc/GCJHFVN2tXT+Qbh+IT+DLcuIZVLFKEPNWCSkiVQfQjRVjJ89M5GaK
-o43Sa1s6sPe7C0P6LqEvm+qgSU+8UblFvHtP518cYwDucyLid2kQai5T5wqDFxEpVFMbEbEDzWvB
-ayh4SFdp7SlxOxEMojvOHm+BXdxHAA6hVQK1UcB15FGNX7oADe5V94zXrubkQVZ0B2R6jLXRhbog
-ahAxkpHBulF1t38PuplvySBwLAVmPFYO9qA41SQEALYDRj2sMqxOUER9fwz3HFXS3jYCSqhDRcRO
-wECMVcIMIb57jAAfIoo33XATTs9pJdHxL1eAsaCT7/N9SwZyF/66zg/4ehJ2
-"""
-layout_big_with_dead_ends_068 = """eJylVcuOxDAIu/crkLhb+/j/f9sJYAPtzGmjajbJpsYGh7r/b1xuBssx/nJq7qYBcwNeG/HEz+8L
-wC2eM+IFDpx5r2N1MM6LOOsz/U4GXgEibi78nMUBjO3iESFirxjYCwCTv/gN5sJL4jxiBCBPI/E4
-XludCkftdA6QABHekTnKYH5L6SAyAYwA/SDVuUTbzCOpDgAXQP6Twvp06aCaEe7BYB9Q0kNQlge4
-AdgAYEjwbUgCyABRwQaQE31TXLIpIXeLUKZLPsgpmP8ugcrS7hqZuOWgrMoMtnkLoN3OMPXWJUwy
-Ce/6CBwTrLCcIq1cBoMYtAOGBNX4QxmnoWwz0NWQSlQVXkGvKWliYUvIPKOkQBf0APiUxCRmUGfc
-zmxX+q2EXSsygCqrMGQiAPmja5Zgy1K+wySDfc2jWYE8oM5CZxvk+pYwAeOMGoKPJreq1KsPZTTd
-4kcnGBejJCyA2Qm8HSC/n0rOWE8GoxHara95N73qggTABqgOaor9rt3y97q7nEZcRKq2I0f8GEwJ
-UP+jaMTecTXxqjz1EUFI+KrbmMnJzvL4pmHkdbr9SPhZSYzGicW88/jmK1xO/Me4/gAc5BJA
-"""
-layout_big_with_dead_ends_069 = """eJylVctyxCAMu+crPOO7po///7cGkGxB0tOys2kWjCzJhmZ+Nq6Mc+CcuEMS4zE/Yxm4Z8bK7xvA
-Qrljs16R8/d83GM+59r3DTAn8ORmDEbixWR8sTgRjAzAb0oBFuORdu0tCQsIfHEApRNPMJEDgBIY
-izg9IBz2Oe7J5SVTc/EqyUycqS0kszLJhYruMmKrm8wwWYgUC7nAxSWBeI3JyK4GtA/qAzaDmaiw
-iHYoyp602S0PAR6B8iRYhbQyIqAGIwCiXYzeqeC0xF4qoi8GMM7lkrMuyPUCAdxRJSENYB0UtDRY
-COLwAC8Aqh1b2RnAmGwmaqN7EPSA1TtyuIQiBVs9JeAFoCVkdZcxkO/5r89TQgqgGsKKlqvwrbLr
-PRlTAkS1eD4bKXOjv5v4vImOwK29s4+nGqnOIKoLFPZ6wOz8XcnebpeylfaJrj/72UdfKHZXUB7U
-7nW5hMX0hdJ+VM3rUtruO4ikj5ZQXhYAyxjd/90ZrVmtnH3CHACpd7vt3Qx6wERar040qo8BVeGr
-AsQT6wE18HTy8R+zPPjhQWEzSALy9OuoYQF8OK4/lmYR4A==
-"""
-layout_big_with_dead_ends_070 = """eJylVUmOwzAMu+cVAnQnZqb//9vYWigpTk41iqTeKIqiHdXv2qViDe0ZIxhdZQd7yuZUPgtAVQ5Y
-B5gIs6k/fsmgAk8eGwzccQDIBtgvi3pSEbxk7jsCoAPeGzQHRz4YDCR/hD7DPQ07aweAA4zkerqj
-A1+KwUAmgBdpQCa9Wup/r+LPlbG6Ja2o4EK1Tw0kPRDEIalLTFcKUVo4gCbAnhxSZjZrAAlAsGSw
-ZuClCaLBPRyymdgiRUtBkthlu3UbJrctExelBGBEM8dkQK8OEamqFFzTxwKtmNSAZ4gckVJJA9DB
-AMEAmRarXynEekyfaRXHRARZMaIDkEH5vGWLZqTGoPRCiphwoFHVyipdg+KIJD0A6AgZdZ8MeHR2
-WemIcQd41en+DRDmMGlRpmZxRNIGqR9NXWeBZ0OIYtui4TyN2gEqiXkayxTd37W0n8ZIDMX1vEim
-z9wbWYWXe/PlftNTg8y9ks6OahtudJJdE/GFiOK87IO17bxGcrcgcCP1atz5LICfR4CxbX/l5EGr
-PXLpX1qufwuhN4TJg0+xj+tX7foHlmYR4A==
-"""
-layout_big_with_dead_ends_071 = """eJylVUluxDAMu/sVAnQnuvz/b40tUoub22SKmTSWKYqUHPfPruVm/nzGBcf53WuxhAgCrGL3ze8D
-4AIAdxeQ73/wLO/rfCcAo77JQJn5HAxg+p0BzHLSvZRwXcwZGCrHWcn+gngKAJ153sfmBLMjQlAG
-4y4GVumLDRNrdSYaGpxbTEfOjtAAEqaSWLcx5LE7eyoXEGk5UoMok/TqDxnEhJaYI82itnbtTlZX
-j91Ntxsp6s5Yz8JLnWYRu9QLwAQgC2IVydNKsaaeKlkOVijUDIzS0qD2W5MSNoomt0BNu8VwitGd
-4w0E0ORz3Mm0+dxMSv4PQEvQ2PhbCZgpl4ZkjJE271+kHWQN87KlGHRtrhIOvnmWYpqfrdEq617M
-SiejX6+WxXDBW5fIllphB4uBC8CbjQy+W7cmDU07Ti5bufSz3nXpwpmrsTWjkQyQDPbYxxGY1Y0J
-z1M46lhXiwUY8hS9ptE1uenG8jFrSc/7gdjT92YeAJAwaEg6EKctZFkA8QQhtIaEYTrce+aLwfVI
-c1Cnn4TJt0718QH46vzOsJSijl5CVcFDKU7lHxt9zxdovpBqUnyI3Wz87Fp/35gR8g==
-"""
-layout_big_with_dead_ends_072 = """eJylVTmSwzAM6/UKzqDH7PH/v60tXqCcbBMVjiNRIAhCMvDZWLAYMNJ4vTD+7hXAZ1ALY/wGwB0m
-ywGhMxj77lx7fCfAHTITBINAY76eLC4ARrKrHtPiKq1MPV5uDWouUlaOLK7Zb0QMfncJlHgKR+w4
-ELVqArADYa4BHD1TsZ9UulGPrySRhXNQdrhADdsM6EoIg5kZXYIIxqDRGjAAnuoqAFO/LVFyj3hl
-cLa4BfMNrP4GA3oXEN06xuhkcWpZTc7CawaR2MVT5X0h/L5CTzamZQYLGr25xBhG6pKlF65Ytv6w
-L9KfbCc+1kUIKujM1gzy+I8IloimxUVL/LnSEEMhZ5eav5fYysrVmTJsWLVAzyZHXzeDOFfGjGOq
-lABvnbYZVNfMG84Sg4j74B+/rzRENbYsm0wToLvAwcBKVetICaGmFGyUlYfymJKFrDNzGrkYWN38
-zbXvjSkiTY3Np5FSv5qVG7E4lLMAvdJeXdqWHTk8kJc+5TB1Dr1UB78OQtW88BVzxzfnxYdtfvyQ
-AD/2GCHx/hnH37+95DiNH471ByhdEYY=
-"""
-layout_big_with_dead_ends_073 = """eJylVUtuxTAI3PsUSOxHbd/971aH70B2raVEiT/DAANW/d84KjQgKor+2wO5SeLYxwBgD2DHbfW+
-fQjZou+7BTbxfQFoVWztmkCYUMMqUvAHxsA5GIPY6xPqR8TxAmX5QeAPA2hu9yNJJHeKLF9UtWxe
-AKcHs4MkzbSKQbkX7hhRd8FZFEntD+1ZYKy7lQSQpmghS84yaU8vzPAFgHmhlPiK+4ye+DTy20DO
-SC+HSDIZvFRqUrQLZQbEQBqnFYmgiRWDONvK7fxxaGSR9R3HuSxXO3+qiRxBo0AFg4DTpxSoCGT4
-TPriMEUMwOHOlZmBVBfKt/w/Gc5yO8M7AQi5p8BZaGYesRbGFJEtA5paO6R8jz+01B+SXCXBxJBp
-nO1iZKxTynlO0QwGoYV3TyvUmKaqKgCQSpesm8NWfNdCZsdq5VVBvkQMYvKpQk/j6jezbKuuHYQ2
-Wa44Bu+qKgXJWDeLIIDSe3QsKmcGj3YHahiRRuUQsWA4f6kv7sCwrlw0OdPMILaPJpG0Skj2g7o7
-Ku4Nnu7RJeRS/goyIpP//s474yEK66P2HP0pTpqX5x7c05afdTf+eZxf06MSLg==
-"""
-layout_big_with_dead_ends_074 = """eJylVVtuwzAM+88pBPCf2Nb73221XqbiFBgwow7W1KIpStSA/60LVguG/st3vGDueuaLOPtaALQ+
-v9Z6xgHeAObiivh+A1QQUDfH9rf2zDvPr2PXJr4C35fSCAaIkxLyc22Atbh2xTgD5pkOJg8cBgDl
-usy/CK5Dk/n7OFssiyrEi7MKlUJ/fUgiNVgPIpUdAIrH9aFqBgVQzVPQDGs8F4E4GAT7DPO4apnN
-oNtklnOUESVYp3JnMKUgG4CZRzbkiMAijhE5dFQNzHsh5FQAtGLShmKmBmA1TSRTIbbFsaiF3jkY
-aAqlcv0wL/cQNkBqMJyCCWB2E+gDg00TXblIhQ1EV2UDnDYtDzpJqV8qDNwYfKiPRQEV4JZCaeD+
-0kiJKE9XiwKaTAM8TBzB0sYucbr7A2Df7m7hwYBSSpTHdxXmTGP3ivIQlzPl3CJ+GhblcRt4luwR
-hr9k+Lq/ZrNvER2JOfUSk8HgHJW7Kj1Z0SAWrk/nZx88JhFa7hToE3/OtAY4bardWZO+t5y/8CVW
-PRjQejpyy9OO9f8LP13AYXkFwFmFTuJ65v33df0CrlARaA==
-"""
-layout_big_with_dead_ends_075 = """eJylVUmSxDAIu/sVruKumuX/fxsHEMhM96lds8RLZCEEMftsLNsGbI5+ymF2fuMpHuTEmf4+AD2Q
-646YkwfBHw3z4BnfzmC/JzjpzLP7AMC5oYGx7brqnEgwyGqSDQZ7oPYTDwKhgakIJgB9XYY7pUmw
-OwYC9E0lI/9wFZmFuh6xQgb+ZkeYbFPDiupsmeKeJbiI/wUIAJdXBT2hQQGSQU7Q1K1yixSrsJNP
-/1u5jgraGEIvIaYXf240g3yHqQAFcHLGzFjB5Gw1M5MQUsGkGT+PgrhcYrcPaq/TWDlOv2bu9RU6
-EbUHbl0AbbcyVWR1WZWZOPc1QBDJDCGTvZpw7fkEA+BljCWiKhNaqXybNXABbRMRKzOcobJnNEc1
-JKggD8BsY9YAVITv0Mhe1WRwO1PoscyqcjuEbjrhRC0QrxdpGrbLxaPdmFTjxR9ytO18tQMWvzWD
-bu1ZS9FFGreIakNkFu5+0KZSealgr4uRri5MttU6Rv3IZepEJUcRwo3ahdHnkH5dA7Wlk0S8G8Hg
-axLY7CbYhebfOkwZt/vgZ3Tw+oyyPY4hX+Io5w/H+gOWZhHg
-"""
-layout_big_with_dead_ends_076 = """eJylVUuuxDAI2/cUSN5b73P/u702YAfSt5tKM0rzMcaGFPjsuRDvh+0XMXbgmQVzhPi9AYC4f/fs
-mlmoES3EMV4oNUJ8iwHOGBWBz9aDQSSDInFpayFjw7Ny0NSKjn00BwLIs2u3YukUJAyi5ZanOoM1
-wZu03/NAdBkeXrlAnCk8Ca/VWqL8sAZOAbXUAZ6jjIx/MDBGE+reSaXAAggfk0cP5CLO7mRhsMJe
-Rb7OiGYDmDWW29vLSOEFYM4OP18WgETD4JtqKBSzflnDVgrdBVh7MZB28p0uGKnRAMTfu3dJpZdI
-4bcaaAzYfMJmQCNOJ6rgWS4ws4+xg800F2f/i/L/6tnWKl2unnOri54bVu3ctWEXbmdrQXrRzHYO
-O4VtV2SDnB4nD4x2/rdYWgquslZ1AnCo5pPo8wWQWVlEFpndKMMJA1SfqZvL/ysVIVVCzadi0FNA
-3XSvFLhPREvDXlKihe6d0wWX67i/8GLAdVFPgPZBqCSwe8p1+yqpo5DMGxLDhcRSbFzvZwrS9bAR
-66J2w45Vt/NXbPjQqHfdUWG1nbV64Uf8ecbQy/zWHoV24cPn+gOvSBJk
-"""
-layout_big_with_dead_ends_077 = """eJylVUmSxDAIu+cVVOlOzUz//29jA2JxklO7+5B4kYUEBPhuXJA+1P4iqPf1rDaBmED89tLnBMhT
-Dcc2A+pT61ETAr8L4Bh7b3uzP5AMCKhcvDZBQt959Ld97AhBpBjIwcTwfc9YtWtTA6EGJh7m1bBw
-1x6d7AIgYA0A/dwcKUNsg8rJAIFH9TSl9Al31qd9hcf3ygIIv7TR14rFYHQ757uKSjGQuK5i1Lyf
-WjQPTZOpgcWVOgt4Mhk8GgTayDRF1xFM4vSSBqgiVhzmjQFS+xOAKji6J5KSEmpvH9Ph4oQKoRWP
-diYJ4bUUHmtFPTQw8c0xtROZSxVXJiXvawB39vfczBC9wOE2AqRkk6lXY/CgsBsRDBBGuEkDINCr
-1ISl3TQgpbeUiYDfGLSeo2ffQRexs8gCNQ2aMklZrII6Aznqzc3walReWQnpZkZSVLVrBsAuUAz8
-p0UlWsnNy54GU4NW0kxKNzbns/uStpwMZvestvrUcn3ww5IMNDv4jfJgJ77VM1E8y2ffoX3zQ3Oj
-cuEn+2R0Pq+lamRVPA+NewH8DReqzOh1+0zUx7cDfDmuf6LXEiI=
-"""
-layout_big_with_dead_ends_078 = """eJylVcuOxCAMu/MVkXK3dnf+/9+25OlAb9ORhgLFNY5xVb+7loqKiGL/78tbSHbVhnJ2T8UK63wM
-AA+QOF41G0JRmDRpqPBWfjfAwI/Xq8xhIpEMAtC2YL+85Gj9RnKVP117JIA9iGagfqfFELklZ5fY
-63h/aVAi+juDR8w20gMAGyjZc88Kut+i2i5gRBwQBYCpgFxsNESsBxK1GMw6YN4quArOwHctXoVz
-oV59FkCpJs7AqfXz0FuPBM2GPLW0GFdpR0cbAC/W2gxaOhymVSMDZoBCNjcjrewlObgTA7oQNjYG
-DgCS7cZA27lFzN1sgHQVjuNgfy94dNThPghBTNWxIDz8wslXp5H8fOckWjAvEEhTtwDYsZkHo0Co
-9zeDGKOOtQGQpRR66pKfPAYJ9zWDyi1Wsf1f5GY/jFR1hdJ5yPoeR4t2akc6GOQRpfx6S5px2MWS
-YGWoR0TAPaKYGuDWw8bAqZy5QrkRRy4pvyXN6m8BI1XRlIpamYvaoHSg5KAq1WRG+zwOzSDKMJL0
-tJb/XUljZfyR8bUapi0FPRSYROTHA/DXaCMRMoinCeobjFix9Mtr/QPHMhHs
-"""
-layout_big_with_dead_ends_079 = """eJylVUuOxTAI2+cUSOyt+dz/btMEbKCtNBpN9F7bNK0xxqHu/xvLzW0Pns819txQd2LgMfk+AH79
-cc5+rg/c23gCfJKBXroOG6N+BxGNcwTU+jqv6jkT2I2H31kh6CQDXO/C8z0CZDTETQSATnlQChBd
-zhE6OlEp6SRyAUi65J9ZMlawQS69llESRhLJsZL2l7idAa8wgA/APikF8/ZMAS8vZltaCM7AaoUe
-AZp0q6brRlUchyxch5bRysjC+jBacg4AgAbrw2ikxqBCZAoJMIxEzc/NNSE7emZbIuqRTYnmWLQY
-M4X4px1RVWhkVamTArQLi6DqZh0gc1RyYrBlJb2oqBhI0LdMKSIGQZP5u4hcRM8kjfQoz8krAaRB
-jVZx+gBADzG6HA05TVIMmi/pb2R7AQ0Jc+7mY8HGdbV9UftoltFVqbHXRgqNV581qt0fTfPpxG5D
-a8pHmbykaMKvl7gm858UjHo0QxjnAaAWGbHYAbODsI8LIFsmCkBNuhHxMSuApKeyrfqGsI9LadFt
-vxJXKXyIP8dkc+NBmZEBl3/9CvD81laXey/jX8b6AVmlEhA=
-"""
-layout_big_with_dead_ends_080 = """eJylVUluxDAMu/sVAngnuvz/b42tjUrSS+sBJp5EQ5PUEuB/a8H8E6s2+fu6wR1ACeR1h2f7vQFM
-Aa7o+7owGEEdiANtn4cBd9BzWV7yhB3KPuVgHYCLHu6ns49HnAcXkgxYAPkPGtUBCqArPxKEXzPA
-iwTrjfPwLdzAQCWVwW8LmRuUFycRlgCeqHcKJTeTFY6zHi6UxpvuySBMLAaZ0fAgBabU+MrQyn9Z
-5ykZWXBT7qrpgfQntGZgkZI1aybZVOJSejxnVWN6t7qEhAtRJnXlmBZsbTcAQQk6AJFrOI0ECwnq
-c0jA6AZalQ68k1C+nAsHQP/giBr14VKoZWItQRD8b6k3MhV+ctgRylPCaIdhR5snrdZObAY0TQ0o
-g6C8c03zLEPVQZdGl1O0dx2Mpj4yvipTmWlpveJ1q/GeC91MaAbdOY8RO9ptdCO8Q3PsOBC7/N7a
-3b1byNGgDG6qX1bRcIBoCOwRYy1VZuAvE6cl6LSURrjrjrRSGcS9bqRhYnXjY+T720BHWrwzZADK
-IHhZ7vjCh0n29Q3GPv5pXr2tFr4sBi8pAIcH7YkBBYA001/X+gFyCxIW
-"""
-layout_big_with_dead_ends_081 = """eJylVUmSAzEIu/sVVHGnZvn/38Y2IIl0ThkncbrTtkBCJu7/G8vDzM7H/L5zivzN+9n5vgs91/T4
-3QB7Ra7pJ57bPV855bD7OUsa9fsAVABg+Ak2AMwQGGgGCuMHJHyiYE/eOAJ709vz0QCbgtlKWF4m
-HzCtDJo1Zei5KSRMXogkuaYAVAOSgCZ5EQ0bh10KSg1aY703SaWglAQzaA5hDHThLHWtXXFDe4pF
-Ea0z1AFCpZtrBTM5aCCJKwFH1R4FCRN7LBeXWNp6GtNKHFh++2yTUYCq0YyO+j3TH8kuyHEjiB9q
-dx8ALpqlXin1QwPYBwU0YkPquAChsFSjM3hyVL/zNM4KtmWnDh2Wi+xxGqcPpw6vMrcGVdxtMzox
-2DyEWRijV/UJ4LCk42nvezhMvgHw6lQeZ+NZnBW8llwQqdqMX5vV9uCR4pnvgzc0ICtHAd80QjGp
-ONErQuCwR2cocmjqxqYPDUDe0b36QhsK51Z8UTXkLV1UCkIKbMK7QBTRuo1XBxfzocNn4OG4BVwf
-uYg9uiABTaSoG+DLEBjNQyQhgLQ+GnMD/EyFXfuC/sPi38glidC2/tlYfxBzEf4=
-"""
-layout_big_with_dead_ends_082 = """eJylVUGSwzAIu+cVzHDX7G7//7eNAQEmSXuop2ndxBECCVv1u3GorAHZB8bvzUzX5/UAANgtv3uG
-kREW6jfllwDvhwVbFzQiQXn/KHRJXOXVMFbYloIGqjGIAA4ZtEWzDEqsWgchXAOIJVx4AgSFmItT
-JWFLyADsIZ9ViR3FEvI57Bl5LQYYKWgVPGkUQI6YeiXdB0wRVbUI0BnsViAtB8BkYFobSgdwiIiI
-VAEOKLk2VpHYSMFFQZbefNAl2MwzGVBYYPogv1imeA6t5DYVmxMrDu2BWxm1okjRKhl1j1MvoebI
-5IALANBrzZewm4rsnxmwGvcp4OqQVsRrlVxLKpYu7TXvDJDN/knG5vzeC5D0Scs0tJU0s9b/ZcEE
-QBkKkwFir0mPBIOtnUXHtrmlUBtIvhlE3EjIIva2vdRgMqgi9gC+a0AuAJqdHGFGO28qkmh2YzaP
-bOGDAe3R9GNf1c7aXdrWdSemAGJidtWzRQlbopQT88hAI/lxnAA/iav7ENKIc24efwT4a8HenKUP
-5+/ywXfj+AeWZhHg
-"""
-layout_big_with_dead_ends_083 = """eJylVUmSAzEIu/crqNJdNcv//zYxIBZnbnGlk4pNy5IAG/hsPDAzGF+PPowpHwTOV8xbDeZjvwKI
-J2GgGEWfqdjPtHGufR+A8/cEnZ3RsR5uBZ38cqLjBoPERW39wnQJ1mBODCOoPeAlwWNZm9uFTd8O
-B4DG3uVSGpQkp2eZG7xwnkbNDcbEGpgR0E9KOOgrR56/MntjEi2XbeLF4Mhi8d+6UKYnAw6BdsdG
-EslFoktFHsBgM4bzX2KuaoqHpw60sAwPiT7Dyjuo+S6YZDBD3MAhZHmohXiJmADTLtZLqzqsO6Xq
-/PHmQ6dgZKUSsuqXrGLKLCAkn5FmZzDBgWOTQbe+JCCCi+fwW2/zKoUyUYqldmV7+ZkWL9vLRDHk
-CiHEmE2sa8O8DjgqoxvPNhledVZePHnevHUhefXCVebm2jMLyvEVO3rBVkJG81UdcKRteJhylaRe
-Vz06g3E+tJn/j7czJxkk/FBwGb50yV8/DZMB4jpZ1A11qlITLVd92Wei6lehucsp7wu7G8sBOvPz
-4qgbYBR2x/k9FEAPvsrXpfQ6pLpTUNDJ4Efr8/KMI5um/GV0tz7agw/H8weWZhHg
-"""
-layout_big_with_dead_ends_084 = """eJylVUtyQzEI2/sUzLDX9HP/u9WPryDppvUkqf1ChSQwUf3fOioqtnDfcVDYMb6wLWKHjPbw7wdg
-LwO2Tz/4A31AsCLl8wL4QkY1nWKgDA3mfx+dixu0jR99eV8Q1cDAQ34xEANwOa5SO1t4UADlA1My
-gJKb8pukZ4ToL+tJeKZQ4ggZ/j7RkB0kZWJ6MjN4ckmGZE/tjMGNuxZhZAQkTIS5lBbuSh6XYnx1
-Fa5OlVLoj4dbJ1qnOYAOEVEFbgqVZc3JZMyg27hru1nk9tQjj9QXIf5IO++o1yijx2VC11XdTall
-MZDuWrMjHKpkiZhyuGKwu+CxXkuPRsrmkoRQUD5hD9am/ssrVIhBr5Qfspsr1G5wQ7TLb6owOJAE
-FAgapsDXRGpumv0QY4lTWBjCjqMlbTQqGfHS2Z4HEhJkrLwwatcpLlMOnSIaty8kvBhQd9d57YEy
-JQ0GNTBotDlp7CAuo64MlGuPNDTBdI0Z9EDVOmlsaaBqRtjQefPDAp/xBQBZrQKf8SbNy0gLzXH9
-snQbkZpHwoe8VBLcEi2XoFv20S8X1ZcS5UMK923SHv09x/pf1vkBx64Sag==
-"""
-layout_big_with_dead_ends_085 = """eJylVUtuRDEI2+cUSOxR27n/3ToBDA4v7aKNRu+TSQzYDk/1f2Op+DDb13ixnBvD6Lrve9XLAfaT
-6v7tZ8eN93h8DkU0/XwD5IbYPEI23G34jncGe51nbRs60bXyEa3SznIIQGQgV65xMZ+2scgAIIhh
-CKImKKr/rdjWkw5AoHxvMlHRkwTLDKg2FmyQHv9Yr3HmMoNDO+kJQQYMV4WKNQdhi/LKIegle+ki
-lnIAu5YwQ/eaAACeHCHijaGeRtIoYRrQJ1xJIVCwYST3fl9qyvCQ3jcYSHeXPAA1fGC1SeBdVVgb
-DOZBscgNVKcK+45JdUVidZUZZrd6pWhNIueW1qlOYbGvUlSYRCAjdDE0kwdg5HYje+nNKLzSDl0P
-xYtEmRb5raeRhJBx+nNI3/lSV4T7Q4XuOOPU5GEi4aldxhUAfUzp7I5Kbsc+fXCzuR56HD2Fi11o
-mkklRVFp0ygab50EleYgcuGRXZRcl5hDapPO4HHWcRoFNCYtBmuHEqts/wMRygyXoO3ppR9FwPUr
-1pYAHH8HdwZfIhTk/IIOsCqt1T6+C38a6xujUxKg
-"""
-layout_big_with_dead_ends_086 = """eJylVUtuBSEM23OKSN5Hbd/971YgPwfYVKWaJ6ZknMROAvC/NSAiKvEzf/0F809gL4hTSUPY85kA
-mKa2ymadrc+Qb3y4EPZnIt8WgR1HUL5RM3EIOmjeFkBEx06mG4V5ohOyhO4ssVNgaKGdbBPOqvxs
-3JnlTmG5AhMYX6gDHNF7AuvUASpKjZSdlkih+85vHED0JMCiZxUcXVsKTqJtzhgtasndTRIiglYA
-O1hd6WumoF0FjU1xELiBrpSFFAd9gVQgkdQ0UWdeAD0YLpE8gvCeCiRr2tydpVjNFHbNngvjWNxX
-uiMQe5iGcPjMvb2NqwAuh2jxV+vaM1ZXvKKj/6Uol52KNdNVROBWLtlZj7AcrkYzLT001bS5hOw3
-h9sAimfuVUYhSiNajIhR/vUqFc2+XJW9JWksAQHw7hU7ktwdTGUKTA8okDZScRWAD9dMASQVioNj
-tMhZ8Q5gA+cS0wGSzpBAQ6JS4fDN8zyG602SWDNtE6VrpM15uAa9RsuyeuEqRZrn+5Zp7hNlAnx5
-hIfI/WI7xi45GvghGXtf1dUKARNI1/Gzmf60xi+uUBFo
-"""
-layout_big_with_dead_ends_087 = """eJylVUduxDAMvPsVBOY+SPn/37JmHcqbQxAtbLjI1DRxgf+NC+YDftw/6ycg6qLnvM6MOx/frwI+
-zA+iJhmrYDxELRBlmIvYZyLIFfx5g6tVGlZAUfyGQhAYON/Qp/J+6HVvTIVUR2vgN4EGB4YAxqEw
-KpBTgMGj63GuHUHqwFJhEDSFhDfLzwtr9kuCtHGtDNtLACpim/RWA7F3swoREcWO2U0h36Jx1lFp
-qozgIHK5dzwQpKESQAy5hWFExCpNUxgP5SROmoP2Lkib6gt7QvCZG0E717DDBZaT6lW7UAKIRfHF
-pi+CZCYYFOrKNBA8hYNRKKB1Vw3EY+QX6CCZKcGVxCM/T8mYt6CsLRq8sUbDVUfv0mOaNpQFQRiz
-eTXHOi0bM6Wm7ZDAkewKvC0EimGEyyp8t81EgwP82rsVqWkke9/zsRcKp80W3gK7n/MC2tKmkWSY
-22H17mB150A6ZP+/RJ0SfvBFQn/pSFbwgAwPs6/fBSn9VtNwHckwaxwVhoVBgFVD+ag5pUIWiH3c
-e4Ftkne3XvfC1xAgtet2F+y/zPZ27Hza+Ndx/QC7PRIo
-"""
-layout_big_with_dead_ends_088 = """eJylVUmShDAMu/MKV/mumuX/f5vEq5wwp+YAITiyJS+ofnY9KgKJCzqf66Eq44Ltxk3k1wBog5Zw
-64VwOt0mcfveABZAfksDh9JAKvx9yK3ssTYKABQB+1of+pMBMdgGcDMOsFRRPgg65ic6AnKRoQcd
-yETXIeJ6cxFBjg7RR0RJAUF5rTZAc3bX5BMNCwJYL7lXafzvMjwWOAVwljsCSDr3FKUVGkAOAK8R
-pIgFK1pkh6xnHY2SesJx1JYpf+R0YBX/eNsU4Km1RaxnHDgjSi6RhcBUsLp510lLZ380hVDkonpR
-oMawCrIsHFvXoasjJTxWBJ3XINFR68XJJOmKtDoYypCCLWLrt+0RAHvRdVCYbxSytCN+yvwztLtq
-ZkaUtHLQdRZAAc/C1VHXIjmIIknVC9IOGwAvQ/XiV1O5+JPLWHL6ciQG484CuiIHadVRxXIa2Eij
-GcX+ghSyRi421tHVjQHQDT8mKkU0ClKrF9p0dCPGhDsEFo6g/xUMlg2ZG1wrBfDVP6r7Jxb98V4j
-4iL+0IaOwk/3aYv5zKn84fX8Aa3UEOo=
-"""
-layout_big_with_dead_ends_089 = """eJylVUlywDAIu/sVzOiu6fL/vzU2SMZpcmkzWUmQBQgC/G8bCDK0sd3nBjBwXeYZ83kdqJfxfQFg
-Pt9xYzmA9d21c9rWPe2O+JwM9DgZQG+TUGyA+T0FgCgcFIBO1LlsF49JRAA7hOJ93Y+ivHYiUdOw
-LgtkMtsAyWASmtahFYuXSbMIB+OBgT2UA68IKHhl1zmgAYphVBnn91RlCohJ/wAI2UyoctB80GqA
-dsdbCOwAcfo4SMfTATIMttIN60POFIBJPJWxUtSSmLQYXqJ2PAIcObB8U8GZDwlYDNABiBTDtA6D
-0TmgQ2Ay8JI8hOQQsEmd7VYhKMRXIXVDr1PKYmf4JQedgRMJi0g19GvTMUAmiF2rW4KtF+hJ0efH
-ew5+lZGKTjWXkEKd8QRwE5JJ5plxDBSeSlSDeaa0VtrqbyHc6gS2L5tP6zzELQd14MxB2eQjRGYT
-jWM6NK12AM02xVMj8QjhSSnRJrnTXqaqcLYz9pjcADlHqaBr4fVIDeFDB3gqY3WoVvfUb6UbUO02
-A7YkirRrQNDeCfChiCLaJOcGWIw1Kfrvb/Ee+NqC6yFkIdjHbMId/+JjIv1tGz80zhHI
-"""
-layout_big_with_dead_ends_090 = """eJylVUtWxDAM2/cUfk97P2Dufzca25KdTGcDATpk2sj6OCnwv3HBYO5m9y+Hj+saqMl4hLPXAvg8
-kA8iIDBQCIXvYLCGD1a2cTSrj40fK6SEx5s5jZWLhJ3g1h68V9VDDhD1JkncAPWQGB74tM2pPT8F
-Hk6kH82hAOw0IdeYoTVBf8jq9a9S6CRRDODTnWTAVVmOANj9C01Fw1tyQxS5UrP3gQuD3jf9QQgi
-tRjIKUvtEd2ZBO8zMzKQB0ETrsrFd2nxdt9QzeGQUxfbrUAUZBVM0clAWTCgmQLtUcLHHjlSaDUX
-qL3WpBZBAENT95SabWcgm4yNZ6Vi/bjWjZrlAUkNnk8SWuLOANxvW8dWO3fIo0+c37ORqj1HApVd
-7cah6ci8GEA7r7cesge2DcYmU8hogJbVfYuejvvbqZMxDgaS4KLp7F8fNQhJBnkgfEgB1aRs37Xa
-XQwkwb0Btlow9ZCGk24zUFp9bvXelwfjVI+TUH3Qkm2cn34msWUS12tOj6YMUDwd9u3O8V6Y7zMG
-/VZ1mBAAX5iL64Iy1Ef+j+MG+DloDSjs3xwvYHdrD/4+rl9BPxIK
-"""
-layout_big_with_dead_ends_091 = """eJylVTty5TAM63UKzqDHZDf3v1tskSAhJVXiwu9ZpCAQ/Aj427MQiOdhzDueJf3T2uNWLjRbfCbA
-A9QQTHf3YgLY05//msFBwDemlSDcpXe9ALko6PPXuOkc+McL8LoAfXj/QTsnTFzg0SKa7Ti8iEkR
-0xrGZwPQdDAmAuHt8AKwjlr7o4mf4Ra165VBR256NZjYCAWT+BIM56tDgEI44kJ/MwolX1VNBTAi
-TvINYA5/acEWUhKaiJ6Zqjge6e69FBsoydwhgBNdJFniBnAalYX0X8J0gG2tFrkAtFykQxrs2MpO
-VOlvimib8RYZhJqp7FQBV/duIizKTN5o2wZezSWa3xUyKkYqm4omMoQ8iFYHN0CtMk6ADGw5b5UM
-r/y1SKWId91UIlXdToNHPV/FWhoIrZhN4U0Vs/dMHUwlWmNMdKcGyNpQI9IH11J1dyPe3dt069Tp
-fEK9kLVnocU0fEp3z9ty+LGdba5nZgrknHeiZiKeEydslrruM3xzGA8DT5ORsQPPX9kF0DdFTUXW
-oAHimwA+gh6ADwHfl9d9veWhfYnWnoX/7iU7rpz56Ld7GC3i75/1BU00Ec4=
-"""
-layout_big_with_dead_ends_092 = """eJylVUFyxDAIu/sVzHBn2u7//9ZghFCcnFrPbOJ1sADJUdz/N5ZbjshLTS2iZz7XqIlPlOfscwHE
-fpzLwMz7jou87bgM2DF5rZDYId8XgGxCwr0HCwAosP0QeBVl2UJoC6gldhxawAjCVETdk4OIzoz7
-tTtcFljbbsyqYLfdxpLHnNYMnfCP19yr3qlgSOCYDWghcUhiJ9nCSAU6jsWocKHEmGgdybUgVaFl
-NmXXhoOXOiQlT0hzUKpcbYUChGzNX2A31rqUPkZ2qNA7QqBcIe9H2RUAHN2Cn42dXBlJFPXIbf+t
-E4lXyW/ogF1+ZppO6tRJ5lOvAXjRkDNi2VmAyngvwEcVdPHojQMVPAg6Mz0YDrC/YByjDpWKE4AK
-hyhNgDxedBHrzo0q6PlogyuAtECcTVagSturfAKg5du8RnQBM75Gj2EuMpJpGmq8pTzrWGWS46hl
-e+1bNvnN7Eg+MuJdaA5GyGpBLKHTuFRQ3whv35Jvx5Dj+CDIgpUZTwVzDqIdQyjZJ7JabFx8kKBC
-K0/j9bZ6ugi/Jb3QHHy1S1UfILFTudNQhTnWkpb2Y9UiWxCDuxmm4wskLRyG8qexfgH3ghF6
-"""
-layout_big_with_dead_ends_093 = """eJylVUuOxTAI2+cUSOyt+dz/bjMJHwPJZjRRn5qXUrCNk6r+bywVsWsPv52B8f8s+B0x//5NoD3M
-I3Gu32f7OgOccnweBLsU3gAJS3dGEIevGYIdCekPI0ad4av+XjMEKCzQqDNBFgDLG4KWcEwyjU/R
-OFmCWFLj2NRUocboOplyhkDUEmhPkF3w/FOdiiCAjl7wwVNBrRoYiiIg2QJXdXeSIwDffPTRBaoD
-HUGJK2aNSWhAEIqaOkT035FB2EkP0xAYrwSV1I4z3kUODSkisHVyhUvJN/FrtrGZDMlkl1vbDOnl
-lCfe8QRjB52bVQ0nxnvESezciea9SlniQCHqOA6Ki4lf7FSg6vpKQIUtS2lq3tl8E/FyiIt8W1Dy
-rHOgiQC3CxXFzwSGkPCMhqDVDx/JDIAWYONULg8kNVCZ29w3eIiI1kmrkceWDheIdTQF6ggKWyWD
-5q06oQZJgadmLDe+jYsB2wneCj4SkINt9BO3hoJoO/FSp+oUXfh41Qenjvz14TEEX1EbzayN+vyg
-CVVaV/0/jvUDNM4RyA==
-"""
-layout_big_with_dead_ends_094 = """eJylVctyAzEIu+9XMMNd0zb//2+1QQjspqfsbOIsXgshHnH/7HrcrisNGBYsG2LDazuW9XktgHlZ
-fOVL+8nisZH37bKt5bsYwLB9wkEX7Wvvuaj5egPNwDZAs+XpdIzkI3KMq3gW4wMgz9KrBZsZgiuk
-PvKPiG7DzLdxqMF4jSLawZZuVrhah8aH4mQAcdKvVNMzF+E+mWEIHGl6POMspzeTBPANiEoxEQvg
-iGsvkAgjoxEOnLeJ3AKINMPKI2MOJEfSSl/oJJG1GPhk4AoUNhjUS40RrAhQAhC4ishEqosg9RLf
-yaCSrz1rbPODT+ulLAQfjP3g13oTF0eqVImHCdqLakjGmC0GPrMXcHDyKqg/IXQfD0mDQUuijrcp
-Xn1hKCjsAKgoVXZyIj5ZfVXYI/NkYNqqEiLrOF4lBBepKJaoQYbA0+CdORi1zKhbL8kmBt1mkS1I
-gzcdRgFqIpV7BWpsv25n1zi5Oz8A3k2KqBo6q/XmEcvTXTfGmNcYszbNlhvmMRPZu9efgSd/WLe2
-jSPshcF9IA07qrRqrA2AURUxthSMt2Ajoxkvam8BfHVuXR0/QuiKom6nmo//XBOpW+76hz11bhE/
-vJ5f06MSLg==
-"""
-layout_big_with_dead_ends_095 = """eJylVUFuwzAMu+cVBnQntvX/f5ttiTTl9rQFaBvXMkVRjBLxv+uJ0S/0ZcT8I2NCW1FfMV4TYF8r
-Mn/HDTAEkOj7YNTv92LQcsLvAP2DjbWTJMpezZtiEMwSihOjPCV6jcHWIEke9mHfiAwdpYQOzp0M
-c4DMnTkpFAFEcGlJYmv/CRDAOGIwZN1v3Dy2c8wTAe48uZgfWOnRSsoMCNYO7U6sVoI3I3h0KLWL
-x8LEgIh1Hi7ramgdk2FQgolBtAKu1dYntYIkMgYU7ngKYHo6kam7R9SFMtcmW6zB4O4P1jhwMYjm
-pbntBqd0PG6BVkIawmJOFS6FreSDZoH3Z6HBodrvIvYiafvui16TfGsa4MjTiiQrnMeaHkFz4uUA
-MThVQD3Odr35oLjLLx/MdFlLAPWIKXU6Vp6oosmAHot96220J0UJBqtok4/RNg9yAQGgC5CjpVkA
-zgDJrB6xzJczAYNzRVNtmG/ZhQpJBX0IVCwZFFr0EqpJpoFsvwFgJmslEeBtzGQeyMq3zbsmD6dx
-muv0WMbb/Wvvm2GLCfB1M4AT/vi2K8MUgx9RP0NQALgBrnfvebX9+Xp+AYn1EZ4=
-"""
-layout_big_with_dead_ends_096 = """eJylVTmOAzEM6/0KAeyFPf7/tx1bpEQn6dZAMo5HJ0k5wP/WQkQkIp9HcL8fWtCPjE/rtwI8Ztif
-46sA7XFnDJrW+t4B9iajPNFu2SFgjzwZIvtYFegLnbCe7EJ7a0/RF2IOn/z5GOaAsH8+thsjC+g5
-KkBnrHCOIg92bJXjrwqDgJq6vJPf2eXnGGACHOKqulSFjUR0Q3N+7MT8GuJQKPQ7dr7PQBwmA8NF
-09hnyZSHj+ODy4CcNzaiURVB0mOz29UApV4G8CcAS2m3HE7CpNzAyTSLkiUCuu1sKRMDE7W4u1sA
-DCCrfnRtmBkVtVmI3p9sPiqvLXgHKma9TO+bOV6Iy1FEg1j7gc5ldNC4GwuOKgiiqxN3GUkt4BPE
-vH4KxHv0326khk5+zAYDUcXfdxc0R+0GDY307y3EpVepNglX8ZpxGTDARVy2horTcGUR0da/ZiGp
-RaOCLYT1Nxl4sew5lQ5MneoPuoUMFo1YUHKvQpqLJR2by3vqYQtdnSqvDdkHLH1WVfCIa4Zz+HW1
-vt1xBmJMAIIDjeBcDyFiQlQzR9P45aPilNo0tJT1J1AYVAU/8WnNVXCh2Pf/xihDIP5nrT+WZhHg
-"""
-layout_big_with_dead_ends_097 = """eJylVUmOwzAMu+cVAngnZqb//9skWqnAt7ot4qYORVGUCny3LpjxfsXiujwLMDyX+tr7uP9xAFmK
-4LgAFwCet6EAfm8AX/Z8Tgz8IZiGUQBTBvuxzSpCRCynJQBMAnC6z/04yGS1NPDvfLJCxGsGjEhs
-KlARXYxKFQLsAGhd815K4qK8quBbBuwAFLBBzzEBPDHsQm8Rp8Z8s3QGAdcA9zFGahwA5CEWcmmZ
-KW0Bkv+BwVCrE+y9urN+ZmmQZTaihJ8QlVxL0yADYCm46VPulSoJxctQf4SRah/On4IIg1u41j/i
-M7GukaVTyMxzsyKLn1cvbLWHZVcukuxqieOv0a/9aMlYU2gChKbMFwOJjLBxdJ9UwbqoUfOYSNPx
-Wq/FoGaJjX7+ToB2RyfenuLBX8NnUhhZVO8SVwHY1WoABjtSKpe5VB8qNE8MmtcApKtcL0p20v0L
-wL29BkdIl/20LNx+PBmphlf2NgZuBh6bac3EGJNKdCZZ+GwczxnCYiTk8JFCiCDvJT2yRdwMtCHk
-MZr21oUfBZDBilAf/d95/tu68FcAmrdNFY4M4hoT6ct1/QOh3xEm
-"""
-layout_big_with_dead_ends_098 = """eJylVUmOwzAMu+cVAnQnZvn/36Y2qc3uqWOgSVwlNEVRtvv/xuO2Bq91z+HOP7FvMOz5umCFfwsg
-P9XjvoAAqH9WuL38TQAosJ/jZgoEJOI9wa1hTAHFGBnjC5mI5t7prusLICL1ycTkB4i/pAl/r+Se
-ljspkpnD27J9umNbCDHoa6HNmHNyCgYgIzFYACCaFlYukVC7lggJ4C4GrOnlAcoHZW0h/i7rUkUM
-rBRsKylnlGzJ7RKx4E7plTRSiJYCbDCg3fxI1gA+UXKRbj4YALJ4Y8B1bGrA1+AA7w8TqAgSIJ3c
-aJUzWhkFycTaq9EcwxrshbsKCGXefVJ4KlCJiEODyTS6Cc0kaE5EOHExgLeIVdmY3NguTivPqigh
-q/IB5aKkiAsAHTZc23r4dlmKiOHNsGtPQaa+7H5VAVG5AoDPpZtJ2PsbwEePXsbprW2torZLelq5
-to0QIrfTWH1ud9wPZPyeIdpGyak4xBmRAEPEiOBucCSnysV1Mo3DpZbNVYYxp9HXtm4Zq15AAeqs
-UFdkc4RQj381d5QpTSeau9WGORztocFP1JQeRJ6j1OTygY97nEyfj+cPHOQSQA==
-"""
-layout_big_with_dead_ends_099 = """eJylVUFyxDAIu+cVzHDXtN3//62xASGcXDp1sllnE8tCAtb9f+NymwP3weFwt/WGrzOm63ksuq+f
-DYD82bgW8XgtWacTYI8EX3ffB4MTwKwZCIcCX9cCgJ1jUfNAguUkOOSlAHKYKsMbKwAjETwYzCAw
-WVQIEA1yh/3mqQEqmP1OTovBxgKQOhTAc1iSJ4Ay2J/ldb43GIAWx+P47nD2AXUCB4BEj6mBmkiX
-SoPU25k3HQq3KriHZWQAxUX7VPjhPOhkeroAhnHpQ6yIidXpob/qPFwYLocE6UPY2AE1S+ZB1KDY
-JorldgjE0+7rTGN4RJn5rhZSIeuqTwZOHSrKSMCg6vX1Em0BDF3g1tK5VdbtrWetYDHo2s/a1Xxg
-ACOx2/V3F4xyJ70judwk+y5XXFWsW1qbNndPBmh5o1JG0ldFdSecMtDGrNBqoW6CG9PD7ukCe0QU
-dIYAApDBwwcCTJebgWRTIJwt75L+aNoxm8FL9sgNATqXPAs1AXZvP/+/uvwPBlJGDKFuMJcS4Euq
-RjRgCx3hEaAuN8BP723VCDWRZgqd/2Cvbf1P4/oFusERqg==
-"""
-layout_big_with_dead_ends_100 = """eJylVUt2xDAI2/sUfo+9Xj/3v1snBgnhaVf1TJvEA0IIgiP+t1Zsfl4L+S+Qd2ej7mohav9c45sA
-OzfajmgZZlvIsnj29v40BmYxOAo0w1ig47YqPsQCpJlGkcFOQGwHT8dVvxLfQ7/+kGnn5VkCRzMo
-NkgGKIGiDAKJTleHjwNQbIplFO9wn0Qj6oYKQwaVAnbbHYSHTMJS3QaEA6hmBtCSQ4/na0I9v62i
-LpPzDNNg+nhqZFC8snxhercGtsKfHaDcSAdqjovAXOwDCYHRDSM23m7IABa/m8pEhDnYa5I7VQVU
-u7Ude20uRJb46evUd+UFTOTYXGkyYif0vPEYDJgbph27pVNqLgW0hlK/CXWLqmEzqvBHjbKMoHZd
-UQh7MIj3pkmAEqYSDI2MCXAi3QRY1tP3pTQlOc/r9P30aZNbRGPJJMgAbSge2weZAWgaOQCrNkaH
-NNCMqWkcoZKyCl2q9tnZbhpIoZfl6GEpRBfe9MYODtNr2G41VY+0MAZolpo1pSkHl86BPpm67dQA
-WSuPPU+FGusfW9N4OmiU3q+wWCTAV4kLK71WH67gAaN5TIB/rvUD+HoSdg==
-"""
-layout_big_without_dead_ends_001 = """eJylVUmSxCAMu+cVrtJdNcv//zbBWF5g5jT0liZElmRjgP+NB6ZBXUDvNmjXWAu+A4C1Jh+F/74x
-rMLR//rkXv35AvSR6+PCfwI8grxzfB+nsCWB+obY/cl/QdSfR3xjjnFzs4QuJ8+YdTXPfhQN39W/
-OEFnhud+2BBMF0Cqb1YsKqJzCCDaDB2gCICbzgDcrCBbLe8RkAfTNMhNTTNDUqpUKyuNB/sdIv1o
-9zcxJgCtM0i/oBIKsye1sDD5lQfo6/qSrp9sWVIWCCa00lwA8tDV08rH8iDlHPEFwBAbgZV/ToDw
-wKnykMAWFir1zSoAUtiIj6x5WIsPz8MlwcFUaHqtmksPWvwNykuCwqZfw8RsD7WdVqkHwBYaXFil
-bIeEURLJoC3JAqyFNZUQ5YEKacvxtgPYLN5qcZI4C7+ncSPXxtFV3r32XDDwXqkO0/TDbATbtUJ0
-3FXKCUkVWpuJruKfkz2QaWxd6u5gTr+y1BUwAEanHDEi39XeRTg3YD+ZYLeAy7R2AgRARCKjjHVK
-VXu/D5w2HnyIkk4tXipErTZofr0AX3Ym+Bf+R9caJ9M/x/MD0ycRsA==
-"""
-layout_big_without_dead_ends_002 = """eJylVUlyxEAIu/sVVOmuyvL/v8XTgBBOckk6FU+P7QYhCQb437oQwYj7en+yd+eij7W4vn2+AuQf
-z/Eg5jV7l/uc1vsE6BMD7t7m3blRz0PPXyUc2Jb3+8J6QNiDuANUJEzoWTwoMAeQV6C/HRL7DQ6I
-JOSHAEVzpe0SpszE4BDRtESywBMk820EfFDAh5rsrSXLALkdam1NAKkQhuAF4oLowUMGr4TQOwGH
-JhWamsxwpAKLVlnCVFhWDplpamgOSgVWDPsv6ApAgxYhOVrGjH+2NGZOgBQG6qR2HiuSimdRPYyi
-VTg32wyuu4qPRiCeLYAzzgbbjb2ZaYtPQ13ObFuCIyygaqgKb6cnsXwi6JOmONTBhh2N1IzkCh0R
-toyxmRlXXcu5Eqz7LZ0kX4mW8n6kkcyYVvw002M4coSN8oGmgBoD8l34lMOw35ZIBN5+Q7tBe3b6
-9PYFm3ksdq0j9kRa/Z6T6ILoCLWNC4YsjJwpsLrhGtG3Ch5gL5vAW4WYYVO5FvlLhk7ENdaHfC9T
-vS2aJ8BR4e2XNP7DZnmZhHACfPwAby8fzhCfZfBl5b+s6wsP9xGA
-"""
-layout_big_without_dead_ends_003 = """eJylVEuWwzAI2+cUvMdebz73v9vUBgnZ7W480zZxiBBCJvN/68mIyP2/Poi9+u594fWXFbW/fhsA
-9kpjvO723l7rhqsz1SvfDZCo13asIuvRQoRzCMEFS1i8EOSmxSLSswutUy4ACI4/IQYTW3ViELHo
-NYMhCMYjWIJARuFRkRpY4aNA4lITF1ExyJi8YpShIj52NKgBmKM5tcYIMpi9k2RtN4PJkVVjirk/
-p47cNAAHrVBYCTD88W2OiCpTAKNAldg5lley3RVbVgPIipPZ0HY4SpyLfjRdUEIxiNYAKQ68WHs7
-egG0uUKhY20T8Sgsu6wxkitzhvL0ZYvR0Mkz9NBukAapC8jKgqU5+T1WfldJDi49j4ZMM58y+GaT
-deJot5lQH5prAJPMDbEVHiown5vrCsCk9alyWVkiXiU+F6gPtDQq8D2xCdwD5Vi3va0P8C5cE6Lm
-hjsYfpyP6UMRjyEWPr7GSAzDNXifdjYRW8eB7SKOccsfiME1qp2jiUFNx9obwFA9axdCMVyCegpq
-8FXa6vRZG6XUdFSMus4XwI+pKMvda6bGjES28Z/r+QN9hBFc
-"""
-layout_big_without_dead_ends_004 = """eJylVUluxDAMu+cVAnQnpp3//62OJWpz0EFRZ5YkdiiKlBzV/41LpQ5F/Kp/+68IUK7eBgDpQ++P
-HXPsqAa+/vRrAahMVobhh0rOB6BajPuspKDBZJ2Rtg4SEQPO0wDA1RFIN56WZxoHqCQAqgjwsJkC
-ypTpq1xnAFtVeLgAyxQYepxlCn26sqWIjnl4BXUN2gw461ov35sBvojS3Sk0VEMArarROOA+GMti
-49Yhncw6+G3cAA/JpwtiJQfXyWTdWfm1aYDInx5kJzSLm2AwDU4CiDoUS0Ej4jSzlHLX0gmmtCJR
-/o1QLeWyvDewsCzm003EkyEyBVt7p3ZkvEXEQB66uaKhaUiOZFDM4TXIOkviyfLrU6G0kpDdyCgU
-uSN517eCrbKypTCdyGbSacVGiaYg3mw80wAzj+xf9vShPu9dvoFhmlm2knAiPKAOQAD4faea21jb
-3bhOEiwB2MidLdXhRltJRSmrK1ieGTbuE6STxQmvA60bUBVi1MGDjpe+2Cj+oMwRAE9eLYBvLpPS
-FfOtugvJloy38bmh/HFcP6JbEaQ=
-"""
-layout_big_without_dead_ends_005 = """eJylVcuOwzAIvOcrkOaOurv//28b8xxI1UvdqnWwDcMwOMB344KIqJxxZvfU/o7JrPBHM2nPfTvk
-zx34M/xMOagVG8cV0uvZYMs/t4NjR0SPmA3wnmoCcLv/qEe8P4EAO4WCVZ4c41hzB+ZMY6eCAASk
-QGyYC1f5vB6+CxKQoAROjv1Fohqmi48HcwAZxAHacQoE4iAWtBYSgWYlm4MiRCRyOhyoDrbWRDmo
-sGgsNnEQAlBGbwUGoc70HHaWcRVojwKxqC4HIN8jiwi2R0lqCalgx9S+wDBTdbYOhnznXBNNKTke
-p5CikdTbpFkdyEgzC4E+dtC58qipNd0pPOEV9kdGo7tYB2+58pbSTXAlWA7Mpz4qNus4a+0i6xSm
-SIKnDyOOFYkdrIlE34kp8NEJcaGMTliVUAa/JsebRi9E6Se/yYErIxVLd67FbiVSbnlBTIGn/IQ1
-4w76zlcJjTmFmREhGCRilLFSsJz6FVE3ru8IWhygvrlUhTkA5hr6zbKElHFSUl2F2adUK49y4WVP
-hVgjaVIiMUeNJIngVyArBaX+Ta90w7Nozrvxu3H9AxxoEcI=
-"""
-layout_big_without_dead_ends_006 = """eJylVctuwzAMu/srBPAubOv//9tiS9TL7anBsNSOQpGU5ADfXQvyXHr+7Z9nyZ295gZ8iw/sej0A
-eoAYeUBsfW7xqspILTvm1xicEH8nwCMVIoO2J4a+grdpaSkA9Qd2HwwOiUeCKjzR3tD0IfOd7OmW
-ExYDkJDaXlX64Q+KMXRAAUpwhmK8MkreIAcN41A9QMbp/usVc/wsWTPRRZ2a3vVyNtUe9dU2sVSh
-1MlUbZmCZDDbgQwod5D2PaTmq01CgivGSOHYqfuS6ADshOxpJoVKqKgMSCsBno7iWw3Ahoy92JQq
-AUqSu3o2kTE+XPDHunZq3G1osrTZOgwKo+CprhPokixQwTg/UFxncwrsgwpQZj4ArqaLQGH9SkAM
-pWpjUJzLflF86CxnQwCMFFnuY6SGJ6XR2fx6GKAVDzxDPsyVIqYiJaRuL+MkrfWMjM4lwGywYBJS
-KoUA0PRA86zIWvAkS1UTGT7O5FA+HDaU70gx11nu83hdByGzx4k+zFQRGR6UQfJb+zJ1eyJDVOEH
-3YFoB3bdaFKHse0t4W9UTPJVKRMZX1vhYWJaFr681j+6wRGq
-"""
-layout_big_without_dead_ends_007 = """eJylVUmOhEAMu/OKSL5bs/z/bwNZHWpuXUK0CoJjO6k08Nm6YDSYGWi67h38etYdw3jIifT77wNg
-hCFAADZ0fa3ABZgBwHcxiBw79s6UyWCDig33AIQARmCi5M4BhI2zNTZFOECEWjxpEmB5sM3JNEWy
-AfKe0soDJNRo8DfGdNkZYDArfyk3rNQpzh1rDlexHJc6T2qbcpQYzI8D+MXJw7ZL/Ur0LkloGwCx
-XlyAlO1tZrAogFIvFUsGbYkaEtrYABRbdrmA4/lsIQzWyr3etZkeYkzhBaDA1IxNHEedBKBd3gyX
-fcMANocV3kiBRc1bUafuoJU5Tw8OwdC8W9020X2RNwvQ1Fq1epn4b6FMj4o+91lRAEwfJQplXo4E
-oTYt1wDnGjXa/ag8ZUUAIEaHdj/0szVH5cgpg1e7Uvq6tI11bWHwuGT69qTYDdA2i3rro3KhRylt
-1clCW7dc55cJ6AzmBO9KdE7khO38M4NLgvglYzmnCdV6dpszWaiJYZa0daXk5vbILcdugK+xdhdD
-fJNZy4irP5Eb4GcCY44mWUp18a5MCmA00kfr+gMPexEC
-"""
-layout_big_without_dead_ends_008 = """eJylVcuSBCEIu/dXUMU9tY///7dtJUBwvK21084OGpKAtvv/xuNm9n6w/tb3Y7ivMFZkx8E1iOl3
-AazABuOcOPu75XrEPwB2Mka+i4FVes9g8FprXyQUoSJv+0OAWOzxYNCTKEpPPVDpEmAL3HmGES9x
-dLrcbdaqEyAXqQdpIndseiXhZDCdd9GaSJD88VjEA6AlnRIqZVZlYrcEDH81fdroaDM1QfbBJZZy
-jD5W5ZjblEHKTJVN/KIMXm2LCSD85x5Ma7znzyq8UlFx8UDnzrEBQmYzaIcHMXU4frZuJHxSTpOW
-+y4kaJa1B8i92gwBEWcwqTQELfeSoKQOukJl/gw9jdllV8fUSwwayUCroixPytKhA4AegN7cwJJf
-Lp0A3ZXaq2sgb4Hr8DhCz20B2K1CwM/DxmYmg9HEFKlNc1NG7c8mGmmtVJbMI/0pwUSC9inPTrS3
-JO5Lr8rOs+DSa6Rv9NEx0wa7XYqDQe1uoXWrd4HyBTXKeLwtuNnzkPZl4P06KK6PfzUD7DfXliBN
-2+71dcZ598GP0uXtzbPodpaROCheL8A/x/MHTLgRUA==
-"""
-layout_big_without_dead_ends_009 = """eJylVUmOwzAMu+cVBngnZqb//9vE2ig5RS81iqbeKJFiVOC7cYFcC4tYj+FLrN98HnndALFxP4HV
-oP3G/ez3iInzawDYy5UB8+T9sUVDa9irfcMBPPwZH2i8Op39YFJLAERuoG7gDfNzZgAjDHPHg1RK
-7BQs3j6xKXjCyYCdBhC4BCu+qlIU1iwhz3ohauTowdcvcQO4EbrGQ9HER6LBbXPDMaoQahlSJoq8
-5mKWpPtB4SwBTINWZZKF8oqzAdgAhgzMiEGhG9C8+QSYVtIBMCyR2wr1IQOwOMJIz/zWyEDhOKwr
-DSqD6fR3FKaMVbmZIVga9DI+bO/FttfZ9mfHOEXUctdqYyjAsNqTAvwNkk5p4DxLfspA5pCPdXhm
-0ArtAJQGsmtc0wvZNCK1ZGWklV04pQrWJH5YbSPtrpwXyuaEDDwNNN9zaaCY6hgs/81mSRXC5lcU
-emWr6ufCdIwOlxFGF7zw6JPnrJvS/4AodyYFeqtuEN26OJweDAJAa51COmNFD2pdtQpEB/iZGYNj
-Xv8XI362VAP4W48hpU46jVc0gAtfjusfTTQRzg==
-"""
-layout_big_without_dead_ends_010 = """eJylVUGSBCEIu/crqOJO7e78/2/baiARvQ2HaW3tmEBw3L+Lx80sbIYbIvJRb4xLodPPArhsS0j3
-+bOF8fE7ANri+gBvA8SI2AYnA7cuikpqlAMfAI2Yg3exNw+ncA7ebIQLA3/fjGVfBztpCvQlDwvA
-66OpH0rG0e4i4KBhS8LYNQECq5H6IWWti75MsTAYs1YKFMQWcvGSdI9klgQkwnYBmURbv5qOrYwO
-vJnYWSR8nhtjn0xDOgDmWBP7LuNQ1oESuiW1FzSKdeIUFk0ZkHBYKYm43QBsmqiqRCsLjaDsRUT6
-p3aiZR4860PdTAlxOyKrkASj/EOCIuH0Ma186TcFCMmBBpLoR20IkGIXTBQR1P11QBkpqgdg9n2y
-fBVb06aRrDaSAd3r4mocVb5PgNgEUsIC2TsrI0rqM/GrB3PbpOF5LdXdhnKi+2nlXtx2K4uAvG22
-HJw+1nRISfDIpjVKCJhooxGSRL1k23FPHlNt1vstaQQzLCG3srVB/afwzFYKWPmHjM7/sPutvDP4
-03lctpUmtqBwfPzLeP4BHGgRwg==
-"""
-layout_big_without_dead_ends_011 = """eJylVUGO4zAMu/cVAngnZnf+/7dtLFGkO7cdA03TRqEoipaB360XWLsY97nQH+j+Ce2v7zdAPTjV
-cDXX6mtH0wAN4VV/HgbxaEI5l/OTy+AEnBgus8Og5q03FDr8JB0qS1uksugGYA1rZK6JhnUQWVe7
-DJAM+ylhAAgD5QLoEuCI0Llz9h0tIixidRsVzY4wo/drvEREYEoHtREqgQ+S+8ktQQLdi8HAJZCY
-BoYGDmCokG105tDzUdNtDPHDygHQyFQta5x2JtdqliA0gDKumx9Kfik9wvD+K42ZQjRAdiHTHBbS
-oJ9sLpQMNzbsxvXf50X75nSB2EbI5eDkmN2nbUC7lrCVNQc+NFjXdi3h0mXAy0gAV4PUjQL4KbVE
-XDi/VNj+NRY9B7jC1gEwWswm8aUy1g6jAm6ACmcy6owtMB0iLyFkJH7sD8kpAO7OamtdkzE0oHq8
-c0NFM/+d/c5ggFvVGDwITFkl2ZcYfE4pR+wkXftbzwmVlSsYXDnFJz2yu+3yQcnlO4qXQc9XqrAz
-67KNYcxgGFYe0XRERQnPZvq6zipXN0kli068+xh8GPzNNm76nR4/Vx7BTCv/33r9A4pxEhw=
-"""
-layout_big_without_dead_ends_012 = """eJylVUmSAyEMu/crXKW7apb//20abNmik5yGpBfALUu2AeB/7UIE79+674e61YAapw3KAPG7AO4f
-1rWskZ3I53qLejGnPYX4vgG4Xo6m7jhFOZUtgmW0JaxB2OfbvG7QU0DgPVRA2ABMwGGX5tmj3D4m
-NwOukWJA8YU49IfNKl0VQBrSJCQ4c3w+NFnCHsGwGEgp3PxkYBHeEigAjDcKgPGJQfEHHgw8vRXB
-J4NWl+LvqFkWxhcFEk0tpSGnJohZcVfrd47mGSnYas2y0BLQf6hs0OUmd6t1vRwA7Lro7HfgITLZ
-2LdJI9rIJRy5LAZyn1VpDOqjaZSJAYhTX+VYAG8IGv8BYKYqM8mDwUucmoGHVXtHy3YAX9QqR1gw
-H7lOMlcvJDlJEl4MXlns9/1nApCV9F6PRxq9uGeDKyIt4c16GV8x5ZjUm1oB8GX9vTCYNKL1O4Ox
-+cDg2G1OCaNaAHzGgMMpYUktwKu2zpQwh8R8yOoekysfloUEZmSW0DFgMWDoNoXiWehyE1DMEVJ8
-LRpea5vBV6Xx0/nVUzHqtHfsNP4I+Dg9ddyem4FO3zqNczH9s11/olsRpA==
-"""
-layout_big_without_dead_ends_013 = """eJylVUtyxTAI2/sUzLDX9HP/u7UBJOR0WU+bZyeOQEI4mf8bJyPi+e+B9yTrWW8AZrr7vxvg2dcj
-7Fqz3q77D0z9oGE+CfAa8EUBoGGYwcY7mXi/4UlW2H6bALlIv1fLALgBsPPhojTqKXIBsra4uCbD
-RQGTAfrnoUBpPTCSWmQS/clgKCV/OgMtiAJAN7KiMYY0KAJoAEwkK5x0hshgeJGCHpyhaX7JjBQF
-3m2iWxzJKxGV4QoRIktHMaUikQSQx8xubq9kQecBBrf/HgBgNVqXZbIYsOpSIaeQFJFZr6cIe9WB
-luybXQW5rrSCWCwx+qFnWLOdLQhUHesWQxpKHuv3TlfBTL4XVyaaljq5FKr12b5a83F0sHSbpcUo
-wx4vCYNuJ1zV3INFU2aQW9xkH6xu8pU5TYydgkJJK7k43OECUBXkxq5QqHsmpfVquM22CniEmiPi
-qsO2VU6XmySy8i7m7OAROGtSMCHEBEUh/p5VY8frZLMx6BSxCUi/xFRhg3nguI5ffViu81pH4Gpw
-dzhBUVWwbokFQOTrpfe3gxl8BDt2zk/aTQW5ZdjP4AB8WWVGWmi5FP58dmf/yX+O8wMEAhG8
-"""
-layout_big_without_dead_ends_014 = """eJylVUFuA0EIu+cVSNyttvn/3zozYDCzObVE0Sa7xNhgJu7/i5ebhhvsGT4uGu8NsF47sDP8+TMz
-nPuV2GH+HQAWdVdiEYCy2RmeiV43zjskPKD3jQYLZg5PFDSqkcEpeh4sKRgSKI0MEv0gJYBWLd0H
-ypgbxEePtsIAQJCadSvtAOD81vkpC6aEqVy+ZG/2G45WKpNmE0dgTKElBLzdFTZA8ksSN40tFapN
-bLWovT55T1vC9Giysxk5Disn2uhCseXIVxMQOnomJSHmcT2jHTjyqJj0S1IbqXRF52qG8H6KJmbs
-zwbgBggOLW9kIS6rgksUnXg+qQQzKcJuymYYFzCmIEVIUtYlVeR3SI1HD5L2MUa3KVmQo0ioXSjx
-+qzNCx3rvKgPYHXm0DDDSOItCXAKj1MvJdUQet3a8Qe8JMyN7APEs3O9YzP0RNJNPeZtpTcNicng
-TI3NQE9BKo6WQHehU1xnwgELeeGQTuyDu8dhcgB33fAKWulcJmT90lG9sUs5Oz0AgjhaRZ+CIoHH
-dS7gAvj68I+VEsb+SI/CnnTizz3ap60kcN2dx/pf4vULKF0Rhg==
-"""
-layout_big_without_dead_ends_015 = """eJylVUFuwzAMu+cVAngntvX/f1siixLdZNihTpHaiU1TFOUAn7UD8W/jeZ0ND+NXAvBxjba4OnH+
-iPDNkNd3ARQE71CALxFgPk3ACyDxUa/R4xqsX84Vg/wDG0APGYoGSYbFAPXo7JHQ3OokAwy/RXKG
-s7ag1lwyMCEINYyBycVmn72hNCEYwCyfEEKaNIMc85LTAKxF36WI9sS+EZsB2gucQLLTjDsVO5wY
-cHbODls8OIO17dq63h/9sBXrFBCz1xJN2RPA7oOlWGXIzbjkT+N4xlKjWxZg96YuBZytGWn1aUIk
-WzdSFAPZhA8A0ULkTGNSekRhL6vyAaD5QdYNY/AUXQOoZiuWYoDOjd5mEYQHpizAK4zSqz3ELvSQ
-Ds32mFKnh3A3Et1oqlk7UDyuUqAAzNgR5vmpxi3WDQ7tGKsy0bADpSoTw6BOMym2avutFj2Nc0gA
-oVLCKBa2nAZAByBNAyvemBTQAtBBM0aSPcmtghUCwxj0oBlwM4el4u2Evx/3CqEt3/wKbDPjoqDP
-UB1pXyPiyMXaej5wzx/AC+BH3G3O+/jvdgJ82I5fA4YRPg==
-"""
-layout_big_without_dead_ends_016 = """eJylVcuSBCEIu/sVVnFP7eP//21bIBCcvq27NdNjY4gJqNn/xrJ9Bvb59ueYyIHnH/v8xY946Khf
-AnDG7DyY4YBzIsaupLuy2fcDcAY84GKARqzEPoUM9SVkgIRMBp3Oowo9V/n7+LEilpk6UDIe/FhS
-GyuSDwCskYN0524GQ1xIyErizHXiQ/JaUKI10wbzLeAEP0wQCg0RHQkuc2doz30LEHEu8tPjTTU1
-alGaD/XQSwbIpbDYuDHKJWtmKLbrs6wLAFSlSM0m5pU+NWB9+xbQebMkI21rMDZmWYxHd9q4VeLB
-KEFluGXl6AvAaByxk83hH56BDBwTWTlvS9Q1rQNLF9gcsauLbsnAXb0BIHSNF9q4lMHhkdWMZvRI
-GRqEJyJiO+cL6aluLxlFO3dlzEqJ1VdpGTE3Ad5Gnx709Xpdbi11jcfNACmG2musF5DBR68erVDN
-LT0e7REHQFViZazjrgD5LgXU48TKRlVM6LecesxRgcQ9AOOuYHzkfDlgCUEVV9Kt5lCZ98htVrbY
-sLFvCWhGiI1oBm1ilOSyr7qntholaWMewkA8Xvazx4zULM7FOmuoOpbS5d34j7H+AHILEhY=
-"""
-layout_big_without_dead_ends_017 = """eJylVUluxDAMu+cVAnQn2s7//9ZY++JLUc/EMGyFoihZYf7feJhyQP46AWU3jDj2WM4/AnCAKCAx
-XOhbLD8HAEFW/O0MCg/YI7sQaFJ7bnbm9wVAB/BQYFb66JLTzlbKAANgGh0GMFUuIoJjex0Hjh8v
-Hw+P2FRz5f/6VBGDYpEYOjURHQkhAWUWMJUuDOQ0WO8QJDE7PgGfIbhrFD9WB3bUZXgBTJwzoYpM
-ToDcYOXoJEDTyFm4pXKZogYyEzyCVRF3GYADid3dUJBDxF0dbIVf0MGDQAe4xechhEiWDmfYATjF
-hzqPN6mw6U4awGCIYmMAlyqYIaCgV/2if1wZ7Mw4bZW3rKsLQDBfANzjK3ev1zdpl6FWB50WXOMa
-mYuMYhp34VIFng7qxyVYu+rJoKjkdzfbWd7wuHk2P94YfIAbyHEVJcI9UdQZxIHxTCcrPlfzJOC5
-VQcgXbTeyj2snT/LKPNXWjriq1VDIGFA7rfFRtpdpMuUbKIDCIMvLUmUa27fMdopTrHN7wvwI+gc
-4Fxc5Ac23I9Qtoh/Hc8vxrYRbg==
-"""
-layout_big_without_dead_ends_018 = """eJylVUmOwzAMu/sVAngnZvn/3yayNqrtbQJ0SSxTpEQ5wP+uA9sX6zsW8LquUWa/DpBQRPw10AOI
-xrCJMZvc/vj7AeDdcT/+jYL3XR6e92Q83AzsSvC7hwAd84aAEVsqbjpY5BcOSAAUT2biAlgX5KcK
-RQiANeUIKul971UaTrYZUKud5RwOCLiW47eMRgUAah9L27PMAs4KIOJSHTPDljAZc8uHGpQ+7cIA
-0MZDQzltEgVK6d2bg5A/7Yn8rVoY6D0xDPhO/wLQGaWRGhBtBZWQEZJ/C22A65XQmcZUI2mVVEKn
-zDqgmykARIf2ljJS+p7JIRtc/T3d516D6SaUBcpBlXyMJBZ7YyoN0FIXUwHo2kgbt4e6vuWEODLO
-VGoGoADu/LoOThcU1I+PBqBpxg8ekvxZtDugp7syNo06yKkx5ma2Y5p9Fqc9Mcrgnb4A1CHU0yqN
-ywX6gPdYpd51oLAc1Bbb81FY/QjrQNH5iBzNFMNeTKoScjzM9NzeNUh11WUWpDKY9iAcPHJKTY09
-8h0QPpkuUJLla6RfBMko6olyoR8YD8CX+CPy69FUDK7OGZKJOfh5YfAivjH4McqL+L/r/AFNNBHO
-"""
-layout_big_without_dead_ends_019 = """eJylVUlywzAMu/sVmOEd0zb//1st7pTsU9R4GikiCICULPLduASEoAbRJ2P2sOmzAGp1gUEECs07
-XDd6Kjzl/zUAov9qec/cbP/Fnht1AYhg/NbBIlAmmAt3APaYxLJvtT65dwZi2gv8bSylLHTdaADY
-DeLIipa2stwgdAkYHhyGIRJrBPVPYUuCbaSR1A3bEDc6+ODw4LAgMDwwPkAG07rGAFRfouc0onWq
-zkkBTBNffS8GVCT1n2vVVDcAcX6eH0GJ2FTU41UI2uq2CUM5lX3EksDdxMlg9FL0HMXYNctt4iZW
-uXxdGDJGgbqJaAxcUjJgOx5eB9tFmI3VEAsgJZW0MI6+L3x5ZOBdqKxXAsmam4SXW6kARnbJmsPr
-MBsrnqRzubAC2FSEiXGsZv5pYmuITN8HrQGYZ68D6F1oW7z1uB2r46hbWq8Ct+55ulC43TqHiXVb
-vfvesvDwYML3RIk+thnvAODuWbvRe8zwQDCr8GBYI6wvumEBzcQfeRj5PtM4grGab8BgccnfUZ4t
-93zdDpV6I305rn99hBFc
-"""
-layout_big_without_dead_ends_020 = """eJylVcuOxCAMu/crkHy39vH//7aFJMah3cNq0WgoU7BjJ2GA/40Lw8e9op60AOMpX5Ha/y0A4P4g
-Hu6TSIC5pJ0SDOPc5wRYRDcJk3f+wnV6Tohfi17kRTwBsGLcEtgjiAD7YM4LgHESMREznICdkaIR
-PsYNgJS/4c0DbkNNRwcYpY0iMgkG4Aw9jRZeWMZInEWPNwmQhAfuOs2wlvzVAJMQ3+yx1Grjh7XJ
-NUoCmtPdxF1I7h/3nIVUoJj1lgAw3VAcTeuAS0jhyoE3hjfCwwMn0zSrKXl55G34kyrxsWmgzCp2
-PKvIstBHJG6dLKKyxcKIjZey8qixRZ/diOiwpjO2nBG8upaW7s7fVRJpfK1Fq7+yZQFQBo5KIzt7
-C6SgVBxdRPVCCVKdDsUxhgUcK/X4r1nQubwIkcLfvL66WjttL7K5OY7N6O18ltJ5oei20fXzLmFf
-kai1m+iVJAnvBqSSaC+sm3a5IYJdiWsQx2hWIDqMWxjVTE7Y/j/8QgkLgfJAnX/hQ0b7P1fh9ELK
-ZRVimPi17euNwG6iLdyq61T+13H9AEy4EVA=
-"""
-layout_big_without_dead_ends_021 = """eJylVUuOxTAI2+cUSN5b87n/3aYBDOS1XU3Ub5oam5gE+F9bsLMxz3277kC8Yh805LPa7wagfnhp
-ezwRiIwO+Pt1fovBE0QMxh6fDCwYRD9LQooxf/Dh0UF0Tx5MNigZzgAiOoLDKAbOeQ+7euCgHSUB
-WJCcLOveEoIAR2bXhRuQeUiQixIAmTz8C60AMgeKh1PIQxI/yF1cjhzEUBEABO0omzpxEDXPAYtO
-xTqJJOz4wI7nAIozATLbMZs2JYgWBWB8BohBmcRBTUdJsBcGadkx5ZKQuQk7r/LkmPHjjAtbwnE9
-qxEyoLNmBbRmIBuX2VfwbAblXQyHMArAK/w0iwPcmMlp0yEjicVgh15dpDgsKaOAldEGQEEHg1Q4
-yt7Cepm/VwAKwOSmlpAjqrCeGVAALbsk3GrrBkArgCrh/UjmCqE4XeANO3LAGaEfFete4NOS7kTR
-ibSVZ8iWMApcRGOGej2ItUx0msFJjiNTUYW1KltXsMe29q6lAY+lf/qgpcW+wzMHKLOjezqzqzw5
-WN6S+LrvbICvnOEyXm4IH7vgI4Q78ecUxrSlMgvLLebYd/uXhX+29Qe6RREs
-"""
-layout_big_without_dead_ends_022 = """eJylVUmOwzAMu/cVBnQnZvn/3ya2JIpMCsyhRoGkTkqRlMxGfLZesVZ+9qrLtbCW3cfc9qO99UsA
-1N6FuQ7y+brv880gKkIAvjcAnEFh4drW3YTtS1W49otBcatXkUQKABsyMPKqXqIdABBcndgAaAnL
-ALALhjAY6lU6TuE4ZUaGKrgWIBL6x3QcSzzoL6HdaQYltiiOR2wEyhn24QZACaO+3NR+OfmS0IN0
-6qaRIDRmqtIXNANxE+YBVENPAU0Ehr8a8Qozd/QJwI25+VQS3J2eGtubSbNVDBQXNEQlwKF4LQZW
-67lQcC6gJTz3+t3/YN8weBJtIaZtii6aKLZYakgtO04s4BIeHWsGczCmq+vBQAYFXY4AIKaUTw9u
-B6xGduKBsjoY2hBKGGu0G2umPuwoz8kLdsHTph9mthWC+JJP0pgnAINxBjdUAkRaMwCcfAj9yMxE
-sugf440EWOsZDHseLd8lGhEzB3cjzkPM303mpQYjRELB3mZUZJw4Eeo04CTSl/aLudUAkq4cPmIl
-gx8BkFMQyw/E3AuDHqRP1usPukURLA==
-"""
-layout_big_without_dead_ends_023 = """eJylVUtyxTAI2+cUmtFe08/979ZnAzL4tat6k0ywBRJYIf+3HkIUACJf1qrnWdIrHKEe/F4AeJ17
-wWwIGBnwy3pDvcz1uQF2fm4QMKH9pCsS0Rfj2JPY2M9MmMH6WJG/ALBZMNIUgAtbkcrwps0GcJYk
-DNEQPkmJtwI769HA4ElDBowe4KJAV7B2KhDXUhcx6eM3DQxg1QQ3SkxpIn8RuikUwLs0sRm1z/UA
-fXcB1F43MXJ2okViqqXUYH1RzSiFGstKRk/G3YhqI3iFkHVXTndgDqMsIrr0PPGgQ6hPBbs8yi7E
-J+2G17ZRhBgcZ4oScci/FVCeCd4YEq40WcL68FCux7OXsyHYKa4Up59RwRgElvY069JxCh3yP3fA
-3tEnEe6tYkzc+auCIWFNf79ux59qAJ9z+cfouP+WZ8h/Gp0A9z3p/pH3Ki+45yZnY7SxtfdY2bhJ
-0CkpfOAZRA9AmAhSEcZU0A5zrtuTznQ3QrI4xybZLKMK/IWCzsntLN34Udd0l8Sjwe3YPFbmuG3p
-NJh/Aaikhlm3p1zOruCD90J5hwmzGSJsOQoKX4O+sgKN+wFXhPwHM1+WI/1vPT+uzBHm
-"""
-layout_big_without_dead_ends_024 = """eJylVUuuxDAI2+cUkdhb73P/u70kYDBp32o60rRNGGMbyJh9dg2b61pfWB+9LG6Wy33fQ34DAOvF
-kdZ9XxmyF87S2T/bCvB9AAx2IDTvtORkucp9AJmNACEjYvYtyawPBKAYnLVhpC/G9Dhz7Hy1qZGL
-AU4KRiA5lxFl44nWdZeQtMu6JSuTpBpKXOlARAFQAVe1Xun7s3iwEeNLHKwy3tBHdpcAXElVft0h
-LXUB0D3Ln1sRSfpe40kJAjAVwKWZskYwEGoBMNVEyyp4B6ll8YjJ9l4A5FfKrip4hUFNpU4ZQHbo
-k/L39jEJw54ARCfWMB2ADI78lhW68lgweOOGx9iotoVG6SMbZZPoTebnAsRTCaA3Q2cDVarG/9je
-Zsz4vqsQ4xsN8ugbUWf0rwFUNvrkLw/lJmEd4DpPa5ZmEZnVV9URu4LDbne0eR+DrSYmA5BYVHai
-CpG/gEyzPT2oUmDaf/Lb2Yg4CU8fvNKvs7Gy9j6gB5fKOhvBHjPOPyXGM6IPIm/8W/TDlXRlsrIZ
-CPClZhOulTH3SiW7cwP8vExN/aG2vLLPufQ++OQaf7pFESw=
-"""
-layout_big_without_dead_ends_025 = """eJylVUluwzAQu+sVA/BOdPn/3xrPyol6KaqmjmHJHJKzBPjfOjBfNDDu5sZee+j9uqz17QCvN+Cn
-dcH/CQch7fWJkKbxPwPAbmYWfwPGir9pJIAcLBUOEIc7eIP31QH6ifInLIQFG3MN1wqAobWDGMTE
-PvQGExLyhdlNXSFBOCZseuR3R5jzl2ylnfHhOw0+DMhhLrdPdJRQmzxjtBrag5WFKQvs5+3L9gAC
-F7xYR4YB573cpUWyTuYaFG5cYUYCNFO2e0FRsgnAqgIFW55bFlJDJo3dF82glU58awllHMsMR0N9
-VW0OXnE9WGHSn0rEk9f6yoLi1MRzdCSYElTXthRLUIyE9uPyKevVp8LkpZ0uCZqT6Iidt8kL+0Sj
-RB10G6HbskeCcEJ19Ci96sA6SyomqzrqcYm0NVAwm1uCZ/fXjqNnYXozrxSANajYB5aJaz7UdJHu
-YksYGNQM2h7YPbfQvujAm0PugV2LPsTLT3RtCq4MFChrWZW16Amb+tGbdwn940HTNFZN7pUAH/tZ
-B2f9rK3pJrFjTB183Q4IlzUDWwWnZs/N7G/r/ADTJxGw
-"""
-layout_big_without_dead_ends_026 = """eJylVUeOxDAMu+cVBngntvz/b7u2CqkktwkGk2ZLFEkpwGfHhfVy6CGw2Dd8vP7dAbB/dezLWANQ
-QfSy3sfd9wnAioqKj/iLzZ5Uq/L2PwDRj6EYgBb25cl01ie6E2DtELFn18veva8Pgv3Y67whyK2F
-4IQ7sE4WL5zFIhd6S6jACsjzaw64LB9Vn0prBMFq0YAijFOfXNVwOsAyxTZBycE4zA7IE0MFHk4b
-gUroLWYQwwIMBJIxXnFUf8NgprxMb1baG/gVenruFjSs3JpMvujM0PnPFDwB6BK9kpY2TcONLEIw
-gLWo1QttFtyDeztT2bq9FOaNAkMwjJ4KeFEPWlGddcEYyVco3ms3B7fo3ksED21y0ZuYkrqSXVOY
-cW1URXuqWdJ7s5mKqZ5X02Gr2qRcvzuXOVByvjzHp25RbSLIQpCjwuar8dLyq9m1qpvJ+G+JsvpI
-rxLatGGWS5qIu5hl8iORkzMcohGK2Y3T6KsI6+ETfU+NUHoAm9btaR/sqs++AuAdQRGmk/izr0a1
-10HwBfuguQSmWOWf+qyw8s/IP00wxvpjYqQKHx7XH6JbEaQ=
-"""
-layout_big_without_dead_ends_027 = """eJylVUmOwzAMu/sVAngnZqb//9vYlqily6lukcRJTFGU6ADfjQWj7XEPe4BsM38Ci/99Hjf9/BDA
-WYanlTkEED/9z/g9AIeI3yhiVkcjiAQwi5PD2AagiV4FTPaKhFq3s4BgLsBY6CkkBY8IVmjoTd05
-AJwMZv7JwFIBpXAnCylCxqz0kXy2Egr0MQWlXaIwIprrzsKlA9AB4HVlQ5FeTdae+HmHYvCudApl
-yjnCDBGlgVmPziqkGIACiFXIyw25uiTeMXdJLWoMErsKdzvRdaaTRNQV0TNax1GrmgSDLllvOjVD
-sH55l5cBMdBDOHbTxI0McF0JB9BVZyC5Td5j+rDTZ5qp04rOlxPyCWwwUKQ16edEMt8wqtmFZYgB
-2VmgxUQxqm0QlbWsdejsGqTB0LxWss0eaC1H9UFb5ev6Fjbs+dTv3gdeFJZMDWuK2N1248MZ0Cwd
-iuZb08bHTIAv264YSBLpiYCLpIY9u13xpEGbZBnt03Du680+qQt5MyOaylCorym0/U4M2IIOBjJT
-bnzT/6d3WgX7Z8csRVj4UaT0YTJ4m3+kEN/QDfCXlb3n7niMovk3FG3mAF+O9Q/rjRG2
-"""
-layout_big_without_dead_ends_028 = """eJylVUFyxDAIu+cVzHDXtN3//62xEULOtpfWO7vxOgSEBCTzf+vKQCSQ0Qvx81oWuG+Wadb3tRys
-z316+K1/cxr11Drb19hxIz6Xg/sAbbLi5z54xEf0CcpH41oIlvV2QC+YjXDBsJUpv0whKonYmPv2
-3jovjMGATSI2Bj1Hy+zru49w0+JA2RFEJ4QyxtwH4XoKFXv9QkTUpmAe8hD6ycHonA2/qXqTQmD4
-BNpBFt6bDToAUwh7ApEPVLFJnPAKTAuJ+cBhixzsrCS/LmXMYCGZU7yRA6lC7hommXQyUKnIng6S
-7aR61gUpME4AU2kHBwe0wLhTnZ160f5SaZ9Y2YyTGbou8jAmB2gtWyPDvcYFgRhRAKm/jMES21QS
-ie55+sRIzOnbbiCJp+43kTGV7s30S814Vdk4qCIrEm2MbTg4fYEkdvCmlCR2WUyfvI9V6/OY8FKh
-e9P6NR+ovMt30Ys3c1BsjWwxA8Uc7LI1bCKRkjW4ttFcsPmQqrNEdWOXFxrkw0dakgZi7w8OYiSx
-OS4xZ9PlmGcKfGeEGDmEqHYN1XO1yu3go8xZgGo8Kw+MICYPOoWvGbE7Nfib67kG124nhEj887q+
-AeuNEbY=
-"""
-layout_big_without_dead_ends_029 = """eJylVUmO5DAMu+cVAngneqb//7eJLVGiXX2adgoorzQpMQrwu/Yg1Pg+sYZY/ZyxtjcS59T3Anhh
-YoMF+c5xb9VOYICYHfYM4s8wwPyJXdx0C1ILe/SAee59WOgwLQ7disi+7QVIvASpDgkBAHHI/uBn
-EtASevTDmUATKAkX/mJPwCXYfmJCunGWBGAzxqYLikGC7EXLqt9HMUA/JmF2ozQoSJWB6ibAKXoY
-dO4OlXP/BwOxOGJ/RlBEcibSiRHlQHGGnLsWtz2N6I5Ka33WYl15AOThpIpO7XH4tTYrjexjGAbJ
-rKM6+hoAZeU+CDHeTpgwqI/2BzsSj+IRAtJbcgGkWVi3iGpKAONihwaQDpMwQco00gtJyJX1y02w
-IHXW07ZmJDscSQtKY5urAdhBewqrzeomNBu2uS7X6W2cCnH71kx4uH2MVOuztc3qJYnhWm8GXn1n
-rMoQzsBty65IVI3hZ/mYS7My3AXIKxJ5RvCoai6hE6KK9PMZxV4MmC9S+zmPPR0qq5XUlEtYs/VN
-ab+E3kYrGTOc5vwO6C3hK8YK9emakIZEIc287Ul3x4O/p330pbI2WZWWyZSC+P/t+QdMuBFQ
-"""
-layout_big_without_dead_ends_030 = """eJylVVtuwzAM+88pBPCf2OP+d1ss60Gr6YBhRts4sUPRFKUC/xsXzNaH9Osx7nva46jH3wngz3BA
-sO/uQP3SEf+zGMBfX89kRxE5eB2smsG9gIhSsTzeCHovU+AdYHPUQLG4z3YwWGF2hM1kAcBJELJz
-cXENeCAzwXvrPoJvwinPVoWlyb7wbRpnBviSlaLQP0NEGxjOFC/ElCIagCK2NVlDoT8MOINIyf2l
-ZHjNWdtqYezINJ46oy7ByiKCz1hys0S08ILpEfaFGlXOgZTYARiVUAy2Jaf5Mysdcsl8pQnZtaDB
-0LNCdhOGmeMI2+PBoUJNAOsQYN5doL0w69yLtgzc9HMcPETElEhexLBzuSOOoK6J6sm0WZGI0MXA
-BMAjqUFkgpoNk6UxILUwR/WE5qjShNeiH/xeL4ebTMoOdYTccVRq7/c+NjCAo5hkVBmm+TWtbcrE
-KAbpjaFzVA+1y69GxWxDlzRORs8UpgwhW9VG3l64umqx/56UabZ11Wlx4YOI1kwOvRu+pAmzJ8AH
-RtA8jdbRyEBXxA3wZf3S03jzr8u3afzjuH4ATLgRUA==
-"""
-layout_big_without_dead_ends_031 = """eJylVUuOxSAM2/cUSN5H87n/3aYkceLw2tUgTV+HgjG2CcD/2oW1bGWrl6Mhn7YM/C96fh1g2fPM
-e/wCbA+ET/PXAEC8fQeAElAs2wBrL5sQVny8Y2MowGtLAG8+rRg4wO6z+prP/WdcLMfz3T8HACaD
-fk9Vcj0YVeBvPW6AXtjRi6kCrAGQdF2TGyBVs5jK9YdfHwzM57YGrXxorkROBo27Yc0BqqXV1qZm
-D11DaRAef9qYK/R47i6pDwYEMOhaxmUksahNYBCmjYjUlgsldnR0EryLomcslUFtvDkPEU0iRYV2
-DlZH4fSrjZQuyHwV0Y4xMvkpRlz2EgXJD29bGPb6QDKwlmbEbh1nQaxlcbjQJ5XRE8+ObbjLomAy
-aLFiuYOzJHBo0yKiatpMLEaew97QWgjv0wgbDKbw41gFu/YNvQWTU6NJJO49lUXG0aoIXD4XrzHS
-0qIlsaJwdZ1eTwwIoKV/VMGwcdHL+ixp3KelK62kHq0BndSSiLHSWwuAGs2D1jkA5r11Xj43wJcy
-WDSfOfDwvdx8FgA/QjX9Kh2em17GcS/8p11/M9YQzA==
-"""
-layout_big_without_dead_ends_032 = """eJylVUFyxDAIu/sVzOjOtN3//63BIAw4l049s1nHcWQhBAH+NxbEhoog/v3eJpA2NJ5qrkA+BHjm
-CaC8R0wB/sp4bp9n3w+AA0LRNxmgn4lzAs7pBmyLiy9Nwv5mfQCuBCNfXO29faDm/jp5KPZlO171
-ASDxGaMo9oGqVSRKA49AB4PKBR5lwh8xHUddlQFwwaHpdpgggnIRBVQHlo2SOJmhGbWgcRik0ENQ
-3YIqVeAee6BJIwFA09AjLrPQIte4AHxBtSQ7wxVmoorlwpoTK0Cwj2sk6wbQfG1lPprPa1LKuVqx
-doRkABlKZaamwdL6sWnl3jc72r3iZrKlSidqalA53iF09BNC2BvaX4tKZl1LQWYGgwGkMLgAhOmK
-Q1UbABnIjJ223hljHSbOXhwAFo96DRal3MrZDRvDWQsOH7VSsyCtumjrrPWVdZmgdSjGwqx4MtAE
-yK5RGbBB3+M4Ed6FSgt2FRBN5c2Odl3WGFundEVHBwUjEhmC5ocFJdndfC+NLl3pLU2aUpliYSvQ
-bmNJi8h24pccj7RN/Hq4NDEtXz6G8FP7RFyvTiyn3AOAfWG9evgPY/0ColsRpA==
-"""
-layout_big_without_dead_ends_033 = """eJylVUGOxDAIu/cVSNyt3Z3//21bMAbS40RqqzSpsQ2h7t+Ny81geWk4ePN6rSdys3P+eQAS6X4M
-CH38ihhvGMftNwBiEnvH/twSsIvdw6IAnosA4JwTz49tkHoD5espAQKICwGxaHFAcgLAFGio5PIZ
-cJoKMoA+bwmQhAoXuoSfjlcaC8KJL6kJYMWxCPnac7ltkdATg9T21hoqPXhJjCXzDcCPIPahJQF8
-qKvNDZBUkHpGxUWmLsmMucXGdkAMOiliYGSACqqkc9lYiZjyloM2PIBLpoM5WyaOw6CZ8TQyGgbl
-jELZVoTq5vSkGaRPxy6vOoAQawlK6A3gTehg2hJiigoahuHwQD75LAjYcHO5TAZMo7oEmwgFbM0l
-tdJNfU8alRcVStdOA/iA7p7T/cArE525zUBad/u8tDRPCjbATaXP2BhqKIeD6wSvvlLnvc9VpNF3
-JTNnFVAmomOoB4EM5p/h1TpHeQz3iuNsKEvfOuDoGMFlFN9uKE1iNfTTW53Joys7zl+IqVnYQUsZ
-vvxHLWaonDIsK2p1gSnhT0xDJk4zUSWJpZaeMI1fjOsfNM4RyA==
-"""
-layout_big_without_dead_ends_034 = """eJylVVtuAzEI/N9TIPGP2ub+d6ttGAZwU6mqlWTtNR7P8Irq/8ajsoetr89iwdlZadmO6Xn/WgDG
-QwV4YBGzrz4Pg2UeR+wyP+9t3Wk+/1nC3lhG5kj7t5GJ1ySgvGQBhMWGCZuFNDhX8tZWZOAAuP/s
-0TivvHAPgB2RwUCdAXwdGihOt4KQtZ+VgSkkKsK63NKD6siBIlOChAg7H3g+fYm0mADHGBJMyF6K
-510lAdLhT8o1uNEfjEoLO9wsZAC/+50We0aAwK78EPnCoETBtJGEoiRNa88D6wAh1t1YmAt3h4TG
-gLWEsOS9nYFdAAk9zEuYyeYXBqX8qwQLIBses0jlAnB7LQGdprxhwOMjaJlhfi7FB8cuQVVH3gyB
-uCdbIHpikkKq9KbE6mQqH89cUYh6KRXk7LPAWPMR5gmAWzDTUtkSpR35ngClO5iUzlFaodZz8Imx
-pbWRrauXkqXfAUAJvU2+bafoWIyZZBjjSp6t7bxkcLy2UwtgMIfA8w7amhIfiNAC+JgGY5X52NMr
-/hEXwBdReZrlP/9rsY2UuyX8cTzfiXkRIA==
-"""
-layout_big_without_dead_ends_035 = """eJylVclyxTAIu+crmNFd0+X//62xDUK4vdXzljgxQoglwP/Wg9iLzAst7I9fMu/gveJ58i0AHdHv
-sQLIvCQQEO4+hE8DWLfYBAi52Uas2y/G+pwVLwB6sxZrl4Y4/4v+ZvDCerCHgTnuXYUQiRbHNpEv
-EZeNiEUxSEMBiqC5ag04TseOurxDAmE6awAmX5ejsnCcR5PLOLbPBWBWogbJgJKjxPLUvBgPTFSe
-dJVUSnjm3hVaX2YW0KLWUyK8YsQguhwjCyIBoj16DoeepWIaQHXQ5Ym/BAlU8flD/T4KTuKK4okt
-/lpqmsOgbnU3wIsT0RlE7er/ufYuZ7h3toidzAMwmvhecmkit5eobnRVhmaOM+XN1FYpz+xk1uZA
-GjkuJqlBNMVuvd4mAC+ixoBxhSErtkdUmY+OXb3g/EpgFRfQAGqjOdKU9DFQjvx7BFajW7d3sAeg
-xaWmM9WBrqfsxObxmBYQvahZlEcvt7PwqaxxqXFeR1uj39PX3wtxbLOAeImYbjhLDvdIQ79APDX0
-5hovoBfgw95UWV2oKUSOELppYABfclMq1JFZymOtN2YB/HM9P1kpEZI=
-"""
-layout_big_without_dead_ends_036 = """eJylVctyg0AMu/MVnvFdk7b//29l15ZsQ5gcsiEUsiBL8qPu363D7Vw4P+uI5eva89rrd7NxvR75
-C4DAyj8ee26Foa24jP29+5MABPc6eFIwu9wFygKAOEBvezsl9r4zABK4YxcDYla4KwOqORGoigDI
-HVekhEMyKAkIIiKWDDzyoBcTxk3yaFs8ACaPDIJFmbhu46u3qANSNhgocsDsl4sLDR35jl9LAl9K
-BpYFNWtnLnQGgLmV8oiIkYMoWKYjmRyyP10PAAndpez2sNAZWEXOoK05ejHTCPOrBwVh6O6LTu85
-qjtGH3kro4RTTmdK6UdvZ620BQXwVoq1edCJEUy6EhTW7JGuBeD+ZFLRvTkMK4DHStkZrL5KAFqa
-thylZrpT0uEVmR90Bh+KVQVCxHB3eHCdihxF6qXeW61uyUBF0etJ7quz27zct0gAVkQr+fuELi4x
-PdAlZJrAltBQjFlafdWEWY5g1oFn78bOyEH/H8HJ0rLUpvKOCI6FOc112gckD9FMdo/5hoHmpWxP
-Bi/aNtzzi5rbhE4OJ8DvSNssK5VyTRw+U+385Tr+AesRETg=
-"""
-layout_big_without_dead_ends_037 = """eJylVVtuwzAM+88pBOif2Nb7322zRT3tYhhmFGmbyLRISYzq/9aj0hdE9q24D1337AkvvlReCyDA
-+MvCEChAbiibd+DnBnB8RJxh/VywPnsnkAAg2HqyKVRODiD8eC7aoixQDEBRSO448bRWBrp3k0mS
-cM6pwf6GenZg6gaLIV/ihAZFJRIhKitTF4ruBrBOW0QSTcWI6ajpUUnrg1nJ+n9KiB7RKQikF9tO
-tAQZkcVmBjCWsU+PaxS9y2fHPYtsT70BpAYTgPUhBYwqVDBlZ4Qo7A1d1KYGx0nKGrVj45sAQ9qZ
-wb2DOJxLxN+C3mCjNtLIzNOHN9Ibfk4BKUuaAidaDk0dBAFwIxB1U+2N0ZsUBoBrl7Qump0lyil1
-TwyvKVrQJ1oRdai0MmgLLUO5OlHvsu7KbVodwCc9DrVJ3zWS5sp9UMX9wE8bVQgKclsgd/qgGRy9
-rvIwDaLicQDcjJQ2GV5fRg8+TPb8UMo1CYe3zZ2lAXh2xWv4GrEXi79m6osFqcFH0afIL84kZgVx
-fvXQR796G5bhhHliqenZ9bOR/r6eb5XqEWI=
-"""
-layout_big_without_dead_ends_038 = """eJylVVuOhDAM++8pIuXf2sf977ZQO3FgmJVWG2lggOLajlsy/1crIwLH7zyfR9RfnrOe3wq8+X0C
-JA4gjq43oiHOS1zf3G8nH31uAI7UMRH7Iet16oGzpyAAJsxxUSqMNAo9AQGERRk8xJYVduOJArUc
-AALT+FIRIZXnHxAbVz57UnahLA+Uj1QBUfqlCNAMUGS2CqE2AO5X2AA9COIebj0NQssstfcgZbVR
-qNRtVy9ByJ7AXegQlXJxlwc9uwHKGkwG9L5OdjY7NOnQhhkYFnkpkW3J9RrUQHZyiR9mbpV/SRi0
-RHc09mQAdQVqYvWRcw3nirwYkLRMFJ/XwY2TmnuvBvSsTmK0tTnM3Pegvg2NXlLr4khzHgskbsk5
-Xx5y1lx02Z1iYUZ59hjOnpYzrW3YHPkpXl4eI3cwA4QBikBvEJSs9uKS/jWkOTLWWjoc/vNG78I0
-EWPfzBrsKy8PNbHiNKP8puSBUxC1Ntv35c3JUkA5qC1NDqM2zGKgHOzd8eHbMXWQeA5Xq9G1pXlJ
-3WvmwK0qZfbgPQUjWYWPKz+kEvpqjYK3ngaL4QE2wBeHPn5AxxtSAS9pPl8Pqv9U6wdxjxGY
-"""
-layout_big_without_dead_ends_039 = """eJylVUFy4zAMu+sVmsEds23//7euJRAE0/SyKyeOY0sgCJAy8H9jYW9sPqf9/PRg/5J9iXMFPfwS
-wN8PcvG+6Dznre9z8nPN+SiAGZd3Qt+EFjWakRYiooYm4MG5U8ECZKUWGrzSv9HI4FYAxkcpdBkI
-InSsHKconeejO0/sFdrkBJNHSoJSpBKjGZADICKb0D1kjdRyCuf5myHZpOo5WDEOsQNA/AjO3xiU
-lUK0jS62oYWxqvwc6RIBtgoJDewA9V8pHFVxDaWcvQxGA8RwtNEIXWyyY42gKO/kLPce3MJEgbgX
-VETRA4mohaGtZy283OkMCyaaR/jsyxLRrrBWdfuykQKxzgslaMvD13J4126VmDRwhrdDlP1T68PT
-wc0iqmBDjN62psfBowqvXeikXbPyMLR9MYIGcNaMkoe2n7dN5h5cGDMI/MZgBD8blgAYeybDbO32
-BQMMAN9d6hDunBAV6AqIzkCpHZV4Daul2H6FiBrTgpaxmskBtWs3wNGE7p4hpG000901sqMfQpJZ
-GbeQ/swc3b4dkskx6Avgc0ibjdCXP1+7tdu3Bv861jeJeREg
-"""
-layout_big_without_dead_ends_040 = """eJylVctyhDAMu+9XeEZ3TR///2+FOJblwK2hs7BbUCRZNsD/1gdxLV5HnvszAnEuHuf4vQEMLvQB
-AzhvsK/fNwBtB+ZjDBDrCmgy3LcU3/vXJWFDaz/eXwPNoPVMVQUQg0SSLwAgIQ/ua8uFUQxMYAEQ
-YiU6HJZLwuE1mE+Q/mMXAA8POAxu+qMKfAlBoBjQN0JME4dHJ9sEuEiXmUSMQ9kI5SR0hgDcx7Iw
-nbgrwHahsrAuaCZS9pXpSDZHHE5Rk0FEUy436s+sMiRuAGufxa5qsBhVBt87ohh0YYOSsBm1psxO
-y2BkM3kR96YmwU2JBkjoC+CVmfUOpSflWSYTwEKivMvOIUFNa7vsbowjbF05QK2BMl73F8DOBCmg
-umePhuuhCqgLLQBopmi2zAj7QW3BQ8JztSjvLitiVeE5bNS7ZokkdMHOgULvaydGqjXm6oGyAdpF
-nwa5V43IERh58DozuVt+zFgfv+vJ50y0+W1x2KOhp1wYA3nAZxaKwR4riDFqVzN9na8rv7Yq6H/z
-VffBz9AUR6hN1Xz3Uh78c33+ALrBEao=
-"""
-layout_big_without_dead_ends_041 = """eJylVUluxDAMu/sVAnQnuvz/b421UkovRQ20mTgxRVK0o/q/cVQEkOf/8weJodIDdgv/tcf3AwAo
-rVA4QOA/14F3X835e/28DOA1jAEGAyQAmHTgxKKHgfov9deY+lIEvmjwNACQhFWLpmXTCAb+OCF0
-eUUeYHjbEmJak9yLwrPw2rR6kAWPpq0SjnU/kSIK76XEc8D+dMvRErjwJnLU2hCdRRCvOgaALtzq
-o4wx+KV1VxC6NfkE1b3CLwB/kjA6HUcnU7pjV6dLiDbOVS/HI+QevHLUGKAYkN3ZAGClK/ul2cbs
-n9PIuNjdXTsCBFmKE6CnKTAEwAkZ9SIHIYoNNrbgLJHAKKWdxBClQbc23O+Wll+w3Viso0VVXvcq
-MEAQPxxuf5KZGccUtZhNcg9Q72vIDVTsUKvzjllxCVMg1n1t6S4zD6YzN+fcsIlBG0Fmv6QYbCL3
-sNfa0lRBKE2SADoBlNo4z4N2NtOeZ+Ku0wI2Bdrj96wzD5rB8IdZYYAhqjtASdg0kIlfXxvJL6F9
-E49+ZJeDYNdNgE6ZzGPqfhaPfslrdLL4CKUoOgPgnYO/j/MDD/cRgA==
-"""
-layout_big_without_dead_ends_042 = """eJylVUFuwzAMu+cVAngntvX/f1tqUZTs9LQZQ+usMk2RtAP8b1yIe6yP+5OMHpwTPbhA3y8DoMpw
-z98j1veBxRPyuwGgZbVmgUY+T17HKAAuckRihRhUaxAtRm20KksDelWg5DADNY7HzgeDpYEA1gbo
-FpBdw8xqt/uPDaA+k11UAwS8of/v4p1BikiMwmaAFKgqo0W/tvLqw74MAJVw6sQ4bBxU2VOZi82R
-t04ziSizpcHWdroAdh9VUiI+3OOSlZI6Bp3Fm150A6RpEZhUE2C11ouT4B7LU0Qtd5BnL9YAFiJS
-A9CmGesBgEdWsTGIAeDEbQCGrb3yQFxNprg9WNdKPsUOu6BBjorVnBKdytfpkOpUDiqFOphevNko
-gA0/GfBQpeJS+Rkx7pRxtDByGZsGdT2hV9qQUjl0obQHjLlpWYLhglNoAKvvW0QpFMAsf//iO/d0
-gTNGtluJ9hltxQuAvp/QiRNTnw7ItMoqnwz2PKQL9HS6N25g2oVkpyk3R9TAOAtcFzU/JnEbTDN3
-BuMdJICvqv30/so1fecCVdsAP8cy9vP2eo0u8NnvJP59XL9kohDY
-"""
-layout_big_without_dead_ends_043 = """eJylVUGSwzAIu+cVzHDX7G7//7eNDQLhpqdmmsSJiRASdt2/Oy63PiDX++bnzDk0ey2AhOJ9D/bs
-unqh+P4UgnNP/W6ADtlXMNj5+qRtnWYBDE6ZVwBtp0CEITP3uRgg81UZcbvDsd8lEoZAiRsl8DMV
-yqOQBHhXn3y3C4jwJM5pxFNOnPnRDBiKnieDBQAnqlhlxL0BTn762CLaORwlBInDDRHEaW9BRCK6
-8KSRCKURBcBsyQAzI/oFvxm9ubFFAxolXWDCQQEQ3WEKEDUiTAAtc8kXnVhYqDoWoIhoxXJqPtmZ
-OFUaiH82C3nzroYoESFx6HBQGqt6YsXsQsE1mwxSJmSPZqr2/NDWylBXAJd8BeDCGafd3Qfrsero
-jLUjfOiz9bu0N4o10T53t4h4zD0snQ8rLR5Lg4fNdSvq1MN0udcCWDZmS+l2QcsoIopIU3MCkO+D
-RgGAYiC1VQQZvOcvBrs7tIGdmxzKhT7n9l07gknUcKPWgq5hLaI+zTUrgMHx8p9ZIBhMaZrB8fcX
-98v/JqenoQ+BRnutHem74/oHolsRpA==
-"""
-layout_big_without_dead_ends_044 = """eJylVctyxDAIu+crmOGuabv//29dAwI5zh469ewjiY0Q4hH3/63LzWx98w+8jrv16XvYw3otAOSm
-I0ze92mUlu9rj3uP/dnI9f0G8DyzfhEACw+epmXivuEdIRTBZIA6r7EB8OcgCODKux6ZiziFvq/1
-hAAL3oM55WtcCMC4TjpYGgzudsYzHrPZTBkjxgUdHIoBOnEk5w1AvBAWJSgY2TVWJQBt8khLQxfD
-EgLQWqXTST6G/7hohRhClwI3OxddCkCnQyQUBkWwak4ArPn46EM66+LyimXFBGcvQJ2YrBuHlcay
-gVUVM6IKqs6iAabfkCFMWYmNUWdndxzRiwa69pMJoDa+ycFm+sQPh01XUKmeGmyeP0rGRKbWmSRY
-9oIkRuWwI5+ZZVVdNLhxYOmcpbVX3sWq5SZbo7sQLK5QgP1OVzVUsQM0QbunEeLCBYAW2efmMpzT
-qfvoMy6sQ6j5UMnB8G+AEWg2PXvhlkaesSoLneY9decFEgweZuU2k5uBzF3iHqVMOjXJNXsRY6MX
-ZWmmqaEW2roUgnl1R/YYZb38S1zrNDfb8JJ3CYTiEKX88xCDlOX2nkhhTWO7h/Dndf0C6xEROA==
-"""
-layout_big_without_dead_ends_045 = """eJylVEmOwzAMu/sVAngnpp3//20SS6TkSW812gZpIoqLbOC7tRC5UD8IBrhvj0e9OC6/N8AFEzBA
-CIBVuG9nZS/ESwyQb6k1Q5jAo+qDhHybUQW8WeWf1yLgoqeSlpDQh+hH86zjfJQMyGli8Sxl1X9z
-Oz+SIKJJ2+KrDVLitFGu3VJjmFjtbzvtkOS1/7uV0S+MVfoNoA50jjZ+uHRVMhWuJI/hgfS56Zm/
-sNpEyC397H8oA6ZjqmOoaQLw0Jkc8kpYmuKJppsAHPoyjYDdly7OCITJNFGd2Wkc41381Sc0qnW/
-lBXvpqRizO9mwjmRVqzRX9qAtZGP+U3UAzGbIJRd7QUUiQ6RHSWHJnWw7u1BVmr/6jkxXHQs3pzq
-s1wZ2iZt9v6LjmXooxUXADwIz7GB5+rfvIUAZt0xte2/EMeGSdsyxtobftW+KjqKngYrBoN5Am+L
-Dp0DrmI8D430gAYYEXEeKCPGMpvQHAzH5sdainfHIx1kT6K683n2m1hfAJ8ABjjqBinafI2qR79s
-tITT+AFm8dQxGHO8F37iUSUb4fSYlX0qoyW8D+c/aQ+35jRRDL5c6w9NNBHO
-"""
-layout_big_without_dead_ends_046 = """eJylVctyxDAIu+crmOGu6eP//62NLYGwb613Z+OsCQghSOb/1pPxu7C+78r15U5bLtx336+DXzdB
-d0D6w8hlBYSup6NPIujlCPwIBtSREIEW91jb/emTePHwJMviyRsX42M/Qlw6R7NFB0d4piAEnZhD
-XHZyUNHXLxFGpyBST6BpDiaROzDKAXGN+IupKA7yRFAchOW0vTtaQ3BQCDQH2KbZOthhOoXCOcm0
-FDaJw8Y5SCEYAmESXrjJ4iSRUtH52oEHg82BNKIQMDPxW3rbQZuMLSkCkxItvpdU0pWtcq9CDw76
-39bc5j8LgftPRsUgcV00H6I6ofKBF+HQwcVP92JIAS03xTcSC+Ks2AaGYRE1HJyD9CKkFGxQpK4L
-pRx0GaiAoeNFyCn3UwdQzZvtVHNBDcYwJTdWIZA5wVkDM74X2kp6kTgmRoRxULOm0Y4Ujmbs6RwW
-QqPNyJwIuvFqzCwd4kQvO3QVrH8weq/LiDzDS4nuFqUTZ6trc76Invy4cdEDr5qafOsB2UheB19n
-vPPO5nYjEFB/sfxtPT80zhHI
-"""
-layout_big_without_dead_ends_047 = """eJylVUeOxDAMu/sVAngntvz/b+siqjjZ02QwiItCSRQtA589A7T9+EvPWsZeZdthf/9OALsg19y4
-Pp7DOan2vIG+F0Cu0d0tgB3B3gxYB9+o5zX/GYG/bbven04cRbAXkM4Za5MDWG7ImAfAZ8eZlbUK
-sLZpjYI0pkd7jMMihgKAJRVhLOI8YUsbzRzAxwe85rv/UBKsTtJOKThzeFoZqAgyTzusBIAbuym8
-/BBVPnmJAAfAAXFiOcEwUtCP/3FQSXT/yxsZEbjHtdI0IyGZ0i8lk3NR2KrgQoD1KljxN32RCcrU
-dBXBynZUmZfY9F1ywFSgj1oE1zkL9QBZGzw8WfSDl+hQU9iMXuejR9AaCgpzlk0hRFmJLw3FB4u/
-Vr3N6NEBesEdIFSRQmFEgDiWFirzxnJQRj1BmQIVrjNq+iprmimYTkY9LMX0wj7pU5UaobA7AtTj
-XFpaHvyowpODqEI0FaC5uEh8a1VRMmYEXap3Csx8YSKsrNV+INGAF0CCyBi7t/sag+mMekR1PKdL
-7KqmpLyuHtYbYOCrR3VdYxCXp/U/78GBnw7Qr1Lq3LKVIL0sJX72jD/HMhHs
-"""
-layout_big_without_dead_ends_048 = """eJylVctuwCAMu/crkHK39vj/fxskDnGgu2xIhRaCsR2gZv8rj41ZMLLMTwNgs8uGFEjACuHX9wJA
-jhoBxgJYLSFsvs0yqm9P+lwAHLcKymehxWKOmwFYb6NJqGIF4LELwCy7k31NCgZeUMaM1iBny/gw
-E4DOAe3LjMayLp7Ef2yIBUICSSJl6Tq215oAnrKzWDVpIth7pOy51vdFMbbK9O0MYnN4AC4kDFqN
-zWm9h4Q39N1D80WMtHZlgS6n2kPIKdVJOAA89petvzdn635jsHermMSTk3tnD5HPosAsbFdnH+J5
-obMGuhELAC0IOrfDELht9BEA5KPU/Q16BESepJlpbN5oliQLjU7sXjgAD/xLkhIAiZe6BaczUIMo
-SbDbzZOrOADymPrEPDxHTeVoUkJCvz4EHaeQK4gSRMXb2W0Hq7ttCAl3RF0jXBSvt05IsLp4tsvG
-WtLYbD6yECrv2z0v2tslbA5yratvPFlxrdewXVZQAs/Y3lI7EqGt/jWj3e7O4CO0IX9aVii141cN
-HL8dn/TYl3gnDK+tH/9ckYAm4c/l+QHrjRG2
-"""
-layout_big_without_dead_ends_049 = """eJylVUmOxEAIu9crkHxHs/z/b5MCbCDSnLq6O+nUYsBgAnw2DqyHP5+43UtcDbGO+tncfcfvBpjI
-+cAFvz9cgLkKfL89SOsL807FiQsTl3Sl7odwHt/7ELt0JDBRhzhVYAkQW+RHAlixoBCep5hHoZgC
-ORcKxuiKLt5rTdDpnItNN3KAjB6yRhgwLBQAI6lTlwMT732MFqd1HhLSdXF4YOP4s+Jo932Qj3I9
-ncoQlnd1oGvm5hacIYlIIlAAmWrkNis2K+5RgFAAnZzMQpoMcN/VR675VPERx+nBrvFJCwR9/XMm
-RrfiYFT3+Gco6mYIHCW8rQWbRekwFdIAtWlDWWjLNuxXCG5MYmuowz0Y/mxHKYkd1EvtqsRBjocY
-24M3r8vQ9aD0WXKvheCb1VdpDjwXtKuUd83vELqe1KCqbyTfFyDmndtU1SHbJo9MSld5kFkotluD
-rZ/0whmfShnMAnvTKPT/1DyUrlyIA7UJ9l5u62OujjP65Blcp2yxrEdou89188ksYFgSiS3FqD5J
-YkJn/o96U/mghmfVJ2sK3k2yXwF6tVFDTrlnkmZXrvF6+TwAX7vOIwTf1bdUgIX5APy8TIxEmrTg
-46379uDDcf4AHGgRwg==
-"""
-layout_big_without_dead_ends_050 = """eJylVcuOAyEMu89XRMrd6u7+/7/tQB52mKqXoqoMARzHBOL+XbvcogHZ75/1IPu2uWn7I8BsSMjV
-b0f3f2yPrhB/TgCYEti70wRfndvgbyuE/nQ6W//wWH5/+P7c9qDBkIqB23TtM1ov7puIrl0ANZtQ
-q4X35WfzKhAhWDxvgKJa9na4mAYAQkSVC7XwEnaqncl6h9NYrsvLlT49qTcPAtQQEmsv2QDB7qGZ
-P4cUayWJt4hIgOTS7g4AZZCnzBDqBPqoKudcAIBCPTUAQ/CUmACHBlMmMgBTHuHK9QbNIDIKyzxA
-C9A5OBKpEjWoEsAGg5rYcOhdvhP/TNdcf/uep/CGa2XdvSiopghnJh7atF7yDIQkwgATgFOAcNB3
-JCNzXmAB6CjeBtGknIL1KYQFIOinZG5DwqkGwoAaDIDjxp0aVCKVq7rFDcAGWpmJMp/6I0WEhNA8
-6s5dri8pu46UiYQiPtRmYUnnwm5opkMm6gBAJS9fcfTzMF58I9dVF85aYXkbdkVx1e5ZdxaDVxEY
-taud7ar03CgAv9NAZ6ysQqBKsBSWL9v1DyhdEYY=
-"""
-layout_big_without_dead_ends_051 = """eJylVUmOwzAMu/sVAnQnZvn/3yaxSIlu2tO4QJDaFkVTopP5v7EyroF4GUDNzwJmV+qZ8UsALtiA
-ou5tmbXG4HsxC+D7BuCvNgza8bapFAgf4tEA5BDaw9crlskGrFhw2yqyQsw4aETPib4mdlheYMYA
-+QRA9vFaHuUvHVe9Mz0mHA5gMy1k7sJUFeyAnSg84auwqXM1gG8RjemBWcWE71KoCncMdAQ8dMzn
-X9Pg4z5qgOmumFPFANSMes2a4E13SexigIMBfBnGwARh+aXDTkIzKX0BYO8HdrchDggxwLTy+KaE
-7eyU89CAOGg9Vq/RwOFNVwBwu5OoskqDCm+CHbE7EduLG0aGacfvPjg8gDwgRoP3Mm8GCQIMA2PM
-enZ5u96ys1pi5DINYAwM1V4bIOM1+bMz6xJAeYI2XuyHuZfwNF8LAptlzrUB/Vo73fvO3W7/utLg
-ZZyMpZjdz6LRt1/CNIAnzJH/FLHkhwD6CAE/BNl8vGGn6SE7M7+JlG2+tCbIsUsziEYcsUKfEsvs
-NHIKt/Kr2baQdqW0fnYxuWUvgB/rxCmCfVVp4OcHmAD/HOsPM9YQzA==
-"""
-layout_big_without_dead_ends_052 = """eJylVdtuxTAIe89XIPkd7fL//7bTgMGk1dmkdVqbponBxuEA/7sWzOz6N/N9N3i+eE48XcjntwLs
-p7/+Gj5m6w3G6RzZZwF4AWCGStC4xxOSwwvAJYoE71eb8xsGRLkyeENVGaOGSWfn8gJAZuBP0UsH
-ImHgRQbyuSK6vubi4LJVuHa6AOwMBhXItiFuA7zPAJB5B29JwXf8yGjlTIFOvRxC+tqX7GpxAqhL
-bvWc48jloGBpJHoFNLTJR8u8Mz4NsjijOzj2A0F04kwYCYeXwEpeGjhXe9ZO/bmNFAn5jfZxKljb
-eUhLg0zMTconO29iOoVYlQttW5nungC2B9xwd0k7g1KlFxwDFwCPqEEBWZO2LQ4EY/G70lXa1Zaw
-Muhf/JSMi0LGp1vrxAJ9MPWskBIphCTjvLSf0u3nWbECKFAN1rblUlXEqtOsSqcAKPDRUfy3DCrQ
-6A5PEiL6X3zeACX+1Os05P3ymwbaWdufM3r9BmzqSxPG8QviFFHESHFL5IUPhiFh9dLQYTdeb2oJ
-8DWlfaTKnjBNngD/vNYP9wYQ/A==
-"""
-layout_big_without_dead_ends_053 = """eJylVUGO4zAMu+cVAngnZnf+/7dJLZGSnVwGk6KJmyo0RUoK8LfjQuwH959A3/ycWfF1+V4AdxBW
-ZIHGXCJRUN+oWCTIv8mAeeotoPvIk7DuD/Nyf64jpTvSfOuBO/pzC0xqMS4LoLYxk5MBozZfEF5X
-EgIY0hkAYPRaWZcUAlEKgccxrZgqUAwwUlj/k7WYKQCx0UYTWVgJwPGYfG8XEpZSPuz1Ol8Y1hnA
-UnAJARMeFPP6AXDSFewCGrBpRRm5Ikcpc7jgZzgBTi0zmygG7zYEErlKuYs5/ckNgZilrJUZdSFx
-M0dtIQ3G07ALjM1GChtVBxTPS8RyT+7BBhCmKiHiwaDbVcRpyzwTHlqXjU69BY1SqyR7VVk2yiK2
-4Q//wo11aN3zgK6eqpetPmN4SMziu8bMc+8rCZXy2BcTli7laHxkNtWazcC1MVSWiMp7zDyHdvs2
-xdWadWsBFIcoqfCm5cvAsQvdGGgiLsoo1c4CUIlcno6mDfbaCp4AslUMjonNHH5sDTTreSbTAJwz
-r1TY52P4Vg/xG+Bry3q063ir2WEvtdkN8H/LDt0z6ftR1se79/lq+/Vx/QCV6hFi
-"""
-layout_big_without_dead_ends_054 = """eJylVUt2xDAI2+cUvMee18/971YPQiA87aqeNpOJHVlIgN3/Nx43GXE++La68zOPP8O1F+TT7xfA
-+ZyRF39NAZm/TQBCN8unnwcg9vNhEw4GgAkjTAElQIaA3fBvNrsFV3u+LLxc2I0GYT1turijP5yG
-fxS3A1Ak/Z2hiCjibbWLASPF94Qocv1m4SECFwxKQoN6s1QZrBhE9eLZJmKdAws4YSuKdrouT22a
-E7UClGEjdSgqUVxajA3Amwnismf7mEQfUYrvdQg7w4IGqh1k4EmvOEJPb7hJCQjFHfL+qXth0PG6
-xC/5lknAPX8FaEdFxAl+yoIatP2wsPUZ9enNUtkbYPiEVKyksiEXVowKYK2Jm92SeXFtBsGbIt42
-sjiWSdYPu++I4bTxTg6Rgam5E4xl8c6gM0HiR/IEEzyXXgCTIiy4qefg5kwcTN3FdI2u3apmnyBo
-/8sywJ6m+lezuDqKoY618yAEFsd0qxWFpnIsQETBrmwxsbAvdLi7y7Y9tHHWXfkTvZD8mIR9EmRX
-lhCHbqnNVP7j7Mmu/KFyiQq+oiCvsGXii8GXddc1PcFcRZw2eJ2EebD8azw/ZR4RVg==
-"""
-layout_big_without_dead_ends_055 = """eJylVUFu5DAMu/sVAngntu3//9aJJUq0s5fFBu3MxLEpiqQd4P+uhWBEEBGfv/3/fDxjdnHucXz/
-PAAPTi5BAyCH61bVogbywXP/9QFgF6YBHCQoEjYm7FWYsQtomMUrP45m1GiNFkAVGAafiayCe8nU
-ZqCxS8TNgFYLCUWJcbTibJ4pq2tGt1DCbcmA6FbwyKTaUUoagJZtmtknq7skczMYDbb8LuK40IaV
-hUy5UGo4QLWQJkNKY3RhmHYdErWQRVQVAzUd9vPhbzbKxFNJGdcy83ADzsABWPSaUI2bCb6ZCmCC
-rAylfrRg3BdfIsaZYrkwSanMo6dpN4pdR0/7G61qTrOGWS78lZnCIAY7AN6kfq9LEymVGUgf2Pvl
-Uls5QBdu1+LIru0QWxsvAOFogmJ05WqCL4CIq4mgrdb5gYG6RMwFWzIdIrN7VPXw0oLvUT5M2AJw
-jqQK0nAPb2GOKEVkjpA5VE4lDYDvoypmcpFBjNobXvtlmXaApSq1YP2knf6ZKzm8rKE5xZyBpdhE
-1Am1XTDPVft+jZwu0E7/hT9tmF5c9iqLeoAOhFpQKha+x5ODCd/SdmFUr3xvpn++1i9xExEa
-"""
-layout_big_without_dead_ends_056 = """eJylVUFyw0AIu/sVzHBn2ub/f2sMSIh1Tu0mGcfJohVCYPf/rcst7H7vxd/c3x/LT7xfbvUd63UD
-2IFp8gUAkec4ALjpOwHqyBgeQihx8hqAVAZGBicNMABlZ2YFwS2Xwml6i0VBeUZneKUEBtZHBQGI
-vxi0nglQ8WQwgCRyFMZFOZ+71iB3x7OYN1UmzyJIPTKFVbpA3URExrnokTKoiDh9WISo08HhbTCn
-JAQY+b1KXudGEerCGaTtHwsgtg2IY+RWhZtDkIqUsXeWlhCp3NsnAsDF0XnsdXaAkYhaqYPv9KJ9
-GJXidfaXxtDKLmZyZ+U1heja6U4Y8WwgkSJFBLnMOkBuxVTpPmRaGqhhAtNjaoc6cMyoZ6kBrAFy
-wTrYprPnTooorjD+hUO9UuzdYxPpBXQpShetwcxE3kAOuSZADQiTyYHeFsOgxyy2jNMLnAEdBwbx
-rCA862AgE0LmxREjw6aiQzRIUA5tnWFUkAKCqa9mihoQpQfb7bDSkh93lxDvppvpOFZ+Lgi7xjo4
-eM/CduKDhTyF3gBfohyLEBgAS90HlQT4UQZWnRpMYaby5wfwDJS/rusXifURng==
-"""
-layout_big_without_dead_ends_057 = """eJylVUluxDAMu/sVAngnuvz/bx1bG+V0Lm2AFk7iUCJFeoD/XQtGi4vyfy8gj0GD9ZXr7wNQaDaw
-x2Yw8RTHPjfAfMq+2xiBamf5qGRFAdL6a8n4zAH2a29I9mR7a3RE/ws4MLtzFr8Q3QBv6MMGaXSJ
-ofULgP02iUDKA5P+qOUUigS9cX+Ci/C8S1qhwcSPDs6KeAyP0bO3GwBaJ97pKI12SdcmWY2nAK9d
-DBaEb+kqKYqFlZ/2g7KsWxUaOY3ywUtANj7L+T4DAvIgP4HlFE5tOrccz2nRjeUddIflcO1AZIRl
-IpAioocYNXLg24muKS95d4cNUJh3GsoHsdPSFGKmSlaN8PD1TQFQ+rVvXBR5cA6E1I+ShRg/kS54
-zg56e+VidTzUkenjHAPb5FRQyhTuoPs8ioIGQJtcGAGYbw8sS5s0+Tg2+kychriznGayTH0yXeO4
-uHNR6WCJeJ0/koWchlJoAe5jo2qtSzoJZdEiqjJvds8sZEz1OI9kcexx1MjCQ4DU26Yb7yGeDj5G
-R0maqsHbY/l08DW/jTVT8hBR6enPcf2w/PlaPw/3EYA=
-"""
-layout_big_without_dead_ends_058 = """eJylVUuOQyEM279TRPLempne/27zgHwcYNe0qiglJrGdV+C7eEBbAcsFkRtY25zvMz4vwDiEDrAh
-tug4vxNgnS2AGX73+OSRWssBkCcpPzMR+S7ma4I6uq0NmFfgBzO8Kwbcgsi7fYmswNESauOrNSi1
-4T04VEDbzSSIClXBHtKCti9SIMChJCCpXiR2b8TXwGRvQBYOQOkzsqSC8W2/w2W+AuDKQWN01jSz
-OAFml54hZIE9S7KxRGf4AJVRFTSACIbrs06XUVtg+S1E2UyEuMA5yH1OcoLlAcBw5Hu5eYFu2bJy
-Kee+H8rF/Rh2s5wTeOsx7F4BkX2hxI5pYHFAdL1DBbMCKArEPcpamSSHiV49Nhc3ACuA0JyiQjjj
-sEzaCQoQDaYKd6syAaxccQfYh8SPMsnvUybjEDIek7ruoFQQ6P1psz8PlKwbB8JPDRNFlj4/Gzj7
-cFg4MQlqJkIayR2pDNRFZeWiyqHd91pbPferM+Hg/OOgctDMWWZ+8NP7tFsc5vSCJ8DfLSP/TOWR
-BnaAee4F+DKef0vAEFQ=
-"""
-layout_big_without_dead_ends_059 = """eJylVVtqwzAQ/PcpFvZ/aJv7362RdmYfsgOFipAEWxrNS7b7/8blVgP7M4bHfbfn8SJAAVr+rkUb
-zmFIYNiY+C2AE5kAZNApk6nWJICj4fgAIJOYsBkYgQZAsZcAD9oALLcdJJEA8HPKZOAT/p4C3M4Z
-H30HavuSUHujfLD+bwgIjNjnontiGXf2ooxRq4dExJUyUdc9FJkxGK8OcFHm5ZIAKCtfy0g+kyI/
-mJelZesRI4tjkgJ/LlomKwAyX6IKQASQK9jphjc82KtdeEY625iHQTELIPU0ebEPVQ9CLYnO4OHm
-DWC6F6G/AXxY2wf6eUpdOgSDQW2L3ppRS+lC2Mq4owctmZtGhwrKbCtxApzu7S/MA6VS7W3VOUf2
-II0EBhewSEo12Kv1KUHHosinDTqImYJV6LHjAgjupwvtudf/OY4ZSkG73axMgKOGeoxeTwVoLNVm
-v0sUwGlAm5LPUz5lB/xZJF0G+6SsGoNeKxwA7X3RddizhObrG+BrVKm9w8Aqw7oAG/gL4Oej75YM
-pjs9qY8p/Hlcv1itERQ=
-"""
-layout_big_without_dead_ends_060 = """eJylVcuSwyAMu/crmNFds7v9/39bwC+ZpLmUNplgjGzLxgDfjRfGHPsVY07AQbp0fh4arC3vBdB2
-N92pCay/C5GAXDbm/NcBoNv3Hhvrw8UlzLUtdwCmbyDC7cQ0kQaw4gsAmotqUVxIEF01VFN0Dijw
-6PYdbhCBZI+FbgBrWRdVM51g47MDdOLFISFwK1FTkwAZY9KwB8M84SBE+kjxgD2N3TzddGgIq48h
-lC6QdQj/RdYLYGcSmclRabXdFR2hs10hUUhmh1knJ48Xfu9COA+FZ+AOkAfABwrV/+MweDjOQQ/u
-0B0P+BICLj5Gcd7FFe8GoBbOFjI6vZtS9kL6lKtdS/HZk23Zlywwdar/EGeCWqXdhNCKFlGJtxS2
-Qtok5lFnHNw45GBF2LNTALYnzmt109P8cwhxcMvvsJqzmNBaggCoJjjivKgHvHS/6onqQW9l0uNl
-1Tsx82ZC1knig/06SpGToS3t5tY4WmsI2xVkAD+7W3ovqGsv+bx2KcWYAH+11K6jkYArPo5L74yb
-6cvx+gcn4REI
-"""
-layout_big_without_dead_ends_061 = """eJylVUtyxSAM23MKz2iv6ef+d2vAlm0g3bSZTh8hICRZAPC/Z4AWDw02/54Gn06uD8B8X305jP4z
-n+8H4JkTYAJ4mswOq684W2afDiA8AVDtZHc8zA8BMEHNW1xzWWy2mTihJCFQrGQXQIiB1NimYwIQ
-yd6HGavDOvYlRQwoHYQVUnhQAC9yZOK0Jc0sEyWp6hHMmSq6B8wvmok00WXJfGe6pA+5fxBkW16J
-WBGaTBlkA0BTRa95cJiYCylHC6DXydGCHk6Aqhb0wsUgRqCoSAJN/5F21kIpYVspdg9lbs9YLEpT
-eCAAXAz0jkhJaoZQwZAQtiINz2FhxBkkKYYkwDOQ7C4Gsd4qHBrT7kFzJdyvTb6lszEQgC/KAtDg
-PczZVxIWu5Ga0at8AFRfi5qjhQQ6S3hYmYMrTdvh1MIzkrLSvzLEzr7vrthxVfuR+5J1YkoCdgmV
-TujMNnnQ+Z0e9NL6plckA+D96L1NpGpQ1ZKE46RMATLRFzRJ2g7ygXvp7W0D0C5uES8A/nqLbCam
-MMrED+Xo7fYKxqqSAHLUBPhKvOsGTdlx2d5XHtPEPz/jB2UeEVY=
-"""
-layout_big_without_dead_ends_062 = """eJylVUGSgzAMu/OKzOju2d3+/29LYluWDbemQCEhsqwoBviuXVh3s3Ow8R5+tX2c8x4yvnGPfjbA
-/WPjrY/v57jZpyEjBAB+ncGGBQMyPJIBqaCH2l0XcvZiACMYrAAkR9SfpGAaY8WhUx44+z5EVGST
-x4NiqUHjrgymgpYylgZ9ceSpMWgvoFJFkpkaug/GGjpOTsjZGCuU8awYmPrkAAw7hcaTCJ3o5rCU
-IJbRGVC6YRY0BlMII4D2Y/jBNdjreQd+mLoYHG6LW8IUQEjNrK11vmhAgMf6ECWtUfbpWR4Ae4zg
-GDCjrFJ0xEoGk0A1TeI1U9XAfB8e67uuiD3dI+8OC13RRVzc2YwSgjyy5PiuB80aToy+Vku5x8p0
-AfCySRSOxKLoxBZoDOZGzYgrGETe/h66IO7Et00Ss6m2oqubL8wuVaiuSAk6gwBg5eBQhLVF9gLd
-qmBzYmQ5ti0rrFjTmGhj8IYTxf68lpbMomNZD6aGXTkpChUIsaA3wE/kaJSOnykaSar6NPWFP/0e
-pE/Oab2qT63SiV+26x+V6hFi
-"""
-layout_big_without_dead_ends_063 = """eJylVUmOhEAMu/OKSLlbs/z/b0NV7MQFc2skoCFpx3EWMj87row+UJd9C77PfUeaR13rze8CuGGi
-0NYN9Ws7CBzYSB6Ylu9ioGj9j+QjXREHg+KECvkCSPrfDvuWZ+h4cKAGmMgNQDyPDeUz8twABrw8
-LAuUl4wnk2VFWAroFBD9x/AjDxFIVmXccEsXiHVFNDFJ1BHX81tEEB551J3pp9RwEWEAE2sqz4Ix
-pPOhiNH0VMjspLeyqQbNMVKSGwBnE+jBVWy8cWqKV7a5HCAfGaaNV66ZAuB5dU7RiTcTDha6nRUl
-1WfR0wjiThBrg12RKRFCAHucGy4ZSilgAISoFAnVDARnLNFOWhDO3vLuRuqm20HUdTgYMMVJbwNM
-Azwq5Q2aUt+cSrqLbB821HCBMzvG8BSCO/ExLdmvcBZ4mlzFsTLakGCGpztJpYHz10L5Z0ZtWnw1
-bFkXMW6TAoCNj8I+N4mCTDvKq8aZDe+Rbabjtel8vV6cWUa33dkZqe+1Mts5wkW0Opy/a0YPgFNE
-Fsy+GV4XF9MkcYCvlv8I7R+AOnu92YdwAfy007lDU+t97L0grEJXfnhcfwQCEbw=
-"""
-layout_big_without_dead_ends_064 = """eJylVcuSwyAMu/MVzOiu6e7+/79t8QPLhOmlTNvQBAtZlgnw3RiYx2B818WuiG9bhLUG8+8C0MGA
-AmB7hvX5SQBSgtpOC+DC0m6uh28ArGtcZgZYfh7ptxF3arbWGoBnzYMA5hQA1aYoOoBSsMHcXLjn
-9l2DlcpIiVYAdwT2j+F0+WSJa5Ayop44H99lATzrH7wNgMlg1kOl+aiNyjBc9ff+NHNI5J439c9a
-uAaoMm5FOHdZJWfbnrMs6gzSswFAigFuRhIpIwUD7QwKIOGaVWhVm6eIDAE9hMqgbKKmCQZi3GTA
-mGBb2TPTlChWVg2WJbAjS1K11u6HobURx9w0mPkvhWKUkTjahFcNtlCWIGP66UDpZYSbff8nCwDN
-H7ldJBs7NgZRhvTB06GQJeWKmXaAOf+Rwq1fKJHSa03E6sxjMA4Cae1iwUwxGNykZO+jOmsofl8A
-PACSjhYjaJRNNu8Bjd5u2N1ZAF0oxioH0INbj/AN4ITKF0JhuN0h3Vq52Nr+oqlZyDjwmjhFlFci
-LsBtk4HfaLZzXVk0X7Xz9IoDfDnGP0BHEQ4=
-"""
-layout_big_without_dead_ends_065 = """eJylVUlywzAMu+sVnMGd0zb//1tlboBi59JqEjl2JBAASRn431hw2wPGua572v+hn5nbMfL2tQFi
-+QVz/fKYE8ADA1aXiemxZF/2+B6A+CZM7iiAiuWkcDIZgFBCBhGlGZSsK+JQsdMDFIMngNlSS1Kv
-9f+LJmGEIFVO+JbmDZHLPQHIRtwIMqdYXiZlzWA+gezlfEUY8MMC4BGACTUQ03Nyif6BgR8S6t5c
-SZc35lNoAxCs/FjV+0aBK7OPEtLgeQSWTufaumgeAESoFBIq9WHR+DiV2FhtoHcEaS5k5o8R6UoA
-HwaAMuD2fiIuREMFgEOe1RrdZwopFTAe4F51PrzpRnqbHht5L6YK2eWtsNuUbqQ66mUafUxiP1QN
-EcDP4+JeB+ICq58S2GsOO3vBJ4KsqtnLkilA9P0TA1Oh1ULKrAz8IIFt+3ZmCQNczS6JuTEQA+9V
-JxL0lOgsDDKmgTujRcvqQD9a42RQAjGFUYlA7anz1lghe8t6PrNYhY8AkeqMtk6x8vLgu0RO+a4D
-urHwla+rgHcIISvnrQ+3Q4IPwI+GfmOSqdNe4LVsGw/+OtYvA4YRPg==
-"""
-layout_big_without_dead_ends_066 = """eJylVcuOxDAIu89XIPmO9vH//7aTgLGp9rQbdapJmhpsTAr8b7wQZ+BcGTXReK9wCVx5XwnOvwsA
-gUxo14U+d84aKzvqmeZd/3wDnPUYyB0/FR3a4NudQv7CsCjcP4I5O4PPNwWLntmUSX2IrVwvhbuW
-BCV/sg2FazB/fDPwa34ZLktK3EIC6yEAqVZsXLPO0kScLAiQDdP6TNJQFnDU+wqrgFWXUD7jgxop
-gQbpAOAomBPXai4zPWxyygYCTKAgGQFkgtlQzPHWAFxFkQSplgDFfFb2ilJFr4ev1oKi8FVvBuYA
-+9/3HCNZU26tGVv1XLjshSV3gJOdBFXqzQFRUE7cmQv37iVXqhOiUHUJuO+lHi3DI4cYNZl2nhPH
-G/Agsk9RRnWV0L0Qt8WfVrH8LcYoU94zEb0F0vKP7rzw0MUEouCnya4jxkwdIGm37sKXSrcb9tnB
-QTEzzLXVC8nOW4mrkH6+yAsD4AbiS+Z7fwzfOUZa0ptxVzn7jNXO7LLVedD4pQsPhPa/B56hT9Nk
-MO96zZnCjq7teSl8lC/m5L824IeAigwx6mgUvgay66G6FYVn/NUS44M/j9cPNM4RyA==
-"""
-layout_big_without_dead_ends_067 = """eJylVEFuwzAMu+cVBnQntvX/f5sjiRTd9LSlRRsnNk3SlCL+d12xzguP+0DeRT2p+dHj1w1wAM4I
-PVj52V/kaNW4Ab43AMJ2hLaOmtEA+1G/yjEaYN8SwLjxCv3Xgua3yKlur97ng4YwqBrGMgm1KRnE
-MM8/WSkJw4riCMBHLeGkgt5/8ZmNaz4BtEjawZ8wS/YPEhXUlhIi+ZSqfHvYIICxXhTxDJISQw+G
-W5gHen/x+SNNaaAzmMP33a5wjX0GjY8UU7rbu35hp33RfAHvyE0epOKQYOEtBvcEyHUC3ViYOKXT
-Cn4uCR6jsVpHIYVRMwZD+pbQxeY++KJBghlcEWsJ99kr+XHnxMK7ZwLv0mjUFFOvNQYfTJRRpNYM
-5ux5eG14NYWAnaqiPRLPJJIBzJMK1Fuld804gJrQIWG6Agbw2PJKc89q9VOgB6xtTNlVq1KU6y27
-rwF4wKpAwrdTlJUZq9YCeJMvJAEEO6okzFkpYmp0KuWcCwJwOmFEcZGgV7pxUTFZt2Y3wEA8mj03
-lYlawNrCIcGbECzXCfBlpkTTRbCfH4X0SFMG6UcAzq37kU7YrDyuqYW/XtcvEHMR/g==
-"""
-layout_big_without_dead_ends_068 = """eJylVcuSwzAIu+crmOGu2d3+/79tzUOItD3V00kd7AgJMHb/blxuBssh/z01d+OAueGsjO0RAM9N
-iRYf9MCZy1qsIxAd5/1Mf5OBl4Pw6+MPBzDMZQwXYTsA8bscyr+si3naUQvcYg3QJOuZqyjThMJR
-FvoI5iHhiEDGKJ35LaRCRAGsAeaHVOcTicXvFcAJUDtK2EgqHarmLYP76gQ9BGV6ACFbm0ZCuUR/
-DUpAM0BkcABYiQpoJuyXhMptA4ASkFNM/Ns/RkinYtzcs1Cl2hGc4q3yYxo6//3VRUwyQVedeHUs
-tz1FlnIlGGQwFUAAKd4PhaQFxX9fSKMSlYWn00slKRYIQMBRBx7QA+AqyazDJQwkr5LptxLEq7Qe
-TWq5aSYEYH1QdNeP3/LabshgH/NoVujSBDsLiwotUCQoYOxhQ/DV5PZJs09ptEEcCdKubIJcEjZA
-HzM2BfGW5QYh+4aBK8fd13yaXnXBBsAGqA4qatgp+rDNkx1pMXDDIlK5lTD1ZaASwOS3aITtVPXq
-B+hLBCHhp05jBic7i15o8QYpJ5O1A/CnabVonHIVTCjwelWAlfjFuP4BHGgRwg==
-"""
-layout_big_without_dead_ends_069 = """eJylVUuywzAM2vcUmmHPvM/97/ZaC2Sc9K3qthk3kTECyQE+Gw/UdfB64xkCHo9Jhf2+A+gwFDBT
-Yv1fl+dY1/Xs+wmwbvDOLRigICY9WZwEJgbUD86Ar/mKY69AXwxCTRLA25kntVECUCkolnXVQHA8
-72nNApgU9PCh/VCewEtEpneyCimjNODhm8WItOh1rWbk3CkIb2St+DYhet2acPZhiOiwqq1QjTyI
-u2m0AW6B1qTkAsJGFl1gAmCoOJ9e9QoWQ0Zt7aqCGDA4j0rJOjywAh3LnQICYCHa8z3tkDEFO4Ub
-gL1TKScDBpNDRC9MDUoayL3LHpnCiMh4ek2BbwB2CpjqCgbWHf/qrF5Ia1wtbps2PrLE7oidAk11
-eN4LCTjonyLeT6JL4FHe2O3pQpoe5FSBw941WE3/rSONU10mW9uUHtHgZ++z2znOiHCILvc5XKYZ
-t4pzpE1TghYRocLazyRz7BRGywGQje3SkAz+W8QqK3f0fqmU1Rxa5ZIbAMvqLc0SFdsdRmOYLhe+
-JsA82RfOGxHIl+NVgx9R42kScdWrTg8H4MPx+AMoXRGG
-"""
-layout_big_without_dead_ends_070 = """eJylVUmSxDAIu/sVVHFXzfL/v43NLidzancq1Y5BCEGI6mdrqdjCuMcT0FZrg3NkZyq/B2D/7uUA
-jMBL/fZdDDow8zhgKI8HgDgD8ahPKoJ/MnePAJiA94LmQ8oHRcMA8iroK5g8Hue2AOAAlNxMl7jB
-TUEMhAG8SASZgdvU/67mX5ZhPZJWr7oFl1L7qYEocTWWDhjHhaJRWjiAJsA5bJEcDxESCVBgyWCf
-wLUJosE9OuQkYEaKkYIksWXeehom3XYTN6UEqIjWHMygenWIiFZVGi4VCmfsmKXBPM/goqBdqlwM
-EAyQaVX1OwViMPGnBopi1efMQE0mbiQPvEofrSqkPkgREw7VqGoyyZsGpypeMwaojhCqOzOQZOB8
-xzsxugtNyTWI5jCp0E1djjyhSuW8Vk+iTiGJXu/EFFEnQCdRjVSWad793aaDQSZGZF+nSgN47lEF
-mlO9lfsZjVNikFWqpHOjyhLOPKQb6X2c+sJz2Adr81yU3BUEwjMKd0mNwdcrALmdr5zImx4H4Cdb
-bn4LoRcC82jFNsCHa/0BQMMRjA==
-"""
-layout_big_without_dead_ends_071 = """eJylVUtyQyEM23MKZrT3tM3979YHlmRD2kWnJJO8gD+ybBHgf2tgPmt/1ArE5DbyKNIkotmuh9cO
-AJ7SuwJh/QhMvp7lALT6ZABl5n7QgOmXczCLIh0lXFvPyg3GUDnISrA+QjiFIDpyPycAB0sS5JB2
-F4JZ6QsNE+v0THRwANLW1/ZIDkLEVJKJ1oWkZ97ZzVyGgNKFOYjMA7A6vsNGO5PrlLUgDHJLYuxt
-VNeMGUF1YUFDs4ULf5vQDT2nFBVgKoBaULkE+r1FTAMigAmwY05Qm9GrfWoaxZS7dAkN7SIDJKN3
-jg+hAI18NLWV6iAdNEhoCBxARyHZoNvrO86UQyI5ZCTn9R1uB1FHn9dC8AtT9HMPGn3Y4zk4wRM/
-NcuddAlSlMdtHJzpLjuWp6o6DQWI1kYa36NbSgtzp5mnnBt/s6audWHr6lDalHUhCCNYsgdvUqHo
-CoeOso5xjVgGC9+itxqlXHdj4GqfpyCbjTv9cRn0ACYmWiS3vZc5hdIBcieSaIlEgFHBgBtPcnBu
-SQd1+4kY/+u0GV0BPjq+LRa3cauzSfD8+xOCr1blDsBT3ahWyj2liXXchf11jW9ZKRGS
-"""
-layout_big_without_dead_ends_072 = """eJylVUtuBTEI288pkLxH/dz/bm2CAZP0vU1RO2+UEDDGYYD/2QOjwdzW3/6PhfVArEA2xL4ZYLnJ
-drxCVzDOmXPvMwMsl5kABonm+Xqi+A3gTLZOaHGVVpb6xZoDWRP8woGgRy3n6irBxd8FI7YfHLWr
-AbYjLDhA0DSJitoFNxExYwKpEsrT5QSO1jQCjwNE4JJzcBA+ZU4YFM1GGCVcNEMDuAT3wk7/4uA2
-NGFxwKu/7IJHF8BuHTY6CWuytysx2DsETOxdsgRNfpcSg+5mwLI+I4w+bCnPISRp0+hCiuoimOG3
-Synx2m8iVJ5XlkIAE7iJ2Ps6aHFsSTwZIIXcD2/OX1PMNlZXivPSYAc9m0ytbQS8V1sXLVm9eS+V
-ti9Tdc2i4X0lPCX0Ru8P0j/ZLMkmUkUw7psXB2S1yp8TVlP6CSLvQjGPSRlpPWYphVxdsJr8zVzP
-jUmimwrbbyHZoHx0spG8nMoXzQTjNnQQ2TyE9ki+zCFU18Q+Bi6q5gcfXDu+OX982OaERQb4sstI
-8f4ZHHhC7E/yg3/a8wPSqxEy
-"""
-layout_big_without_dead_ends_073 = """eJylVUmSxDAIu/sVVHFXzfL/v41jQAh3z6ndaxwDklji/tlabrKwPw69mgv8SrPf4wDnA2BvPy/z
-/R3r/DX+r/WEORvfj4O+G+Y7BBg+NtEAEAE9MTQFUkk/Gd76bPOo7ee9PMG8MUFZTvxJImJuByh0
-HiYe5jzSCEiPBh4UPCUhyKaTkK6sdHw6CFlTTnQebMKeLE7g7QDMPDowJpS6gT7lpKA+RSKrZOgt
-hnE0BYaBILD209wRMnYtOusA0Mrt/JmguxHFiRVYLqqdP/fynKKJUKQQ76cVWvysnmLgJRozUU5X
-pk2iWxkopjQGudX1KjlJu+SdDsRzb0Gz0Miqp41yRxF1aW3NyXxJ5Yf+KLJR77y6m9KKAjm+z5e0
-kua5imYgwH8zTYbN2ZauogNIlV5l3RjuiqcGPHJ65aWD4pYgqN+NNdJ4zZvZthQ/nMTiWBwadFdJ
-eBFfa8AjMCn0oEKfdPHL6nJOv2CxOv5cJmMB6k4nMM5UJkzN9BuTUd98GlQhxVjks4O6e+en6OWw
-YRq/EozZxJ9RKbw5e3o/BU8L4yD4EUz98BzrZaYJzeUfrvUHusERqg==
-"""
-layout_big_without_dead_ends_074 = """eJylVUmOwzAMu+cVAnQnZqb//9vEWinHOdWoXTSVaIpaovrdulTOS/NA7Dzjgft9FgDCVMUg1+kG
-2ADmwvL4vQHSaZ1xqW17KmfeYb/MRgh2MwSKCsHNTgykAAwNa6ePMQBp4JzxwIEDIBGdNQrEASbz
-2xwllngWFm9TIMNJHSKE+nkIwhiY4X1TKDsAGA/rA8JatzYAax6ChlvhmQjQBwNnr5rClCpoBlUm
-M53JIO0Qj0EhgDVgKdAaIOKIghweuojr8Bw6sgZiteByMoCWYlSG/jUBIFURgq7kJES9JH3nYMAh
-pMr5B1/uD43t0EAnxQEgsgl0YED8qqC6ZCFtgw1AD/r4lajqiP5Sy/TG4CU/4glkgC2E1EB09Pvw
-yJ6OLHjnsyoOcJg4hMWFnTms6g8Gdbt1Sw7JZgBKpWaPk4hEH960XM4q9FOz21jEt2GRPS4DT4I9
-vOEvGr43+ZhatVpEQ0JMvawIZ/AclT09a7JqgYh3fXR+1MExCJTeEbtN/DHTpAB0Mp8prUlfm+wv
-/aFWfTCA1HREy1Mda++Fv1CW3oHYAN6C9BC+XNc/od8RJg==
-"""
-layout_big_without_dead_ends_075 = """eJylVctyAzEIu/srmOGu6eP//61eIwRm21OdtHEwEUJg1v1/a7kBsFy143Lff7GLTfPYX78fgFqg
-/SBCALF1TMe9Ph+A/fpzTTrT1zYAXJh4pYETOsHQrCQbDGyg1k6OCA2843sDqHBMd0pDsDuHBKhI
-kjH/pRWsgsIjLKYqoGdIttRQWe0j77jbhCPiW4AAgJm1QpwYmIVJBk6WQVW1BcXytJFPfazw1M9T
-weCq/DzMI/xzUAzCSaVACsAasjIuGH5LBnfZnQqK/PN+FISb0jN2YvVBnbcIzAVZmXSgjzoR7Atj
-a/sAaGFKCxAAw95F7ADWUwCLvYrwzRADQAJ6toI3EVMVnh/4elvegUqhdF+94C7mUPU8m0MDCZfu
-y6/7nzDIVq5yEDdNEIPfGrSRNyi9Kp6hM7jDo19MzUQW+zXT8jZe/NFcEyRToFfFCAYeAyIPnSzv
-Cd7nlophr6lM2T0lbxAQiuaWAOSGErx37nveauys9vOWYUo0aLS5z4dNXud7po3C/LmCwcckYDlN
-2kw8zzpMGe1U4WtMcD1GczyO1Z7EOCPtn2v9AN8cEXQ=
-"""
-layout_big_without_dead_ends_076 = """eJylVUlywzAMu+sVnMEd0zb//1st7pSSU9zGI1sSCIKgDHx3Lch9sf3ezvoE5LUBnj+Az01sqIO6
-jrFu9BHkNxjgiKGzzz/30j5lAMlAFAABEAENPqjGK42O2mqDAPB5qYCeW77giAHb1RnoCz6k81kj
-QroMm5dNEGcKO2Gd9SlG2NQgU4BPdYC9lWLxDwaJ0YR6VjJSoANIbosabUglzl5Jx6CHXU7e9wTN
-BjBdZMvbw0jhAkjOGX4+KECIhsHX1IhQ3Fzo9uag06qA1D4YhHZRd4ZhUo0GEPzLJVk/t5AKfwmS
-IladigHTnLMSbnh6FWjZy1hhXeStE9ZohnLdM4Vxkf6qypWtHvSyYaOduzbswknIWz3VTXMwyEqh
-lcsa5Kyx8cBo57dmaSmky5rrBgPKLQggvAAsqxSRTqYapSqBBuB9Ft3s9V+miHqk7FV3P8eqPeyk
-u1Jg7eiGgtTBgnAEq4ajG72Bx/mFiwH1oJ4A9UGoJLKn3A5ISiXUNFLyRoiRRqIrNo73d0aK1ulF
-1IM6G3YW2O4LP1LwEqPedYfDfDk9t4W/5vKPX9OP39p9pH13rX/3/hH4
-"""
-layout_big_without_dead_ends_077 = """eJylVVtuBCEM++cUkfxv9XH/u3XJOwyrSi1b7XaAcYydBOB/Y0GOwf2F9gCbsjnW2h7fFwCHKBzs
-H4COIyAEPvu5ASYlGc8C3Wq7HV8fGPNrE+SThRyTRp326/EVbbVYBxXEnrHqnPJ0rgH3H2Zo6HFf
-DClDOQeAISnARcjcbSER20B5MHC8UI8ppU3QBGCJHK/vlRcAO/H+bUmwYbid04AsKskA4uHqjMz4
-3blcNyd0C1UDPZc0mf3NZFAuSBmEsFEqSbr1bJRT5x2TcRiDeccAqf0JECoYuiVSUkrmc1wz1akv
-9Nf2f+xMEsJqyT2m4ARAiq+OUd+IUO1cmZQRb4r4K/OkifRHyzkoac6kXo3BRWEzwhnAjXiFOAEc
-/eHw0GBQmjljNc2Q4sqAWZrCo2iniFXwEuUnpkFTJimLVlBncK83q0ZGyEpIM9OToqqdeYBoTMXA
-Piwq3kpuBsc5JBpK4s1V0owd14T4TeFeHAxm96y2emu5NuJiSQbMDt7Hm8ZPY6CvcjgncZ0cwUVO
-Igsf2ScReUBrJM3hdt0dQi58TV3b3TqT+N4r6mb661g/cY8RmA==
-"""
-layout_big_without_dead_ends_078 = """eJylVUGOxDAIu/cVSNyt3Z3//21biMGkuU1GmrZpcBxsqPt343J7BmDn4fd7HzNYEfH/eQAcN5Al
-Xl2eBQx8MPploCKv9psM5hYVK9PCA24JkoAPg/xxcDcbE8aoXG08cgPEzmgGa8aL4X0PsjEetQHm
-aPbO96bsGukGQExsKtSivH+SGqeIhUhAFABmBmSvOrOXFsmpzr0YTB0wbx2qQjLozF/+CvTX806K
-miwVUtNaD3/ng6C8iKcuL8Yl7XgYMk9rWQJI6rCZ1oMMlEEVTboZtHJKcqgoP6XYqcQCgKTtjYGT
-tDzNA0BXYSsHa8tNAu0wpA+WypHVEbA8fOIU0TRS1jdfohOWAkFymhaAOLaMNARC7d8MoKta+TKS
-91phsHca5gRG93VHogU0i+L/gS2ZCiNVvUHrgfpupSUnjZJeDFii0r9Onc6GGaITJABbRMrsSyTJ
-Ad75iDloV2Zfkb6hPjj1Pc8kssYFqURzEbV6rsp8ibTVObR/9W5bORTAmrbRSecHjexenSZk/LHx
-tRqm7ZWoHMgFweBPJN6qz+1YTBmwIi7/clz/D/cRgA==
-"""
-layout_big_without_dead_ends_079 = """eJylVUmSxDAIu/sVVHFXzfL/v01ikIC4Z+bQVHfiLJaFkIn7e7HcInjeY+xr9Ht34Lj4vgEumGvK
-PvseP+D+AvjcADnBk8iNUb+NiMY5FtTznYLrPRPYg4M/WSHoJANcc+E5jwC5GuImAkCnPCgFiC6v
-ETo6USnpJJIi8jVjcq61gg3y0S9lzD9aom3s57qTQY4wgDfALYxSMG/vFPByMtscUtutCVit0CNA
-k27VdD2oqmpDFj4vJ8GqjMp6GC05BwBAg/UwGqkxgKZnCglwiMgy3RqURW2gZ7YlIo28KdEcyzE1
-gPinHVFVaGRVqeWsYMfpdbMOQOn4qhhcQ5k56iwGEvR1siEiTqsdIsqjnUEa6SjPzisBpEFFqzh9
-gOEROUdGKommBrUb0+AxA9leQEPCnLt5u73snwziUPtolhGq1NhrI4Uz+iaOjjTG6gLLX0S6ulkD
-ZqxfyaLd+EIdtBSMejRDGK8DQC0ym1eYgB2EfVwA2TJRAGrSjchDm/a9yfaSZVv1DWEfl9Ki234l
-rlL4EH/GZNPl0QL8DtwAX/8CvPrWNh+8GesHHGgRwg==
-"""
-layout_big_without_dead_ends_080 = """eJylVUluxDAMu/sVAngnuvz/bx1bG5VxL60xSBwvEkVRGuB/Y8H28KdO8vu1QDuP3udrxb+/3QDk
-Hu05kD4gB+HLn9vANnYDZ/lKD0i/7uXYOgbAcCLec1oG/MdGwDKQN2hUBigGEQswxdcIcAnBeuI4
-fIomcDNLRfDbQOYGxcVJhKUBT9QdQoWbyQrGCZhyIDAuaRQSC4GLozjIADPUeBjaQAaBeh8qmgOb
-cosL9IP0HVojyJSsqZlEEzDTXe2z1JjcrZaQYCGKwVaO32Jn9Ly2AUIr5RgQtfqNXIZNniMEjGqg
-lXT2VskG+eIw0B8cp2JFhUuVSWypgWQiuKtMxRYHHRF56qA4YSffmkSPbGQ8I1uIKquEURpBcedh
-zTozlA5aGi2nKO9yjIY+Mr4qU5Z579IrXA+Nd1/oYmIj6Mp5a7Gj3GY1ngr1DEgDLAZv5e7cLWRr
-UASPqC+jYLiBkA12i7EOVXrgLx2nQhjdUtv2I+5IKxVBrHUhDRKrGt9afvQ1aWn5p9ENUBrBZfjR
-hQ+T7M9/MFzTKAdPCF9NoETOEMebDcxJ9oO/j/UD0ycRsA==
-"""
-layout_big_without_dead_ends_081 = """eJylVUtyxTAI2/sUzLBn+rn/3RobJETcVev25TmJLZCQee7/G8vDzPbH/PznJfKZ493+roVuMr4f
-gOdhrsEbz+2ef3k5n5rsJUD93AAVgBi+gw0AMwd8IgHxUBgPmPCOwj154wzsoPdctwbcFMR1CdvT
-5EOmJ+xysG4ZcAWFhMmJC4lzVwCqQZOgJjkJwMZml4K2BtBY701SKSgl0RmAQ1gHyoWpa+2KE9pT
-rBbRkKEOEirdnBU0JEcNJHEl4KzaVZAwscdylS7dGiMZ1IuWf3z2kFGAqtGMzvpJ+uo43HQGJ8Ir
-OKAp/f1+pdSXBrQPC0hCInUcgBG2z1bt9Juj+r1P4xCSloUOM2wvOgC/aOMsk+rwlhkaVHEfm7UT
-o5vHSK6jawaZMS3poMD6XA6TbwK8ndrH2fosjpGWXDRLtRk/NqvtkVWg95sjyoQMgHksqw0F08uk
-GAv1sjqr0lwQ5Ooz1k2fGrB2zu6FiTaUvkLxNeslur0L0hS6CT8FahENbbw6eJexO3wGHo5bxBUD
-SgakEOfoDA2qCh/GwGweFFsBpPXhbJ/T+PVSePQF+YXlr5FLEqFt/W9j/QAcaBHC
-"""
-layout_big_without_dead_ends_082 = """eJylVcuSwjAMu/MVnvFds7v8/79tG0t+pAUOZAYISSvLsuK4fzcebueAzYHt935m9nwBAKylWD3C
-2BYWHov2K4D3w/UDZyQ4108AwVriuj4N4wzbUlibBOCUkKRtnjIEpvXnYIJrAJ5cnQCkwLkFVRFe
-CS2Atak9qUmGDL7mWHupNhKgh1eEpFEAOThVcguAKaJU8wjQGUwriFYAwEbMiBNCdYCAYERkFRCA
-ls/yKRHbUohaI6VfPuglaObpKfRxyIndB/klmbiPJuiQsDmx4oDuwW0ZvaJYCVNlHJn2l1BzZHLA
-BQDoWuslTFPJAq8ZSI37FFAW1E4X8aJS1FIVS5d2zTsDYG8ruxNHjWWoOguw9EnLlNwszez1/7Rg
-AqAMVVqTAbMe9YmD0I6z+dY2h4jVQPJNEgkjrRdGu6hi9ZhyaWogEVENjF0DdgFw7SvMdpxHuxDR
-PI15eGyEJwNjA2nH0KSfeIkBsqJXJ2YBbBVz+CF7fdS6HZpyYl4ZaDE+jgPgJ3F9DhMN3nP79SeA
-v8vi/ez+/j198N14/ANxjxGY
-"""
-layout_big_without_dead_ends_083 = """eJylVUmOwzAMu/cVAngnZvn/3ybWSnl6q9FVUSSSoh3gs/WCmcH4vPNljJAvAhl4vqwX6+9vFchb
-owZ2Oj0U/awa57XvU+D8PUmnESbX061LF74ITJ4gyLro1k9Np2BTzIFBkkYDdvHmL1y7df2it8Mp
-wFStGS4SeeWKMhs8dV64G0hgLWgGGm1QONXXjHx+LfauSdBqYhwRLwTFfhwjP1v0REAhaHduDJFc
-IMYqpQEMKndPxUpFdYj1m8cHccG24EHRI+Xyw7iGykaRCKDUj4BCZGmYUPImQgsoPPZNokgZtoeU
-CLicKeNuVFj+JdtMOQUE5bMohq47dz1os3EiXCxBoIQqnViERsRirAJND9WztoAwGhFlQpzJEOUT
-DrDC7B+PDwaabjwDFAwvn5UWgWB8ITm89sJlc3PuOYWa8dudY3qurB0PEx9QxiYahrg9pLlecjsC
-OR+6sL1f/86cRJDlhYEKfkdLXz8NE4HP4oJemHsPGgYmc7/KmVj+rdTscux91Z6N5QVm8vrg6CeA
-GHvy/DkUhV74al3XBK9DanYKunQi+BGuKz2MguYfgcSH0eDD9foDWSkRkg==
-"""
-layout_big_without_dead_ends_084 = """eJylVcuSBCEIu/sVVnFP7eP//20VCAad23roaW0mhPDQ7H9r2MwFf/oW4La+IN+Q9ttkGf8KQC0H
-9mds4mD9QFHD2/cCiAVaKZ2yE2go/3U0Fq6FlfOTj8kgMbDJXwymA0Q4m6D4KtsCSItOKQAYLsM/
-JAMFokpfC+mIaG/sl2DGr2pUIiaNy0M4n2RoapxvzgCB3zIKzADY4sIZ4gPHDRDkLFhqPLUrl1N+
-wtwBNj4CoEuVWUBXvtfIoDNlgKkFFcc3C74Oi+ohgD2BxJEdBi1fLY3mkdBhxFXVrZH3OoiTENzl
-ICE6IyLD2UbVlN4LYRvHYQ2GrSlJXIi/aZlGocTSqX9Fhgoxojw6DZFbc1WJbgVxVE5C8FK+EmPU
-gOEQBAemwK+JdGrEWA85ltSFAyDlGMz/VagixFPZwSAa6JmJbBjzdspm4tApeqju9iw8XXpkPD2t
-HaLGjUENjFPO7+r56nVwZ6ONtL1wCHICKYNzx1jtaI5uBl5Any4WHw9QgKtUMM9VUFO5kXwoCQdi
-cXYP+7oFkwsm54Cocq8F8BNBnabkPXpfsJDRBgH45xp/lmYR4A==
-"""
-layout_big_without_dead_ends_085 = """eJylVUluxDAMu+cVAnQnuvz/b00sUaIV99IaRTrx2DRFUh73/43LbQ3gecYL7DiwfYm1+HsBPJ/c
-n7/n88KNd07O4TzNP2+A3BCbx5EJZGf2a8fN4FkHjw0guhefRoViB4MEMBvIxTUeWNMYi0AAavfM
-gDWyqP62zkajL4AGNv3fYrKitwhIBi/bxoT3O9BrlnLpwuad9YSRgcJVoYbWIGJRWdkMPbC3LkJF
-LO6/RPFl5P18AIhncgAnFeodJI8SZgBje6Z1W51kIVSWjQpP69cGQDm7NTNKnQCtNJ1gtKupgieK
-WwQ/S4CXer4cidVVZoQd9SqntYjNbO1V6ncdnFdVLFAvtRCFvVtCbiexr3O/q/fDWXE8RTxH5DBm
-zJw2znwO65uvnMX0hwt9mY6uyWYS4+WKiycBuk2ld4dop7bPHJxi7psf253SxWYOijnGKRUa58Wr
-nVAaBBcdeYu+7sRpNUwYnIys7LIiLCIR7XDiqtgfhehe0LrkJ+wG+KAGU3QTEUVMTkZxN8CXmRzy
-yuWwjZrQbf42/n1cP02wEkw=
-"""
-layout_big_without_dead_ends_086 = """eJylVUuOBSEI3HsKEvZkPve/26hQUNCd2TxfpqMjlgUFqPrZWCoiJvjsby72jvpCsSvC1vvfvwdg
-/3yUzdk7xzRXvHkP6zko387At0EqJuYmAUEb7bYDQOz4GlO/Sep6WIZzl/wa0EKza1IkAkCx2iAX
-AGgtgG5jATDYhwMWDAKtkYT7ABh355kAEOtRDrumQqBbcyGC6JPJ0VmLkswPKYJBS4BL1o77li5Y
-V8EwqRgAF+jIw3LhRWotFVgkc00suIuqjQiXSMxAK91LE7o2I0IjZYRds39itChhaicTPV97kHHh
-q+9ttfSfXb9FG/8qXf9barPUXxn3ii6vox/YSCLlUiYM0gM0VqjRTEsPSzW9L2nWG+RfkQ9v1DNF
-gr8xw/stBgE7UsWyLk9mX0lalFSl9cRHrjh3qq226ZFdWZfpdstJCPBS7t5c0wUlqbRiMFqLzIyH
-jO7RFDMAMpyQwCBRqTDu5n6O5voM0p3CBXpGuHs7DWvpSsOoFh6pSP1ckar1+IDtBvgKhkPk/rCN
-tksyL/3Bo9ARjJ9WMqBcCxk/HOsPiXkRIA==
-"""
-layout_big_without_dead_ends_087 = """eJylVEtuBTEI288pkNhbbd/979aXAMYk7epFmtFMPsQ2BvfPxuPG4fH0DDynwfX3G+gjrxVgxbH9
-vA/kpn1k/XlMuud/hEFd8p0I8oY9T3ANzAudQ9bj3ke+XbBhb8Wa3HEXpoAinFfQoUGg8QNDAENT
-aBWADoDgwXjo740gdUCp0AhIIeH19b1gZD8kyDSOmytxdQUDyLIpbdFAJJysQkSPYMfu8kGtqisS
-b7qpPOIHkWfnDgeCTKgY0JvcwEAE4oZ9rSkM80M9Sj19QBBB2lRftxvC3jkRMHOEHVlAZbIojiyU
-AJKiODHpiyDpCYSI9WVqCJzCede2dYVjaDD7wD7hNFKa+TSjZRpl3JIhf2vnOCAiXpWuCdyAbgBM
-I24IwhjkRY71Qldjhc7jNPDp7DK8DQSKoYXLKPirzFSDIw1duOym1o1k1j1MKQiRyiQzJ20mNa0J
-aWndSNLMzLAL6IPV8oF0yOqaGaeEb3zh0H86kjW8NA+yr3u0eUqobniuSieOMsPAIMCqoXzVnlIh
-A0QdsxbAJO3uRlc8/iPYoJmsCp99wLleGnw4nl9NNBHO
-"""
-layout_big_without_dead_ends_088 = """eJylVUmSAzEIu+cVVOlOzfL/v02bTYCT07gq7SVugUDQwP/GCyIqMRRzfiZAxlA7jYfIrwG0g7ZU
-v20gHIKDDonH9wEwB+p/2CsBhUAq/PMSwEkKgDwENHkwtP1lQOi7B+BycqDxqtKH8Jge7PtO5fxU
-JjpGEJ+dB1GboRX05ZFTIIoeAHJ2082mElYbwLPJs0rjp2F4PcAZAGd5PFBJ456bvKUEkAXgGvH0
-v0BYQZEdYV3ibfsCyJzYWldOB1bxj92hoJ5aW8R6+qHbI5lZCExoj24+MWl5CosGKfirN9WLQisM
-U5BlYR1dL83ARbWplJSFFpMEvcbFyUJCRZoORmRaBBlExu/c1wA4C+qgMN9RSGm3bGNTuKlie5S0
-stElQOiyCr45nFdbKSGOMWpBaJAA+qapXvyqKxf/ZjKWPX0Q9PKfWdCZilDiu/bGC9bSWo/q9oKU
-pkYuNidyrMYAYMHf7c09GoLE1MFWk3pPbFmeaN2D/skgWBZkHnStFMAXP1T23dpOykeNiAfxpx1g
-CD/N512dc3blf47XH9IvELQ=
-"""
-layout_big_without_dead_ends_089 = """eJylVUuWwyAM23MKv6e93nzuf7cJ2BImaWcxQ5s0UBCyLBzgf20gyFBje84GMHD9rPvs11Wd7wmw
-Pmr1FFyD1KJrYI4dAHPd5wQIQ1+zaPjZjQ0w53M9EGvymokC0I2619jFYxIRgBkk1zU6zHwyRqK2
-UBbIZLYBksEklAC1I26kl54CeDCQBiENYF4QTrGENWAPwStGbqIsVQAzGE/dDLAhomnQ1qDlAO2J
-txDYAeJc4yAdTwfIMNhSN7Y/ajEF0BzzTOOdAcsDDG9RX7wEODQotRcuo/SQgcUAHYBIM8zRYTBa
-AzoEJgNvycNIDgGb1OEUhSCbvzVSH+h5Sltshd9o0BlYSNhEyqH/Nh0DpEA8vbq39lmgKwXsc/yi
-wSONVHRQ2uMIAS8BbkYyybwzjoLC04kug4qnHaXt/hbCLU9gm9nWtJOHuGlQF04NakxrhMg8RLby
-oQFPANU2xWNjvzdSPwto9S16yV12G5Wgm1NUR6mgq+ysLlWEDx/gVRrrhGp3V/2WugHlbjNgE3GT
-LvGIVsQXwIcFMQNWDmtf1EnuLwxLP/C1k9xtlolgL7MJd7yL/Wb6exs/94IReg==
-"""
-layout_big_without_dead_ends_090 = """eJylVUGOxDAIu+cVSL6j3Z3//21bgsGkM6eJ1FZJU2PsQIHvxoKZuV+X1XC53wM5kS2cvTbAp4G9
-EQEBQSEUfm+AYOLCygbHGycegx8jHAwmyXsaX94kNoyA55QMZtTa5ABRL5KnRjfsCoVEtsnQJJYh
-9WgOCWCnCMis0XCoC9s1BqAG7SSovhuUDBogwxHgMDJySho7KeqYEEkus3nrAmw8d2QhRKpDg3Q7
-0KFahRO1ZBgMSoOgCZpBySMXz5BMwcNRKsVzUCC6O9dBBuWFpFgaMJNy+CHtcKHP3oIbfUcJ5wUB
-dE5UatirLlArKla1sKde+KiYfgFIJZjwfJeCVGhZvA5NSike5zZZzon3+mLiiGo7/GI1irOH58kA
-VXnzzHidplyy0puZFICZlp6b5mnjObrOLeJgUCl40XSeX2+slnZVs/KPLiAbQOnt0hLEBfcGkFie
-5GbT80MD1ar7Vte+NVypEJ2QDOa/BF1X4sQc9GxJrH5h1RCBQ/anC0+G+w2k8EZUESEY/Ix2nzek
-oF1AH8YF8PegVVDn/2z+gMPJrMYvxvoHD/cRgA==
-"""
-layout_big_without_dead_ends_091 = """eJylVUtuBSEM288pkLy3+rn/3VpInDj0ddNSaV4ZghMbkwH+Nx6sM2jPtVD/6R0qhLa2PjfA9x98
-3cML4gTVqOl7AMxkc2OsEoSH1K5DIZIm9Py12pQHPtkAOwSo5KMKFHTnwMyVIg5+ObIwKYKhaNVz
-AGg6WCUC4R2wAXhSBQD6ZCbdLO16BOkVm7YGzY0QGeGbaqhHUYAoDF6oOVeixOMAUAAtYstuAJV8
-F1PJY3HXThPRnJU7wcZxMKqarHbrICOJXQBE6Cv6baAMOVaWXgVwVvOKXAB6rSskDQ63fEWk9U+J
-qDWrW8WED9BZmJMWAtrAfQCVQ/QYFHRK0GRQRnKk4sSmnLjSQzrMGyDfck2AUP/xumUZXudnIkWs
-9ZR2IuVuL4PtZ+sD1oLSSGUOrDZeu5i1pwDGdUa//IV+eEMXkd64Hrm7LuJ9e6vczNo3nzAnEk5t
-9YVftL54B7y8ztbX42QS5G62kAYvGqX8gxaiZG/9g3RVsEZwFfOz2a7OQaNQNzW7IrPRAOuHAN6C
-vgHeBHx/vO7PWyStj2juefDhUbZ+JevOPr7DEvHv4/kCWSkRkg==
-"""
-layout_big_without_dead_ends_092 = """eJylVUFyxDAIu+cVzHBn2u7//9YYJEEc39YzbdYECxBYcf9uXW5rhfWKsDLi4XRwWtKQPz83QOTr
-tQWmOVyXT27TIX3W/3RZx+797w2AQ05wApQBAAWWL4FXXrZKCJbgnUukH0rACsGURz0XBxGMjOd9
-OnwYlFsWllnl6wBApz5cjZVoU/QUBklMAJKgXB0HuoS1EYkMko0ZGcy1GaPcByWmQNeM3Mt86wLb
-bJNdaw4OeYyQjEpLVFfusmICxDi6/gKnYWMqHCPbusATMaC2vLoFSJ8A4GjEPwHsXJlIHN0Tt9zW
-ROIq+fPSFeyhjaqkpk6RXzl0F1497DPuwrJDAqcMglONLsSxNi1k8CJoY//NcID9C8LBEdl05wGg
-DsfotADWeElFjJWbujDngwJXAEsCMZuMN24oLG/2GqB/Nxu0EUP369Wv0UYxLUGNU8g9j6tEshW1
-ZA+61SI3ZXvIT19ncCQCZglDEhjGRwYGAYVuPdqoDPBBGAYrMe4MVH3Jd0872cW0qIP4IKEL7Lx0
-xyn1UhF9S2jgKP+AddQOEhnKXYI6LxlzWZL2JxJVd1+l2T/HFwgr1Mbv1vUPukURLA==
-"""
-layout_big_without_dead_ends_093 = """eJylVUtuBSEM288pImVvtX33v1sF+dkMqzaap+FBcBwnMO7/s8fN4lmWr204/u+JfKPGnwKw0xP7
-cfP1bMMMx743wAqFO8Gh5QsRwyMtGCxP2GtxO3hmeIu/5oIB74TkNADthtbLNwMFPAYNk0NITm7M
-wCNHUdOTQfwRnUK5BRBeW3EF6CqY27tUyqCIHrWYhauCzhoECxJwsgVe0YdqMQDL/Oaq8aEMyI+a
-tQalwZBwMPROwfq3ZbCpZLp5CYwbQMZCTiHrOnKoBzDNUhqUhKbFgncZpcnQea5wz2qGzrrlqT0J
-wOJWqIiaKfS+4SnOVl0a4dhD7wNULWHUxcPf4lYY1f0GMAoHChWVsi+3ug+ODkmR3y1ofddhABSf
-5AL18xBDSbhNGEj86iM7HeBE7LiVacFaA7fzmOcB35o+1Xsao8voRxdYVLRPnjKgbH0ykN7iwWgw
-/c4yezLgtI7bNxjcFbwA8E4kR7nScpFO4ksd1qmq8HWLjxkm89uHJxj8VGxIs4qbTMwJe39Y/mDP
-L1kpEZI=
-"""
-layout_big_without_dead_ends_094 = """eJylVUFu5DAMu+cVAnQn2u7//7YTiaLodIoe6kkQJ7YpirQ8mX9rV8bbhqOf93vWxZZ9/7sBDK76
-nHe/Rb3umvtKfXs9PocBAndMJBjFwr3GcoL26zKIG2DZcnUHRkYaPfE4PuYJ0GsnTLHxFFIp7ZIf
-REyTa2bDh4P5BkUMV3IIZ0JPBj/n1K8YQPDqJZRRzUjKBhOYAJ3nBH0yaYC8ATEWE9EYmEnZyUI+
-xQBkrepryb0AymaE8uqcC4l5MFusSWQtBukMUokijMFMMmdvVgRYTTpFsC9SoX3deq0PxmDMX48O
-7OVjDXKh+MDGExwAdS9csKOamhS2EsutnIRBEbHAZRGYeZYL3lRy31LYkjJJeytLElX8zBkZ18Z4
-yFMA4jeSxwKQT+++2djmPBmEhmYLydSpOu6v5Yve3tc43srzag9sL9PGtUmkxWDLrNyCNHhTYRRg
-TqQJr0SD5WflHJAcZ+UPwLOG6waDzfPJo6ZdW3W/HWPvDz87E1m7jz+DKoMc6nniYE4k566VfiiB
-20t+GIB88hOxc9dUc7TzxYy9AD7W2/RTT9/sHLJKHHpXfh0nksIhzr+cs+ZcxD+26z/TJxGw
-"""
-layout_big_without_dead_ends_095 = """eJylVUmOBCEMu/crkHy3Zvn/3wZwnKV6bl3S9BQFOI5jAvDZ88KaD+cQ2B+0BjmF+MH6PQAHZy3h
-redzP8Hb6I2I/98HYMRkfyPzCy/WDSKUO9ovwQCOglyXjLQr6Q0GVwORLPZov4SWrlACA2AFAwMo
-tmJaKAMkwaOliZ351yYXACwGXF5y3i+utt0YewfomZcG+48tdYyUFIEwdebsxhop9GLAW1eG7uI5
-sWRgxNjPLuspaGwLw5zQEiwZYCSQxVw11DqmWVgMLFzpSDq8nWivTo9kFViFSAwvnv5wjotNg9Ko
-REQ3uKXz9rbQACpJC9GK8q7MNTbKB2EBzkWdf8GxxXIKM0nbfvpi5oTweNeAJc9I0qxS23BwBCon
-9jyBYlBZsDBQh9MAzR8ufDPRUxlbywB5xCK0HNs8IY84x2osHE7sJyUDLGcxOp9Xt36gAROAUwC1
-lpaAnJgMKGZxxBRPPYHLfSW7mnVU8QTg7qlT25pAeNwMAg0zhZFVdUBfAeGA3mktawC8tRnFYVr5
-eRa6JmIQM1eIrHHeJ7d+475ZbbABvp4M2An/e9uFYYLBT1KvJpgAfAI87t6rwWfP6w99hBFc
-"""
-layout_big_without_dead_ends_096 = """eJylVUuywzAI2+cUzGjPvM/97/Zig4ScdPfcNk0d85EQFPjfuhARud8Rfb++uMAfGZ/Wbzm4j2Ed
-Xa+6uMUZcZ/T+l4O1k1GWUJm+TFo7giRwTyZAS9QwPpuFLzHwGvv24E27/h5H8whYf28z2J9xqGj
-KQeKWO6cxd5YvpmOPyoOAgR1WGdfU+mrVkK9HORmDzQxBvYmAU2eXes0DobESkWxOz00D/1gSBgI
-2ssOueuxbfa+DnTNnYMDH6CMKyWkU5rEQsJvB6AE2yynJmFSftBXPGwHSbt6mCkpV/Vd1Mzbytsc
-THpWS4E1zlSilsR24GpNb5UnBEdgJL5R+gasbC056VgO0D0UR6YzCk5goemBgfBkx4lOKeuguDw1
-iWrON0pBiJLZFLwSJYlM/hwjYB/JDGwa6v8g8dArVZtNV9S8iDkwHFjZepY1chQH7C01p/TPXsjW
-orAyY/W3qXsGy+pTQjD6iA+Y2CJFcyccgj0nR2nlPa0nH0LwQU+mVf2j+7Oygnu8pjmnvq7W14wz
-EmMcNDmwFrTlfzLJ6ZHl98KXt4r3onWDpAxKMIj3ws87okF6TiQNjc6qRtp/1vUHQMMRjA==
-"""
-layout_big_without_dead_ends_097 = """eJylVEmSAyEMu/MKV+mumuX/f5vGGzJJzSUk1QsNsiQbA5+NBTM+vxgctz2AuNk9YubXAWQoguMC
-hAA8eBvS/3vu+wHwYfBQrwx8EwYDBTBlMLdNVhEiYjktAWASgNPd87GQycpUgr/TISNeM2BE4k0l
-6LsZJRUC7AClEDWXlrgpeRcGMAbsACh4ld4AdEFq1DQRB/qwzFkCunHfn2UMaTwAARaJT8ppbDxP
-A5L/GwaHWq1gP2t11mcmQP4RsutdnKsvJ3tWhokEFoNeiU4JpZZhVxrZcqLyT0KEwWPcVd9MrFVV
-uLdchxJSUuphMmBJ6Gf5DimJ5i+p7Czt0yj+nU2ea5HQBAiVzGQwSvg4X++aBeukRs5XZy5DX1k4
-u7rU2z9DArAKSGSwa4pv6uvwORJOI5BDW9KgAKyCOwAMdqS9prIahx1ovmPQvBrAHU8A3D2mWQmA
-F9JoHBGXFV9KuDqQemA2DUj3Zo+pC4/EVY1jX0Y1QYCtj0h13oxEkcDs2HKa/u30g8Gd3/b93Taa
-nq2FLwUQ0c6HYQav/RJm4aeXz5FOa3VOBGZL+3CsP9IvELQ=
-"""
-layout_big_without_dead_ends_098 = """eJylVUtyxTAI2/sUzGivafvuf7fGBgQ4u9aL2PFHRkIhwP/agu3mz+rVAJ/k6WjUTu7npwB0NIbn
-QQdgzezltvnbARgLZ+zLDICCZO4LuN3MKbAiptZ8g4jEO3q4+/kA5EodmZipAfWCPLzJrcbdQ/TI
-nqUcHXB25elCRAT9LrY35wxpQU0jSJx+gY7Wr4MIdXYS4QJQTgfvko/BugQ8FHaKAyDusM7yIXNY
-s2RLB+AlYsFN6ZGkqeS00GkjArcbLrJG+sglj6CbDwaAQcFWwJNCbXsY0vs14Padwz1mw5hAjyHT
-GJARQd+KQkkP1F0zCxTs+0jDc7M3EXlrcCe0UBKxOdHSiTsCoq9U2pzcKBcvJ04ZnZBV+lzWK8d8
-AbDDRgRgl+12mUTk8KZVwKJwPmBOqyuhPQuKogCIeXXPJ7MeDCcOsiMpds/Y+eZugCobWR9VTpP/
-LHdeD8L4s2yN66gY8h8hgCFimbG7J4Oqeg5RXdBGCThsqCM5M42+y7ppDcyPkC35FPP8viPRdApf
-zR1lSos/GhAALcY+fAB+lNO4Kf+jrsnLBxh9/pn+3tYvlmYR4A==
-"""
-layout_big_without_dead_ends_099 = """eJylVUmSxDAIu/sVVHFXzfL/v02PQSBIX6bGnaTsDpGFWOz+v3Hc5sDrJyuP934vWvT8+wIg/7b6
-FvHN6/bfywPgTj0hY/W5GGwAs/g4Fl47e60KQHmXETyQYDkJDvkgAJKXKlMLI4AVEdQGZDCdGFS8
-XIBokDtcy60BuMO1ySkZXCxwiwJ4DvMhjDIIFjfWYTcZtPhGGK/3BADjc3GfAEMLlzBSd4kSNUi9
-vfJmuqJ5sKMkqQzFHYsC85BCmV4XRuAQd3wRE+P18piAVkly3vFiBBlI6tGsOkSHnDGoqWJJH4G4
-8/XsNI4CRgdg49HNzUCDk9bJP5zF8pGT80YXuLV0t19kSKebQfS4xORuDs0HiaYktuBoLQgvWia9
-lVxBMLPvjE1UsW5pd0dNczU+kR2E6aKjgZNDi7wAKuuQ7TOLrnFRWLvwqxZAaQBxgYWLZoBHzyLA
-jHIzkGyyrcV9f7pDk23VPxiFRw3XAg3QuRRwIMDt7fv8amGEgSa+SRi3+FuDD28/RYNsn3IyDQA+
-XgBfrcioKbajcdY+TrC3bf1P4/wAcRMRGg==
-"""
-layout_big_without_dead_ends_100 = """eJylVUGOxDAIu/cVSNzR7s7//7YKYGxa9TTRzHSUJsYYh7h/Ny43M3wt6sej/hkeHOE9X8/PAXAC
-cB02VxibgLPuzJn9AkCWuNniuIBdA+W2q+OHpKG8E8+KRL7wTSYBnGms0H7EyLTrccaABxk0mygG
-IIAFHoXuLR/hvQEQrFh683bdkwD173xiaIBBpxDGdYlwqlWwUJeAoQBTMwGg5EHhvdghj/Ouyujy
-3kcPvFIfaGpg0LwiQzn1dmqwhzIiQG8DnSxcUNKXAR+MELHcsGI/jsUwCIlPU4mIIRvkmNRMV+Es
-2utgpc0/vEp8fF36XvUIJJJrNEcWXRKK4TU+EG4yA7cwJXKpLVKFNdaB3KLOaV1VeKlRlTGkvZjE
-v/nA3hxTlsI2H889ANJ4dwIoa/q+lYYkfZxjdsH6ZHAX0XjgkAQYBBcOD9NGJgDTbBQAVVutYzSY
-HkNvoTgXu1GH5R4ru4mVcFhSD0nBpfDUO6anPprtmIotzYVBkOX0GiGw7gHeTFP6202yYu9bocv4
-Y9ONN5lppfcjPCwK4K8nQkqvY67ZQOsggOFe+GJc/0E/Ego=
-"""
-layout_normal_with_dead_ends_001 = """eJyFUUkOxDAIu+cVlny3Zvn/3yZgSJuq6iClEdQ2hpDPMQgB88T3iMg5768BjYbEKGeiKLwDQBWb
-TXct0wSsgGVSXmYkwA5kL2gu2IC21T65SQ6uHsGM4gk77Qxqk0gadKuQlUs7e+BypfrlO3sagJrM
-O9sG9xS5Qyw73UkJeKH2WlvWefUB+Fjh5rVgwL/n/gFVIEbb
-"""
-layout_normal_with_dead_ends_002 = """eJx9UVsOwCAM+t8pTPgne9z/bsMWtf7YTRMtpUKBc1wg2RTQt4I+fQJkNi5ZAVAJns5gLqIDEDtb
-LmEEyPpEtfhXVICeguwhElMYYD639sGbAMnkJlGJ+dhgWPLofK+IZPqwMVrFujFDVA5zul7angRs
-ssa5Atp0Zqgo7l24s2jzmdN/Ad5hTpmVpWmO9uE07h8dOkal
-"""
-layout_normal_with_dead_ends_003 = """eJx9UUEOwzAMuucVSNzRtv7/b3MwadNpqltFjuMAweRzDKKCEOqvnN6v4FENygmcVcirq3wbQQ0C
-9W03yKX6xuSRgWu3B3oJgixDnV40gDU0Ae4gCOgI2NRfVE2/VAqLYquUVK0LaB/4B3uxKkadsoRo
-jXWmON/0I9BUTcE4k8dNqQxeNbzYeBuN2ObLGj738XAfHWL147i/I3BGqw==
-"""
-layout_normal_with_dead_ends_004 = """eJyFUUEOwzAIu+cVSL5b2/r/vw0bSHLaoqalYIydAL/XQgRDmxVcK0uPAQ5Vzw1UjZnL8N2AmG69
-zRx+cq8KKqU+iEYTzRBmyH+YPhmmcYgF0PTCsGPn6qMRuwFsxSfFBFjdMN+4EucRKJ+QO+kjJdfx
-sbnVtVpj2kW1clwQt/W1JVXmPrG2+WpHmEk+8hpkwKfDs9h3Z9T6c9tYXymmRrE=
-"""
-layout_normal_with_dead_ends_005 = """eJyFUcENAzEI+zMFkv9W29t/t4KBI5Wqlk+IBbbjAL/L4E6PIuNEN4Qw9ysHIFxVDZ1zfcYAg4dD
-KPi+xFUDsyERMGoJS2K4U02baFZPkwtVI9OU3Txt/N7FWUg5SXCBL9NiSLjPTzkFVZsLrWGZziQn
-p3xgDByvBntgszmCqgQNj2GYzSN4SbzGr35JeDcybX9+G/YGZ8JG7Q==
-"""
-layout_normal_with_dead_ends_006 = """eJyFkUEOxDAIA+95BZLvVnf7/78t2NDktI1aKaE2jFPg/1qICOaLehiA9yRrd5eg6iVRpVcqSxaf
-FGjJKXOf0GqNSDnHCvUrtRumYAC2yzThVoZEIp0I9T0xZ4ShdOZglJlUh2zH5sJkrozckO7GYwI8
-1AKZnfxJgknNZoCDzU0ay1EWtuuJqtQx/+JSBScDHEj3vfBVpTAxNzkADfnyu38QzkaZ
-"""
-layout_normal_with_dead_ends_007 = """eJyFkV0KBDEIg997CsH3sD/3v9saE9vCwq4MM+qk5pNm/o6VkRGIiE6icz2MtwX9GxJUrmDvWQJM
-SUEVOj9qTUi0QWowqEVcApXbJJ32JArcrA6gz/DSUhaDxhe7PL3XNGNbd1vS8VoHpwS4nHJDwuDb
-ywzoZB0cnDW1sy1sAE9qEKQZucWjhYMat4kmvOLrjsxgwb/r/gBItEbP
-"""
-layout_normal_with_dead_ends_008 = """eJyFUUkSBCEIu/sKqnJPzfL/vzUxQDuXHqxS1ISwAM+2EAxEGiOQ7vbHvgKEAUKEADwA7wTkU7Py
-c18hoL0EMNdmsc9R1Fp7T6M5ViqfBWDrFlVXhYN2R4iCl4QDWmTVpyVYEdAZCEC/sGIfVWNymKzu
-DOkyu4ruUkmwT7AaZb49Hn3bjXodne1Z3FUn4PMzHc1iFEVYf6aNdQE2Eka9
-"""
-layout_normal_with_dead_ends_009 = """eJx9UUEOwzAMuucVSNytbvv/32rAybQdaqlx4hDALvkci1UgCmBpdTgXe/k0oG/Yy9S1TfjwMgDe
-7+rwVJIkBCmpHKzg+wtAl/1Gdgw/iogEYSMdtmF7QNyscKUqsuEOZRiywVaVYPA+L3Ka3NyjxXm0
-TmfTB2M2nTVu8aerMSes4TUMeyz1NzNLXDPVVHlmDhtpwNv2vjNWds9Siofn330DgJpHBQ==
-"""
-layout_normal_with_dead_ends_010 = """eJyFkUsOxDAIQ/ecAsl7a9re/24D5tN2M5NGSYjMwyXA72GguzO+nBqsKyLWKwTwmHSUBLGjdLkc
-IVB+wryYFWxsyhayKwjSgBDJAzjV28/mp6DOXmEhiLWcBAx6+NDeebb5khBYbbGsz2xyOXvUtXWj
-btDflkXAtKX5Pj+tDtijJzJ4x+KF4LN9HZMUPsWeHk6V5b5S69lV7c9rw75O6kbV
-"""
-layout_normal_with_dead_ends_011 = """eJyFkUEOxDAIA+99BZLvVnf7/78VDCF0D9uoFSgaDA7A/3PASMsTCeC/p0YllwNOWMIZgszgwCcU
-LJD9SSGKpCoFgFWNBLCkBKhb1dmupa5YLWJAdOXwsBXIVUdP2cO0goyRPae8OxjAQ3HFBKTAsmXl
-d0xcCj/O2CJSXEDZMpuPli3OvK9XmqNoBwe+AmUMuay5vXjql3XfW1ZG4Q==
-"""
-layout_normal_with_dead_ends_012 = """eJyFkUESwzAIA+95hWZ017TN//9WhLDT9NA6jkPsNQggf4+DUD2eY7WtNoCzAA9xPggwJPC0h2yy
-PNQsql4YxwoB+kKuy4ADJEZBDSwPzETT9gGMhn2Qa+gfr7KHqODHImGJbiA59PYdjQZtf7cQk0TS
-bBG6Djr6oEvDZJY0mxbEncUqjIEJMaUs4IGv+l6Fj4bXAOlYSKZjto4/3ebxBmGMRuc=
-"""
-layout_normal_with_dead_ends_013 = """eJx9UUsWhDAM2nuKvMeeN5/7320CSWxmY7VqIwFKgedxIcjQoC9/Id+agW8CNMKP0DSIqkSu3glg
-M2Q5W6E1ppSgxVA9Ebe8WdKDFY0muo2lFA3QTf9uaVPJagNGz74HMCrX0m8G0WOZVGvZOBJU7Zis
-mLx5t9UHqjImZ2fFu/Z+TDofBYWVHBPwipZm51yhH4YPKvyy+n9qnKifjvsHmXJHHQ==
-"""
-layout_normal_with_dead_ends_014 = """eJx9UUEOBCEMuvsKE+5kZ/b/f9tCUWcvY6JGpJS2wPsamBOsrauOtUhf3yKwPv0yATp1QBcuKRjR
-OgoFWqJ+nKI4nSVSADd1ONyf0m2QszXnMqlQiEClj6cWjEljcC4/8CRsuvFWaL4Dxp+eFehKgxYB
-qdI+ughGECkzvUMXkVDG3GhH6stpE5EqbfKTJDSCMxTG5P0czlJIlph8H/cPSLRGzw==
-"""
-layout_normal_with_dead_ends_015 = """eJyFkV0OwzAIg997CiS/W/u5/90agyFrNW1RKtrqw3YI8HsdiGCshwFVL/r9LQCoDxWiGmpHPBfA
-aGC1MWWrRO4GdhdTg9bMDAL3St7JBqgeTIyBDdgRPsjYbYvP4DR7V6ifTH84ZQPRel/iTsjqSYVt
-p4EcPRDJowo5sxXwuAZ3jAIgi9f1enwQ2kwWf677BCmmRrE=
-"""
-layout_normal_with_dead_ends_016 = """eJyFUUEOwzAIu/OKSL5b2/r/vxVsSLdq2lDVUnBscIDfEVj3ANfKR41DABfyxY1xBXgmAJmbLT/q
-VlB5lgLsM0wCYaDTxOoZBmANARrcDB5hYAWgM5U+GEj3dixJAO+lEidHM3/sA2GKHlIlSxcAewnP
-YDsuBotps71mL9ESYihnMEaNcbV14OHRhnRb3jcSeF3m88vNxZ/bRpwXBEaf
-"""
-layout_normal_with_dead_ends_017 = """eJyFUcENAzEI+zMFkv9W29t/twYwhFeLFMJxgI0D/DaDu8c5RjgVkZV8VgEYf9Wn299RQJ+k18kp
-8gZWvKASQ0UxAYnJ46I9BgaVSKiA3T0cNhc7nrOTlqFXdewSE+YbQm5j6XC7+x7eFEnmFLE7ZcmY
-XFvcxVqB5l1KLm0kllAT4nWFHA7ETDJ8KmZjnC4uKPvz2rAvQn5GyQ==
-"""
-layout_normal_with_dead_ends_018 = """eJx9UVsOwDAI+u8pTPgne9z/blPQbl/r1rSxiKDA/1qIWvQmAd0jUD/uBFABNqSeElS7AGcCvJhf
-dLbfdEaVoKtUkJlKDkBkq/gylCUEaIbMougkEi3zpQqOEgPquuOJ64CI1tAKb4BldpZciI9dKyRl
-21GjKE0DsF9Ku1ygPVaqOokPlRm+nQn7BfcsDr9Nf2cwPYAEXG9yuJN7djEufsf9ADxIRsM=
-"""
-layout_normal_with_dead_ends_019 = """eJx9UUkSwzAMuucVzHBn0vb/f4sFspJe4mS8SAhkTL6PgwDkD9554lorgd8CkPC/AmRjGDjwKYZV
-ADnEDiNB744Q/KUDH4AMLoxaqbQ8kCYjUZhaqwB3w7mFywsgTaVC1oA+OytxKjYAw1oS1oJXYfsQ
-5pBVbjeuZqijxp1cUfFvAHraFHhLnOPO9pmt1D58R2I/FR7v5ybfn/sCFwRGnw==
-"""
-layout_normal_with_dead_ends_020 = """eJx9kUsOAzEIQ/c9BZL3Vtu5/90KNpDpZlhECXmYH/BsL0Qa48/A8V0JyCK5PKCPg+OTAOEH60bk
-ebMooEjFk52u05Zu1ZBI/ulVCi0OiRnoIuSKyddSAlQ1ykE2DbsWqBC0VlVCuxaQ2lGHv6YL574V
-Z2mq6U2hcPT43JKa5XbRpkby5Mw8gTd2sp7yGbyX9Z1t8ZCxG5xlPaz7B2GMRuc=
-"""
-layout_normal_with_dead_ends_021 = """eJyFUUEOwzAIu/MKS75b3fr/vy04QHpaUYUCMcZ1yP8RFCQ4RID0CRX3AmTIOTsDMBqfBTgT2ocm
-h7/gacArBPaGrJNBTBUs+haQLcEiXeXOuqOqVwy9kO48CCwoeIq6JVQTmcPaNqWOhnRnWxP09geB
-vaDxQjOMk5q/5awoQ9qLI8h5AS5PdLsNH/+D336YAbSTkkW+PfcPEM5GmQ==
-"""
-layout_normal_with_dead_ends_022 = """eJyFkUEOAzEIA+/7CiTfrbb7/78VGwJqDy0SUbIZnDUAv+MCEQoyEJl1yh1zxW0ATvQdZ8l4JuBN
-FiO6WLcHCAHIE6gnlB2UXt4ZEOhHtnBECujvwAD1l2hgwpD1uoIGeJwtsCV2gXZ9xLcXDXw5Kyul
-J8A2pleyQqUArsKniHuDY/OxwJg/vcq88MLMplx4ak0K+DfuNwqYRpM=
-"""
-layout_normal_with_dead_ends_023 = """eJx9UUEOwzAIu/cVSL5b3fr/vw0wTnJZXamIxMEGgHdciAiS+Q8wOjYYdfMkQSCQPMSRFj5JoPgZ
-UB+UdlJVS0KPOlggS0hNBJ/GRqlRJulLOS0ng2alSZ+MlpkSmTbHKRdnemHPIW9ddKnYEDWHdnQ4
-PFxLokV2i+4Zm9BT0bjhhJa455m7i3Ky0wvfrnBuSWra4FrW/3X/AFUgRts=
-"""
-layout_normal_with_dead_ends_024 = """eJyFkUsOAyEMQ/ecwlL2Vj/3v1tjx1BWLRplEDjPSaj6vVYBKDr6A3gC8G5B31ZLRqA9KqHXswW+
-0lklkRAwiLFACBzaXIW5TMLUQKEkpv8p0qwRVCVXGtJYWTA26UJC0q3RguyP/RbiIjQPTvD5Lklu
-KdL2/Ba5S8okr65lP4Jd2Lq6ZuZ0TU4Wj5jsCTPMobXgdRAJ6SIvuP68dq0PQn5GyQ==
-"""
-layout_normal_with_dead_ends_025 = """eJx9kUsOxDAMQvc9BRJ7NJ/7320Cxp1d3UpNbPqME/I5LkLnAf2K4FnACfmL7xFQUaI1q9Qc+Tbh
-xEmUgMBK8aaEyU6LSTTGA1wgwzHfyDqJgNkLyxl1fVxjKSViWmCdMAR1PdkIqnYzm7xpHOcWCO0c
-QvI2GH/Yg2HsXP+BMgXHcQcTVyDczjCu2FO7+OJOpf6MOfglfBah1kpAbrFTPF33D234RvM=
-"""
-layout_normal_with_dead_ends_026 = """eJyFUUkOAzEMus8rLHFHXf7/txrwJOmltZRZHCCYAL/rQlWB/dDqT9RZ7wZATZIQhsbQTdVTCiwt
-LipbEHS70QFgUXyE90IYD3EwIv1iKNINIMVxaDpqA9phBGGHSx/nEcOzyPyKJ0AGwOEL3H5vgC0k
-sJ3bPuLW335D0bzjgRmOd1gTlAGPReGkJHVPpuaF19ftTBQrN13Wn+v+ADxIRsM=
-"""
-layout_normal_with_dead_ends_027 = """eJyFUUkOAzEIu/MKS76jLv//WwEDSS8to2hCYoxxyN9hBOAOwqGoP5XxHYCKTDZcB1GEZwCiPCiI
-ochcDMzPDncc+jRphgIknXjVxeu20wRsVS7v3pxdAogL9KVUDLjyHqjxWVkAVROzm34FstbScw1x
-eyEnOUPtlM519QCcY1I70QYaH2PLrfR4b3xxNK80aZbn9ue1aR9O6kbV
-"""
-layout_normal_with_dead_ends_028 = """eJyFkUsOxCAMQ/ecIpL31rS9/92G2CGFzUyExKfmGafA7xqICAQYuQhCU5DU/FiggscUb3VNQVae
-523GIkid6ElgDtqFh0FKysJ3E2FSc2VRrtYJEEbRhOJJWehFmIsha+37Y6DD+g0LZxRhXHkPdHT2
-G/OIOFJs2ZT2TZ4Et3E91Q1r7sBnb6066dGNug+DCiMXWPDvd38BYYxG5w==
-"""
-layout_normal_with_dead_ends_029 = """eJyFUUEOwyAMu/MKS7lb3fr/v404MdDLmkoFgontJOJ/jICiFtaPRMedgMTNnCCM8J1AnwlgppFf
-5aCMYU3RZUTKvZ0X1sAkWdQBdgpFAUuGnrErnBTEg1jHB0DmTgM+GlDlqd0mTLZRUvTGFSQ3aJvR
-GrE82vRBYeLVcHWORXGtvpYalg92mRHfVYIe1p6eNLyM+wcEYkaN
-"""
-layout_normal_with_dead_ends_030 = """eJx9UUkOxDAIu+cVSNytWf7/t8HGRMyltGkRcWxDMp/jZEQGggHmGar0im8BkAkjDMveZLzFUEU+
-FwQMf1BCP0djWOqk3pIAGSRiM+AOcgCiCH/IgsYoVxcYdagu7uZrBmfiVJu3J56kRHtW1f635LEX
-/Fu07TpgwO7uTkEUZ41hj2qcFOA1VSL3yElFiY9n1peUNjRmelCP1/0DNhJGvQ==
-"""
-layout_normal_with_dead_ends_031 = """eJx9UUEShDAIu/cVzOSeWfX/f1sIUOxFHDtC0ySmwHctmFm8qvigP7t7HACwwLTc68UBVzHolK8w
-oPcpjgQYnSWGAhzlAJYHB1GA0kM2K1sbGyYRDoMIqBkP/iAsAHnIyiBTukzmbzFzwKG6yhf3NAjl
-RdLD0PxIk2hQMEy+LAC2ZQf8kuud8c5eHu65rM73dXUd1Md1/wEEYkaN
-"""
-layout_normal_with_dead_ends_032 = """eJx9kTsOwzAMQ/ecggB3Im3vf7fK+tDu0BgBEgWPEkWTz+ciAOUDzEtdAZ8FBIailUCVyfCVQLKE
-iGkjWRSA4I4BLSlnVlDXkDXIPVK32BrRLpUMU3lsQfsvQC5BBSB2Vb+CcVketoNqbUBjcpkpV3X4
-4/v0wFlz5+ERodHOg3J6AdzshDoH5Xfnv4C3O+q4r4nm2OLfdX8BI3BGqw==
-"""
-layout_normal_with_dead_ends_033 = """eJyFkTsOwzAMQ/ecggB3om3uf7ea+kVTayCRLT/RlE3+HhcBUP5FpNcxnMN9AJ5pASdrQLEdwHsr
-sMutDK/8JQBJLlWqe7unBaysGKemRR1ApU6UvxFzMKBHAWMDC8gZ2uCwYe0BHJbJ6imAtJO+8gpG
-obvY2RFTA91ByGDdmAp4YW42OlarK069+JmXqXJXboV/z/0F/h1Ghw==
-"""
-layout_normal_with_dead_ends_034 = """eJx9UUESAyEIu/sKZnLPtN3//61AInpaLigmISDwHgtkBIOIDAQyI6+heBKgIOrRgH4rDL4JqEKq
-QLUGdMS0mLfDzUyq5VKtnDQtJEKWj2KVQh8R4+zot4JsuWiI6W6Bq3IJhOyuS+0SqMkqsU02nZ5R
-U+bd7ncLk7TO7RitcG/FM8ZZXgI+3pO5eyDOZ/3OaAZoc+1xWrx89x9VIEbb
-"""
-layout_normal_with_dead_ends_035 = """eJx9UUkOxDAMus8rkLijWf7/t4nBdm61mlaNgYBDPteLAoGzzlsQ63P2un4HAAOkgteejE/hUwAd
-ovmHuVQgRCtgjqiHRi/QCmzFatA/WYhJexJisjwgorKbSnEjdSvI4miOmJ2xs6XEVDc5h8xQrLB+
-egnXtG5MdDp22rETwIKAnVehZYX3ztVues6eaWJ+l1ptzlCirJh8vO4/PEhGww==
-"""
-layout_normal_with_dead_ends_036 = """eJyFkUsOwkAMQ/dzCkveR0Dvfzdi51PYQLqo2nmxnQz5uw6RFYiAi0QQRNclIPwkrFPBwrqeBbgV
-UvFpnkvSMg1E+QxsRnIUENJuURtBKfTLaRKI+gI6AMZI783gnppCCp0UGvPWjQEWDys4Hb/020Kj
-JMAGPnQrsMY1UIu5c3LGHgs152Y4RjXXZnjsXnfPNuobOHzNxVSaMYoe//y5bZ43HTpGpQ==
-"""
-layout_normal_with_dead_ends_037 = """eJyFUUkOxDAIu/MKJN+tWf7/t2K2VHPoIKUViTE2AM9hcLrHgWcASkjUzTcAUBIgUp8AqC6xcd7N
-wGHgvDSDC1Al1VEYMcYrbwDf4PzRiTRkMf30lqxNDPTlyHbLImuy+Xt1h0crG9binSQNZ3dbNavv
-SEa7GNfhj0M38xpA+cJhgOdgBXjNS9ft1MUoDZ9mYG4Ea6F3aH+2DbsACphGkw==
-"""
-layout_normal_with_dead_ends_038 = """eJx9UUEOwzAIu+cVSL5b2/r/vxWbgLJJHY1IUoxNAPhvC0EGw0bIxWFXAsrCzsF9pfzbDA7kghm+
-KQSIFoG+cs0alugfFaM2g8UtBrDSW6LUcxuAC0qYk3csrLoB+8augQJX1pbo2EhYMWsfQHRhPF/h
-wyrW4xUFliqnD2McCZeZ3Al4TV/FYRSO5ix8finQo5PIDOt53DeTPEcX
-"""
-layout_normal_with_dead_ends_039 = """eJx9kUsOxDAIQ/c5hSXv0Xzuf7fBpk5mZlGq0gq9YAfI+1gsKKofJRLgVemfdwMO6FW1P+WKM54N
-mEUOdapmUpIEDIM5h+lFS8AdLG4LNlQDCN3At8T1dYca4DA5m2g/S+nEpsKrgzStW39KZkaCx7lY
-Ga7h4iHOcU1o7t1VTTKNdcv6kSh3eGBPVtea3ZzRLb6wpy05Zm3TI8u6WfcHL9xGtw==
-"""
-layout_normal_with_dead_ends_040 = """eJx9UUkOgEAIu/sKEu6Ny///JoXCjBdJzOBYWlrd/+twMwAWR1Sc0XQf9RAAz1folqAsgq9k4Exf
-FshRt/E0w2JN+MgS4DNP/dwBAwwApFycTsZeQS6oGdVKYMMRfkEywETj6C1QgqDEzrflIOVccqWk
-JbcgKod25R+3GUcDLJeSl563yuHcghjDlXwx3ItVOain7Lj4+d0vPEhGww==
-"""
-layout_normal_with_dead_ends_041 = """eJx9UUEOwzAMuvcVSNzRtv7/byPYibdLfWgtCwMm5HNdBOGS0OWG+a7/bYAO2J0KAXrPhXcY5JmX
-KNN42FwK9wK4ZVbCSqlFA4uE9hILgx/NxbB40x8Mt1uT54pmG22GRnVmraPGW6spGA9jaGy0phCG
-kwTGRrbsP2fiBCfNIUhsAYx2BWVY0PF78VWhZrUu+0v/4ucEt99oHo9l8vm5v1tWRuE=
-"""
-layout_normal_with_dead_ends_042 = """eJx9UUEOwzAMuvsVlrijbf3/3zaDnWSHNmobxVAgNvC8Apm/p16CyfQiXb5E0EkQE/DuN9+tIABg
-s0anlENGVWKrZJ2L7i2mKkSg/WivVtBik4bpT6xQytLpaBkogwBsgALmL1uM4LLg2SgTJ9Zm5oQ8
-roSp9rV3yO6vbUmrTMjXX2/dNPtpBIFPj4pbB1wTPBt1M+4vFwRGnw==
-"""
-layout_normal_with_dead_ends_043 = """eJx9kcEOwzAIQ+/9CkvcUbf9/78N24FkhzVq2io8bCARz+uKRADauZ46yfTZp4D6ZKBYTBaj0OtV
-AMOi02f8P+ACoGSKSslALwEVcW46UBbClWkF+rYmraIrbgVMD0Db281d7A5+0VHwSWgC3eniCciW
-Ze0ad+FHDe6ObsK7iGsmstvXxMJaBdwz1zzgpcQu3uumMpzaA9DOw+LfdX8BTupG1Q==
-"""
-layout_normal_with_dead_ends_044 = """eJx9kUsSwzAIQ/c9hWa0Z/q5/90KkkXTTRjHcewXCTB5Hw8CpdFPr3EWVf1BfASwZji4UA3waqAD
-zHwYVuRGYfRglzmd9/guUDZlLBg5wQJYu5tUrDBMA73cOnTyC+eAy44RnNLn5wdl/68duqVHoZJS
-ZJUsbCwLWIFOAOui4gKot2nUpXMNPNWW06dtNZSAqng7ybLpkUsd8F3cXvcXTupG1Q==
-"""
-layout_normal_with_dead_ends_045 = """eJyFUUkOxDAIu+cVlnxHs/z/bwXbqaI5dJCaBmLAGPLZFgFU9UFwfmOVD/g2oB9sAcqFfPLtCrIO
-NoIuVOMr2oDSG5TlXnZcbMX1oXijqtNYAz8BEzo4uteQTG0x6GupeE3CnOagO/LKEjqZ06I0wD17
-etFsDRg+5sZwPQCZJ9MhtaMLtlBUfZOMLthCvSyqFUc2s9Ufkp+f/YT0XuH6s22uC1UgRts=
-"""
-layout_normal_with_dead_ends_046 = """eJx9kVEKBDEIQ/97CiH/YXb3/ndbjbHbZWBEirTJq7bAcyyQkcGgViAcqPykADHiOIxVp+qVAvkH
-Y2tV6FzWBwdBlcQW5CKnTspc8jJkkiWQ9aBDfBpYhN+hGsL2NIGC9R7+lGp1eSbWnuhzaI8IFC/c
-ynSrtaeoe7knlFWGabKT59X77VJwqfHbO0+x8DbBXwT/mjF+6qfv/gKNBkcR
-"""
-layout_normal_with_dead_ends_047 = """eJyFUckNwzAM+2cKA/oTPfbfLeIht02BVkiQmKZJUa76XUctFlBY/Yv1WU8S0FtNWCB3DnLRz70J
-FVCA1PQVJAtQf28YHW6v3QP1aWQlHqFlCEFfJQVQJSlAbixllVcaslDAjacNW5HgnqT5ZdXoEdWe
-xLZCen5L4SS7jbIVj8hiTY7CcGd4THEzgBmyiR6+mnxc7geZG2aS/677BEi0Rs8=
-"""
-layout_normal_with_dead_ends_048 = """eJyFUUkOg0AMu/MKS75bXf7/t2JnKVzaAIKZcbwE8ncdFAVIhECA53OWUPU+AfAFFdDVrQE/LwCv
-meYAGUJEwouG4SbgzSOwIc7R2EtPSzSD2mSRagGib0eRBtACWJNlywyG5c3YG4m2Ggl9gy3DGstx
-f3XMFsA15DJoYpatmlGNTGvygRrrEGPn3oDXTSBg+3AUReLf7/4ATupG1Q==
-"""
-layout_normal_with_dead_ends_049 = """eJx9kUEOxDAIA+99BZLv1m77/78tYJPk0kWqmsBgCAD/7UIgIhgBgvWfe9uTQHtpSO5Msn1bwUD6
-lcjRqV8qwJ606E/5HEBGKKUAKkgDMWxlrkD4WCU4nso8atSxFfZVPTTnblkAl6KPUytRKTjAetDq
-lXuSCh41VL0eDw4QmAF161ZVic/R47CefG4hgdt72XvqZnxfk3xf9w82Eka9
-"""
-layout_normal_with_dead_ends_050 = """eJyFkcEOwzAIQ+/9Cku+W932//+2xAaW02qlVZoCfhDyvy6KAPYjv0c+/yRA/r0C1opEp/G1AuDP
-aKVRFR+1RVXNWUrU5toGO3eoTCQUlC0gGZNV5nDEMNi33YjadQXvp0vK0WllGELWmF46GBoJB+sw
-hLxmcXQbt13hNwNlUOMYhrumqumN6Gm6wjstHAoU2+Lpur90Lkb5
-"""
-layout_normal_with_dead_ends_051 = """eJyFUUEOA0EIuu8rTLyTbfv/v1VAnZ66TmJ0goia+d+ujDI56DEoY1q/nwIkUhDCQ2jHSl+HoWBF
-gEPngAyRW6zychiGaAbhATUKP/22yOm5VJaFKkEzUPk0mdQDFaAD6VvblIBG97inl5RwivR6Wh2d
-+yF2Chc0w85rKgMWL32cD72wAtyxm91du78WduWbWMyJfm42DE/n/gI2Eka9
-"""
-layout_normal_with_dead_ends_052 = """eJyFkV0KAzEIhN9zCmHeh7Z7/7ut4y+UsjUkRDHfqAGe7cDGQJ17uF2eQE9jZmfQHevAWwStIlQW
-hmBBoNjkxhFqqAR33CQbj1EqHq8iU6xrQGJ0JYvApqJbSOeLQGyb4eQ958ChWun8rCGlpk2VjiLo
-NWcc0a8yYgI76m4TUW0VLsKrxKTfg8pA7IPPEGzb3A88f34b5wZVIEbb
-"""
-layout_normal_with_dead_ends_053 = """eJyFkTsOAzAIQ/ecAsm71c/979bY4CZTyxJBHsYhwO9YqCKr9uEAdsJK9jaAclHcBoo4xLMBdpGM
-ykTNiEmpkqRgzaY30IXprctAAClnKmN09CHA/cR38mkmSI3Y51X9+vPbbTJ+Od2Z1sPXac7lcayd
-rHTldTVi40cmcW2maePenoDHkddOEMKaAl64DBDXzvyJ689vY30AHTpGpQ==
-"""
-layout_normal_with_dead_ends_054 = """eJyFUUkOxDAIu+cVlny3Zvn/3xpMoMylgyKUUoPtQD7HIiREZPaNIPJ8A8Bzdvh/tNTtHYDujVEG
-UcyWfV30VyaHksJAA/Y8JbErkd0vk1lki3DVeucEA3FalCi1rKC4JQY5g8sqNCYAWalXKFJZJFjV
-cg8c3dLPBDtstycZkB7SKDEkWsOr3EvjHXoDi5/eDMe+ylg89Z91X2GMRuc=
-"""
-layout_normal_with_dead_ends_055 = """eJx9kUsOxDAIQ/c9BZL31nzuf7cB26SzalSllDrwcIDndaGKpcVCwom04dsC9NuLRfauuCDBWxVa
-3Cf3+ETaMG8LNj3PfpNWrUBFlCTS1TBiqOSmcauYNsp1BUtDEN4h4ozSguGjkPOv7gNiWNxKdbrZ
-tr483brB8HNnPgzHA+zAt8C4x6HbalrwEnIYx2rainS98IFd/r+pc3026vm6fzYSRr0=
-"""
-layout_normal_with_dead_ends_056 = """eJx9kUsOAjEMQ/ecwpL3FjD3vxt14n5GIDqLRo3z4mTI/+dBABwf5AjkuOWnOpcFFUvzLVm5HC8L
-1ISiTAmYOC0anPQo/PbgJGXYjVMEVn2uxcCNoNYrORkWzy1AxlSNudW7BRuatqvhanH4ojn2ksVs
-Amu6CNWYw0PLNyf7lwXPmkjnKjG3Rgve8w0Nbp+Y+z89/P7dHy/cRrc=
-"""
-layout_normal_with_dead_ends_057 = """eJx9UUkOxDAIu/MKJN+tWf7/twHjlFEPRUrTgMFggGcLkMm8DKhzvfEtgP6YRgEsDBvWr3cB2sqB
-ToawcvW3IV2BU5NluqFqCg9AScSk9IvKOgAomrmtQiWHxRRLO1PAFBWK4Ufa/49UnbBDreKQcPAd
-CDhb52hhNTzmIWTex6V1yKUdASTZDF6AlyvAatykD3y2NcyytlXSu3ha9w9ItEbP
-"""
-layout_normal_with_dead_ends_058 = """eJx9UUkOhDAMu/cVkXK3Zvn/38ZLKAwHioC0sh3H7X5eq1HNpwroYq3yXF8C9DdgzoBddr8JIKcp
-g76xs4kCctBiiycOTLQHQqgggHRSnjrLysJ7RasPCI1Twf352twoDL7U4rITTB+j3XEUxnWm2N3S
-fF0NVUxixCTiHBxEOiWoMYmdw99gmcITl3N47QBR2HkfJAI+dWOzRRJVtPHweN0/KaZGsQ==
-"""
-layout_normal_with_dead_ends_059 = """eJx9kUEOw0AIA+95hSXfrbT9/98KBna3h4ZDFMFgDEs+x0WAgpAhgvQPOvNJQJmTc64GJTcH/QrA
-aNaRQpluyBIBdKC+LhrAAG7UymfJs4Q2uRVwKGiPKAtu0ayQQArICnJ/7eKmmigdCtErtjpmHA8P
-ZVJjEmXSa1+zDg4F/iisI8+adfiyoADuwRvyrKrTI944n4fryLX1PtTf5/4CTupG1Q==
-"""
-layout_normal_with_dead_ends_060 = """eJx9kVEOwzAIQ/85BRL/Vrfe/27DJtB0qooqFSJiP0LEe1h4eH7wDDhCtVL+zmxgkmfQecWVfrIh
-Q4cdoAaA1UuFVqUsG/DHgBHsDGVLd1l4iGHMGghMLHyg4Yt49J0Wt9p1GzNmQVYux5mHha5aOUaj
-7awytX0kTUj1kuR7NKRehoNdPMvM4nh44QGiwnfbDbHQi9MS7wyP6/4BNhJGvQ==
-"""
-layout_normal_with_dead_ends_061 = """eJyFUUkOw0AIu/cVlny3uvz/b8UGJjm1ZBI0wWAw5G97EAJE1McPKXvfy/gJoG4yKse/6xDJfzXg
-GPoFFoihiK0HQ6FACsAu2bk6FFQiBVjqTmLSJ2sq3Ho4FdK2B0oPYqbYyB0fHbacvYnDNF1rAKG5
-KkzPiQQwSVoBbpMbABxlVqmr5wI8V4MFjupqxR5872K8Ky8rW0u0Kf6t+wtt+Ebz
-"""
-layout_normal_with_dead_ends_062 = """eJyFUUkSgzAMu/MKz+iuoeX/f8PyRtJDEQMBI0uOAvzHAQNpAb0AtuISwf+Y0a986CsKwscJAOtO
-cDWwVgi+L5IJk3IdwoaYKR2ZBO8KZdOQbeRtZeHVFJwd9Mqy4E+9iIzeI4XsGT59ZFpDsiKo4RZg
-djH7UpfizEIT1mD2vBhncc7AKfqEXgrf3VdxogOLHN6O+wYXBEaf
-"""
-layout_normal_with_dead_ends_063 = """eJyFkUsOAzEIQ/c9BZL3Vj/3v1vBGNJuZhgpYciLQxzgOh6IIMgcK4meIzx8CshPUdMA/sVLCoGs
-FC82WEJshUhAxVyigRGrIuIo+Aigd04kMB1xV9w/D6AjMuFsz0S1TBb4Xaz7HqCLbs7BNcPABrdX
-tG0yCt3XXlFN+5ajIF/KcQMyxgrPtdkH/4kl8N6XGcAvp3uV1TfP/QVCfkbJ
-"""
-layout_normal_with_dead_ends_064 = """eJx9kUEOxDAIA+99hSXfrW37/79tgoFwalRViWLsgZDf6yIACpCgtSexDr3eLRCILYsLMq8su9PB
-HuuvuNrWiK8ivMQsVTtgCdiByYDAiFBpMgCttYXK4fRkf6Zb7K9siyFPwSlISE0sdB7tILnY3gF5
-RpUOjVVxlWDIMxTLZBS3tgS/MdkatSbDM95GxSBlp474fO4/5UVGbw==
-"""
-layout_normal_with_dead_ends_065 = """eJyFkVEOhEAIQ/89BUn/G3e9/912SkHcmOhoxNFXCgzwvDYQEb4zKM46FpCfqZ0epXOM+Ayga9Ts
-FwHUfjmlZNTeXC1IWEwqmV0b6GXQv5F5Bdh86ZmqKjKNZQHjto7KkA1J4znQuDPw9BMjwJUha7NH
-gQU02vNxEez2N9xmkz1wMuwx6qqzRlDA9+90cDm38BzejvsHVSBG2w==
-"""
-layout_normal_with_dead_ends_066 = """eJx9kUsOxDAIQ/c9BZL3Vj/3v9uAwWlnpGnURWPMCx/g/WwIRh1E/jAAgnVr9UqDTgZGyqAMrR9F
-iFCM0bq/xprgjLBdnDa0JAbHxxtShLoGHoS0QgVTBJJWpsjxcgyhxn4Iysg3OQYrXwTNpIuc1jj9
-kKvufkJVrf7c8D1qj+Q5Ik+uCLszzFFsITacltSsdqJljOpR/1/3B40GRxE=
-"""
-layout_normal_with_dead_ends_067 = """eJx9kUsOAzEIQ/dzCkveW/3c/24F49B2MyiaTNDDJoS8j4sQQNRXXh11nCzfBcgnbUlB3tHr2QoO
-l8pZtQIjVIBZjQ71xZtjA2o+kiOTsEYs3GmqZ6cbNkCkOcwvTig99FebjVd84Dn0ENz5n0syAbBD
-iMy0XdIDMPc61j5psGsnMnfprH7cCnjwSNJla2adAl7TZoSQNzsv6FHfP/cHSLRGzw==
-"""
-layout_normal_with_dead_ends_068 = """eJyFUUkOAzEIu+cVlrijWf7/twbbJCNV7XAIhBhjSMR/G5GBAJCYQYKWHeA2YN4niK68rPwpAHMs
-zDonOJtitUhXdb6SZBmMEC2AGGryQwO+DCYeXU/xJbP6J+MHAxtI45p2Aaj6Z5Mt0tpiNXsAPNMe
-sUzEFOn1JlVbozYnwOGtak/caEAjCnA1xf6qUGzA23d/AI0GRxE=
-"""
-layout_normal_with_dead_ends_069 = """eJyFUUkSwzAMuvsVmuHOdPn/32oQctJLq4wT2QIJE+B3LNQOsPR0EKVDb98GkIKWFlUAwQCeG+Da
-EE+XfMsdVEH4PuyoaOjhfm+IYewmSj2ijmSxywMrpL5FJNGADJy1bnkquvQhqcPlwIzATaYBGFk7
-hbZ1lLcPR+aIizmID9/eqINVNG3hker2d6xOS9IdXkMPcdQQsfrf7/4ASLRGzw==
-"""
-layout_normal_with_dead_ends_070 = """eJyFkUsOAzEIQ/ecAsl7q5/7362YX6Iu2kgzzATHPALwexmc3osOhdjpL/d3CACOOjLoDOp5hkAG
-cSRDOUg6R1RiDmTQXtVrdQo4FrdKIOWwlp4wTFjoxS2Rv0pwGAq3HbSXhtkCs3H4YVg3sVSRU7UY
-6ma2gRt7GfjdZofpYi2LuC0EZHjsvdY1Ni56BobXOPIM6xqf/Zk27ANO6kbV
-"""
-layout_normal_with_dead_ends_071 = """eJyFUUkOw0AMuucVSL6jtP3/3+oF3OTSjJLZDDZ4Iv6PIwDUT386z/oRoAZEATYceCUgmJcc7kTZ
-C4uIBLBDOWuHTdeHAjQ2HKDlRGWSBlodgS02BGmQvtp0ORtTBg6F0rXw4h7WY+XyUL7CGRLoNvEn
-tlNyStyd5X3A5qeElV8aXb6k4eyebn9X4ORLwPvyNri9mgBPz/0FPEhGww==
-"""
-layout_normal_with_dead_ends_072 = """eJx9UUEShDAIu/uKzOTOrPr/vy0kUOtFLsUYktCS33UwEACIOgLMBoaq7iR02xgZQiL0fZbCsKeW
-OmzR6EPjfiQhNaWrCeVAj8codMw8lJCOQ+FFqE5gtTUadhfJhBFtI+/suSJIyYvy5SXVg4o4ohWS
-Y6QfveZrNTjqWrPH2cH2ikjCb7tZmT33boVrvYUSEn1Zhmzx+dx/CphGkw==
-"""
-layout_normal_with_dead_ends_073 = """eJyFUUEOwzAIu+cVlnxH2/r/vw1soD1t0LQRuI5NyN9xGAByRdQbZC5UsPIqgBEh2LSi/svvOwFV
-itgm/RCdx1sHJoqWOqoYTC7KEHQ40IBWFbgpKE3CWcN48H4tZlE2n5UBoWVbJFW5D6DpRqRrI01K
-scpHZJbj4bJdt8jO4RgVFpGAlyaSsyW22bMv2sMPwb0fM9iDEOXiz3V/AR06RqU=
-"""
-layout_normal_with_dead_ends_074 = """eJyFkTsOwzAMQ/ecggB3om3uf7fqQzmaWgOOHYl4omTy97oogPASyPjEpUO8UzBa5EblQ1AH3yFw
-xIwkzL3+k5BZB3VYbF4SOhSHOGZkH2wBNqM9TtoCN+DqSZxSag88MfPtfJWgDnvqaJWopvV0Krtm
-C4A1KVKboRacSdeon2ZScvHFNVs1b5hF+PhdtB/LPSAF/577CymmRrE=
-"""
-layout_normal_with_dead_ends_075 = """eJyFUVEOhTAM+t8pmvBPfM/7380VWp1+aKNZyRjQDXivgWAgVNWw0ay9CAKsJs+FPsQvCSfduzSA
-/0lYyhZILRaUArMJh5kKddZlAqWckOemaewp2ASHyxVex9I7PT0raNMBBm66TVDW6DHbVBZO60Qi
-yJbKaubjqi8Ljb9emxS2uK62MtCMCvl/PhAaFeHruQ88SEbD
-"""
-layout_normal_with_dead_ends_076 = """eJx9UUEOwzAMuvcVlrijbvv/32obU1c7NIc4iTBgAryvA8GoxSCyAFX6qa6/AixCFb3r8kkAkyce
-nInzaSQgOvWg+0Ep5F4A5go1SFuVrWcGrgmhLHLMoe2bYeQoBs4Y5DZzetqkR7jZpaVUQgzhAcxQ
-57LeABsjdkzLNeCR02bk1zJ5xkaLv9Q7qK/N1ZWYVIyYHN6++wJItEbP
-"""
-layout_normal_with_dead_ends_077 = """eJx9UUsShSAM23OKzmSf8T3vfzdJm1ZWMooI+TQF+B4LZDA8GAC92uuIewPqf8MaBzY78NsAfTVR
-B4VGwiIPrBDsR69sxBMuATBJ5GJnAQYk2j6uEPY6FMK2Vpg9WmH2MiZP0nrFJsM4lkKjyVaIifnW
-UOjJeXStGjW9KS+Kbp+FywkV8uga2Qr/LMCSinlcHZkW39f9AB06RqU=
-"""
-layout_normal_with_dead_ends_078 = """eJyFUUEOwzAIu+8Vlny3tvX/fytgSNoetkghCrGNIeTv9SIgRIiVkXVHBxxPgOoIIsz/FMBcqVlO
-GIpRyEcxQdaLhGWtoK2ZHkjVHTapVhzOKnhTqJIq9nhMkAqQJ1a+DdjYKMD2LiXUvSsAHEOywbYa
-+6ZgA2lFl64bQOxpesq7YADeW7Oha/JW+GL9jbt5Av599wkXBEaf
-"""
-layout_normal_with_dead_ends_079 = """eJyFUUEOwzAMuvcVSNzRtv7/b4uBpttli6omdgjGmPy9DgIUAPkDHawzJ8C5AFr7uvPtAAL2Ip/D
-oHDBP6cbOjjm6LfzkH2qUhpgDQUkh/JptsMCUGnORa7MqzAEc2lIATW7GT7KBql01TZZ3vGB24gy
-WE2VXU0gAlriqy/foK6BBdSm26iGGoYHb3tiNUvZNl9O7BnxHlw1/Bv3GxDORpk=
-"""
-layout_normal_with_dead_ends_080 = """eJyFkUsOxCAMQ/ecwlL21nzuf7cJdkKhiw4LBOmrY5OI5zUCCJBEL51Yla8BRkLia4fPiHcCOkDl
-ROd2CeUlFfQ/DJ1ACGDpqc5k5pV2SLRJy0lFCkybFhn6uvxZeyageLqFNVw+6GqxCaJC2WZ0ili+
-6CBoDZZJLJsKsnJ3ixtgHxVqxKvfGcdrhyYwFT77cLaZsU3+G/cPYYxG5w==
-"""
-layout_normal_with_dead_ends_081 = """eJx9UUEOwzAIu/cVSL6jbf3/34aNSaIeGrUkEY6xAXhfFyKj1gQgEQh+9eMmYPKEJpgmQIf4NkDP
-ZyUmCFSArhX9VgeQyGWuupggzx0VWdMidVu5jRUDmlLKDVDJVWJO1m02v8LYND2WlGYbDbzhKVNm
-8yyR9hht2ea7D/I1YbesRX6sWxuJoj3n2PzBk2FaLTyn5z68jfsPFwRGnw==
-"""
-layout_normal_with_dead_ends_082 = """eJx9UUsOBTEI2nsKE/bkfe5/tycqTd9mnExrKlKkwHMEknkFoGX/zK8AVwhLVtGQtwBwpWrslIS+
-ZoxKOij6ToZhGnOvGBmVcjVg0JTIzcUxrNr24rordN4MyzlUOH0x25xcgBGdzUD3Y6Xo/PQFdgwP
-3+McUzyF5+K2pjloQDtjl7i+dWPgdcwXwzHFegMfm7Qa/t/GYz489w8ppkax
-"""
-layout_normal_with_dead_ends_083 = """eJx9kUsOxDAIQ/c9hSXvrfnc/24TjEnUWbSpECDyMIR8/i4C64fQhmy3A3xXgeDKWAAnIt4uUABQ
-OLJlnd2ibkqhd6pxRcjdmxTHdEF5ZtLcaW8hK3mNu/KyH0XpZkKwFts1NDd7EG5UjgTPMRo4EsLi
-Hjkt9lQ9kWZwE7yPaNgjR5EJL+z2Z9Wz+Sr4gDgPxD8p2cPTc/8AKaZGsQ==
-"""
-layout_normal_with_dead_ends_084 = """eJx9UUEShDAMuvsKZnJndtf//20DJOrJ2onWEEJJ1fs6CgBZ0Duhjwr+PBugReeE0qkDkPqvGTrf
-P1kbttycAbgFk/Hup0JnQNhNA5NHD0V9iNXNJS2ApOvRQuySGn2+Vx/c8xLJKTYmpMQCbsYUrzEm
-PUYLLnWsh2rEKLH6brPHGD5aIOZGwIQV+YmpQK3Rw84Z1m/LM6TbBx9nWG/j/gNt+Ebz
-"""
-layout_normal_with_dead_ends_085 = """eJyFkVEOwzAIQ/9zCkv8W213/7sNDKRUmlaktkn0sB1q9r+WEaA/UQaaaUXk0UeAbYDVhn6fDngX
-0Apd7E0AoVyKg6Q+kaH0VNzdlF8phICXvBJyQJsGZu5goIS5SAvU2Q96lZI7yEy+bbkBzwN2dPAO
-3Rbz4hguI2R3P+cVU152jMnmMAqIm9KB65E75rABCHj73V8KmEaT
-"""
-layout_normal_with_dead_ends_086 = """eJyFUUESAyEIu/sKZnJn2u7//9YkIHpqWUcXDCEg8NsWIvnZ0isQJ/YIEBsgA+gg6xfxJkAnV/Sh
-axTW26I7OZvqKDBAF65rAZjcaAZl845MMIP4vNHSXVRxwlAiR6HA1eb2ydQlcvKWeRQ2Q9VQTGXT
-gKulLVKSotVbwzR19aphcALN0DQ1oXtw6uI1Cp2DM/asOXzacd3zZDu2/rw21hcdOkal
-"""
-layout_normal_with_dead_ends_087 = """eJx9kUEOxDAIA+95BZLvaHf7/78ttoFDVdVSqyiYCXGAdx1EKUPKTIC/GF1lsKI/qgyoFtq+TRAk
-py27hWsTuDbBVhfHwM4iEsqaS+TVNDb0fDupGWKiCTkEaW84R9z3PKe6UoYuwPC5Uq9EYDK5B8sk
-QjShbwQz5BHT7DE4wh1hUyvDxwTl+5D7wW9fBvNYG8hE/frcfy/cRrc=
-"""
-layout_normal_with_dead_ends_088 = """eJx9UUkSBDEIuvcrqOJOzUz//2+joKk+tYcshiAi+R4XAUm1wCsJ1o5OVNwFqJQqm6hduQN9+RZA
-9WNy+doPRcNgLqeF8wz4g5e+XGHdkBmQkhiRDG1oLI9WDk2JhZzyPtHIALSJJ2BowxAPyO0i5Jgu
-Vk3EWcEqZhiMjA+cThWa3tOF/dvyOD6UhwX4LHvnxIfrgn34nclkJhoPMsOIfB33H3pkRv8=
-"""
-layout_normal_with_dead_ends_089 = """eJx9UUsSxTAI2vcUzLBn3uf+d3uCmr5VnbS1hiAY8jkuQgAoLxGOLviNbwFI+EEtOQUWVenbDP4Z
-VLEUaiK4A1iGFNMklQbkHGaTq8I5FQ00qyyzmZl9yd8CCCcmLZBaVGy2IFLHwf+RaNCYtsbuaP7u
-7BbrSLfINpIDsbmA2ewZzYivddehGWdGOoBXzwjHwTK0kYufMX3PJ7c2hbX5cN0/L9xGtw==
-"""
-layout_normal_with_dead_ends_090 = """eJx9UUsOxFAI2vcUJOzJfO5/t1HBN13VtIlaRLDkc1wERAkJdl1Pdyr9FsBZhyBjCtVvxXsYqlII
-NbjA59Nl+qHhWcOwgGGYNo4Qb5qNBRikKW+jXWhdwOnYGbBWr5phU/d6TpahiAwXrClL4jcia5ZH
-29/h2uRtdH3C96yDrs1znFaamzEMr9wGS6GFj6+LH2d9UAFnTdNrXTz+7h88SEbD
-"""
-layout_normal_with_dead_ends_091 = """eJx9UUEOwzAIu+cVSL5b3fb/vxWMSXOYitQ0gIMdB3iPBUYGM+ofAJFrlSr9NYCT10oIC+WfBGSE
-P03zhAZEAvrclIqiwT603MnDKoWx9LYp6FYVoO4QiAKioLgtVdvW2hr+dFHSZsI4MBSdinkD1J2L
-wCIRLfK4FY+LxKNhl+zU6d3CNYDUOr5v95mA7+SaYAfm8dhGvT73DTYSRr0=
-"""
-layout_normal_with_dead_ends_092 = """eJyFkUESwzAIA+9+BTO6a9L2/38rEhg3l8ZJxnaQV2CA/2Mh9qA+gPCagXw+KWBuuOMlzRDg+ZUC
-rXOHWkAIbYsQbQHBY9wUJSsigUIywlgM0wL0CwnSIRp1LCCg6/DUyciVFtCHmrFVQd4IMamWD8Z5
-7ZNFrQuDr+ZWpoA8Zcakesp0XZzbaqZ6cVna9zk9cZrKdOFdBP8T4qcnZfHU7i9ItEbP
-"""
-layout_normal_with_dead_ends_093 = """eJyFUUkOAzEMuvsVlrijLv//W20gMz210UTJ2BgTDPxehWa3dhYbe0D7PQASmK9PyUIGr0g/l6Fd
-gMMScG7lX05aVBd4QttGDMtq3BZZA4UTALAGBywSrifbIgUXM82Qd9wtrsAC0nz7zr1M1H5p8y7d
-iI1ygMpYjBSnbwDcXERul6U3rmRY2xrg2B2wGB5x9Tgcw6VBIl+ZizV8D02e1J9poz6AmkcF
-"""
-layout_normal_with_dead_ends_094 = """eJx9UUkOAzEMus8rLHFHXf7/t9oQ251Da0XRjAMEHOB/XYjIRUZuoZ1gtuoT8U4AQssV1TZH9UyA
-uadFIUpKcF+hZgMsQrSGPSSD5FEtAz7mALoIG1hPTjHEsqIIDjQK/pFReeiUx8PUyHNbqxC2Nk7L
-NAegYxiGW2pf4aGYETsWTTABj7bjIW9qx73wCnRK3N7MnK8UP577AymmRrE=
-"""
-layout_normal_with_dead_ends_095 = """eJyFUUEOwzAIu+cVSL5b2/r/vw3sQNYdtqhCCRjbUOD3WQjmFxUR51ARVwJUDhCOIDmAeJohm+tk
-PM3NsUzgFy2SWG58efAL6laSYVPyVgwhd1RnWCowubX1wc5apVjSrz3k7bs4spJgZ7cAJtdTFNf2
-BlO1rKbwOJ5MEpw99BT35XzsTYDHqeWWMTs3QQJeN46ew6bE8O93vwFCfkbJ
-"""
-layout_normal_with_dead_ends_096 = """eJyFUVsOwzAI++8pLPnf2uP+dxsYp4k0aYvaUoLBBsjf5yIA1dsWEgm2K/t4DyDhwtuo3foU9lmA
-Ph1TF3KykUxSKDQsA8Y6XIBGEEfE+a46gP4dzYgW31jxVGA4rExW05b1XLQd3RqAZWmLTLUvBrsN
-0NHVVm+edHH2dTc6SrZIhzIndz3T6108iAlF3j1xhOKFLMAbIqUVDsW/dX8APEhGww==
-"""
-layout_normal_with_dead_ends_097 = """eJx9kUEOxDAIA++8Asl3a3f7/79twJjcmqptUqbYAPC+AplJMuuVWjhXHc7zKcAszTTQd36VQRGK
-rT0uFuAg+kdIQTSAKzISJPS1oIBoeToyHUC7rpAAnyXGslump0zMfiJLUmDAyankcPLRjXYin9uu
-Ne1OQvQWeQunAWNCSmb6foDP9ijhifCKBH65s3HqaRfdyfdx/wE2Eka9
-"""
-layout_normal_with_dead_ends_098 = """eJyFUUkOxDAMuucVlrijWf7/txpjp5lLx2qrhlICBHieBQYZOawLyDtm8E1CTX0gUFQBLDTeSdB/
-eTPAlGpugdKSQnBEYPHDgQjejVJHeZCZXHIUWov7aaDfyoNw4ibYx455x7AFVkzY9ulhxE1gtyFC
-re2KUxRPD2eqSWlQ/FZwM/aRfZVtb7Tw+ul2Ct8xFj7H2fiw2E1T6Rf+zLoAYYxG5w==
-"""
-layout_normal_with_dead_ends_099 = """eJyFkUEWgyAQQ/c9xbyXfV5b73+3TiYRtIsWFUf8JAGA3+2BUqMekPPm3F2hDgEuTyw9PPpqAGDU
-CuZGLfXNomfQ47Sk5gjgRrj1RlNAU7oyYN2VRwAdKE6XKOMzFgg+/86PSdp3Ql7WWqednUdhN4VM
-XncCbBlpAdjI2gdNruVQW6+Bp1eFr73OWht4p/QZ6ayIm8W/4/4ABGJGjQ==
-"""
-layout_normal_with_dead_ends_100 = """eJx9UVsOwzAI+88pkPxv7XH/uy0Yw7JKHaqSkBrbAeB/LDAymJ/P2ur43oBwEIG96G+WanluQEde
-FPTcvgy7Omk3g3BMsqxaSayUMWK6oHCWqKQ8GNDEC84wl2WPZdUM0YojAmudzwybNBl4NArkj7I8
-U2qrFas/NskRs8SlQ26jJR7TV1HLA85nvtpiED2U8cNjFnfj/gAQzkaZ
-"""
-layout_normal_without_dead_ends_001 = """eJyFkUEOxDAIA+99hSXu1m77/781xoEmPewiNVLRADZE/I4jQGB8ep+o/8tA0SDHA4QyVOIrILhX
-g84JRQIdcBv1zBExAU+kZ6NqNchAySqdS0PIRWukxa3skCNgbeFCtq0BuFNlXuOsIVoVV7FpZgKY
-zqxnM24XuUPEe2FM4NN7zS3nDlujgHO7zn6tBP6d+wY2Eka9
-"""
-layout_normal_without_dead_ends_002 = """eJyFUUkOAzEMus8rLHFHXf7/txobT5IeWkuZSB7AhgC/6wLJyGIgVtH3OwG60U1ugCTneUrBWoQA
-qC9vkVKwCJoU+wYCeHjukqdZQUsYEMdoi8/mvUOJ1CLqLk4pLHv0fzG8FAXYFe1izbRCMScq+aWd
-NeCwNXadn5OcZMbFlt6FR5OOnHnnn4DX1/t4eLUohX/P/QH+HUaH
-"""
-layout_normal_without_dead_ends_003 = """eJx9UVEOQyEM+vcUJPyTbe/+d1ul+KLZ8qoxWisgJZ9jEBWEULP29PmOqwqUG3hXIa/O8m0ENQjU
-r10gp2qMySMD12mPyeYCLH55HDSANTQBThAEdDSY9RdV0y+VwqLYMiVV6wHaB/7BXqyKUbcsIVpj
-HRqBPz+cCKZKQZzJ56ZUBq8KXmy8jUZs82UNn6M75N46xOrHdn8BFwRGnw==
-"""
-layout_normal_without_dead_ends_004 = """eJyFUUESAyEIu/sKZnJn2u7//1aSgHpqndVhISRBgd9rISKDOx1cq0qPAApZrw24lpWr8N2AmG6e
-Yg59tZcDp9gH0lBRDCGG+ofoi4HAxCgZQHVjsuP2xRIlMA1sdWWnsgByN5ZunM1J4pDqMkqLdhWf
-Mbe7ditMT+HWnCkS9+hrW3LmvrEe89UTYZR05RYS4NPhWdlvJ9T689pYXyNwRqs=
-"""
-layout_normal_without_dead_ends_005 = """eJyFUUEOwzAIu+cVSL5b2/r/vw2bkGRS1bmqAghs4gDPGIhgJMg8MQPCtYhLDXDdqIDBTt/ZQH8T
-Lq8k02qY8xYBE5uwJJpbap4UWNFwGpu1ljaJfknEL9gDkrMEd+Gme2ByiZS6wikHMdTkKmEv7KXF
-0D7pgtmwfAoZVA3bm8OocnDg1Qw9eRhvic+iY13fIvWA9uHfc38BVSBG2w==
-"""
-layout_normal_without_dead_ends_006 = """eJyFkUsOAzEIQ/dzCiTvrX7uf7diG6ZZtSgjJciGBwP8jgtVxf6gwwJyJ6nbWwLlJXFmopWS1dOC
-DjttnhdG7RYt51rhelKnYAsWgLcrtSqlAolGOhHE1JjbIlB+czFkViYMHC7szJqRX8hU49EBaRqB
-zTfZ0HGm5jAkwd1ksNxlIevez6x6t9WChzM4GZCBvO8LL2c80m5yAQbyz+/+AP4dRoc=
-"""
-layout_normal_without_dead_ends_007 = """eJyFUUsORCEM2nsKE/ZkPve/25SWVheTGfOiFhHwFfg9Fja3vhjIeUqNtwioQxBGfVfYMwiBVykC
-YcVmlwK4cyltitsuSahyTOBtKolgMBCyFueSmi06miahuu2YRUhYUbZZx2udOEHg5YQJSQcfL2dg
-btaJw/PMenNnKClaKYNcP2/h4Zgd7TIphdd05lvXgvCv3R8ppkax
-"""
-layout_normal_without_dead_ends_008 = """eJyFUcsOwzAIu+crkHy3tvX//20YnMd66IjUkGKMAeDZBoKBSGME0i1/2SVANECIEIAH4C0AYmZl
-MEmLpegVGmCeZmBnc+MLoG8aO6cr2acBnHUtVk+ybk4NhrsEi5CxSoT/gGZw0CKbi+Y+usbSsFRt
-hdxtnnNwCVqz1Kw2azjyGLc5vI7Jzl3srhPw+dmOdoG5FyWMP9vG+AIdOkal
-"""
-layout_normal_without_dead_ends_009 = """eJx9UUkOxDAIu/cVSL6jWf7/t2Ib6HQOpQohxICdAs92IDMiaiHpZdoT5b4FqBuU6zxDmw5vAUJx
-mYqmjzeOIERXiyV8lgHJqyQJTcudGB6BEBEPjp7EfIUm2dnsDl1EfQQ4mA8+TpE4NLnpvYJUcKwy
-c2OHbin2BbipilUrZSb5/zi/gjji1a/qLPbNJZKAj/tdbUgCPqU5PP/uE1tWRuE=
-"""
-layout_normal_without_dead_ends_010 = """eJyFkUkOxSAMQ/ecIpL3Vof73+0nzoDY/NIKCJgXE4D/bYFmRv/iV2MuEd6/LjADfBMpgY9IXXS3
-BH4+YJbMDCq2EOQRdgZBJmF6ADt7+RmeCJi4soM4CGh086Fxe+h5SAiMNlmr5iyydvcdmlCx6nVY
-PgjNt760KrA9RKPtGkE8F1xT1zZJ4UMswaO0nFcqPSvr+nhtrB82Eka9
-"""
-layout_normal_without_dead_ends_011 = """eJyFkUsOAyEMQ/c9RSTvrX7uf7cmdgi0ixnEiAw4jzgA1+OBIMOjAiC/DIMKPiXIP4vDMzegJQUv
-CRISe4pQSaKmoLKIhljQwBbots5TJXupM19RBWIyDw+bQHOqjAw5xQxBxsipU95TWIIf4lotEIFt
-66xweTThzxkHIuIStK2Is2m+4un97tJquCCU4C2hjMGPdb5etfrmub9ItEbP
-"""
-layout_normal_without_dead_ends_012 = """eJyFkV0OwyAMg985hSW/W/u5/92GnYRN1bS1FFL4THAgfz+L0H7dUFFiJQCeBjam/cEDhmvgbqAm
-NwCEQuDqEIAWlFwGnKByDDA7sBpCWw/0Gc5CycCKDK6J0WvupKiyjwHlL9OHGsEG2ts1xaSOzUR6
-L3hUo3OGdlY2QwvicXGcaNywS7mBGy71pfhR/8VHA19uzAVef26b6wU2Eka9
-"""
-layout_normal_without_dead_ends_013 = """eJx9UUEOwzAIu+cVSL5b3fb/vw1sSLYemiopsQwmBnheC0FGLepThPwb/RQhabURUVskFhJ5eyWB
-XaGSQNQdAyVpScgVlCMUg8b0AOEcAq3kCuIl5ApdCG7VhBg9ndhMq6wTToXDrqAIfvhNgqdJ2CY9
-XkkOILN2kyMTsTuIsRrHJpZR+HGOSbiipdk+23T0DBbe5vaM/qfGsfpp3F9t+Ebz
-"""
-layout_normal_without_dead_ends_014 = """eJx9kUEOxDAMAu99hSXuaHf7/7+twdRqL43URHHJGBLgfRyoAvurKmrKIL2cLWD/9A4SQLMmaMFX
-BFc0ngQd6j9u0Zqri1EAL6EEpk2LQViNNBmCDUIcrKcBxqRrcC9vcBes3PUhjN4HjgfPBDppqi1A
-Uu5FJW/cH5vdd5OkVjOEwXOTT95JaZOfNKErTsGgxuTv/jh7URVPNvn+3H88SEbD
-"""
-layout_normal_without_dead_ends_015 = """eJyFkUEOxCAMA+99RSTfre72/39bnDhQetgiqlA0sQ0A/8eBCMb4GFD1oNeXAKB+VIhqqBnxGQCj
-gdHGlK0SORtYXUwNWjMzCFwjeSebQPd0jAkbsCN8kFvIAvY9mn0q1Ob0acebQmV7xp0hqycVlp0u
-5OgLkTyqkPNuBZxbyBVDBbL47s/jg9Bmsnh57h8dOkal
-"""
-layout_normal_without_dead_ends_016 = """eJyFUUkOw0AIu/OKkXy3uvz/bwEbMmlUtSjKIDDYAPDbAutu4Fr5KfEWwIH88cQ4AjwTgPTdLR9l
-y2h/JYBdw2wgDFTN8nEFmEMAe4qWBkkYWAFojx8UbuDciBBJ9MvWWeS81PQe2MwYDc1KaUAPMRrc
-ALsDRtges4fYFGtE2J/F1dSBh6VN03PlfZHAay+fXy4Xf66NOAD+HUaH
-"""
-layout_normal_without_dead_ends_017 = """eJyFUVEOQyEI+/cUJP1vtr37321CK/K1kahooC0V+B0LEZFrBxF0Rip9RgGYT+7zGe8sYPRjaBWK
-9wUqH1TF4aJEQHFuUmZ7AiY/lZlC3a1hall7Z8/kYRiq3rCF0HeY+QTlw+0+Z+umRV5NklGKyTHF
-Hew4cHTLyeGNzTJrUbyuka2BaKSFTxHU/4grPMwp+PfdXzxIRsM=
-"""
-layout_normal_without_dead_ends_018 = """eJyFUUkOAzEMuucVSNxRl///rTE4Sy9tNKPJEIwxIX+vQdRSXon0HqCf9yRIi7GOJokygc8iWEkF
-dXXO/EW1ULoUqFkuLYLFRuvNRg2mcipazibZ/Y8UFCdsgrcLR5lCL5XJ9VNWkTGvqhGhjZspnHEc
-lOzpEBDTNXhNwQWCSZKXVBTuZOB5tfMbfHRxnHzHriK8sIuRJPfdJah/1/0BFwRGnw==
-"""
-layout_normal_without_dead_ends_019 = """eJx9kUsOxCAMQ/ecwpL31nzuf7fBTkg7m0JVIHnBISGfxyIAZSK7/LhXO/A1sKe/bSCbYeHA28AO
-gGJim1HG7Fai8ecufAAFNqNWslYGKsmSMOPVAbgSrlck3IA0karLGuhzvBIn4gCYWy0RLWRVXsHJ
-qS6z7ySuvsFHTXXqiar6DaB7mQpviddU59SZrZQuLH5G4rQKt/4lyed2/wAQzkaZ
-"""
-layout_normal_without_dead_ends_020 = """eJyFkUESwyAMA+95hWd016Tt//9WW7KBXhofCDGLBAL4Xxcii/FT4PQ+BRQXydVMCxvHKwHCP6wZ
-keNRUUCR2k+23bIVUI65Vi5SaHFIzED4EGrF+LVUA5rnQLYz3FpAbXEfOgndWoDUtjp4+F7tfRzO
-0tSlR8HZoL++kvuT5JQukiMn8wRurGSd8g7eSb4nNm4y1gsm8PTcX07qRtU=
-"""
-layout_normal_without_dead_ends_021 = """eJyFUcENAyEM+zOFJf+ttrf/biUmBl5tdDqRxDiOIX/HoCDBIQKkT+h4CjBhMLgqG2A03hNwbmgd
-Qg5/g6cAjxCYCZUXg1gq2PQRUCXBIp3VzO5RXWuGDKQrF4EFDZ6ku8S1mAFcbeloKHeWNYOefhHY
-CxovhGE7qb0t94g2JF4cQf5PwMs3Uo7hWWwCPnmYDYiTkkX+e+4vCphGkw==
-"""
-layout_normal_without_dead_ends_022 = """eJyFkVkKw0AMQ//nFAb9i7a5/91qeSUttAaHWZ4tawL8jgNaBGkwT9TW4vwS4JgShrrqj8fTgVh4
-cQNx24AJkAg4EhmUlt8FIDBFpnCaJNBzLpAbFDChiuxXAzAAtrMFtiRc4Lt5LQr4cJZWsp+AsFFv
-VVY8KYDb4d4k3gZt87HAmC8R5cHrNthItLPz52/jvAHre0Z1
-"""
-layout_normal_without_dead_ends_023 = """eJyFkcEOwzAIQ+/9CiTfrW39/39bbEOa00alRiQOzxDgd1yoKpLrX2B5dbB0cktgIYGl6ySp4r0E
-jH4t0IekTlRViFzSGQawSoQWwezWE6KJMwgdxqmcdEWrrmVodqqXKAPpNtspt6Z7oecAFvZObWVb
-8Rzs6HB4uA7CkKdFNzysCDyBjBuTcBCvXEP3Ihp3qgofVzhfKbS8oObw57m/PEhGww==
-"""
-layout_normal_without_dead_ends_024 = """eJx9UUkOhDAMu/cVkXy3mOH/fyNOnNITFQqldbwE4HstRASpinrya5eIOwF5iwAboH3AJddPAF3p
-DN2UzSI0RUuEGVgMGFxxrmKK9kBRCcx622RxNQBwryTSGy1ByziFgKQMC7qqar/lBxgHQ/KVhz4f
-S1KzyZLna3IseZJHask3YIytIzUH905OEpdFZsI0Z4dJwH9TuDiFou5Jfv3uBzYSRr0=
-"""
-layout_normal_without_dead_ends_025 = """eJx9kUsOxDAIQ/dzCkveo/nc/26DjWHZVGoovDqGkM/rRVQ/IHpp36C042egOQFT688OK/9/BFzW
-74itRANcBWMKncgaD1CBQk3JQcXJeIBzWJ2h48NATYmYI7BOaIVKPFkDoXWYTJ4ax7mAQk62gvNV
-8bdDkI6Ba8hdcBynseINCucM44o3qDd5Q9gsV0HAdyVqaznCt5gunq77D0i0Rs8=
-"""
-layout_normal_without_dead_ends_026 = """eJyFkUsOwkAMQ/ecIpL3FtD7362x82m7gZFAaubZcTLA7/NCRJD6Cx0g7ucwkEWSEEMzzErpPwIY
-+nGlRFboctIFYCVu4bsSVIZOwLbQrbvI10Br2QktN9VAJixDB778sS32NmzSn9IJqAFwy6Vek3cA
-FQd4JJ4pyv/KW1Nr3s5gG21oJmXvL4H3SthbUjZPBrf4Pl6nV8F5wgT+PfcJHTpGpQ==
-"""
-layout_normal_without_dead_ends_027 = """eJyFUUkKxDAMu/sVAt3FLP//28RbnELppBCcVJZkhXxeRgASCCGXjh3fBZDjVj1NyovVhLcD5Hji
-QsHY/LPhXpebvhgC4HTJmyrBhjgmYEypZLyjqzCJA3RxqvRQda+ZNH45ILuJrlovQFZeaq4kQmeR
-SbKH2lOKO5IBaMQrCddyiVfHcjrt7B3wuXmj8KywZX9em/YDL9xGtw==
-"""
-layout_normal_without_dead_ends_028 = """eJyFkUEOxDAIA+95BRJ3a9v+/28b24Gkl11E1SR1BkMzf8fIYCRCC6T3APR+SkCNM+O8f00Bg+e8
-jSiC1PMhAUy4Cl4FKDk8kAP7QHNVQlVLJ0AYBRMWT8qFLsJcDJXWvj9GdrP2UDijkAWUcmS3jvbI
-o9LtQVVv6nZ3ToLHWFY9sOaO/Jyj1SSdPaj7VWA1c3r497u/TupG1Q==
-"""
-layout_normal_without_dead_ends_029 = """eJyFUUEOwyAMu/OKSL5b3fr/v43YCdDLmkqFgBPbBPgfA6HwQv/IqLgTkLh5JgiBvhPoMwHM48jP
-Z4FVn4kpBHAvUB21nRetgUmyqbMXpcUU0ZJDZawOJwVVs4iVPgAydxrotAFuT+02YbINlJo4FKbc
-MjsBKI2xPNryQ0OXrgcXgKa41rtaDe2DJWzgu6l7WHt60vAy7h/xsUZ7
-"""
-layout_normal_without_dead_ends_030 = """eJx9UckNwDAI+2cKJP+tHvvvVjBH00+JGqXEsQ0A/7FgHjTtfob+UZ/dDiDAQhQMeRlxDoOvAZHN
-bxCDjWBigGIIyaUk0wZSinEjQwKIyWoLlnyhNFUFW53Kizv5kqFO4lSZU1O8DIl0qWz53yVXeeHX
-YttmA/bqpgtyufC2YW9VO3HA0dlA7i0PqmC4PtNBGeoJZqN+x/0AHTpGpQ==
-"""
-layout_normal_without_dead_ends_031 = """eJyFkUsKxDAMQ/c5hcF7MTO9/91qS87HXXRSCDh5kYTq/r6G27FyQHxruhJwFAzT3dwC+ErB+Sr2
-oH3egxplgVDJQwJtBSAtQiBQfq5haLQdw2iCrUAB8AxNPwULAJotA0LWuwcoZGZprqNyYZ2mILPQ
-+tGkEVApBaXC7hcF+IocwEdaZ8ere/bwq6KOfnuT/373DffnRoE=
-"""
-layout_normal_without_dead_ends_032 = """eJyFkcEOwjAMQ+98hSXfLWD//2+0TuKOC1TTJncvrpOSv9eDAOQHmI9aAdcGFoaiZaCkGb4MmCVE
-jI3URcgR88+lnK0CkmebjwftA/QRnVJm6MpOdTIcQJEwILaqrcVEVgYlQVkH0ITcYSpVLX7lvmfg
-tJlekDbXSzoeyvQW8GRPqOcgKGMx8I6jbvc1o1nAv+v+ABcERp8=
-"""
-layout_normal_without_dead_ends_033 = """eJyFkTsOwzAMQ/eeggB3om3uf7ea+tldEgWwFeWJoWzyPl4EQHmJnX6PcA1XAEIBKyXzU9bwORXY
-7c78RCUBSHKrWp+otIFYsip32oxDC1CpE+VvxLwZ0FbA2MABZIYx2GxY24C3NtkTlELaSV95BKPQ
-U2D/AiOmBnqCv3NizJvAG3OyMbFaPWoL+M7NVLs7T4Wn6/4B63tGdQ==
-"""
-layout_normal_without_dead_ends_034 = """eJyFUUEOwzAIu/cVSL6jbv3/34aNSXJaozYRYBuTAP/XhcyIDO5cQP0VdhQPAQKGPjRANWLwKQAT
-xUfnBBgKt1JYtc2tUz0F6NbUIMM2UnWyqECPIsUYhdu0gqSdNCSjB1mAlTkETLwOtUOAk/FImZSf
-9Iw9ZcV2Py1MUi7GMVoB27VnjH15Bbh9T+auGxeDCt89GsaGetIjAW/P/QM2Eka9
-"""
-layout_normal_without_dead_ends_035 = """eJx9kUsOgEAIQ/eeokn3jZ/7303Kz51kmGSkwAPJfzsIxAmTjxgPUWh7ViBZnkLfnY7LAkWiRaHR
-ptpSeXAeVSqyrF5hVqArOsRk4Dga0kwaTlQ7FHFW0DdSh0oZHpndYr4MzppqzGnBaTItssLytAsF
-bNc3Jno69rSDU4IVAbsvq5UVzt1r0vSec6c15r2pDrOIB7ohf3/3CyNwRqs=
-"""
-layout_normal_without_dead_ends_036 = """eJyFkTkSwzAMA3u9AjPoMTn+/7cIIEXHTcIUdqwVDon8PYvYI0jIkBAx8zag/DbsVcPGep4FZCus
-ktW9bskINaDyOXAYb6EB5b0UY4Sk8EcVoPoHdAAcIz8nQ/ZUCyt0UrjmpasDDK4oJB1v+m3hKhtg
-A1+6Fdh1A1y1bm01Ft68T4bHqHpNhsec65xzjPoGFl/X1TjNMVLXX39um+sDEM5GmQ==
-"""
-layout_normal_without_dead_ends_037 = """eJyFkUkOwzAMA+96hQDeibb5/9+ijXJ7SQ04BuMRtRh4Xgane2x4LSAFif5zBVAiIDI/AWRcsbHf
-40A5UDfj4Al0SGdMJh3jlgf4WtSJEetAP7lDYYWBk7UPYF2atSGVIdXBI5XJtX0lquGCbavZ+n6q
-lkN1Hf1RdpqXgO4LxwFeg03gpZuJ26mXYwCfcWC9CLaFeUP789qwG/fnRoE=
-"""
-layout_normal_without_dead_ends_038 = """eJyFkUsOxDAIQ/c5BZL31nzuf7fBhpBOFzO0Qmp4sS0K/K6FIIPhItTiUu8EaDDcPOxPqj+t4EG+
-sMK3hIDYJtBTrQVgoA5K2NLRsLQNsEXPzCgHsF5iAvas87ZFJePOQMF1qy3O7OKk7APEmd1Dr7pZ
-65p89nT22sMUx8IxUzuBx+xVGqZm93m+8LpLYP86mSTw73d/AHQuRvk=
-"""
-layout_normal_without_dead_ends_039 = """eJyFkUsOxDAIQ/c5BZL3qJ/7322wqcN0M0PVJKIPbBrgdyxkMLIeLgC3zlTcBMgFX0ZtSiiDOAtw
-hYsyi3GKEqEe0Yqpkz4VUwd1kLgsyFA2QHQD3xJbSl0EDONaR/lZXCY2ZZ4dEtP0pSSmJTDOydNw
-NmcPdh7AoxgamoAlk1O+pDTIwhH7z3Is//HOcIprilgBX1tnKPHnuj8XBEaf
-"""
-layout_normal_without_dead_ends_040 = """eJyFUUEOwzAIu+8VSNytbf3/34ZtIN1lQ4oSqMHGzfwdj4wAEHVV1M283xUXAUil6CpBCoJfmhCR
-WzQo4WqdmXCmCr60BOT2V0WnkQSaAt1sAFYCDCBnKjMPvAj8RWtKlLSNCpgQ1oBVgdZwaAU4LrXI
-mxEWOVvl17ayYwAhUb3L9IcpnjcjdmE77wnvMxX2oV0iLQH/fvcHKaZGsQ==
-"""
-layout_normal_without_dead_ends_041 = """eJx9kUsKxDAMQ/c5hUB7M23vf7exFX/STUMpIrxIikN+r0UYfJn+UgCxN4nHAWvYVRJwFR+ucKAl
-b27DdHQuAAQAK15HgyojAVYOMlbykblLph6m2rp5dCi3yaZsFL1aabuy0kKAdaGjRmZaAJxJ4FXD
-u1Md+k5+wuYiEZ1zmOw9KMfKIYBf8W30mv7i3YPj0XY/Xpb8fu4/PEhGww==
-"""
-layout_normal_without_dead_ends_042 = """eJx9UUkOAzEIu/MKJN+tLv//WwcbmPTQokmiYI9xAPgfgczrq0UwmQ7S6bcIugliAj698tkKAgA2
-a3RKOQooRpEM1F1ZHTFZIQJdz2lehA02aZjeYk3JS7ujZWAPBeAGKGD+cokR3BI8G8Wht4dhrsnj
-SZhsPxvINtn9dVnSKmPy8dVbN831NILAq0fFWwfcCZ6N+jHuDwqYRpM=
-"""
-layout_normal_without_dead_ends_043 = """eJx9kcEOwzAIQ+/9CiTfrW77/38bxiFkhzXqoSIP2xDg+VxgIHy4vqwwf1T/JKAbRLKxu7jwiJcA
-wjRd0/8BS6GaJVpKBvrYIuhe+iItCq9OK8i3NWWFTtwKM0NE29stgQ7h6g+6FVxBbaAnXbyAslWs
-yTjBjwyeTm6Fd4hrb2TGr43BWgnce6884KUk4G06Rd16zKBnGIt/z/0FQn5GyQ==
-"""
-layout_normal_without_dead_ends_044 = """eJyFUUEOwzAMuvcVlrijbf3/3xZwiHvarChqUgyGAL/rQhXLxcJ8kOuAug0AtbpwQBTgLQC00PvG
-gKEzYPFVhGAu6R4AWxSRQOgMNgDcKjNKE65fAiwy5kLbw2PPUI8bTrP6V/MFTHNzRw6iFgMxVpEc
-bK4a4LNj8QAzos0F4GwT1CQnwMuxZIhIlAewi0/5Odiim+5kIRd/nvsLNhJGvQ==
-"""
-layout_normal_without_dead_ends_045 = """eJx9kUsOxDAIQ/c9hSXvrfnc/24D2FHRLJqqbQIvxiHk87gIQEIP+lfrvMC3ACHsic581uTbCt5f
-j9Q5nf0dLUCTm88UoWla7MoyAKyg2kY1voEOLY/WK4DRHgeloNhtXMfDzJEsNbQLTomZ32dPLdqt
-gfZjb4zXBeQ8OV30AgirUXLODrga9XJTibQ7dt19FfD5u58RwrnC8fB83T82Eka9
-"""
-layout_normal_without_dead_ends_046 = """eJx9UUEOhEAIu/sKEu5k1f//bUtbxvEiMTNE2lKYzO84sioQFcUzM57IuAHA7UBSPJU39CQAzJER
-b8sAED7KtEQzJC1lwOBVCZZJwFcEkLqpd07F0BR7axrKxcGEHJN6svBCNlMme77+R/UpmnPYS9GZ
-AHbL1lpUcEWqeFoSxuRquGWzOwB+NP5seG2bywbgitf7pF/NMl7113P/AWGMRuc=
-"""
-layout_normal_without_dead_ends_047 = """eJyFUVsOA0EI+t9TkPhP+rj/3SqI21fSmtlkVhHQqfodR0FBFtFX4j3uAlAl+gDbqJ8+1wZUkk4M
-G4KEJSh+F4YBrqxGPIi/hThMapFkAMk+wwwUS6agsJG0VD5zWMIDnvnYGCkBxpM5v6Q6e4S12tdK
-MZ5fpphJThs1UmqxBHYOcrG7PE1xmQR3ycNgCdrk7eN9mL1xN/nvuR9CfkbJ
-"""
-layout_normal_without_dead_ends_048 = """eJyFUUkSwyAMu/MKz+iu6fL/v9WSBWl7aCEMIchaHOD3WGCxikRvqEKvHqwZzwaUZhE952NKDb6/
-AXSGiw2ECUsS0MGnzbwFVLsMm3fAV+b3CmAz+Nomh5QHQOhRFHIDIlDH5NgSg2DeYXtbIlYtwSvY
-YYiviYkETswIfIUMA3dMpg1M4BOsAbeatqa/Bk7fA3h8CBgsH4oi7+vP38Z6ATYSRr0=
-"""
-layout_normal_without_dead_ends_049 = """eJyFUUkOxDAIu+cVSL5bM9P//61hMaGXTqQoLAYHA7yfBaOZXxIMG+nHuRwQ2fShR/VfB0AAFI6q
-99gCkREvsLhZTwHkViAAYbMBJ4VOWJlOUZS7B2xyuBkdjpt/sObbtdKhBuSDy1tGh0owWzRfNl3C
-Do5k9+FBAaZA1ARF8Rl/nHqnvhvwsw7UnvbWSv3Q4d+6bwqYRpM=
-"""
-layout_normal_without_dead_ends_050 = """eJyFkUEOxDAIA+95hSXfre72/39bwARFPWxRWpEGzDgl/8eiBIDxqN4Tyt2dBYTqOApiOcQ8Jj9R
-gNo6oo1yf+tYYVT9zRKVZAHkbFSmNKFqBJKTwD47JmIYinNPIzrbCpWPSxuXrQyDyTZmLR0MDwts
-6mHIDj0s9LQsOO+gcGeiGa6+VY03Qn37pfC1hSMMRRtfL3+b6wdhjEbn
-"""
-layout_normal_without_dead_ends_051 = """eJyFUckNwDAI+3cKJP6ox/67FXykfbVEinIYG0Pmd2wZHdgKaw4dwePVgKoEZOABNM+4Hg9Dw5Qm
-OkYDhPcD6MoMIQYktnCCHwuvKtKaVCfD/HdKiWEqt4ivNDQuQug3YF1hk2jyWoiSdJH0pOpmo17F
-csEEM9gvy3aRZgm2a0RTDHuszq5eU39KbcCpfI7oNTMz/I37Bh06RqU=
-"""
-layout_normal_without_dead_ends_052 = """eJyFkUEOAzEIA+/7CiTfrbb7/78VbCDqoS3RrkgE45gAv+NCnODnL+POAiLyU3RZJnPwLEIthesq
-WUKIkCv7eM6LGW4TgRklq2a0Sp7PJcUdJRhTKdkEDhVjwRs3LoEWVo02zj0HLjXahVYTbDg/S63N
-ujqaUN3ccchvVWgCZ9RjE7ptjNKFRxsu/RkUuk6E19eX6kn+e+43L9xGtw==
-"""
-layout_normal_without_dead_ends_053 = """eJx9kTEOxEAIA/t9hSX31t3l/3+7YCBQhYJo0azNOuR7HQIQEJ8oUj5XXQYIDyUDEIf4JqAcquZE
-yaMsKB+j24/WTPoGctB39wIFhHK7qhe1vqId+r4eX87lG1FYaCwwGJXbHloRueTysa+QQU0JK7NA
-GtDzOpSYu1/BlUvJGHd6AXxGPjJhE9YM4LcXEFdmQlm8/+4/BGJGjQ==
-"""
-layout_normal_without_dead_ends_054 = """eJyFUUEOwzAIu/cVSL5b3fb/vw07QLLLSiqKWmMbAvyPCxEMxcquoAw9HwFQT0asP2RXr4Mh31kY
-BOYJNyQga1RyUBI6S+UCyW6PYjaAFpMEx4S/lvpmMLBbuFAcW5LYFu1ME9gFD4bmrC2gRWmT0S2z
-h7KcmT8MnnCmrWSAnVncLNuiPdw9PTl7GBMCvKNU9haO+9OqH677C0J+Rsk=
-"""
-layout_normal_without_dead_ends_055 = """eJyFkcEOwzAIQ+/7CiTuVrf9/78V2zG9bWmVEPQAQ7p/r1dXobRQfUzkWl8C83mhgNllVxPotzIM
-PDEJp6WteRqIm3/ugKkASiInXKGdegAoTj4WNqUy8kmkdFvB0UtFjAQzjBd4ekmjqyFyowwuJrSZ
-wejxIVR6Xg07g07DD2C5O6FM2UkGuCT5aOSo4VG4lwE+O2Vs+D6fuvjz3DcdOkal
-"""
-layout_normal_without_dead_ends_056 = """eJyFkUsOAzEIQ/c9BZL3Vj/3v1sxGKbpoiXSBIXkYTPA77ghFPllZQAzrQPFSxcqJ+fMVep5PHRB
-JZgSE3DeLcBcgkQ/jW8NXczuCVvOEhSEt2UY4hYtvLYmYH2cNnnZnEdls2Fda8kffU1YXRBHWjwY
-ixxFZqjIlnwRsDOyQNSw8sK9RPAY5UytbD7nbG3GafPf734DFwRGnw==
-"""
-layout_normal_without_dead_ends_057 = """eJx9UUkOAzEIu+cVSL5bXf7/t2LjTNoeBmmWgBcCwH0skMW6AqjiOb8b4B9WUAAbw86qgGcDFJ2A
-yDDWKb0FkQJhNjnajdbX5QGYZF7saNYGqMT0kUYtiTEdi2MrFYRtuzVsVPLfSOssREutYpukWRUW
-wvazZzEc5prbkPV/3ViYEtsZgEemkXoXjyiAmfPv6Bde12Y4tz/nzmQXd+v+AC/cRrc=
-"""
-layout_normal_without_dead_ends_058 = """eJx9UTkShDAM63mFZtRr9vj/39aynLBQ4CYHuiLI5zkoCAQg0Ttvz/kWwGsD5k7aW/JdgOLQMryx
-c4iCckGzzTNHTewMBSkFA6xD4aJztLLxTYgWR9/BS6H9MdE4YhnY4u8EWzTTaDuOwqSej8st5se1
-GK0XAwnfPXQRcUpRE1K7h9XKLnBejO7htQsUtPtepAJ8cGOXRRo1Ixkef/cPEM5GmQ==
-"""
-layout_normal_without_dead_ends_059 = """eJx9UcsOwzAIu/crLPmOuu3//20YQ8ZljZS0AsePQD6viwADAa08yf5x5SNAqBZVqy7zRm5qvxJQ
-UPUhIpUbVBRisJY/ZigADiAwHgAzlFagTfIwYDHEkigLdIaOMDazfumgjXe2xkYshowabHaMHJcH
-08sbOXbtfRgw8YvhpOaSmPjs0LYgkzf7XRtUWu6zJN4zp2iHZ3Ly/Xuov+P+AimmRrE=
-"""
-layout_normal_without_dead_ends_060 = """eJyFUUkOAzEIu+cVSL5bbef/fyvGgUmlqs0lRDFeAPh9FiIPgroYRL2r1HUlgAXIr5hzl88EwE3D
-mcgkJDdWDHALRSsAjYz2wCHsipaVugCCysOItSGqcAqbZmzH4yck8fGO6ubEtEnXpTh59Cj1ZUW0
-tdNria4jkROK3ZSaR5usySjY7WeLLTy+THgMieF17EZN7MVhp/i37jcdOkal
-"""
-layout_normal_without_dead_ends_061 = """eJyFUUESg0AIu/sKZnLP2Pb/fyskgPZScdwdJYQQgP9xIBhBRB71AKx74iNAZlmo6Ex+A6H6lwEb
-4bfL6+4WiiUGK0dBEkBTupbTIlH1QwxdawlQgXLRANw0LINkV3drgKaYzB0vH4au7mq887KnkLhG
-maE1q0AAy7OfPxOzp1hnxqlLcwLO8WCA7Trt2IF3XMSsZYW3BXaLp3V/AU7qRtU=
-"""
-layout_normal_without_dead_ends_062 = """eJx9UUkOxDAMuvcVlrijmen//zY2OEtzKFWj1sJgE+AdFyLIEJAfQOy4RYgi5eOj/lQofJMAsF+D
-u0EMBfEhM8qkXSfhAc1kR5qQXVKOGnIYZVtbZNWCxwZS8ZpHvYlU72WhWMPbp0x7SHYEK7CpNLeY
-e1VXxenCIOzBPPOi7uIzB7boCr0VfucGJFZguov36/4DCphGkw==
-"""
-layout_normal_without_dead_ends_063 = """eJyFkUsOAzEIQ/dzCiTvUT/3v1uNMWS6aRlNPsQ8CAF+24WIjMwaNUUvPbxLwE9W0wi8xVOEAD2l
-l5acprbnkrSO0oKBlRNxCE4BdOQYBVNR7gluShMEZ9oJ50I+LkSozf2QfwcNgY6py6JthgVrubWi
-ME3oC+FcUUX7lkNQX5AZFqgxJjy2zU78BaPgtS9jwXm57Fb/ee4PL9xGtw==
-"""
-layout_normal_without_dead_ends_064 = """eJx9kUsKxDAMQ/c9hUB7MTO9/90msWzH3dSEksKLPgn5PhcBUOsjaO1J7J+aewMCwSAQgMfYNxVC
-Y4Gy1JZGrLYIOzGPqhVgoFSdAREjTKWZAWg4Q1uh3egG8uG0s0I1LSDpWBdbrfuXH60g+bC1I+S4
-qm6hU/DReoc8MY3JUVxtAZ9xs3XVmhl+421UGVRNbfH63H/So0Zd
-"""
-layout_normal_without_dead_ends_065 = """eJyFkV0OwzAIg997CiS/W/u5/91WbDM6TdrSqkmaD+MA8HscYFVBr6aedzxPQL+bKqHnHvmcB/cF
-+tlozqIB9h50yEZ7c01BJphsMWcdYEZAHUO6DTg5RyMmlbiswHWfVL47BVAL4VLgO19ZISWAvMWn
-wQCDTn1sgnP9A1+1kSmuwq022u6nBAEeH93BpW8p1L92vwA2Eka9
-"""
-layout_normal_without_dead_ends_066 = """eJyFkV0OgzAMg99zikh+j7Zx/7stdmOoNMQKtGqxv/wUeB6BrJxR/QCc06cHBdT1dAohwfK/KZB3
-fRLOm2sfKAxCi+XiLIGj90w2R12QFmg7AGzpFv0KQWMNRPDRVlsVote6JXTMkkBV/xJS0ZXklDb1
-KFkbFqG3ZztMcD1xtWRvkTtHwssOc/QPvoLAx0eKC2zp8jT+3DbiC2GMRuc=
-"""
-layout_normal_without_dead_ends_067 = """eJyFUUkOAyEMu/cVlny3uvz/b02MA5zaaBgF5HgB8nc9CAFE/eVvanWfAsg7LTzIAk0LvprhDMin
-asI+9ipAxhpEHXjj2AA1PpSLJmWOW0K3PdqwAVyeKKz25BgP2NKwmI3uUDbZdDzhb8EAMMYUmmW7
-qBMzuUbaO5E7RZbviHF0JJ4cSmYsYuYpwBu3PeTN5gX7Hv489xcjcEar
-"""
-layout_normal_without_dead_ends_068 = """eJyFUVsOwzAI++8pLPkfbev977bYhnar9iBSiJAxxiF/x8YCCKBQXJej5oFdAKJBTsoJ5XsArrmx
-dC9wDUUzrHJ3TV1Fn61zWjMimi4AXNWjiQOwjkUhIs0vv18YvGE0HtseAKv+MuJdJDgiRfFB5Lmi
-IsQW2faWVbfGOBfArV2NT3aUyIoBPIbi/Crm3T78++4ndC5G+Q==
-"""
-layout_normal_without_dead_ends_069 = """eJx9UUEOwzAMuucVlrijbvv/3xps7HSXJqrq1IApAd7XQmgxdy0iyzz+EkAKGtpUAwQN+GxA9ZKI
-o+J3pEKShfNnTw97oCdSSCaMJaJSCoixLHYEZk4BZigTYEY/61G7E+CxKYWTQI+YiTAAbWuX0DHG
-eeUwNtvPBHdMxiMjlIuiLVzu7nw7avfIVPjOXxbx/+7s4e26by/cRrc=
-"""
-layout_normal_without_dead_ends_070 = """eJyFkUESwyAMA++8wjO6a9rm/3+rbQnDqSVhSIyQ1wb4PRaC4cFALRnxV8STAubjkTvwDjTfJaiz
-cqEcSrqPVIp9oJeKSWx1C1jvoFhVIHIYy2gYthjFyUnRvwqbQbh2qFgbdgnswhGHYbu1t5KcrGJQ
-Z6aAMDOnioAbcatc/7p6IgaRunlMwWv6qjYat2FQgs925Lms6/rWn9vG+gJCfkbJ
-"""
-layout_normal_without_dead_ends_071 = """eJyFUUkOw0AIu+cVlny3uvz/b2UxdNpDi6IoAWOMIX/HRXRonojJEc8GFBRuAbZM3ANARVLd21XR
-lNl1UVWKt7+wdPWTgMJyCho5TCZr0KgTsMPoEaXB+iqHojSyGdQtsq6FZ+/VRF5Au0PuxWEI4Nik
-t9iilJ382CzyxCzvEVZ+GJ17WcOtPF1/efjeGh7Hbb6vVoB/534BL9xGtw==
-"""
-layout_normal_without_dead_ends_072 = """eJx9UTESwzAM2v0K3bFzbfP/v9WA7MRLNCQKAYRs4L0GWKwqlF4szKYCqa5J6LYxgEHo768cFnvV
-dq+MaPSm4XAc8rSvFc5RLaeeAyuT0johIoZxEdQZVCsRM92kEJZpD8rO0Ylgp8TCMcuuY6exqUJi
-DfKPXpPHhom612w5OtizyEn43Adr36ejHX77LpwQ1YcVKCNer/sP/h1Ghw==
-"""
-layout_normal_without_dead_ends_073 = """eJyFUUkSwzAIu+cVzHDXpM3//1YkFnNqcOzEWBESdv8fl8PMYgJczT2mMbQ+BCQCgtWRg//F+xMA
-poA5dD1nXLnNsA7SuoqQIclFCUGTppSoRJaxRSFNwqWG9pDfYzGSsrkzhwFdQiVtMXCP7kSXONKk
-1EZ5i4w0lstyXSLX8OOkeheAWx2J3rrNYWsCXXznZriKIT0IQRcv1/0DBGJGjQ==
-"""
-layout_normal_without_dead_ends_074 = """eJyFkcEShDAIQ+/9CmZyz7jr///bQoAWL2vVcYrxJVDg/1qgmd+5aIB2RBbuELTW4ik1oRc+LqhK
-MYKwgbF3gSRV5GYheRIwSl4k0FnSIC4RJiMzKuYRVAP9IwTTZ6oL8bOb4lfyYdHTGD58ZNjBZHFS
-S2A2JgXwyVjdWbvjmEiycGHMlslrprr4ljPnYW0XF7wd9w8QzkaZ
-"""
-layout_normal_without_dead_ends_075 = """eJyFUUEOwzAIu+cVSL5b2/r/v43YTtLtsKFGgWJsIMBvGygWShaHK2q7AlDAOLOu9KGeE7DhztIB
-fBoQUwGcai4mFANh/XmaIbU2Ayjm9d9Jw7inoAG01rzhe9x8d0JkJIs2oPDBm2UABo3TzpZIx9qK
-AJKlejUyU69VHwmNf1+bGB51VqssMhLT5Ov7gbCiAP499xsppkax
-"""
-layout_normal_without_dead_ends_076 = """eJx9UUkOxDAMuvcVlrijWf7/t7GNias5NFJip8JAKPC8LgSjFoPIArAv1eb+FmARquhTl3cCmDxx
-40ycu5GA6DQDDF2oaQBzhQakrdpmDgPXhFAWuTRYJw/DyFEMnGeQO8yZQXnwEw67tJRKiCH8ADNU
-X9YbYGPjEHc5SWxOm5G/lslXbLT4S72D+ticgplUjJDE4+/+ATYSRr0=
-"""
-layout_normal_without_dead_ends_077 = """eJx9UUcSxDAIu/sVzOiu2fL/v60FguUUp7hEJQLgeRyQwfBgAPQq5+8F1P7CGgc2O/C+AM16UR8K
-DavpskKwbz2yEU9yCUCRIHIuKHoDEm0f/yHstRQKzVaYM1phzjImN+n8xSbDOJZCo8lWaL+dotCT
-c1XtZDVqOxkoun0OXk6okKtqZCt8Vm8y5modmb14bvcPCphGkw==
-"""
-layout_normal_without_dead_ends_078 = """eJyFkUsOxDAIQ/c9hSXvrfnc/24FDMm0i06kEoWaF0PI53UQECLEysg6owO+d4Fqi0K4/l0C10pd
-5YSlGEL+FFNkXiSMNUGbmR5I1Rk2qSZOjZd0JdSVqurxmCKVIHesfBuwsSHA9nYLdaPZBzmGZINt
-Nb4LwQbSin66bgGxp+kpq8dUgtdmtnRN3oQP1tu4m7vg33OfEM5GmQ==
-"""
-layout_normal_without_dead_ends_079 = """eJyFUUEOwzAMuucVSNzRtv7/b6uBNttli6omtjHBhPy9FgEKgPyBDs4zvR0nQODUXB1AwF7kcxgU
-LvjndEMHa47unUa2VaU0wBoKSA7l02zLAlBpzkWuzKswBHNpyAVq9mb4uDZIZaqOyfKOD7yNKIPV
-VNk1BCKgV3zN5QrqGlhAbdpGNdQwPLjtidUsZcd81YFK4364avj33G8KmEaT
-"""
-layout_normal_without_dead_ends_080 = """eJyFkUsOhEAIRPd9ikpqXxn1/ncbPoXamxk0poUCHg352xYBQhLG6iR7LgvqSfMXfQaPEDgsTjqf
-QvETFUT7ImsXsASq8vmmOzRZXk0oDGRXsLTy5SKrouZTx6CKplTT4nEjeXuaUq1JMpWHakzOFLy5
-1IOYulvAVPCEIjnM02IXoDk81OJn7hnbbZslBOd7Oa+daSD/rfsLQn5GyQ==
-"""
-layout_normal_without_dead_ends_081 = """eJx9UUEOwzAIu+8VSL6jbf3/3wa2SdEOpRIkqmNsAJ7jhciomAR0CkaVqwHzv6EJRH8FZPkIkLEi
-MYmgAqhX6C0PaCJ1KkDCBLkrKndPi+Tt/LuxZIAoQZUCsOVpMSfrNptfYWyaHkeK2EZD3/Avk2Zz
-t0h7DFm2ec2BvibdI5PIt3WzcBfynGPzu5fDEe7teQ5P6/4BBGJGjQ==
-"""
-layout_normal_without_dead_ends_082 = """eJyFUUsKRDEI2/cUQvZhPve/2xhrbGFgxvKKPGMSLfA7FoJxBaCrv4i3AFcIS2bRkKcAcCVrrJSE
-TjGuTCqKXtEMuzFaYtvIlO2hDtQsQPtNiW2I7k9JSUjcDD2KGUB7OKIHWZ0CyPoGNJH+23kCimIY
-ZGUYzhQG8GtmA2oz3hJ7b9W48Jjli2GWYr8LrzEOP9b1NjL557k/CphGkw==
-"""
-layout_normal_without_dead_ends_083 = """eJyFkTsOwzAMQ/eeggB3op/7360WRTnO0nowZId5ImXy93oQXspGdtkHfJZAsDI7gH1agpcFCgAK
-R95L0C3ShVLofdW4IuRfnlZ8pgVVmUlzYyYetAQp171cx1G63WLWp9bQ3MxBuFE5FpxjPHAshMUd
-OS12qk6kCW6C5xEPO3IcmfAEj+lm1DP5ErxBXA/E00rH/PfcXx06RqU=
-"""
-layout_normal_without_dead_ends_084 = """eJx9kUEOxCAMA++8wpLv1u72/39bYie0pxaUtuBMTCDfn0UAElDvBP9C/rxKsGURsEYHJP9rwt7f
-i+KESTczAtWysuO5B82OIHRjYHj8qNCrqK5rp8Kxy0eJopdVtklUcmoek+pkawIVRnATk1ydyGm3
-dLUXHHfiw3URGKrP1rMbo0cJpLkx0GFMftJUnC4PPVYXf5OeS7qvzb/x8Hrdf1tWRuE=
-"""
-layout_normal_without_dead_ends_085 = """eJyFkVEOgzAMQ/93Ckv5t2Dc/26L3SYETdoiCgW92k6I+F2vIMBcqgAjvCPWp8tANJD7yMvL9zOB
-PAWUQhXrRYCUt+Ig6YcybD0X+7SMlccKEsiy14IS4LB45EbnXJtlgcr+TW8FdWoz+5Zld5F5wIou
-qKosZuMYLjEsMCZxD44CjjFZ56zJqlMm8H7k1hwagIF/v/sD9+dGgQ==
-"""
-layout_normal_without_dead_ends_086 = """eJyFUUkSwzAIu/sVzOiuSZv//60g4SWXhngcwEgIG/hvA8H8ZNQKyHXuroKYBWVABqBdxKcKoDV/
-dYwDMDJcmEm1FaigDtILSgBaxWYodJ6pAc0ipwiIrQEUMJNWSLf0mG5SO7sFF26Ip9JicA+0JKrg
-EDRFWpLVS8Ma6pi1euYNPBks5HFxWXBFY405APQ9fDvY77QfT2O+PfcP9+dGgQ==
-"""
-layout_normal_without_dead_ends_087 = """eJx9kUEOxDAIA+/7CkvcrXb7/78tBkOkPZQmUdQ4AzgR7/EJZBAVJCO0YOKRoITomYP5QRLN24SC
-cK7Rcu1T4L0JJT0ECXQzqFFnfSReVtMC17eVNqOYYQKHULEdTor/f65Tt4hp04lPGnpXBDnDTVyi
-IsAEdxTNAOwamj2CqvhYta6l4DoEuRxY393md18m5rHWkLH69bl/FwRGnw==
-"""
-layout_normal_without_dead_ends_088 = """eJyFUUEOwzAMuvcVSNytbf3/32YDjnraosipXUwwIX+vi0BVdYAiJ8csxXsA7DI4W6GcA5O8Bahg
-0mq0uPq8VC6c33ADk4lh0GVJJQac+wwwrWkkT0pbNRZgyLleXxQSEZnCExDajCkPyJ3C5NgpjgXu
-W7naAkSYzUhmmjk9hfzb6xEfGJGvZZ9a8WFBxvycl8EqlQd+wwb8e+4vVSBG2w==
-"""
-layout_normal_without_dead_ends_089 = """eJyFkUESQiEMQ/ecIjPZd9R//7uZJpSvG2VDKa8lKeTvtYiCVoGFIhJDJ6cvAcoKVApwCAyl8Nkd
-XB6KLt7L3AGmg5N5tTMBus6My0eFW1UDvbFFed8Fgso6Vk5H2O5SEWWbEaQWx8FniTUUYro10g8r
-4Z1+YhzVLTJGXGCbA+zLzChmA3wNZ0+WB3hkRjgOpoNDAa+Y5j0f/9p84frz21xvFwRGnw==
-"""
-layout_normal_without_dead_ends_090 = """eJyFUTsOw1AI23MKS96ttrn/3Qrm89qlRYkExBibkL/jIiBK6GDW8WQn0jsAlWUIKkyg8o14miEq
-dVPGNdyfrqI3DXcNmwVsBrexQpzIGwNg5EyOABfKtBjkftoxWKNXBggfvZxTyVCLHA84C3ZlixSk
-1XYcjk3O6E6WY7vX2NzjpNK+GZvh8eXwXNwrkuFVWcoQ9iam70P9+d1vI3BGqw==
-"""
-layout_normal_without_dead_ends_091 = """eJx9kUsOxDAIQ/c9hSXv0Xzuf7cBG0ddjIrUJIQHuIR8touFtmqbHeQcOFfjfg1U/FlLiBjg3UAb
-9tNlUVEDaMB560+LhZVkYILdKSVOHSygJFcYp5diGhhQi1LvlaqjtVrDnyhHWipEXlrYtdwATueG
-aJHEAueveOSBnp01IKPZOvfZXXwFaK2Z+5l+NfCJTyGumMcrv8Xjc/8AFwRGnw==
-"""
-layout_normal_without_dead_ends_092 = """eJyFUcsOwzAIu/crkHy39vj/fxvGQNsdtkhpUjA2OMDvdSBmURsg+67MOwEZ2BgNRWRpnc8E6J5/
-+lYCVBIMhy0BkceqKUs6I4BSEsJKuLjOAxfyBKTCtHJKINx60lT3cImlElBiwzGoIG8MYwRbB6vc
-PXRLjUNZcxtThDzHFCS+xiyveCG3nwl4hJtco9Z3CSXg1e/iWPkwhlni33N/ACmmRrE=
-"""
-layout_normal_without_dead_ends_093 = """eJyFUUkOAyEMu/OKSL5Hbef/f2u8wLSXFs1IITi2McDvtVBdpT+rC/fmGkA3MF/tEUIGr049yaA1
-280ScCoCQIoZI9UBT4tam0EaasAeumoDAHtwwybh+e6yScHF3GZAlCLx0SAg4tSdepmofNPqe5Qd
-B+VG6+SYyYWORPMsJqlCemVBQDJBKoN23gN4JNWdcAKXB5l83U+D70dTJuvPa2O9AWGMRuc=
-"""
-layout_normal_without_dead_ends_094 = """eJx9UUkOxDAMuucVSNxRZ/r/v01sYkepNPXBygIEHPK9BhElRYO8FJhL4k4AicIHOLppwGcCzF1H
-SkRq0LxhsQZYRCwNPzEZkpZqGPC1GlAVxNNTp0A5n6igZ6BW8CaNpodKuTx0tbz20VaArbXTMK0G
-5DUN45HaT3goZmCPJSc4AVfZ8ZB3aiwPX7BTnn/2TPHnu38XBEaf
-"""
-layout_normal_without_dead_ends_095 = """eJyFUUkOxDAIu+cVSL6jtvP/vw3YBNo5TCOUhM1gAP6fBfMQS4HNcT2fDKACh264+wScQoC1jE8P
-A1pzFYnKkVQpqzQwm0Y3NcXe2MNGBAMAfcq2ZEuYsqpKokS/6iF+v84uOzSfBTaVYpFY1RsEtcuS
-heiIGZO85zAs7sO5zY0Bx/hiyuiZN83rsZ3iofUJ4W3dXx06RqU=
-"""
-layout_normal_without_dead_ends_096 = """eJyFUUkOAzEMuvcVSNxRl///rTGQWS6tlZHlARuckL/jQQBa32RIZEq5xieEwmSSYNaq+FqEicE0
-nW42k22qhKISMnZwE4ZBXBBkwoiZMALxjHoZcP7tCayGncluJnOdB53jWyHYlk6T9DTcFKJZguoI
-N/fW6RbXvY5F4+Q0aaj35K1ze/MWTyJQ7R03jkq80QdwMyltuBL/nvsLKaZGsQ==
-"""
-layout_normal_without_dead_ends_097 = """eJyFkUsOAzEIQ/ecAsl7q5/7360BG9JVG42UIN7YDgF+r0BmkszaUgsuzv4uYFgOg0Yae0pBHYqt
-My4WoBH9I6QgDpDXxBZkF+djA00r07HpBjp1tQRMLTNW3Arta8Jnd5akwMCIU+IYcftGJ1HOHdeG
-hkImRO8l78U5wGBCysZzP8BjZ7SPkLwmgZczfUl7XJTCv+f+ACmmRrE=
-"""
-layout_normal_without_dead_ends_098 = """eJyFUUkOxDAIu+cVSL5bs/z/b8UYks6lg6qkcYwxBHiOBQYZGawPqG3im4QQzxdA3QlgofEWgU4P
-SAo+t0omLiFoEeW0QocILkapI1qBeeQotBb3aqD/yoNw4hDsebc5xdyJ7MEK1HLzMOImeHWJOttV
-tRloz5tw62q6NCh+K8SMBx5XA+Xh9TPbGfgMLgmf8zTnsayn7hf+xLoAQn5GyQ==
-"""
-layout_normal_without_dead_ends_099 = """eJyFUUkSwzAMuvcVnuHOdPn/3yoEqeocEiV2ZAUDloHreGApqAGyv9RaGdZHAKcHLDNcfRUAYNgW
-jGu25JtE7aDrDA0M4EA4fM0pQKH0pPAL+xGANpTqnxVJWgKB979j0U7rjcmpNtBnauVmmJDJ+PUk
-wOlkjCS3PmjzKKzhK8Cz+0yceu2qGN5J6Wuqidgk7q77C/fnRoE=
-"""
-layout_normal_without_dead_ends_100 = """eJx9UUkSwzAIu+cVzOiuSdv//61GCJseGpJxHBstAPAcFxgZzNd7fWr7WQnhIAJr0W1CtbxWQkfk
-Uwxx4jAsdNIuBkAKLNQlXP5y4PKAykuTSJQO5cGGpwRbosWSnGXVJqMVtwJc+ywzbNJk1q5GgYxf
-k6iaqgopVn9skltsSJwOwT5t8t59FbU8YJb5botB9FB2Jzhm8W/cX/4dRoc=
-"""
-layout_small_with_dead_ends_001 = """eJxljrENwEAIA3umQLreSvL77xZjusQ0cDoB8E0hJLVAPTlGPdWeTd3eQayxVg9KwohXXPEUmi3F
-s9ZQ3/G1+v1AvSxTFI0=
-"""
-layout_small_with_dead_ends_002 = """eJxljkEKwDAIBO++YmHv0jT//1sdhRxSQVlHF7XvCEvKTCpSuxCdYQhpzRaoHJqMo8A9Dj+9j7FR
-FnrHea5g/D3xASbpFHs=
-"""
-layout_small_with_dead_ends_003 = """eJxljrENACEMA/tMYcl9BM/+u2EbKv6UhouTQL4U0WhBIiypRixc8lNKIJE+MQ8Gv9PzrpFMBrND
-6rt5+oht/f7A2ibpFHs=
-"""
-layout_small_with_dead_ends_004 = """eJxljkEOgEAIA++8YpLeG3X//zfpYjwoCQHaDCB9o4SNDKmIFamHPZLkHKlNS4Qi4Ns2v+3SwcM0
-7JGumLNrTtXvB9UNJukUew==
-"""
-layout_small_with_dead_ends_005 = """eJxtjjsOACAIQ3dPQfJ24uf+d7NVJ7VDoYUU4EYhUogEsTBkWYBEhrl5S1h0yt+qq3cOO6TQPUqL
-fUjW+8QEJRsUdQ==
-"""
-layout_small_with_dead_ends_006 = """eJxljkEOACEIA+++oknvja7//5stMca4DXAYoEC+apQgCwCdmEZUBQNch1FaoKdUEEG8EYL62dkW
-jR+2cx2RYv97YgEuIRST
-"""
-layout_small_with_dead_ends_007 = """eJxljkEKwEAMAu95heBddtv//60q20sbCAmDxpDfGooCdBq4jcDupNtzB6UCZZNpVVZQhyNooY4Y
-fa6qq8Y3wmnz+4HzACUbFHU=
-"""
-layout_small_with_dead_ends_008 = """eJxljkEKACEMA+99RSH3sK7//9tmqCc3oNRJUpRuldx2LqScHdQ4oQcvEHLexm2KM3gw7dIzsSnj
-lt6zF5ygKf4+8QEqhRSH
-"""
-layout_small_with_dead_ends_009 = """eJxljjEOQCEMQndPQcJO9Hv/uwlVFz9hKK9NW/JVIyRRAmxrBpmdCM+MIMbWxZmKVLTajT3lxlkR
-9J2IuqKg/xMLKLcUgQ==
-"""
-layout_small_with_dead_ends_010 = """eJxdjsENwDAIA/+dAsl/K2n3362HwysnBSLLGKSbR2UosEX9kIA/tczTbldoX1w1kjzqkVZPOZMk
-JP6NaxbQT/x1xA8qhRSH
-"""
-layout_small_with_dead_ends_011 = """eJxlTjkOADAI2vsKE3bS4/9/K9i6tEQTQKICLxqCjNNhLFm0hjWgGk4ZFry0LDpSVs+8OHMtZc2c
-1Qk69T+xASUbFHU=
-"""
-layout_small_with_dead_ends_012 = """eJxTVkYHXMoKCkCkoAfEYIYxSEgPBECieiAhQ5AQWDWQBIsDlYI0QlTA5biUDUAyUJ0gE4BCRlBz
-wTYogzViOgIAJukUew==
-"""
-layout_small_with_dead_ends_013 = """eJxdjjsOwDAMQveeAokdJe397xZMPlLKhJ8xMvnXQwkCwDLWVwhEJrFQN4oSnDI63vHV1bLKZTqM
-3iREJijtruuJASUbFHU=
-"""
-layout_small_with_dead_ends_014 = """eJxljjkOwDAIBHteMdL2yIn//7cs2HGRrETBaDikb0LpiIQuppFjxFa4jKi+pbYoxNu2XGicGctr
-/c3enKxT8ftB8QAuIRST
-"""
-layout_small_with_dead_ends_015 = """eJxdjjsOACAMQndP0YSd+Ln/3QTURZamD/oBfjVUESTrahmRKLsHj6Qst0S8hlReKgn1hIh4Ghaa
-b7FuOJ3B/4kNJukUew==
-"""
-layout_small_with_dead_ends_016 = """eJxdTlsKAEEI+u8Ugv8yj/vfbbIJlh0JidSKfBGU4AJEgNg5SkjFMGaOqjGnq4MGytJqcFSjb0Fw
-WbXrnlEH/08cL+8UmQ==
-"""
-layout_small_with_dead_ends_017 = """eJxljssJADAIQ+9OEfAe+tl/tybaUysENL6ImW9FAiDBdCNtWRrV0hsJsyjTLLbIaJ62vCpr4GY6
-T1kLzfsoO/g/cQAlGxR1
-"""
-layout_small_with_dead_ends_018 = """eJxTVkYHXMp6CnpgBAXGQCFlPWUYBgkZAoXAciBFECEFmJCyHlQcLGQAEYLrBgoZwQyG2KIHMh7D
-EQAlGxR1
-"""
-layout_small_with_dead_ends_019 = """eJxljkEOACEIA+++oknvjbr//9u2qBclkMjQCuQdjYATcrqAz0gKCvWDHKWqnowqnm1U0BoadVqv
-03vWONc/tWEb3yN+I00Ubw==
-"""
-layout_small_with_dead_ends_020 = """eJxljksOwEAIQveegoQ96XTuf7cCk25aE6M+/JFfG0oUABIN2wiQWsXBZWRzhiqF6XrLSN11FZ7J
-KEZ3h7LeIcfm9wPnASUbFHU=
-"""
-layout_small_with_dead_ends_021 = """eJxljjEOwCAMA3deEcm7VeD/f6sPRIeSJY5zciL9q8l1aqkZK8pyRoNUj6WKcmaXwKBoINjsmx4o
-EmMlA2p8yfsGWdcTLyqFFIc=
-"""
-layout_small_with_dead_ends_022 = """eJxdjjsOwDAMQvecAuntVT73v1sNaToEycsDbMOthh5LkgetQhSEwzSc2rLjlIJwgN9rdH2d1LN+
-OrVZ7mT9/cQLI00Ubw==
-"""
-layout_small_with_dead_ends_023 = """eJxljsEJwDAMA/+ZwnB/0bT771ZLTT6pwFgSnDGcGqhULZA3T1dlnxhNV5YyTZVB4rT6RgfXRsLj
-6iYRvgMy+HviBSNNFG8=
-"""
-layout_small_with_dead_ends_024 = """eJxljssJADAMQu+dIuBd+tl/t6qFHtoQJLxoCPBWQ5HFckWXEUi1iC01gjKqj9foZHB3DT2jg84H
-zXtZqptC/xMbLFMUjQ==
-"""
-layout_small_with_dead_ends_025 = """eJxljkEOgEAIA++8osncibr//5vtEj1oCQkMhAJfFd2NnMhCy0juWy0NOoMce+WhxRTpMyHo0Etz
-IegahH20ver3A3UDJRsUdQ==
-"""
-layout_small_with_dead_ends_026 = """eJxdjrkNADAMAntPgURv5dl/twBJFSp0gGzyV7ElsBERWwgKTHHpNEra2QAZPqPqS4sjxsN21Wjh
-plDLpzL8nzgsUxSN
-"""
-layout_small_with_dead_ends_027 = """eJxdjsENwDAIA/+dwtL9rbbZf7faSfOJhRAcyACnLmxJTQmkEaTAENJWT1BrsLa6teU1DLr/IaoB
-3Xqnq9eJpOl1PvEBI00Ubw==
-"""
-layout_small_with_dead_ends_028 = """eJxdTskJADAI+3eKQP6hx/671VgptEEUc6Dkj0ZILkCMxhVUQDSXFIZdBxZQQQOxX62x53RQFuya
-LKruVPB9YgMuIRST
-"""
-layout_small_with_dead_ends_029 = """eJxljksKwCAUA/eeIpB96Of+d2vm2VUriGScF7W/azmyEkls6S5SLG+Gcxa5wW5Ea8DizEu5XT7Q
-Z24asK5p3YyX6Pp94gEsUxSN
-"""
-layout_small_with_dead_ends_030 = """eJxlTjkKADAM2vsKwT30+P/fqi6BViKC0RDyxSCqEEIkjiyWNm0tp6SCfUaVsjqZhWZwWtPLBad2
-W6GL3xMXKoUUhw==
-"""
-layout_small_with_dead_ends_031 = """eJxljjsOwAAIQndPQfJ20s/971bUpEPLYngSFL4qLEcCWdEdpAHtgtAZhDqtVWan9HpmXxyNvJHp
-KK6tgT3j7vo98QAm6RR7
-"""
-layout_small_with_dead_ends_032 = """eJxljjEOwDAIA3deYel2lKT//1tNUDo0iAEOG4B/BCJTzh3oMdpdJjSaRi6tNj/CoItC9DgYasu3
-IVg6wrpCGe8nXiUbFHU=
-"""
-layout_small_with_dead_ends_033 = """eJxdjksOACEMQveegoQ9Uef+dxto3Six0T7ph3w1CElAjoP4jCI/jXwRK66SyHahEFNk1J9GM/bK
-U1jtd7vOBOG0v5f4ASqFFIc=
-"""
-layout_small_with_dead_ends_034 = """eJxljjkOADEIA/t9BZJ7K8f//xbbIk2WAsFoOIA3PpSCoBJdbqN0hKid2VY5R1LZKD0uGtbLg15G
-oxWJfSPW/4kDI00Ubw==
-"""
-layout_small_with_dead_ends_035 = """eJxljlEKwDAIQ/89RSH/YV3vf7c9nWPQBinxKbHSrpAtD6q1Eg1DaRigCVI5nl4Evcb/KHSVyxVi
-SQHdXzCBzmNx/EHxAC4hFJM=
-"""
-layout_small_with_dead_ends_036 = """eJxljkEKACEMA+++ItB7UPf/fzNp1YM7UIUxoUa8tAAB0kdAfFKUS18MpwzpCnLavgUrKdVPpfqU
-mvl0dzj1/8QCJRsUdQ==
-"""
-layout_small_with_dead_ends_037 = """eJxljkEKACEMA+99xUDuxdX//01TFxfWOYQwEFrpT4g0SIjFKAUphw2PlXFmzbCqlq/HqlX51kv1
-PdS5E9cPigkm6RR7
-"""
-layout_small_with_dead_ends_038 = """eJxdjkEKADEIA+99RWDuYbv9/99WRQ/dgEQHosJfC8sSgnRxEgUzOZZ2oGpcNcFSs1SgZyLuHYuX
-DsWNcE/weuIDJukUew==
-"""
-layout_small_with_dead_ends_039 = """eJxljkEKADEIA+99RSD3sNv+/29NsvSyDQo6aJT8a1CSEyQA5zKCEaCG9QZV6buGoK86U0HPmXLU
-dHDWNfa9I6P7iQ0m6RR7
-"""
-layout_small_with_dead_ends_040 = """eJxljkEKwEAIA+99RSD30O3+/2/N4J5aRYUxBu1vXI4iWY3Qd5FgKQ7Yq8iqONRoUTGUw4XXPT7i
-mCx6UI0Pm+D1e+IFKLcUgQ==
-"""
-layout_small_with_dead_ends_041 = """eJxTVkYHXMp6enoKQAQDxkAhIF9PTxnEAxOGQCEgA6IBIq4AUgWm9SDCIGkuZQO4HpCxeiBVRnCT
-wfbogczCcAQAJukUew==
-"""
-layout_small_with_dead_ends_042 = """eJxdTrENwDAM2n0FEjtqm/9/KyQsLQNC2GCTfwxhiApHLlsWkk2aPb+7FW0XDQbYwU6HV7QSTIF3
-hw/afG6gwe8TLybpFHs=
-"""
-layout_small_with_dead_ends_043 = """eJxljssNACAMQu9O0YQ78bP/bkI10Sgn+hpogVcFBBkkZEIaRprjqAmFlwkV0rCQ/eaJ6pVyq1DP
-jOvzitH/xAQlGxR1
-"""
-layout_small_with_dead_ends_044 = """eJxljjsOwDAIQ3dOYck7apr7361+SabUQjIfG7BvlNWBW2EFMy03I22WByrt0BIlpaVTn2n5wYQL
-gsvvErHeHEL1f+IDLiEUkw==
-"""
-layout_small_with_dead_ends_045 = """eJxljksKADEIQ/eeIpB9aKf3v1tNuih0gog+v+SroiiLHaC1GoExQCaYRpaSM9WK58VoNE5bmmLF
-LyWvzxV58PfEBiqFFIc=
-"""
-layout_small_with_dead_ends_046 = """eJxTVkYHXMp6egp6QKygAMIKCsZAIRBQ0AMSesogIUOgEFgOrArChAkpI3QChQwgQiCdClDjjRA6
-wTZBjUd1BAAlGxR1
-"""
-layout_small_with_dead_ends_047 = """eJxljkEKwEAIA+/7isDcQ9v9/9+aCHtpFUTHGIRvLIRtCZQq7aAAkirN/h5Vp1G00UENc9DFXBR5
-XBbPKGqvgqr+T7wqhRSH
-"""
-layout_small_with_dead_ends_048 = """eJxdTjkOADAI2vsKEnbS4/9/Kxi7FGOiIij5YxASJaFxPBJkKonk8iilA+jNCPHa4uI10ZrS22Vw
-P2PVHZTX/8QFLiEUkw==
-"""
-layout_small_with_dead_ends_049 = """eJxljkkKwDAMA+95xYDuom3+/7dKIYcuAoMto7Glr4awjM0qmLHMsrKmdcZKx1MNvmbKOtiZsFzy
-0NXtxvdSWb8nbibpFHs=
-"""
-layout_small_with_dead_ends_050 = """eJxdjkEOACEIA+/7iia9N+76/7/Zlj0JocIoCHnbQwFykFFgGzmPuxItrxFqQWz+oxaaS6OVY/ri
-Gf+1T3mYD9Tx9xIHJRsUdQ==
-"""
-layout_small_with_dead_ends_051 = """eJxljkEKACEMA+++IpB7UPf/f9smxYuGUmTotJJ3BiFK6BD4jFhIqh66jBK5yoJF5hXU8uDsqaMb
-7WxtXpeM3k/8JukUew==
-"""
-layout_small_with_dead_ends_052 = """eJxljkEKgEAMA+/7isDcg7r//5uJ6CLaUmgnJS18Y2BZWqUZhJOUGMEeVCmrVLv6B4VooS0Drs/t
-MTj0cs+t2v+eOAEqhRSH
-"""
-layout_small_with_dead_ends_053 = """eJxTVkYHXMp6Cnp6CiAAoYxBQmApPRACCRkChcAqgGoV9KBMrEIGECFluAlcykYIo0EUSAjTEQAm
-6RR7
-"""
-layout_small_with_dead_ends_054 = """eJxdjsEJwDAMA/+ZQqD/0bT771apyScVGOQzsm3/NYwlhA2KfYJEWhOekmaRtRW7gtWBh6+6hr48
-RXdH3Zcbsezg+cQLLFMUjQ==
-"""
-layout_small_with_dead_ends_055 = """eJxdjkEKwDAIBO++YmDvS9P8/291JfQQRZTRVaXbStjG0BnBbiTR0SwYrUzF7e7ARP2VRqigJyAq
-nx2llxEOzqVZfz/xASqFFIc=
-"""
-layout_small_with_dead_ends_056 = """eJxljkkKwDAMA+95hUB30zT//1tHOqYyBnuQF/vW8sgaQkNKJ2hsOW09G6QKHjtdUaqiCvTUXyOj
-rFl+O5f16iXQ/4kPLFMUjQ==
-"""
-layout_small_with_dead_ends_057 = """eJxljkEOgEAIA++8YpLeG3X//zepshdtaBMmBJC+KhnkJDEryMQtqetsBG87nI3sZmx0PPPD49LF
-bO4bStbvB9UNJukUew==
-"""
-layout_small_with_dead_ends_058 = """eJxljkEKACEMA+99RSD3YVf//zetFRfW0ByaJqH2H2GBASkp9SmZOWhb9KZLSh6U9K0lPScDqyXc
-8lz1rNK4fnAMKoUUhw==
-"""
-layout_small_with_dead_ends_059 = """eJxTVkYHXMoKCgp6ehBSQUFZwRgmpAAXMgQJAdWCsDJEQgGiCqwVKgMSMgCqRtIKEjKCCynDhDAd
-AQAm6RR7
-"""
-layout_small_with_dead_ends_060 = """eJxlTjEOADEI2vsKEnbS9v7/twPr1BKJCsRI3hgEFJCCZ3yWSLjkLcSqFM6qeOborg4h0uyQWTcs
-7TjI+aBS7xM/KLcUgQ==
-"""
-layout_small_with_dead_ends_061 = """eJxlTkkKACAQuvcKwbu0/P9vjdQElQweHBXJF4VQnIBFGCFJVBoAtpDonw7BwVtyV7V9Q64p7Mjq
-IMrBf8QEKoUUhw==
-"""
-layout_small_with_dead_ends_062 = """eJxljjkOwEAMAvu8Aol+lOP/fwustU3iCg9g2f7OYRBGrpD8FNVR1zVX0Kig8bRQJdrBoHNXGC/o
-bhV6L1mK/k+8KoUUhw==
-"""
-layout_small_with_dead_ends_063 = """eJxdjsENwCAMA/+ZwpL/UVv2361nwouTSIitGOybshoEKdZC6ogzg14kGqdpQxbPLep2y88sJIsA
-jPInn+x5aGfdn/gBLFMUjQ==
-"""
-layout_small_with_dead_ends_064 = """eJxdjrsNAEAIQvubgoTe3Gf/3Q7USguVJxrJGYtABABSReIJKWDpifqTLrRRxClRto2Ntjdrkajz
-VwNLtrHOjyc+KoUUhw==
-"""
-layout_small_with_dead_ends_065 = """eJxljskNACAQAv9WQcJ/49F/bwLGjxJd3QEP8lUjUBqZ2mMJWUUjGI2kkNYGzkEJ6lQrrlD3kvti
-ODWN6j6R1P+JDS4hFJM=
-"""
-layout_small_with_dead_ends_066 = """eJxdjkkKADAIA+++Qsg9dPn/3xoXelBojWNIC8wy0N2Zl47jNtKIEthCKim2VdKQPUbGKrNWQspb
-EUKn0H+kssYnHiNNFG8=
-"""
-layout_small_with_dead_ends_067 = """eJxljjsOADAIQveegoSd9HP/u1Vop5boAD6N5KtGWNJpYiWSWFXycFRE2MmoKYRiHA7oW914QO+H
-mqHueST6n9gqhRSH
-"""
-layout_small_with_dead_ends_068 = """eJxljkEOwEAIAu++goS76Xb//7cy7qVpjRJFJNrfKKvVgDol7VB2J8RewYWKjr1GJajXRIa6zkEQ
-g7G/R4W93ED9fnA9KLcUgQ==
-"""
-layout_small_with_dead_ends_069 = """eJxTVkYHXMoKCnp6IKQAREBgDBRS1lOAyOqBCAVDsCoFZZgqMAcqBOIDhaFCBgpwXUB9eiDjjcCm
-6sFtARmP4QgALFMUjQ==
-"""
-layout_small_with_dead_ends_070 = """eJxljjsOACAIQ3dP0YS98XP/u1kLLtqBwCu/iFctgCAhKahYQpRgaGNk10lrSonRrewK9doDz5NC
-014eYHb9T2wm6RR7
-"""
-layout_small_with_dead_ends_071 = """eJxljksKwEAMQvc5hfD20s/971aTzmxaIUQeYgJfFbZsLKlHd1CsRROyOAdF8bwpbeRGbHRM3hNN
-RaNLq9nrUv1+oB4jTRRv
-"""
-layout_small_with_dead_ends_072 = """eJxdjrkNwFAIQ3umsPR6lGP/3WKD0nxEgS8Aziqkdje0POs1FURAW5LucclyYKMNxsIwWrm49Iei
-ek3xbDBoLm3weOIDKoUUhw==
-"""
-layout_small_with_dead_ends_073 = """eJxljksOACEIQ/ecokn3RMf7380WnZgoCyCv5UPeEUwiEwplAqNQAUpx7ULYDlFzD67mxxKCrVzm
-rtoT/DxxDhi9T0wlGxR1
-"""
-layout_small_with_dead_ends_074 = """eJxdjkEKADEIA+/7ikDuYbv9/992lLaHChoZNWjf8ThKQkVETJDdYK1ogGqkglrtRmQOes8NMG3/
-1aisAUja/n7iByxTFI0=
-"""
-layout_small_with_dead_ends_075 = """eJxljjkOACEMA/t9RST3Fsf//4ZtUrEOiDCaCIA3H6pI7SxlG5FwQacyY5W6GJXLRQ3QaFj3UOZp
-tGL0C4z1/8QBKoUUhw==
-"""
-layout_small_with_dead_ends_076 = """eJxljjEOQCEMQndPQcJO/Hr/uwlqly9NOjxKW/KvRgiA0iJOI1nGPB4/I8LFmjJ0sKTrNvbAG8wS
-o1Fz+4QSfJ9YI00Ubw==
-"""
-layout_small_with_dead_ends_077 = """eJxljrENwEAIA/ufwtL1KMnvv1sM/iqhQOaMDPCtRclV3Wm1G9UQBki3EZ7Cw4wiZpXxF9cxUSKM
-Hp3kyqHO+j3xAiF/FGk=
-"""
-layout_small_with_dead_ends_078 = """eJxdjsENwDAIA/+ZwpL/Vpvsv1ttSB+JJUCcMEDeGpSABAQ6L6OS5GDQa+QC9lRpo+7FjZ6UuGLu
-9TOop+rQv/544gMotxSB
-"""
-layout_small_with_dead_ends_079 = """eJxTVkYHXMoKenoKYKwAwgrGCCGgtAJIjSFICMyCKQLyQEIKUD5ECihkoAzVAzUTKGQEU4QQwnQE
-ACi3FIE=
-"""
-layout_small_with_dead_ends_080 = """eJxdjksKADEIQ/eeIpB9mGnvf7dJxtKFwQ88MUpOFSXBYQkEtpElMYzhrxFaHtDFWaeLd1Z8cHYU
-g99+BbR97qjtxxMfKoUUhw==
-"""
-layout_small_with_dead_ends_081 = """eJxlTlsKwCAM+88pAvkPU+9/t6VOBGegkFdLpT8gm6QyLMIxLZfSylos7kK632LAw4ee0naCOhAC
-9V1YGa4fhBcjTRRv
-"""
-layout_small_with_dead_ends_082 = """eJxdjjEOwDAIA3deYel2K2n//7fi0CmWGDCHAW4VsmwLFPG2BU5Jpn12qB7jWBquhk9vZxhrNa1Z
-nIzi+XM5V6wTfz/xAS4hFJM=
-"""
-layout_small_with_dead_ends_083 = """eJxdjkEKADEIA+99xUDuYdv+/2+r8dYgGMYQlF4t2QgDMdxCkiV6NWcXInKPcluTGBQV+hLyJJz6
-Q9enPyb17xM/LFMUjQ==
-"""
-layout_small_with_dead_ends_084 = """eJxljkEKwEAIA+95RSB32bb//1uTDaXQiqhMoih9A5ohnU9cQe7lQ3sOI4pdCIqMXe0ojg6tTF2M
-PEbne7ocvx+EGyqFFIc=
-"""
-layout_small_with_dead_ends_085 = """eJxdTkkOwCAQuvsKEu7E1v//TaDpZcgYJ2xKTixCEj0EYRxTZrzlFI8pRo9BdSHB3nFVS9f+I827
-dPGty3pfEb6u8YkLJukUew==
-"""
-layout_small_with_dead_ends_086 = """eJxdjssJADAIQ++dIpC79LP/bo2pFNqAEZ5GJH81BhAqeRqWEEGK2aQhpEbPzR1MVdQzoX42zH2l
-ceLezt2o4PvEBibpFHs=
-"""
-layout_small_with_dead_ends_087 = """eJxdjsEJwDAMA/+ZQqC/aNP9d+vZhlISsLEvkhL7PMtRpK/0gOykbyH0GySXYFQ1FqKPLz2CLtTs
-403Hb/3Seavjz0+8KoUUhw==
-"""
-layout_small_with_dead_ends_088 = """eJxdjjEOwDAIA/e+4iTvVtv8/28xoCyxYLDBBunGIyxjQ0qwIhULzzgNX6SAUA7KeOCeVdYL7ZlF
-O9LfqRXvvjRZ1xMbKoUUhw==
-"""
-layout_small_with_dead_ends_089 = """eJxljrsNwEAIQ3umOOn11l2y/26xoYiUUGCwzQe+UUhaWg51vk2lhnTOcEwFSW+lhRoYI60Xu3EG
-s87U9a72Hdvr9wP1ACxTFI0=
-"""
-layout_small_with_dead_ends_090 = """eJxljkEKwEAIA+++IpC7bLv//1sn26WFVlDIEKP2t8rdrdZTE4QGIzKsA2RhbjoeRly6xebJGkF7
-c6WUzzeaO+D6/eC6ACbpFHs=
-"""
-layout_small_with_dead_ends_091 = """eJxljssNACAIQ+9O0aT3xs/+u9miJyVAwgMK5GuNguRAHMQyoggnIwUNIxyrHSMU4q1vr7GnlSVl
-SpGfQUe+7kT+e2IDKoUUhw==
-"""
-layout_small_with_dead_ends_092 = """eJxljrENwEAMAntPgUSPPsn+uwV4fZO4QBYHlsnvDCWgsuexRXoRyLjEZSuoKSk4xeixiocLbRq1
-mdR9Djdlmd8PnBcotxSB
-"""
-layout_small_with_dead_ends_093 = """eJxljjEOQDEIQveegoTdtP33v9sH6tRqHMAnkbxrECy4URrwk2WhJm0DK5QUrUIhViv0dnAeIIcO
-kbVDdWKFep/4ASUbFHU=
-"""
-layout_small_with_dead_ends_094 = """eJxljssNADAIQu+dgoQ76Wf/3Uqpp9bEqPiIkm80AqKchOBYltxIZ4rCEQoF2IQYb0Ww7Bt7jeWX
-pVlAbijU/8QGJukUew==
-"""
-layout_small_with_dead_ends_095 = """eJxljjsOwDAIQ3dOYcm7laT3v1vthC4NAgGPL/mXogRAIuOBxwiCTqr0zCBuDbI5Duqsa0Yj7T3o
-HUELvee7U9cPrBcqhRSH
-"""
-layout_small_with_dead_ends_096 = """eJxljsENgDAMA/9MYcl/C+j+u+ELggc0itxYV6f292yWkraNSAsrcavTMEctz1WAUJqH6EOJrN0v
-FfJqnVAh/l5E1u8TFy/vFJk=
-"""
-layout_small_with_dead_ends_097 = """eJxljjEOwDAMAve8Aokdpen//9azI3VImOwDLNunhiM5kWtAbyErgik2xgPCcfudgoL87z2CZuer
-SJ+zoLVbGOGsCt1PfCbpFHs=
-"""
-layout_small_with_dead_ends_098 = """eJxljksKACEMQ/eeIvD2ZUbvf7dJFAbRLFL6SD9wqlGUStH0EZRmGgi9Ri4JwIoqaA05EkbQk7KP
-N/q/2e5bRvcTHyF/FGk=
-"""
-layout_small_with_dead_ends_099 = """eJxljkkOwDAIA+95xUi+W13+/7dip6cWBQmGIYn0jSWMbSAJ9yB3FDQVOmORk3ZrRV3S0D1dOpQ2
-Rm/woOvV6CuO9f/EAyqFFIc=
-"""
-layout_small_with_dead_ends_100 = """eJxdjkkKADAIA+99xUDupcv//9ZGpYcGBJ0YVPrVRA8BLraRB6FoYBbKjTAcvEIvBxeN6sowWi+X
-ZzL4PXEAIX8UaQ==
-"""
-layout_small_without_dead_ends_001 = """eJxljksKACAIRPeeQpi99Ln/3ZpRaVFjgT0fJPDGEB7BCzbKJnKV803KdjZKoywXyiRDzg1DljSe
-Rqss3H/s2wF2ACi3FIE=
-"""
-layout_small_without_dead_ends_002 = """eJxljkEKwDAIBO++YmHv0jT//1sdhRxSQVlHF7XvCEvKTCpSuxCdYQhpzRaoHJqMo8A9Dj+9j7FR
-FnrHea5g/D3xASbpFHs=
-"""
-layout_small_without_dead_ends_003 = """eJxljrENACEMA/tMYcl9BM/+u2EbKv6UhouTQL4U0WhBIiypRixc8lNKIJE+MQ8Gv9PzrpFMBrND
-6rt5+oht/f7A2ibpFHs=
-"""
-layout_small_without_dead_ends_004 = """eJxljkEOgEAIA++8YpLeG3X//zfpYjwoCQHaDCB9o4SNDKmIFamHPZLkHKlNS4Qi4Ns2v+3SwcM0
-7JGumLNrTtXvB9UNJukUew==
-"""
-layout_small_without_dead_ends_005 = """eJxtjjsOACAIQ3dPQfJ24uf+d7NVJ7VDoYUU4EYhUogEsTBkWYBEhrl5S1h0yt+qq3cOO6TQPUqL
-fUjW+8QEJRsUdQ==
-"""
-layout_small_without_dead_ends_006 = """eJxlzkEKwCAQQ9F9TxH4+1Dr/e/WRKSUNuDmzUSFbw5sOZFEjmZIBndahFFqyJYXqsSbVDqfTvsu
-Xdo3r0fs0P8TNyxTFI0=
-"""
-layout_small_without_dead_ends_007 = """eJxljsEJwDAMA/+eQqC/SNr9d6sk0k9rMA6HzjH5raEgQKeB2wjsm3R77qBUoCyZNuUEdTiCFmpE
-9LqmrorvF9bndwPnASNNFG8=
-"""
-layout_small_without_dead_ends_008 = """eJxljkEOACEMAu99BQl3ou7//7ZgPSlpEzOUWvJWUZALEd2fEeJI7o1nUORBKC4S7IcaJ10cPdbh
-uMV19hrvjxJ8jvgBKLcUgQ==
-"""
-layout_small_without_dead_ends_009 = """eJxljjEOQCEMQndPQcJO9Hv/uwlVFz9hKK9NW/JVIyRRAmxrBpmdCM+MIMbWxZmKVLTajT3lxlkR
-9J2IuqKg/xMLKLcUgQ==
-"""
-layout_small_without_dead_ends_010 = """eJxlTlsKACAM+u8Ugv/S4/53y1Y0KBlD3HQjXxRCBozdhyXRBU9hBra1daHgR6JyYKkul8K5Qwp7
-RschS/8TEybpFHs=
-"""
-layout_small_without_dead_ends_011 = """eJxlTjkOADAI2vsKE3bS4/9/K9i6tEQTQKICLxqCjNNhLFm0hjWgGk4ZFry0LDpSVs+8OHMtZc2c
-1Qk69T+xASUbFHU=
-"""
-layout_small_without_dead_ends_012 = """eJxTVkYHXMoKCkCkoAfEYIYxSEgPBECieiAhQ5AQWDWQBIsDlYI0QlTA5biUDUAyUJ0gE4BCRlBz
-wTYogzViOgIAJukUew==
-"""
-layout_small_without_dead_ends_013 = """eJxdjjsOwDAMQveeAokdJe397xZMPlLKhJ8xMvnXQwkCwDLWVwhEJrFQN4oSnDI63vHV1bLKZTqM
-3iREJijtruuJASUbFHU=
-"""
-layout_small_without_dead_ends_014 = """eJxljrkNwDAMA3tNcQB7Ic/+u4WmHRcJARU6nB7pm1I7oiHFbYRkxFI4g9xHisVAvG3kgY49Y1lB
-F2tzM0/V7wfVAyxTFI0=
-"""
-layout_small_without_dead_ends_015 = """eJxdjjsOACAMQndP0YSd+Ln/3QTURZamD/oBfjVUESTrahmRKLsHj6Qst0S8hlReKgn1hIh4Ghaa
-b7FuOJ3B/4kNJukUew==
-"""
-layout_small_without_dead_ends_016 = """eJxdjkEKwEAIA+++IpB7aLv//1sddy9tEJGMQe2/yokoKZas1ZbcLrTd1o2F6IFOEGlWDi1fM+xo
-oOUHytY+kxP8PvECLiEUkw==
-"""
-layout_small_without_dead_ends_017 = """eJxljssJADAIQ+9OEfAe+tl/tybaUysENL6ImW9FAiDBdCNtWRrV0hsJsyjTLLbIaJ62vCpr4GY6
-T1kLzfsoO/g/cQAlGxR1
-"""
-layout_small_without_dead_ends_018 = """eJxTVkYHXMp6CnpgBAXGICE9oIwCEOspg4QMgUJgOZAiiJACTEhZDyoOFjKACMF06wGFjGAGQ2wB
-CWE6AgAjTRRv
-"""
-layout_small_without_dead_ends_019 = """eJxljkEOACEIA+++oknvjbr//9u2qBclkMjQCuQdjYATcrqAz0gKCvWDHKWqnowqnm1U0BoadVqv
-03vWONc/tWEb3yN+I00Ubw==
-"""
-layout_small_without_dead_ends_020 = """eJxljkEOwEAIAu++goQ72W3//7cCm15aL+ogKvmNoUQBIJGE2wiQ2pVwGzlcoUphpt42UnetwuOM
-YnQdwnpzbH4/cB4jTRRv
-"""
-layout_small_without_dead_ends_021 = """eJxljrkNADAMAntPYYke5dl/t0C+InEF+IwMvBNgnpmqK5IiKEsjWRUhpSi/cVPraMXeB4opI4rU
-Yard5o3H9wNiACi3FIE=
-"""
-layout_small_without_dead_ends_022 = """eJxljksKACEMQ/c9ReDti6P3v5uNjrMYA4Xykn7gr0BpSXKhUSipjsP0OLUFRraNcIDPC5remTSt
-PUF3arN1p9D9xAQhfxRp
-"""
-layout_small_without_dead_ends_023 = """eJxljkEKADEIA+99hTD3sNv+/29rdHtpA2ISGBFODRSKFKj2yirsO1qvK0s1SYVByunv88Lg2Ujx
-uJodoQ/I4PXEByF/FGk=
-"""
-layout_small_without_dead_ends_024 = """eJxljssJADAMQu+dIuBd+tl/t6qFHtoQJLxoCPBWQ5HFckWXEUi1iC01gjKqj9foZHB3DT2jg84H
-zXtZqptC/xMbLFMUjQ==
-"""
-layout_small_without_dead_ends_025 = """eJxljkEOgEAIA++8osncibr//5vtEj1oCQkMhAJfFd2NnMhCy0juWy0NOoMce+WhxRTpMyHo0Etz
-IegahH20ver3A3UDJRsUdQ==
-"""
-layout_small_without_dead_ends_026 = """eJxdjrENADEMAvtMgUSPPsn+uz3gLsiFdWeUkG8W5YBCQ1wjWChk6A6qFTNAi7MUjV38urSpeKOD
-sfBVnmrx/cQPKoUUhw==
-"""
-layout_small_without_dead_ends_027 = """eJxljkEKADEIA+99RSD3sN3+/29N3HrZBhGcSJT8a1ACkOYisIxgaEKP0Sxkl0IrqKUsMug5JpGA
-Qm+l6jvhZnQ/sQEhfxRp
-"""
-layout_small_without_dead_ends_028 = """eJxdjl0KACAIg987xWDvo5/73y1XFtQQxW8MJX8VQnIBYjQMI1I026gZbdlABi3Efr3CuqaDWkag
-flDeyeD7xAQqhRSH
-"""
-layout_small_without_dead_ends_029 = """eJxljksKwCAUA/eeIpB96Of+d2vm2VUriGScF7W/azmyEkls6S5SLG+Gcxa5wW5Ea8DizEu5XT7Q
-Z24asK5p3YyX6Pp94gEsUxSN
-"""
-layout_small_without_dead_ends_030 = """eJxljkEKwEAMAu95heBd2u7//1a1ZQ9tSBBGE0J+awgJwDvEMpLsaKMzKasrnNVhNcka7uER7d5z
-wejaqDip/xM3KLcUgQ==
-"""
-layout_small_without_dead_ends_031 = """eJxljjsOwAAIQndPQfJ20s/971bUpEPLYngSFL4qLEcCWdEdpAHtgtAZhDqtVWan9HpmXxyNvJHp
-KK6tgT3j7vo98QAm6RR7
-"""
-layout_small_without_dead_ends_032 = """eJxljjkOwEAIA3teYWl6lOP/f4tZa1MkiAIGY4BvFFL35Ap0G62uG4JOI5dWm29hkWIQGReHsvI6
-FJe2MFfG6/fEAyNNFG8=
-"""
-layout_small_without_dead_ends_033 = """eJxljksKwEAIQ/eeIvD2oe3c/25NWphFK4poPgrfGGRbaqaklZUDiAxOQ2dZb0BZmZ4VFbGx4Sid
-+lQYn+EqtC+4rP8TNybpFHs=
-"""
-layout_small_without_dead_ends_034 = """eJxljjkOADEIA/t9BZJ7K8f//xbbIk2WAsFoOIA3PpSCoBJdbqN0hKid2VY5R1LZKD0uGtbLg15G
-oxWJfSPW/4kDI00Ubw==
-"""
-layout_small_without_dead_ends_035 = """eJxljlEKwDAIQ/89RSH/YV3vf7c9nWPQBinxKbHSrpAtD6q1Eg1DaRigCVI5nl4Evcb/KHSVyxVi
-SQHdXzCBzmNx/EHxAC4hFJM=
-"""
-layout_small_without_dead_ends_036 = """eJxljkEKACEMA+++ItB7UPf/fzNp1YM7UIUxoUa8tAAB0kdAfFKUS18MpwzpCnLavgUrKdVPpfqU
-mvl0dzj1/8QCJRsUdQ==
-"""
-layout_small_without_dead_ends_037 = """eJxljjsKADAIQ3dPEcgu/dz/bjVp6dC+IYSHouRLECnAKiimVRVW2KBLCWV6DVJueTykmosWPSo1
-tuG9E98PjAUlGxR1
-"""
-layout_small_without_dead_ends_038 = """eJxdjssJADAIQ+9OIeQe+tl/t2qqhzYg0cALAr8MdHoIuL4ziozQmZoRaaGmQakyNRhGI6wOw/KC
-rrPB54kDI00Ubw==
-"""
-layout_small_without_dead_ends_039 = """eJxljkEKADEIA+99RSD3sNv+/29NsvSyDQo6aJT8a1CSEyQA5zKCEaCG9QZV6buGoK86U0HPmXLU
-dHDWNfa9I6P7iQ0m6RR7
-"""
-layout_small_without_dead_ends_040 = """eJxljkEKwEAIA+99RSD30O3+/2/N4J5aRYUxBu1vXI4iWY3Qd5FgKQ7Yq8iqONRoUTGUw4XXPT7i
-mCx6UI0Pm+D1e+IFKLcUgQ==
-"""
-layout_small_without_dead_ends_041 = """eJxTVkYHXMoKenogBAPGECE9PWUQD0wYAoWADKBqPRACKwOpAtNgIYg0l7IBXI8yyAiQKiO4yRB7
-QGZhOAIAJRsUdQ==
-"""
-layout_small_without_dead_ends_042 = """eJxdTrENwDAM2n0FEjtqm/9/KyQsLQNC2GCTfwxhiApHLlsWkk2aPb+7FW0XDQbYwU6HV7QSTIF3
-hw/afG6gwe8TLybpFHs=
-"""
-layout_small_without_dead_ends_043 = """eJxTVkYHXMp6CnogpAxkgIAxTAgBDIFCCspABlgQqAnIgQiB2FBxsJABki6QqUAhIwgHaLweTAjT
-EQAhfxRp
-"""
-layout_small_without_dead_ends_044 = """eJxljssNACAIQ+9O0aR34mf/3WyBkzYmxUdByVeDCAkBOaSTyC2QkbaMUAcZUmmEvnd3cHrIUzaG
-0c6Q19dDQv8nLiqFFIc=
-"""
-layout_small_without_dead_ends_045 = """eJxljkEKwEAIA+++IjB32W3//7ea7KHQBhESRxG+KqS2oFuj2xGpmTjRDmUbT6aVzhtronWwQKni
-OoTPt0Ev/p54ACbpFHs=
-"""
-layout_small_without_dead_ends_046 = """eJxljssJADAIQ+9OEchd+tl/t0alCK0QkReDkm8Z3eESEAJ2IBmAmjPQFEovt2q8iJ0UGoU6blyd
-zEtC/xMHI00Ubw==
-"""
-layout_small_without_dead_ends_047 = """eJxljrENACEMA3umsHQ94mH/3bAh1eM08SlxAn811C0JN7KWkQEuhSK+TBGnkm2hsoUGZ0M6+05p
-zAz0xN9DRu8TGyi3FIE=
-"""
-layout_small_without_dead_ends_048 = """eJxdjsENwDAIA/+Z4iT/rbbZf7caRD4xQgKMDdKNJWzZZrAzMhZyaCrfjKpMwGyWkNM2V14Po2l9
-XJa+Y+y+Q3vdT/wsUxSN
-"""
-layout_small_without_dead_ends_049 = """eJxljkkKwDAMA+95xYDuom3+/7dKIYcuAoMto7Glr4awjM0qmLHMsrKmdcZKx1MNvmbKOtiZsFzy
-0NXtxvdSWb8nbibpFHs=
-"""
-layout_small_without_dead_ends_050 = """eJxTVkYHXMp6CgpApKCsrAeiFIxBQhAI5OkpAwlDoJACGEAUglhQITBHDyIJFDIAURB9EMilbATW
-pwdTCBLCdAQAI00Ubw==
-"""
-layout_small_without_dead_ends_051 = """eJxljrENwEAIA3umsHQ9SvL77xZsusSiQCcfAr4p1BNtkI4RobD8NkraM5Yski1o5eLa1ojtntGT
-q8tD6/cD9QIlGxR1
-"""
-layout_small_without_dead_ends_052 = """eJxljsEJwDAMA/+ZQnB/0Sb77xa5JaE0BoN1yLLhXw3L0m6NQsZQygjuoBKxZsPvvFCINroieGLK
-l5hG1yc9t4LOJyYotxSB
-"""
-layout_small_without_dead_ends_053 = """eJxTVkYHXMp6Cnp6CiAAoYxBQmApPRACCRkChcAqgGoV9KBMrEIGECFluAlcykYIo0EUSAjTEQAm
-6RR7
-"""
-layout_small_without_dead_ends_054 = """eJxljkEKwEAIA+++YiD30Hb//7cmZQ+lFUSdEFX6xsiAsWQjWEE4YwVX5CwSO9IqObu+8OhoV9Pj
-d9FVqftyo2LQ/4kbKLcUgQ==
-"""
-layout_small_without_dead_ends_055 = """eJxljkEKwEAIA+/7isDcQ9v9/9+aSOmhVUQZExS+sZBtWUoX0g4yyqqswVlV04aC1nonxkjRweOJ
-MMBBl8ZYNpeC/k/cKLcUgQ==
-"""
-layout_small_without_dead_ends_056 = """eJxljjEOQCEMQndPQcJO1H//u31gcFBMU/uKtuStQUA9kAP4jCQSTJnMVVdkLhi5EZRbUWU066/R
-2d8M7r7TmWL0LvEDKLcUgQ==
-"""
-layout_small_without_dead_ends_057 = """eJxlzkEKwCAMRNG9p/gw+8G2979bJxo3bcgIPiRR+taQAe8z4SkylZSUvkKwr+0csmMcmut9e2Xo
-pif3jtD/Ey8lGxR1
-"""
-layout_small_without_dead_ends_058 = """eJxTVkYHXMoKemCgoABEQGAMFlJWBopAlSgYgoQUFJQVkABECMGFCBnA9eiBjAAJGYHlQcZDrAEK
-YToCACbpFHs=
-"""
-layout_small_without_dead_ends_059 = """eJxTVkYHXMoKCgp6ehBSQUFZwRgmpAAXMgQJAdWCsDJEQgGiCqwVKgMSMgCqRtIKEjKCCynDhDAd
-AQAm6RR7
-"""
-layout_small_without_dead_ends_060 = """eJxlTkEOwDAIuvsKEu6k6/7/t4H1tGKIgsRI/lEEFJCCZ7yxXISsQjydwpHKzqzpmhBirQmZ7CvF
-nQ1yPujU/cQHJukUew==
-"""
-layout_small_without_dead_ends_061 = """eJxlTkkKACAQuvcKwbu0/P9vjdQElQweHBXJF4VQnIBFGCFJVBoAtpDonw7BwVtyV7V9Q64p7Mjq
-IMrBf8QEKoUUhw==
-"""
-layout_small_without_dead_ends_062 = """eJxljjsOADAIQveegsSd9HP/uxU0Li1xwIdGI16NIKFC2EjHyAmytZZQOaHKkMiW6EGh2SusTGhn
-S+/kJaH/iQsm6RR7
-"""
-layout_small_without_dead_ends_063 = """eJxljjsOACAIQ3dO0aQ78XP/u9micdAOBB5QIF8FkRKkCphCaVi1R9A9ReepasvoZKbVD7a9YC8Z
-qBEcuN51SOh/YgEotxSB
-"""
-layout_small_without_dead_ends_064 = """eJxljrkNACAMA3umsOQe8ey/G7ZDBRHhuRxRyDcagd4BkDmwjajlp1LOjIUruqgtKNeLjYZs1Mdq
-0rjKiOmK0D/EASbpFHs=
-"""
-layout_small_without_dead_ends_065 = """eJxTVkYHXMoKIKCnB8IgtjFQSA8ooacMElIACRnCVSmAJRQgGoFAAawUKA4CQCEDEAXi6kHN4FI2
-AglBjIepwnQEACxTFI0=
-"""
-layout_small_without_dead_ends_066 = """eJxdTjkOADAI2n2FCTvp8f+/FY90kEERCQpMGOjuzOKB25JGFMGWJIixraKG7DEyVpm1UqS8FSHp
-lO0fqazxxAMhfxRp
-"""
-layout_small_without_dead_ends_067 = """eJxljjsOADAIQveegoSd9HP/u1Vop5boAD6N5KtGWNJpYiWSWFXycFRE2MmoKYRiHA7oW914QO+H
-mqHueST6n9gqhRSH
-"""
-layout_small_without_dead_ends_068 = """eJxljsENgDAMA/+dwpL/FtD9d8MXPgiiNGrtqxX7W8uKNCM90q4UpyX8ej6huOFrKCG9XnSl4/nQ
-SUBzlq+hiIcK1H+JGybpFHs=
-"""
-layout_small_without_dead_ends_069 = """eJxTVkYHXMoKCnp6IAQFxkAhIA8iqwciFAzBqhSUwar0QAwghgqB+CDlECEDBbguZZByoJARzGCo
-LUAhTEcAACqFFIc=
-"""
-layout_small_without_dead_ends_070 = """eJxljjsOACAIQ3dP0YS98XP/u1kLLtqBwCu/iFctgCAhKahYQpRgaGNk10lrSonRrewK9doDz5NC
-014eYHb9T2wm6RR7
-"""
-layout_small_without_dead_ends_071 = """eJxljksKwEAMQvc5hfD20s/971aTzmxaIUQeYgJfFbZsLKlHd1CsRROyOAdF8bwpbeRGbHRM3hNN
-RaNLq9nrUv1+oB4jTRRv
-"""
-layout_small_without_dead_ends_072 = """eJxdjrkNwFAIQ3umsPR6lGP/3WKD0nxEgS8Aziqkdje0POs1FURAW5LucclyYKMNxsIwWrm49Iei
-ek3xbDBoLm3weOIDKoUUhw==
-"""
-layout_small_without_dead_ends_073 = """eJxljjsOwCAMQ/ecwpJ3i5b73w0baAfwkEQvzoc8VYQgwXIk0I3ECZie9cS1HabhGVzFh90otukK
-T/ae4puJ/4Diup8YI00Ubw==
-"""
-layout_small_without_dead_ends_074 = """eJxTVkYHXMp6Cnp6ekBSAYiAwBgkpAwWgCpRMAQKgeVAggpQJkwIiPXgQgZwPQpgM4BCRmA5PbCA
-HtAuoBCmIwAqhRSH
-"""
-layout_small_without_dead_ends_075 = """eJxlTkkOwEAIuvcVJNxJl///rUBn5jBFjREhSu44CEiupvGEkpigu3FVBYJY+Kg5dGPqjDym+hXq
-rmJcUFX/J14m6RR7
-"""
-layout_small_without_dead_ends_076 = """eJxljjEOgDAMA/e8wtLtFtD//w2Hlg7gSBnOdhT4qpAludejEeQomOlxBqEMO6UuvvJyi6PhKvaR
-oGunPL36/UDdIX8UaQ==
-"""
-layout_small_without_dead_ends_077 = """eJxljrENwEAIA/ufwtL1KMnvv1sM/iqhQOaMDPCtRclV3Wm1G9UQBki3EZ7Cw4wiZpXxF9cxUSKM
-Hp3kyqHO+j3xAiF/FGk=
-"""
-layout_small_without_dead_ends_078 = """eJxljkkKADAIA+99RSB36fL/v9WoILSCqGNcyNcGzQA55MARUsdAJY6WI7XYKhTK2lhoKsRUrnC0
-WxWHHP1PXCUbFHU=
-"""
-layout_small_without_dead_ends_079 = """eJxTVkYHXMoKenoKYKwAwgrGCCGgtAJIjSFICMyCKQLyQEIKUD5ECihkoAzVAzUTKGQEU4QQwnQE
-ACi3FIE=
-"""
-layout_small_without_dead_ends_080 = """eJxljkEOwCAIBO+8YpO9E63//5uz0V7aDQgZELC/Kne3MNSytIJs8jCHT5COKJgHrxvpfWvlofuH
-rgwBPQFnfPYE/Y/YKLcUgQ==
-"""
-layout_small_without_dead_ends_081 = """eJxlTlsKwCAM+88pAvkPU+9/t6VORGZpaV6USv+CbJLKsADHlFxMy2uRuAPJKo1vnTr0FLdj1IEA
-qO/A8nD9ILwhfxRp
-"""
-layout_small_without_dead_ends_082 = """eJxlzkEOwCAQAsC7ryDhTlr9/98K2JNyMrNsXPLMIARJINGsEOWRAPlJviVYQ7sWakLKMPS4jb3o
-/dL8++wvCt1HfCqFFIc=
-"""
-layout_small_without_dead_ends_083 = """eJxljrkNwDAMA3tNcQB7Io733y16CgeJnuZIPdI3QjbQbQS7UKZItTkrER2uUmtxHB4x0TWmcdSW
-0J0Crxs1+HviASi3FIE=
-"""
-layout_small_without_dead_ends_084 = """eJxljkEKwEAIA+95RSB32bb//1uTDaXQiqhMoih9A5ohnU9cQe7lQ3sOI4pdCIqMXe0ojg6tTF2M
-PEbne7ocvx+EGyqFFIc=
-"""
-layout_small_without_dead_ends_085 = """eJxdTkEOwDAIuvsKEu5ka///tyGulxITDQJK3ihCEl1EsE2Z8ST8eE0ZiESja2N6q7LrrOdY4ndo
-cQ1B5oowWdcTHyUbFHU=
-"""
-layout_small_without_dead_ends_086 = """eJxdjkkKACAMA+++IpB7cPn/30y1CjrQHIamlPwpFCCPMwJjKVIZplnhYJPF4LQCq7o2ZL/DquPe
-jmvK4vvEBCNNFG8=
-"""
-layout_small_without_dead_ends_087 = """eJxTVkYHXMp6CnoKCnCsYAwSUtbTA8sCRYCkIVBIQVkBrgrEBAkBSYQ+ZZCQAVA1kA/RCzQFKGSk
-gGQ60C6gEKYjACi3FIE=
-"""
-layout_small_without_dead_ends_088 = """eJxdjskJADAIBP+pYsD/kqP/3rIq+WRQ0PWM+BmBQkhgM8eSKpTLdliWDE555OBDVctdE2qmGyVL
-u1syq0u963viAii3FIE=
-"""
-layout_small_without_dead_ends_089 = """eJxljrsNwEAIQ3umOOn11l2y/26xoYiUUGCwzQe+UUhaWg51vk2lhnTOcEwFSW+lhRoYI60Xu3EG
-s87U9a72Hdvr9wP1ACxTFI0=
-"""
-layout_small_without_dead_ends_090 = """eJxljkEKwEAIA+++IpC7bLv//1sn26WFVlDIEKP2t8rdrdZTE4QGIzKsA2RhbjoeRly6xebJGkF7
-c6WUzzeaO+D6/eC6ACbpFHs=
-"""
-layout_small_without_dead_ends_091 = """eJxlzjEOACEIRNHeU0zy+8m63v9uy6CVS7TgISDcMbDsusoRWkUygpBDM7Sje4rUxMlPbfCklCbn
-lUNvaI/vPUX/T3wotxSB
-"""
-layout_small_without_dead_ends_092 = """eJxljjEOQDEIQndPQcJO2v773+2jtkvrQMwDjOQ9QQko6fmMQC8CmZSYibBTklvIYupBZQdHN211
-02idw5WyxPMD4wcm6RR7
-"""
-layout_small_without_dead_ends_093 = """eJxljkkOACAIA++8oknvxuX/f7MF40GNEhkGlHxXEA3aDjrAEjqEWQOGLbmgMyNdo9IUTjXYS8hG
-DxGaie4btv5PbCF/FGk=
-"""
-layout_small_without_dead_ends_094 = """eJxljssJADAIQ++dIpB76Gf/3RqDp1YQYnxBybcGAVFuQnAdWxZSTXG4QqEBhyzLYnSw7Adnj52X
-rd1AbijU/8QFJRsUdQ==
-"""
-layout_small_without_dead_ends_095 = """eJxljkkKADAIA+++IpB76PL/v9V0O7QiSMa4kG8EJQAS6Qr0RBC0pOypRpxpNG1GV61eomL7Hswd
-Rg17z7kT3w+MASi3FIE=
-"""
-layout_small_without_dead_ends_096 = """eJxljkEOxDAMAu/7CiTuqN3+/29l6K11HFnGE2L7HT9LSa9NkS6kxD3txpyVLFKAUNpD6qgNKx3j
-RwW/Sn+oYP98hNdniRsuIRST
-"""
-layout_small_without_dead_ends_097 = """eJxljjEOwDAMAve8Aokdpen//9azI3VImOwDLNunhiM5kWtAbyErgik2xgPCcfudgoL87z2CZuer
-SJ+zoLVbGOGsCt1PfCbpFHs=
-"""
-layout_small_without_dead_ends_098 = """eJxljlsKACAIBP89hTD/0eP+d8tViCgFxWFXhTeM5kpF1pUohizg+AgUTQIoqQuVKSRiCHW1227M
-sznvCP1PbB+xFGM=
-"""
-layout_small_without_dead_ends_099 = """eJxljkkOwDAIA+95xUi+W13+/7dip6cWBQmGIYn0jSWMbSAJ9yB3FDQVOmORk3ZrRV3S0D1dOpQ2
-Rm/woOvV6CuO9f/EAyqFFIc=
-"""
-layout_small_without_dead_ends_100 = """eJxdjkkKADAIA+99xUDupcv//9ZGpYcGBJ0YVPrVRA8BLraRB6FoYBbKjTAcvEIvBxeN6sowWi+X
-ZzL4PXEAIX8UaQ==
-"""
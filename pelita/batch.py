@@ -0,0 +1,215 @@
+""" Plays many games of in-process teams without any network setup.
+
+All games are played directly on a GameMaster with `SimpleTeam`s which
+are created in the worker processes of a `multiprocessing.Pool`. There are
+no sockets and no subprocesses per game, which makes this suitable for
+evaluating changes to a player over thousands of games.
+"""
+
+from collections import namedtuple
+import itertools
+import logging
+import multiprocessing
+import traceback
+
+from .datamodel import CTFUniverse, LayoutCache
+from .game_master import GameMaster
+from .layout import get_layout_by_name, load_layout_pack
+
+_logger = logging.getLogger("pelita.batch")
+
+#: A single game: The indexes of the teams on the left and right side,
+#: the name of the layout and the seed.
+BatchGame = namedtuple("BatchGame", ["teams", "layout_name", "seed"])
+
+
+def make_games(layout_names, seeds, swap_sides=False):
+    """ Returns a game for every combination of layout and seed.
+
+    Parameters
+    ----------
+    layout_names : list of str
+        the layouts to play on
+    seeds : list of int
+        the seeds to play with on every layout
+    swap_sides : bool, optional
+        if True, every game is played a second time with the teams
+        exchanging their sides
+
+    Returns
+    -------
+    games : list of BatchGame
+    """
+    sides = [(0, 1), (1, 0)] if swap_sides else [(0, 1)]
+    return [BatchGame(teams, layout_name, seed)
+            for layout_name, seed, teams in itertools.product(layout_names, seeds, sides)]
+
+def play_game(team_factories, game, rounds=300, max_timeouts=5, noiser=None):
+    """ Plays a single game in this process.
+
+    Parameters
+    ----------
+    team_factories : list of callables
+        the factories for the teams, each returning a `SimpleTeam`
+    game : BatchGame
+        the game to play
+    rounds : int, optional
+        the maximum number of rounds
+    max_timeouts : int, optional
+        the number of illegal moves after which a team is disqualified
+    noiser : subclass of UniverseNoiser, optional
+        the noiser to use (default: `ManhattanNoiser`)
+
+    Returns
+    -------
+    result : dict
+        the result of the game. All per-team entries are ordered as the
+        team factories and not by the side a team played on.
+        An exception raised by a player does not propagate but is
+        stored as a traceback in the "error" entry.
+    """
+    result = {
+        "layout_name": game.layout_name,
+        "seed": game.seed,
+        "teams": list(game.teams),
+        "winner": None,
+        "draw": False,
+        "score": [0, 0],
+        "food_count": [0, 0],
+        "times_killed": [0, 0],
+        "timeouts": [0, 0],
+        "disqualified": [None, None],
+        "rounds": None,
+        "error": None
+    }
+    try:
+        layout = get_layout_by_name(game.layout_name)
+        teams = [team_factories[team_idx]() for team_idx in game.teams]
+        gm = GameMaster(layout, teams, 4, rounds, max_timeouts=max_timeouts,
+                        noiser=noiser, layout_name=game.layout_name, seed=game.seed)
+        gm.play()
+    except Exception:
+        _logger.exception("Error in game %r.", game)
+        result["error"] = traceback.format_exc()
+        return result
+
+    game_state = gm.game_state
+    for side, team_idx in enumerate(game.teams):
+        result["score"][team_idx] = gm.universe.teams[side].score
+        result["food_count"][team_idx] = game_state["food_count"][side]
+        result["times_killed"][team_idx] = game_state["times_killed"][side]
+        result["timeouts"][team_idx] = game_state["timeout_teams"][side]
+        result["disqualified"][team_idx] = game_state["teams_disqualified"][side]
+    if game_state["team_wins"] is not None:
+        result["winner"] = game.teams[game_state["team_wins"]]
+    result["draw"] = bool(game_state["game_draw"])
+    result["rounds"] = game_state["round_index"]
+    return result
+
+def _play_game(args):
+    # Unpacks the arguments for Pool.imap_unordered.
+    return play_game(*args)
+
+def _init_worker(layout_cache_dir, layout_packs):
+    # Parsed layouts are shared between the workers through the directory.
+    if layout_cache_dir is not None:
+        CTFUniverse.layout_cache = LayoutCache(directory=layout_cache_dir)
+    for layout_pack in layout_packs or []:
+        load_layout_pack(layout_pack)
+
+def aggregate(results):
+    """ Sums up the results of many games.
+
+    Parameters
+    ----------
+    results : iterable of dict
+        the results as returned by `play_game`
+
+    Returns
+    -------
+    summary : dict
+        the number of games, wins (per team), draws and errors
+        and the total score (per team)
+    """
+    summary = {
+        "games": 0,
+        "wins": [0, 0],
+        "draws": 0,
+        "errors": 0,
+        "score": [0, 0]
+    }
+    for result in results:
+        summary["games"] += 1
+        if result["error"] is not None:
+            summary["errors"] += 1
+            continue
+        if result["winner"] is not None:
+            summary["wins"][result["winner"]] += 1
+        if result["draw"]:
+            summary["draws"] += 1
+        for team_idx, score in enumerate(result["score"]):
+            summary["score"][team_idx] += score
+    return summary
+
+def iter_batch(team_factories, games, rounds=300, max_timeouts=5, processes=None,
+               layout_cache_dir=None, layout_packs=None, noiser=None):
+    """ Plays all games in a pool of worker processes and yields
+    each result as soon as its game has finished.
+
+    The team factories must be picklable (e.g. module level functions)
+    because the teams are created in the workers. With `processes=1`
+    all games are played in this process.
+
+    Parameters
+    ----------
+    team_factories : list of callables
+        the factories for the two teams
+    games : list of BatchGame
+        the games to play (see `make_games`)
+    rounds : int, optional
+        the maximum number of rounds per game
+    max_timeouts : int, optional
+        the number of illegal moves after which a team is disqualified
+    processes : int, optional
+        the number of worker processes (default: the number of CPUs)
+    layout_cache_dir : str, optional
+        a directory to keep the parsed layouts in (see `LayoutCache`)
+    layout_packs : list of str, optional
+        layout packs which the workers load before playing, so that
+        their layouts can be used in the games (see `load_layout_pack`).
+        With `processes=1`, they are loaded in this process.
+    noiser : subclass of UniverseNoiser, optional
+        the noiser to use (default: `ManhattanNoiser`). The tables of
+        `MazeDistanceNoiser` are computed once per layout and worker and
+        reused in all further games on the same layout.
+
+    Yields
+    ------
+    result : dict
+        the result of a game (see `play_game`), in order of completion
+    """
+    tasks = [(team_factories, game, rounds, max_timeouts, noiser) for game in games]
+    if processes == 1:
+        _init_worker(layout_cache_dir, layout_packs)
+        yield from map(_play_game, tasks)
+        return
+
+    with multiprocessing.Pool(processes, _init_worker, (layout_cache_dir, layout_packs)) as pool:
+        # larger chunks mean less communication but worse balancing
+        chunksize = max(1, len(tasks) // (4 * (processes or multiprocessing.cpu_count())))
+        yield from pool.imap_unordered(_play_game, tasks, chunksize=chunksize)
+
+def run_batch(team_factories, games, rounds=300, max_timeouts=5, processes=None,
+              layout_cache_dir=None, layout_packs=None, noiser=None):
+    """ Plays all games (see `iter_batch`) and returns the results
+    of all games together with their summary (see `aggregate`).
+
+    Returns
+    -------
+    results, summary : list of dict, dict
+    """
+    results = list(iter_batch(team_factories, games, rounds=rounds,
+                              max_timeouts=max_timeouts, processes=processes,
+                              layout_cache_dir=layout_cache_dir, layout_packs=layout_packs,
+                              noiser=noiser))
+    return results, aggregate(results)
@@ -1,7 +1,16 @@
 """ The datamodel. """
 
+from collections import namedtuple, OrderedDict
+import functools
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import weakref
+
 from .containers import Mesh
-from .graph import iter_adjacencies, move_pos
+from .graph import AdjacencyList, get_distance_table, iter_adjacencies, move_pos
 from .layout import Layout
 
 north = (0, -1)
@@ -54,6 +63,9 @@ def __eq__(self, other):
     def __ne__(self, other):
         return not (self == other)
 
+    def copy(self):
+        return Team(self.index, self.zone, self.score)
+
     def _to_json_dict(self):
         return {"index": self.index,
                 "zone": self.zone,
@@ -133,6 +145,10 @@ def __repr__(self):
                 (self.index, self.initial_pos, self.team_index,
                     self.homezone, self.current_pos, self.noisy))
 
+    def copy(self):
+        return Bot(self.index, self.initial_pos, self.team_index,
+                   self.homezone, self.current_pos, self.noisy)
+
     def _to_json_dict(self):
         return {"index": self.index,
                 "initial_pos": self.initial_pos,
@@ -148,6 +164,100 @@ def _from_json_dict(cls, item):
             item[tupled_attr] = tuple(item[tupled_attr])
         return cls(**item)
 
+class Event:
+    """ Base class for the events of a move (see `CTFUniverse.apply_move`).
+
+    Events are light-weight records. `_to_json_dict` gives the dict
+    which is used in the game state.
+    """
+    __slots__ = ()
+
+    def __init__(self, *args):
+        for name, value in zip(self.__slots__, args):
+            setattr(self, name, value)
+
+    def _to_json_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other):
+        return type(self) == type(other) and all(getattr(self, name) == getattr(other, name)
+                                                 for name in self.__slots__)
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __repr__(self):
+        return "%s(%s)" % (type(self).__name__,
+                           ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__))
+
+class BotMoved(Event):
+    """ The bot `bot_id` has moved from `old_pos` to `new_pos`. """
+    __slots__ = ("bot_id", "old_pos", "new_pos")
+
+class FoodEaten(Event):
+    """ The bot `bot_id` has eaten the food at `food_pos`. """
+    __slots__ = ("bot_id", "food_pos")
+
+class BotDestroyed(Event):
+    """ The bot `bot_id` has been destroyed by the bot `destroyed_by`. """
+    __slots__ = ("bot_id", "destroyed_by")
+
+class EventBuffer:
+    """ Collects the events of one or more moves.
+
+    Attributes
+    ----------
+    bot_moved : list of BotMoved
+    food_eaten : list of FoodEaten
+    bot_destroyed : list of BotDestroyed
+
+    """
+    __slots__ = ("bot_moved", "food_eaten", "bot_destroyed")
+
+    def __init__(self):
+        self.bot_moved = []
+        self.food_eaten = []
+        self.bot_destroyed = []
+
+    def clear(self):
+        """ Removes all events. """
+        self.bot_moved.clear()
+        self.food_eaten.clear()
+        self.bot_destroyed.clear()
+
+    def as_dict(self):
+        """ The events as lists of dicts, as they are given in the game state.
+
+        Returns
+        -------
+        events : dict
+            the lists of the "bot_moved", "food_eaten" and "bot_destroyed" events
+        """
+        return {"bot_moved": [event._to_json_dict() for event in self.bot_moved],
+                "food_eaten": [event._to_json_dict() for event in self.food_eaten],
+                "bot_destroyed": [event._to_json_dict() for event in self.bot_destroyed]}
+
+    def __repr__(self):
+        return "EventBuffer(bot_moved=%r, food_eaten=%r, bot_destroyed=%r)" % (
+            self.bot_moved, self.food_eaten, self.bot_destroyed)
+
+def copy_game_state(game_state):
+    """ Copies a game state and the lists and dicts in it, which the
+    game master changes in place. Their items are not copied.
+
+    Parameters
+    ----------
+    game_state : dict
+        the game state
+
+    Returns
+    -------
+    game_state : dict
+        the copy
+    """
+    return {key: value.copy() if isinstance(value, (list, dict)) else value
+            for key, value in game_state.items()}
+
 Free = ' '
 Wall = '#'
 Food = '.'
@@ -188,8 +298,105 @@ def __init__(self, width, height, data=None):
         elif not all(isinstance(s, bool) for s in data):
             raise TypeError("Maze keyword argument 'data' should be a list of of " +\
                             "bools, not: %r" % data)
+        self._cache = {}
         super(Maze, self).__init__(width, height, data)
 
+    def _set_data(self, new_data):
+        super(Maze, self)._set_data(new_data)
+        self._cache = {}
+        self._shared = False
+
+    def __setitem__(self, index, item):
+        if self._shared:
+            # the walls are shared with a copy (see `copy()`)
+            self._data = list(self._data)
+            self._shared = False
+        super(Maze, self).__setitem__(index, item)
+        self._cache = {}
+
+    def legal_moves_table(self, moves):
+        """ The legal moves for every position in the Maze.
+
+        The table is computed once and cached on the Maze. Any change to the
+        walls (through `__setitem__()` or `_set_data()`) invalidates it.
+
+        Parameters
+        ----------
+        moves : list of tuple of (int, int)
+            all possible moves in the order in which they should be listed
+
+        Returns
+        -------
+        legal_moves_table : dict mapping positions (x, y) to tuple of (move, new_pos)
+            for each position, the moves which lead to a free position in the
+            Maze and the position they lead to
+
+        """
+        moves = tuple(moves)
+        try:
+            return self._cache[("legal_moves", moves)]
+        except KeyError:
+            width, height = self.width, self.height
+            data = self._data
+            table = {}
+            for y in range(height):
+                for x in range(width):
+                    legal = []
+                    for move in moves:
+                        new_x = x + move[0]
+                        new_y = y + move[1]
+                        if (0 <= new_x < width and 0 <= new_y < height
+                                and not data[new_x + new_y * width]):
+                            legal.append((move, (new_x, new_y)))
+                    table[(x, y)] = tuple(legal)
+            self._cache[("legal_moves", moves)] = table
+            return table
+
+    def cached_table(self, key):
+        """ A dict for a table which only depends on the walls.
+
+        The dict can be filled on demand. Like the table of legal moves,
+        it is shared with all copies of the Maze and dropped when the walls
+        change.
+
+        Parameters
+        ----------
+        key : hashable
+            the name of the table
+
+        Returns
+        -------
+        table : dict
+
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            table = self._cache[key] = {}
+            return table
+
+    def copy(self):
+        """ A copy of this Maze.
+
+        The copy shares the walls and the cached tables with this Maze
+        until either of them is changed with `__setitem__()` or
+        `_set_data()`. The changed Maze then gets its own walls and cache
+        and the other one is left untouched.
+
+        Returns
+        -------
+        maze : Maze
+            the copied Maze
+
+        """
+        maze = self.__class__.__new__(self.__class__)
+        maze.width = self.width
+        maze.height = self.height
+        maze._data = self._data
+        maze._cache = self._cache
+        maze._shared = self._shared = True
+        return maze
+
     @property
     def positions(self):
         """ The indices of positions in the Maze.
@@ -251,6 +458,142 @@ def extract_initial_positions(mesh, number_bots):
     return start
 
 
+#: A parsed layout as kept by `LayoutCache`. The maze must not be changed
+#: and is only handed out as a copy.
+ParsedLayout = namedtuple("ParsedLayout", ["maze", "food", "initial_positions"])
+
+def parse_layout(layout_str, number_bots, moves):
+    """ Parses a layout string into the maze, the food and the initial
+    positions of the bots.
+
+    Parameters
+    ----------
+    layout_str : str
+        the string encoding the maze layout
+    number_bots : int
+        the number of bots in the game
+    moves : list of moves
+        the moves for which to build the table of legal moves
+
+    Returns
+    -------
+    parsed : ParsedLayout
+
+    Raises
+    ------
+    UniverseException
+        if the layout width is odd
+    LayoutEncodingException
+        if there is something wrong with the layout_str, see `Layout()`
+
+    """
+    layout = Layout(layout_str, maze_components, number_bots)
+    walls, food, initial_pos = layout.parse(Wall, Food)
+    maze = Maze(layout.shape[0], layout.shape[1], walls)
+    if maze.width % 2 != 0:
+        raise UniverseException(
+            "Width of a layout for CTF must be even, is: %i"
+            % maze.width)
+    # build the table of legal moves once, all later queries
+    # are simple lookups (and copies of the maze share it)
+    maze.legal_moves_table(moves)
+    return ParsedLayout(maze, tuple(food), tuple(initial_pos))
+
+class LayoutCache:
+    """ Keeps the most recently parsed layouts in memory and optionally
+    all parsed layouts on disk.
+
+    Layouts are identified by the SHA1 of the layout string and the
+    number of bots, so that a layout which is read from a file is found
+    as well as a built-in one.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        the number of layouts to keep in memory
+    directory : str, optional
+        a directory to store the parsed layouts in. It may be shared
+        between processes.
+
+    """
+    def __init__(self, maxsize=1024, directory=None):
+        self.maxsize = maxsize
+        self.directory = directory
+        self._parsed = OrderedDict()
+
+    def __len__(self):
+        return len(self._parsed)
+
+    def clear(self):
+        """ Removes all layouts from memory (but not from disk). """
+        self._parsed.clear()
+
+    @staticmethod
+    def key(layout_str, number_bots):
+        """ The key of a layout in the cache. """
+        return "%s-%i" % (hashlib.sha1(layout_str.encode("utf-8")).hexdigest(), number_bots)
+
+    def get(self, layout_str, number_bots, moves):
+        """ Returns the parsed layout, parsing it if it is not yet cached.
+
+        See `parse_layout` for the parameters.
+        """
+        key = self.key(layout_str, number_bots)
+        try:
+            self._parsed.move_to_end(key)
+            return self._parsed[key]
+        except KeyError:
+            pass
+
+        parsed = self._load(key, moves)
+        if parsed is None:
+            parsed = parse_layout(layout_str, number_bots, moves)
+            self._store(key, parsed)
+        self._parsed[key] = parsed
+        if len(self._parsed) > self.maxsize:
+            self._parsed.popitem(last=False)
+        return parsed
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".json")
+
+    def _load(self, key, moves):
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key)) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        maze = Maze(data["width"], data["height"], [c == "#" for c in data["walls"]])
+        maze.legal_moves_table(moves)
+        return ParsedLayout(maze,
+                            tuple(tuple(pos) for pos in data["food"]),
+                            tuple(tuple(pos) for pos in data["initial_positions"]))
+
+    def _store(self, key, parsed):
+        if self.directory is None:
+            return
+        maze = parsed.maze
+        data = {
+            "width": maze.width,
+            "height": maze.height,
+            "walls": "".join("#" if wall else " " for wall in maze._data),
+            "food": parsed.food,
+            "initial_positions": parsed.initial_positions
+        }
+        # other processes must never see a partially written file
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
 class UniverseException(Exception):
     """ Standard error in the Universe. """
     pass
@@ -260,6 +603,101 @@ class IllegalMoveException(Exception):
     """ Raised when a bot attempts to make an illegal move. """
     pass
 
+def _clears_zones(method):
+    # wraps a set method which may change many elements at once
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        result = method(self, *args)
+        self._zones.clear()
+        return result
+    return wrapper
+
+class FoodSet(set):
+    """ The set of food positions which also keeps track of the food
+    inside and outside of zones.
+
+    The food of a zone is collected on the first call to `in_zone` and
+    afterwards updated whenever a single position is added or removed.
+    Changes of many positions at once (e.g. with `update`) reset it.
+
+    Parameters
+    ----------
+    food : iterable of tuple of (int, int), optional
+        the food positions
+
+    """
+    __slots__ = ("_zones",)
+
+    def __init__(self, food=()):
+        super().__init__(food)
+        self._zones = {}
+
+    def __reduce__(self):
+        return (self.__class__, (list(self),))
+
+    def in_zone(self, zone, inside=True):
+        """ The food inside (or outside) of a zone.
+
+        Parameters
+        ----------
+        zone : tuple of int (x_min, x_max)
+            the zone
+        inside : boolean, optional, default = True
+            if False, the food outside of the zone is returned
+
+        Returns
+        -------
+        food : set of tuple of (int, int)
+            the food positions. The set is kept up to date and must
+            not be modified.
+
+        """
+        key = (zone[0], zone[1], inside)
+        try:
+            return self._zones[key]
+        except KeyError:
+            x_min, x_max = zone
+            food = {pos for pos in self if (x_min <= pos[0] <= x_max) == inside}
+            self._zones[key] = food
+            return food
+
+    def copy(self):
+        food = FoodSet(self)
+        food._zones = {key: set(zone_food) for key, zone_food in self._zones.items()}
+        return food
+
+    def add(self, pos):
+        super().add(pos)
+        for (x_min, x_max, inside), zone_food in self._zones.items():
+            if (x_min <= pos[0] <= x_max) == inside:
+                zone_food.add(pos)
+
+    def discard(self, pos):
+        super().discard(pos)
+        for zone_food in self._zones.values():
+            zone_food.discard(pos)
+
+    def remove(self, pos):
+        super().remove(pos)
+        for zone_food in self._zones.values():
+            zone_food.discard(pos)
+
+    def pop(self):
+        pos = super().pop()
+        for zone_food in self._zones.values():
+            zone_food.discard(pos)
+        return pos
+
+    clear = _clears_zones(set.clear)
+    update = _clears_zones(set.update)
+    difference_update = _clears_zones(set.difference_update)
+    intersection_update = _clears_zones(set.intersection_update)
+    symmetric_difference_update = _clears_zones(set.symmetric_difference_update)
+    __ior__ = _clears_zones(set.__ior__)
+    __iand__ = _clears_zones(set.__iand__)
+    __isub__ = _clears_zones(set.__isub__)
+    __ixor__ = _clears_zones(set.__ixor__)
+
 class CTFUniverse:
     """ The Universe: representation of the game state.
 
@@ -299,21 +737,24 @@ def create(cls, layout_str, number_bots):
         LayoutEncodingException
             if there is something wrong with the layout_str, see `Layout()`
 
-        """
-        layout_chars = maze_components
+        Notes
+        -----
+        Parsed layouts are kept in `CTFUniverse.layout_cache` (unless
+        it is None), so that creating another universe from the same
+        layout only copies the maze.
 
+        """
         if number_bots % 2 != 0:
             raise UniverseException(
                 "Number of bots in CTF must be even, is: %i"
                 % number_bots)
-        layout = Layout(layout_str, layout_chars, number_bots)
-        layout_mesh = layout.as_mesh()
-        initial_pos = extract_initial_positions(layout_mesh, number_bots)
-        maze, food = create_maze(layout_mesh)
-        if maze.width % 2 != 0:
-            raise UniverseException(
-                "Width of a layout for CTF must be even, is: %i"
-                % maze.width)
+        if cls.layout_cache is not None:
+            parsed = cls.layout_cache.get(layout_str, number_bots, cls._moves)
+        else:
+            parsed = parse_layout(layout_str, number_bots, cls._moves)
+        maze = parsed.maze.copy()
+        food = parsed.food
+        initial_pos = parsed.initial_positions
 
         homezones = [
             (0, maze.width // 2 - 1),
@@ -334,12 +775,15 @@ def create(cls, layout_str, number_bots):
     #: All possible (but not necessarily legal) moves
     _moves = [north, south, east, west, stop]
 
+    #: The parsed layouts used by `create`. Set to None to always parse.
+    layout_cache = LayoutCache()
+
     #: the number of points to score when killing
     KILLPOINTS = 5
 
     def __init__(self, maze, food, teams, bots):
         self.maze = maze
-        self.food = set(tuple(f) for f in food)
+        self.food = FoodSet(tuple(f) for f in food)
         self.teams = teams
         self.bots = bots
 
@@ -366,6 +810,13 @@ def food_list(self):
         """
         return self.food
 
+    def _food_set(self):
+        # the food is kept in a FoodSet, unless it has been replaced
+        food = self.food
+        if type(food) is not FoodSet:
+            food = self.food = FoodSet(food)
+        return food
+
     def team_food(self, team_index):
         """ Food that is owned by a team
 
@@ -375,8 +826,7 @@ def team_food(self, team_index):
             food owned by team
 
         """
-        return [pos for pos in self.food_list
-                if self.teams[team_index].in_zone(pos)]
+        return list(self._food_set().in_zone(self.teams[team_index].zone))
 
     def enemy_food(self, team_index):
         """ Food that is edible by a team
@@ -387,8 +837,29 @@ def enemy_food(self, team_index):
             food edible by team
 
         """
-        return [pos for pos in self.food_list
-                if not self.teams[team_index].in_zone(pos)]
+        return list(self._food_set().in_zone(self.teams[team_index].zone, inside=False))
+
+    def team_food_count(self, team_index):
+        """ Number of food items that are owned by a team
+
+        Returns
+        -------
+        team_food_count : int
+            number of food items owned by team
+
+        """
+        return len(self._food_set().in_zone(self.teams[team_index].zone))
+
+    def enemy_food_count(self, team_index):
+        """ Number of food items that are edible by a team
+
+        Returns
+        -------
+        enemy_food_count : int
+            number of food items edible by team
+
+        """
+        return len(self._food_set().in_zone(self.teams[team_index].zone, inside=False))
 
     def other_team_bots(self, bot_index):
         """ Obtain other bots on team.
@@ -500,38 +971,59 @@ def move_bot(self, bot_id, move):
         Returns
         -------
         game_state : dict
-            the current game_state
+            the events of the move (see `EventBuffer.as_dict`)
 
         Raises
         ------
         IllegalMoveException
             if the move is invalid or impossible
 
+        See Also
+        --------
+        apply_move
+
         """
-        # check legality of the move
+        events = EventBuffer()
+        self.apply_move(bot_id, move, events)
+        return events.as_dict()
+
+    def apply_move(self, bot_id, move, events):
+        """ Move a bot in certain direction and record what happens.
+
+        Parameters
+        ----------
+        bot_id : int
+            index of the bot
+        move : tuple of (int, int)
+            direction to move in
+        events : EventBuffer
+            the buffer to which the events of the move are appended
 
-        game_state = {}
+        Raises
+        ------
+        IllegalMoveException
+            if the move is invalid or impossible
 
+        """
+        # check legality of the move
         bot = self.bots[bot_id]
         legal_moves_dict = self.legal_moves(bot.current_pos)
-        if move not in legal_moves_dict.keys():
+        if move not in legal_moves_dict:
             raise IllegalMoveException(
                 'Illegal move from bot_id %r: %s' % (bot_id, move))
         old_pos = bot.current_pos
         new_pos = bot.current_pos = legal_moves_dict[move]
 
-        game_state["bot_moved"] = [{"bot_id": bot_id, "old_pos": old_pos, "new_pos": new_pos}]
+        events.bot_moved.append(BotMoved(bot_id, old_pos, new_pos))
 
-        team = self.teams[bot.team_index]
         # check for food being eaten
-        game_state["food_eaten"] = []
-        if bot.current_pos in self.food_list and not bot.in_own_zone:
-            self.food.remove(bot.current_pos)
-
-            game_state["food_eaten"] += [{"food_pos": bot.current_pos, "bot_id": bot_id}]
+        food_eaten = new_pos in self.food and not bot.in_own_zone
+        if food_eaten:
+            self.food.remove(new_pos)
+            events.food_eaten.append(FoodEaten(bot_id, new_pos))
 
         # check for destruction
-        game_state["bot_destroyed"] = []
+        destroyed = []
         for enemy in self.enemy_bots(bot.team_index):
             if enemy.current_pos == bot.current_pos:
                 if enemy.is_destroyer and bot.is_harvester:
@@ -544,29 +1036,24 @@ def move_bot(self, bot_id, move):
                     continue
 
                 # move on, if harvester is already destroyed
-                if any(bot_destr["bot_id"]==harvester for bot_destr in game_state["bot_destroyed"]):
+                if any(event.bot_id == harvester for event in destroyed):
                     continue
 
                 # otherwise mark for destruction
-                game_state["bot_destroyed"] += [{'bot_id': harvester, 'destroyed_by': destroyer}]
+                destroyed.append(BotDestroyed(harvester, destroyer))
 
         # reset bots
-        for destroyed in game_state["bot_destroyed"]:
+        for event in destroyed:
             old_pos = bot.current_pos
-            self.bots[destroyed["bot_id"]]._to_initial()
-            new_pos = bot.current_pos
-            game_state["bot_moved"] += [{"bot_id": bot_id, "old_pos": old_pos, "new_pos": new_pos}]
-
-        for food_eaten in game_state["food_eaten"]:
-            self.teams[self.bots[food_eaten["bot_id"]].team_index].score += 1
+            self.bots[event.bot_id]._to_initial()
+            events.bot_moved.append(BotMoved(bot_id, old_pos, bot.current_pos))
+        events.bot_destroyed.extend(destroyed)
 
-        for bot_destroyed in game_state["bot_destroyed"]:
-            self.teams[self.bots[bot_destroyed["destroyed_by"]].team_index].score += self.KILLPOINTS
+        if food_eaten:
+            self.teams[bot.team_index].score += 1
 
-        return game_state
-
-        # TODO:
-        # check for state change
+        for event in destroyed:
+            self.teams[self.bots[event.destroyed_by].team_index].score += self.KILLPOINTS
 
     def legal_moves(self, position):
         """ Obtain legal moves and where they lead.
@@ -582,6 +1069,13 @@ def legal_moves(self, position):
             the legal moves and where they would lead.
 
         """
+        try:
+            return dict(self.maze.legal_moves_table(self._moves)[position])
+        except KeyError:
+            # The position is not inside the maze. Only moves which lead
+            # back into the maze may be legal.
+            pass
+
         legal_moves_dict = {}
         for move, new_pos in self.neighbourhood(position).items():
             try:
@@ -641,7 +1135,44 @@ def __str__(self):
         return str(self._char_mesh)
 
     def copy(self):
-        return self._from_json_dict(self._to_json_dict())
+        """ A copy of this universe.
+
+        The copy shares no mutable state with the original.
+
+        Returns
+        -------
+        universe : CTFUniverse
+            the copied universe
+
+        See Also
+        --------
+        snapshot
+        """
+        return self.__class__(maze=self.maze.copy(),
+                              food=self.food,
+                              teams=[team.copy() for team in self.teams],
+                              bots=[bot.copy() for bot in self.bots])
+
+    def snapshot(self):
+        """ A cheap copy of this universe.
+
+        The food, the teams and the bots are copied. The maze of the
+        snapshot is a copy which shares the walls with the maze of this
+        universe until either of them is changed (see `Maze.copy`), so
+        changing the walls of the snapshot does not change this universe.
+
+        Returns
+        -------
+        universe : CTFUniverse
+            the snapshot of this universe
+
+        """
+        snapshot = self.__class__.__new__(self.__class__)
+        snapshot.maze = self.maze.copy()
+        snapshot.food = self.food.copy()
+        snapshot.teams = [team.copy() for team in self.teams]
+        snapshot.bots = [bot.copy() for bot in self.bots]
+        return snapshot
 
     @property
     def compact_str(self):
@@ -716,7 +1247,36 @@ def reachable(self, initial_positions):
         adjacency_list : generator of (pos, list(pos))
             Generator which contains all reachable positions and their adjacencies
         """
-        return (it for it in iter_adjacencies(initial_positions, lambda pos: self.legal_moves(pos).values()))
+        table = self.maze.legal_moves_table(self._moves)
+        def adjacencies(pos):
+            try:
+                return [new_pos for move, new_pos in table[pos]]
+            except KeyError:
+                return list(self.legal_moves(pos).values())
+        return (it for it in iter_adjacencies(initial_positions, adjacencies))
+
+    @property
+    def distance_table(self):
+        """ The shortest maze distances between all free positions.
+
+        The table is computed once per maze (see `graph.get_distance_table`)
+        and afterwards distance and path queries are lookups.
+
+        Returns
+        -------
+        distance_table : DistanceTable
+            the distance table of the free positions
+
+        """
+        # The maze only keeps a weak reference, so that the memory is
+        # bounded by the cache of get_distance_table and not by the
+        # number of mazes.
+        table_ref = self.maze._cache.get("distance_table")
+        table = table_ref() if table_ref is not None else None
+        if table is None:
+            table = get_distance_table(AdjacencyList(self.free_positions()))
+            self.maze._cache["distance_table"] = weakref.ref(table)
+        return table
 
     def free_positions(self):
         """ Returns an adjacency list for all Free positions.
@@ -726,12 +1286,11 @@ def free_positions(self):
         adjacency_list : generator of (pos, list(pos))
             Generator which contains all reachable positions and their adjacencies
         """
-        # Get the list of all free positions.
-        free_pos = [pos for pos, val in self.maze.items() if not val]
-
-        # Here we use a generator on a dictionary to create the adjacency list.
-        # However, for Python 3, we force evaluation on the legal_moves.values
-        return ((pos, list(self.legal_moves(pos).values())) for pos in free_pos)
+        # The table holds the legal moves of all positions in row-based order.
+        table = self.maze.legal_moves_table(self._moves)
+        maze = self.maze
+        return ((pos, [new_pos for move, new_pos in moves])
+                for pos, moves in table.items() if not maze[pos])
 
 
     def _to_json_dict(self):
@@ -746,3 +1305,150 @@ def _from_json_dict(cls, item):
                    food=item["food"],
                    teams=[Team._from_json_dict(team) for team in item["teams"]],
                    bots=[Bot._from_json_dict(bot) for bot in item["bots"]])
+
+    # Layout of the binary representation (little-endian):
+    # header, the maze (one byte per cell), food positions, teams, bots.
+    _bytes_header = struct.Struct("<HHHHH")
+    _bytes_team = struct.Struct("<Hhhi")
+    _bytes_bot = struct.Struct("<HhhHhhhh?")
+
+    def _to_bytes(self):
+        """ A compact binary representation of the universe.
+
+        Much faster to create and to read (with `_from_bytes`) than the
+        JSON representation.
+        """
+        maze = self.maze
+        food_coords = [coord for pos in self.food for coord in pos]
+        parts = [
+            self._bytes_header.pack(maze.width, maze.height,
+                                    len(self.food), len(self.teams), len(self.bots)),
+            bytes(maze._data),
+            struct.pack("<%dH" % len(food_coords), *food_coords)
+        ]
+        parts.extend(self._bytes_team.pack(team.index, team.zone[0], team.zone[1], team.score)
+                     for team in self.teams)
+        parts.extend(self._bytes_bot.pack(bot.index,
+                                          bot.initial_pos[0], bot.initial_pos[1],
+                                          bot.team_index,
+                                          bot.homezone[0], bot.homezone[1],
+                                          bot.current_pos[0], bot.current_pos[1],
+                                          bot.noisy)
+                     for bot in self.bots)
+        return b"".join(parts)
+
+    @classmethod
+    def _from_bytes(cls, data, maze_cache=None):
+        """ Creates a universe from the output of `_to_bytes`.
+
+        Parameters
+        ----------
+        data : bytes
+            the binary representation
+        maze_cache : dict, optional
+            if given, a maze with the same walls as a maze in the cache
+            is copied from there (see `Maze.copy`); new mazes are added
+
+        Returns
+        -------
+        universe : CTFUniverse
+        """
+        width, height, num_food, num_teams, num_bots = cls._bytes_header.unpack_from(data)
+        offset = cls._bytes_header.size
+
+        maze_data = bytes(data[offset:offset + width * height])
+        offset += width * height
+        maze = maze_cache.get((width, height, maze_data)) if maze_cache is not None else None
+        if maze is None:
+            maze = Maze(width, height, data=list(map(bool, maze_data)))
+            if maze_cache is not None:
+                maze_cache[(width, height, maze_data)] = maze
+        if maze_cache is not None:
+            # the cached maze itself is never handed out
+            maze = maze.copy()
+
+        food_coords = iter(struct.unpack_from("<%dH" % (2 * num_food), data, offset))
+        food = zip(food_coords, food_coords)
+        offset += 4 * num_food
+
+        teams = []
+        for _ in range(num_teams):
+            index, zone_min, zone_max, score = cls._bytes_team.unpack_from(data, offset)
+            offset += cls._bytes_team.size
+            teams.append(Team(index, (zone_min, zone_max), score))
+
+        bots = []
+        for _ in range(num_bots):
+            (index, initial_x, initial_y, team_index, home_min, home_max,
+             current_x, current_y, noisy) = cls._bytes_bot.unpack_from(data, offset)
+            offset += cls._bytes_bot.size
+            bots.append(Bot(index, (initial_x, initial_y), team_index, (home_min, home_max),
+                            current_pos=(current_x, current_y), noisy=noisy))
+
+        return cls(maze, food, teams, bots)
+
+
+class NoisyUniverse(CTFUniverse):
+    """ A view of a universe in which some bots have noisy positions.
+
+    The noisy universe shares the maze, the food and the teams with the
+    universe it is created from and only stores the noisy positions. Its
+    bots are copied from the exact bots when they are first accessed, e.g.
+    when the universe is sent to a remote player. `snapshot` creates a
+    plain `CTFUniverse` directly.
+
+    As the food and the teams are shared, a noisy universe is only valid
+    for the current turn. Use `snapshot` to keep it.
+
+    Parameters
+    ----------
+    universe : CTFUniverse
+        the universe with the exact positions
+    noisy_positions : dict
+        the noisy position for the index of each noisy bot
+
+    """
+    def __init__(self, universe, noisy_positions):
+        self.maze = universe.maze
+        self.food = universe.food
+        self.teams = universe.teams
+        self.noisy_positions = noisy_positions
+        self._exact_bots = universe.bots
+        self._bots = None
+
+    @property
+    def bots(self):
+        if self._bots is None:
+            self._bots = self._noisy_bots()
+        return self._bots
+
+    def _noisy_bots(self):
+        noisy_positions = self.noisy_positions
+        bots = [bot.copy() for bot in self._exact_bots]
+        for bot in bots:
+            if bot.index in noisy_positions:
+                bot.current_pos = noisy_positions[bot.index]
+                bot.noisy = True
+        return bots
+
+    def __repr__(self):
+        return ("NoisyUniverse(%r, %r, %r, %r)" %
+            (self.maze, self.food, self.teams, self.bots))
+
+    def __eq__(self, other):
+        # compares equal to the CTFUniverse with the same state
+        return self.snapshot() == other
+
+    def copy(self):
+        return self.snapshot().copy()
+
+    def snapshot(self):
+        snapshot = CTFUniverse.__new__(CTFUniverse)
+        snapshot.maze = self.maze.copy()
+        snapshot.food = self.food.copy()
+        snapshot.teams = [team.copy() for team in self.teams]
+        if self._bots is None:
+            snapshot.bots = self._noisy_bots()
+        else:
+            snapshot.bots = [bot.copy() for bot in self._bots]
+        return snapshot
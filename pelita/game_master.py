@@ -6,8 +6,8 @@
 import time
 
 from . import datamodel
-from .datamodel import Bot, CTFUniverse
-from .graph import AdjacencyList, NoPathException, manhattan_dist
+from .datamodel import EventBuffer, NoisyUniverse
+from .graph import NoPathException
 
 
 class GameFinished(Exception):
@@ -81,7 +81,14 @@ def __init__(self, layout, teams, number_bots, game_time, noise=True, noiser=Non
         #: The pointer to the current iteration.
         self._step_iter = None
 
+        #: The events of the current step. They are only converted
+        #: to the lists in the game state for the viewers.
+        self.events = EventBuffer()
+
         self.game_state = {
+            #: The following three lists are only filled in when a viewer
+            #: needs them. The GameMaster itself uses `events`.
+
             #: holds a list of bot movements for this step
             #: [{"bot_id": bot_id, "old_pos": old_pos, "new_pos": new_pos}]
             "bot_moved": [],
@@ -137,7 +144,7 @@ def __init__(self, layout, teams, number_bots, game_time, noise=True, noiser=Non
             "food_count": [0] * len(self.universe.teams),
 
             #: [food_to_eat_team_0, food_to_eat_team_1]
-            "food_to_eat": [len(self.universe.enemy_food(team.index)) for team in self.universe.teams],
+            "food_to_eat": [self.universe.enemy_food_count(team.index) for team in self.universe.teams],
 
             #: time until timeout
             "timeout_length": timeout_length,
@@ -174,11 +181,16 @@ def register_viewer(self, viewer):
         viewer : subclass of AbstractViewer
 
         """
+        if not getattr(viewer, "needs_event_dicts", True):
+            viewer.events = self.events
         self.viewers.append(viewer)
 
     def update_viewers(self):
         """ Call the 'observe' method on all registered viewers.
         """
+        # the lists of dicts are only built for the viewers which need them
+        if any(getattr(viewer, "needs_event_dicts", True) for viewer in self.viewers):
+            self.game_state.update(self.events.as_dict())
         for viewer in self.viewers:
             viewer.observe(self.universe,
                            self.game_state)
@@ -297,6 +309,7 @@ def _play_bot(self, bot):
         self.game_state["bot_moved"] = []
         self.game_state["food_eaten"] = []
         self.game_state["bot_destroyed"] = []
+        self.events.clear()
         self.game_state["bot_timeout"] = None
         self.game_state["bot_error"] = {}
 
@@ -324,9 +337,7 @@ def _play_bot(self, bot):
             team_time_needed = team_time_end - team_time_begin
             self.game_state["team_time"][bot.team_index] += team_time_needed
 
-            move_state = self.universe.move_bot(bot.index, move)
-            for k, v in move_state.items():
-                self.game_state[k] += v
+            self.universe.apply_move(bot.index, move, self.events)
 
         except (datamodel.IllegalMoveException, PlayerTimeout):
             # after max_timeouts timeouts, you lose
@@ -340,19 +351,17 @@ def _play_bot(self, bot):
                 moves = list(self.universe.legal_moves_or_stop(bot.current_pos).keys())
 
                 move = self.rnd.choice(moves)
-                move_state = self.universe.move_bot(bot.index, move)
-                for k, v in move_state.items():
-                    self.game_state[k] += v
+                self.universe.apply_move(bot.index, move, self.events)
 
         except PlayerDisconnected:
             self.game_state["teams_disqualified"][bot.team_index] = "disconnected"
 
-        for food_eaten in self.game_state["food_eaten"]:
-            team_id = self.universe.bots[food_eaten["bot_id"]].team_index
+        for food_eaten in self.events.food_eaten:
+            team_id = self.universe.bots[food_eaten.bot_id].team_index
             self.game_state["food_count"][team_id] += 1
 
-        for destroyed in self.game_state["bot_destroyed"]:
-            self.game_state["times_killed"][self.universe.bots[destroyed["bot_id"]].team_index] += 1
+        for destroyed in self.events.bot_destroyed:
+            self.game_state["times_killed"][self.universe.bots[destroyed.bot_id].team_index] += 1
 
 
     def prepare_next_round(self):
@@ -411,7 +420,8 @@ class UniverseNoiser(metaclass=abc.ABCMeta):
     of noise. Noise will only be applied if the enemy bot is with a certain
     threshold (`sight_distance`).
 
-    Derived classes will need to implement distance and the altered_pos methods
+    Derived classes will need to implement the distance and the
+    noise_candidates methods
 
     Methods
     -------
@@ -421,6 +431,9 @@ class UniverseNoiser(metaclass=abc.ABCMeta):
         is measured in the space relevant to the particular algorithm implemented
         in the subclass, e.g. maze distance, manhattan distance, euclidean distance...
 
+    noise_candidates(universe, bot_pos):
+        return the positions to which an enemy bot at `bot_pos` may be moved.
+
     altered_pos(bot_pos):
         return the noised new position of an enemy bot.
 
@@ -438,7 +451,6 @@ class UniverseNoiser(metaclass=abc.ABCMeta):
     """
 
     def __init__(self, universe, noise_radius=5, sight_distance=5, seed=None):
-        self.adjacency = AdjacencyList(universe.free_positions())
         self.noise_radius = noise_radius
         self.sight_distance = sight_distance
         self.rnd = random.Random(seed)
@@ -450,8 +462,9 @@ def uniform_noise(self, universe, bot_index):
         adds uniform noise in maze space to the enemy positions. If a position
         is noisy or not is indicated by the `noisy` attribute in the Bot class.
 
-        The method will modify the reference, therefore it is important to use a
-        copy of the universe as an argument.
+        The universe itself is not modified. The result is a `NoisyUniverse`
+        which shares the maze, the food and the teams with it and is only
+        valid until the universe changes.
 
         Parameters
         ----------
@@ -462,30 +475,23 @@ def uniform_noise(self, universe, bot_index):
 
         Returns
         -------
-        noisy_universe : CTFUniverse
+        noisy_universe : NoisyUniverse
             universe with noisy enemy positions
 
         """
-        # Prepare a copy of the universe with all bots cloned so that their position
-        # can be changed without altering the original universe.
-        universe_copy = CTFUniverse(maze=universe.maze,
-                                    food=universe.food,
-                                    teams=universe.teams,
-                                    bots=[Bot._from_json_dict(bot._to_json_dict()) for bot in universe.bots])
-        self.universe = universe_copy
-        current_bot = universe_copy.bots[bot_index]
-        enemy_bots = universe_copy.enemy_bots(current_bot.team_index)
-        for b in enemy_bots:
+        self.universe = universe
+        current_bot = universe.bots[bot_index]
+        noisy_positions = {}
+        for b in universe.enemy_bots(current_bot.team_index):
             # Check that the distance between this bot and the enemy is larger
             # than `sight_distance`.
             distance = self.distance(current_bot, b)
 
             if distance is None or distance > self.sight_distance:
                 # If so then alter the position of the enemy
-                b.current_pos = self.altered_pos(b.current_pos)
-                b.noisy = True
+                noisy_positions[b.index] = self.altered_pos(b.current_pos)
 
-        return universe_copy
+        return NoisyUniverse(universe, noisy_positions)
 
     @abc.abstractmethod
     def distance(self, bot, other_bot):
@@ -493,36 +499,117 @@ def distance(self, bot, other_bot):
         """
 
     @abc.abstractmethod
+    def noise_candidates(self, universe, bot_pos):
+        """ Method to return the positions to which a bot may be moved.
+        """
+
     def altered_pos(self, bot_pos):
         """ Method to return a new position for a bot.
         """
+        candidates = self.noise_candidates(self.universe, bot_pos)
+        if not candidates:
+            # no valid position has been found
+            return bot_pos
+        return self.rnd.choice(candidates)
 
 class ManhattanNoiser(UniverseNoiser):
     """Noiser in Manhattan space.
 
     It uses Manhattan distance. A bot distance of 1 in Manhattan space
-    could still be much further away in maze distance."""
+    could still be much further away in maze distance.
+
+    The free positions within the noise radius are computed once for each
+    position and kept with the maze (see `Maze.cached_table`), so that
+    all games on the same layout share them."""
 
     def distance(self, bot, other_bot):
-        return manhattan_dist(bot.current_pos, other_bot.current_pos)
+        (x1, y1), (x2, y2) = bot.current_pos, other_bot.current_pos
+        return abs(x1 - x2) + abs(y1 - y2)
 
-    def altered_pos(self, bot_pos):
-        # get a list of possible positions
+    def noise_candidates(self, universe, bot_pos):
+        """ The free positions to which a bot at `bot_pos` may be moved.
+
+        Parameters
+        ----------
+        universe : CTFUniverse
+            the universe
+        bot_pos : tuple of (int, int)
+            the position of the bot
+
+        Returns
+        -------
+        candidates : tuple of positions
+            the free positions within the noise radius
+
+        """
+        maze = universe.maze
+        table = maze.cached_table(("manhattan_noise", self.noise_radius))
+        try:
+            return table[bot_pos]
+        except KeyError:
+            pass
         noise_radius = self.noise_radius
-        x_min, x_max = bot_pos[0] - noise_radius, bot_pos[0] + noise_radius
-        y_min, y_max = bot_pos[1] - noise_radius, bot_pos[1] + noise_radius
-        possible_positions = [(i,j) for i in range(x_min, x_max)
-                                    for j in range(y_min, y_max)
-                              if manhattan_dist((i,j), bot_pos) <= noise_radius]
-
-        # shuffle the list of positions
-        self.rnd.shuffle(possible_positions)
-        for pos in possible_positions:
-            try:
-                # check that the bot can really fit in here
-                if not self.universe.maze[pos]:
-                    return pos
-            except KeyError:
-                pass
-        # if we land here, no valid position has been found
-        return bot_pos
+        x, y = bot_pos
+        width, height = maze.width, maze.height
+        walls = maze._data
+        x_min, x_max = max(x - noise_radius, 0), min(x + noise_radius, width)
+        y_min, y_max = max(y - noise_radius, 0), min(y + noise_radius, height)
+        candidates = tuple((i, j) for i in range(x_min, x_max)
+                                  for j in range(y_min, y_max)
+                           if abs(i - x) + abs(j - y) <= noise_radius
+                              and not walls[i + j * width])
+        table[bot_pos] = candidates
+        return candidates
+
+
+class MazeDistanceNoiser(UniverseNoiser):
+    """Noiser in maze space.
+
+    Both the sight check and the noise use the maze distance. An enemy
+    is moved to a random free position which can be reached within
+    `noise_radius` steps.
+
+    The distances come from the distance table of the layout (see
+    `CTFUniverse.distance_table`), which is computed once and shared by
+    all games on the same layout. The noise candidates of a position
+    are taken from it on first use and kept with the maze."""
+
+    def distance(self, bot, other_bot):
+        try:
+            return self.universe.distance_table.distance(bot.current_pos, other_bot.current_pos)
+        except NoPathException:
+            return None
+
+    def noise_candidates(self, universe, bot_pos):
+        """ The free positions to which a bot at `bot_pos` may be moved.
+
+        Parameters
+        ----------
+        universe : CTFUniverse
+            the universe
+        bot_pos : tuple of (int, int)
+            the position of the bot
+
+        Returns
+        -------
+        candidates : tuple of positions
+            the positions within `noise_radius` steps (including `bot_pos`)
+
+        """
+        table = universe.maze.cached_table(("maze_noise", self.noise_radius))
+        try:
+            return table[bot_pos]
+        except KeyError:
+            pass
+        distance_table = universe.distance_table
+        try:
+            start = distance_table.index[bot_pos] * len(distance_table.positions)
+        except KeyError:
+            candidates = ()
+        else:
+            noise_radius = self.noise_radius
+            distances = distance_table.distances[start:start + len(distance_table.positions)]
+            candidates = tuple(pos for pos, distance in zip(distance_table.positions, distances)
+                               if 0 <= distance <= noise_radius)
+        table[bot_pos] = candidates
+        return candidates
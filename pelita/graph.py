@@ -1,7 +1,11 @@
 """ Basic graph module """
 
+import array
+import hashlib
 import heapq
-from collections import deque
+import os
+import sys
+from collections import deque, OrderedDict
 
 
 class NoPathException(Exception):
@@ -96,18 +100,283 @@ def iter_adjacencies(initial, adjacencies_for_pos):
         reached.add(pos)
         yield (pos, legal_moves)
 
+class DistanceTable:
+    """ All-pairs shortest distances and next hops in a graph.
+
+    The table is computed with one breadth first search per position and
+    stored in two flat arrays of size n × n, where n is the number of
+    positions. Afterwards, distance and path queries are lookups.
+
+    Usually, you do not create the table directly but use
+    `get_distance_table()`, which caches the tables in memory and,
+    optionally, on disk.
+
+    Parameters
+    ----------
+    positions : list of tuple of (int, int)
+        the positions in the graph
+    distances : array of int
+        the flattened n × n matrix of distances, -1 if there is no path
+    next_hops : array of int
+        the flattened n × n matrix of the index of the first position
+        on the way from one position to another, -1 if there is no path
+
+    """
+    def __init__(self, positions, distances, next_hops):
+        self.positions = positions
+        self.index = {pos: idx for idx, pos in enumerate(positions)}
+        self.distances = distances
+        self.next_hops = next_hops
+
+    @classmethod
+    def from_adjacency(cls, adjacency):
+        """ Compute the table for an adjacency list.
+
+        Parameters
+        ----------
+        adjacency : dict of position to list of positions
+            the graph, e.g. an `AdjacencyList`
+
+        Returns
+        -------
+        distance_table : DistanceTable
+
+        """
+        positions = sorted(adjacency.keys())
+        index = {pos: idx for idx, pos in enumerate(positions)}
+        num = len(positions)
+        neighbours = [[index[other] for other in adjacency[pos] if other != pos and other in index]
+                      for pos in positions]
+
+        typecode = _array_typecode(num)
+        distances = array.array(typecode, [-1]) * (num * num)
+        next_hops = array.array(typecode, [-1]) * (num * num)
+
+        for source in range(num):
+            offset = source * num
+            distances[offset + source] = 0
+            next_hops[offset + source] = source
+            # the first hop of every position is inherited from
+            # the position which discovered it
+            frontier = []
+            for node in neighbours[source]:
+                if distances[offset + node] < 0:
+                    distances[offset + node] = 1
+                    next_hops[offset + node] = node
+                    frontier.append(node)
+            distance = 1
+            while frontier:
+                distance += 1
+                next_frontier = []
+                for node in frontier:
+                    hop = next_hops[offset + node]
+                    for other in neighbours[node]:
+                        if distances[offset + other] < 0:
+                            distances[offset + other] = distance
+                            next_hops[offset + other] = hop
+                            next_frontier.append(other)
+                frontier = next_frontier
+
+        return cls(positions, distances, next_hops)
+
+    def _lookup(self, initial, target):
+        try:
+            pos = self.index[initial] * len(self.positions) + self.index[target]
+        except KeyError as e:
+            raise NoPathException("Position %r does not exist in distance table." % e.args)
+        if self.distances[pos] < 0:
+            raise NoPathException("No path from %r to %r." % (initial, target))
+        return pos
+
+    def distance(self, initial, target):
+        """ The length of the shortest path between two positions.
+
+        Raises
+        ------
+        NoPathException
+            if there is no path or if a position does not exist
+
+        """
+        return self.distances[self._lookup(initial, target)]
+
+    def next_step(self, initial, target):
+        """ The first position on a shortest path from `initial` to `target`.
+
+        If `initial` equals `target`, this is `initial`.
+
+        Raises
+        ------
+        NoPathException
+            if there is no path or if a position does not exist
+
+        """
+        return self.positions[self.next_hops[self._lookup(initial, target)]]
+
+    def path(self, initial, target):
+        """ A shortest path from `initial` to `target`.
+
+        The path has the same format as the one returned by
+        `AdjacencyList.a_star`: it starts with `target`, ends with
+        the position next to `initial` and does not include `initial`.
+
+        Raises
+        ------
+        NoPathException
+            if there is no path or if a position does not exist
+
+        """
+        self._lookup(initial, target)
+        path = []
+        current = initial
+        while current != target:
+            current = self.next_step(current, target)
+            path.append(current)
+        path.reverse()
+        return path
+
+    def save(self, filename):
+        """ Save the table in a binary file. """
+        header = array.array('i', [len(self.positions), ord(self.distances.typecode)])
+        coords = array.array('i', [coord for pos in self.positions for coord in pos])
+        with open(filename, 'wb') as f:
+            header.tofile(f)
+            coords.tofile(f)
+            self.distances.tofile(f)
+            self.next_hops.tofile(f)
+
+    @classmethod
+    def load(cls, filename):
+        """ Load a table which has been saved with `save()`. """
+        with open(filename, 'rb') as f:
+            header = array.array('i')
+            header.fromfile(f, 2)
+            num, typecode = header[0], chr(header[1])
+            coords = array.array('i')
+            coords.fromfile(f, 2 * num)
+            distances = array.array(typecode)
+            distances.fromfile(f, num * num)
+            next_hops = array.array(typecode)
+            next_hops.fromfile(f, num * num)
+        positions = list(zip(coords[::2], coords[1::2]))
+        return cls(positions, distances, next_hops)
+
+    def __repr__(self):
+        return "DistanceTable(<%i positions>)" % len(self.positions)
+
+def _array_typecode(num):
+    return 'h' if num < 2**15 else 'i'
+
+#: The number of tables which `get_distance_table()` keeps in memory.
+DISTANCE_TABLE_CACHE_SIZE = 8
+
+#: The in-memory cache of `get_distance_table()`, least recently used first.
+_distance_tables = OrderedDict()
+
+def default_cache_dir():
+    """ The directory in which computed tables are stored.
+
+    This is `$PELITA_CACHE_DIR`, or None if it is not set. In that case,
+    the tables are not stored on disk.
+    """
+    return os.environ.get("PELITA_CACHE_DIR") or None
+
+def adjacency_hash(adjacency):
+    """ A hash which identifies an adjacency list, independent of its order. """
+    items = sorted((pos, sorted(adjacent)) for pos, adjacent in adjacency.items())
+    return hashlib.sha1(repr(items).encode()).hexdigest()
+
+def get_distance_table(adjacency, cache_dir=None):
+    """ The `DistanceTable` for an adjacency list.
+
+    The last `DISTANCE_TABLE_CACHE_SIZE` tables are kept in memory. If a
+    cache directory is given (or set in `$PELITA_CACHE_DIR`), the tables
+    are also stored in and loaded from there, so that later processes can
+    reuse them. The directory is not cleaned up.
+
+    Parameters
+    ----------
+    adjacency : dict of position to list of positions
+        the graph
+    cache_dir : str, optional
+        the directory for the cached tables, see `default_cache_dir()`
+
+    Returns
+    -------
+    distance_table : DistanceTable
+
+    """
+    key = adjacency_hash(adjacency)
+    try:
+        table = _distance_tables[key]
+    except KeyError:
+        pass
+    else:
+        _distance_tables.move_to_end(key)
+        return table
+
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+
+    table = None
+    filename = None
+    if cache_dir is not None:
+        filename = os.path.join(cache_dir, "distances-%s-%s.bin" % (key, sys.byteorder))
+        try:
+            table = DistanceTable.load(filename)
+        except (OSError, EOFError, ValueError):
+            table = None
+
+    if table is None:
+        table = DistanceTable.from_adjacency(adjacency)
+        if filename:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                # write to a temporary file first so that
+                # concurrent processes never see half a table
+                tmp_filename = "%s.%i.tmp" % (filename, os.getpid())
+                table.save(tmp_filename)
+                os.replace(tmp_filename, filename)
+            except OSError:
+                # the cache is optional
+                pass
+
+    _distance_tables[key] = table
+    while len(_distance_tables) > DISTANCE_TABLE_CACHE_SIZE:
+        _distance_tables.popitem(last=False)
+    return table
+
 class AdjacencyList(dict):
     """ Adjacency list [1] representation of a Maze.
 
     The `AdjacencyList` is mostly a wrapper for a `dict`. Given a position,
     it returns the positions reachable from there.
 
+    For repeated queries, `distance_table` holds all shortest distances and
+    paths of the graph.
+
     [1] http://en.wikipedia.org/wiki/Adjacency_list
 
     """
     def __init__(self, adjacencies):
         self.update(adjacencies)
 
+    @property
+    def distance_table(self):
+        """ The `DistanceTable` of this graph.
+
+        It is computed (or loaded from the cache) on first access. Changing
+        the adjacency list afterwards does not update the table.
+
+        Returns
+        -------
+        distance_table : DistanceTable
+        """
+        try:
+            return self._distance_table
+        except AttributeError:
+            self._distance_table = get_distance_table(self)
+            return self._distance_table
+
     def pos_within(self, position, distance):
         """ Positions within a certain distance.
 
@@ -152,6 +421,20 @@ def _check_pos_exist(self, positions):
                 raise NoPathException("Position %s does not exist in adjacency list." %
                         repr(pos))
 
+    @staticmethod
+    def _backtrack(parents, target):
+        """ Follow the `parents` map from `target` back to the start.
+
+        Returns the path from `target` to the position next to the start,
+        without the start itself.
+        """
+        path = []
+        current = target
+        while parents[current] is not None:
+            path.append(current)
+            current = parents[current]
+        return path
+
     def bfs(self, initial, targets):
         """ Breadth first search (bfs).
 
@@ -181,50 +464,30 @@ def bfs(self, initial, targets):
         [1] http://en.wikipedia.org/wiki/Breadth-first_search
 
         """
+        targets = list(targets)
         # First check that the arguments were valid.
         self._check_pos_exist([initial] + targets)
+        # A set makes the membership test in the loop O(1).
+        targets = set(targets)
         # Initialise `to_visit` of type `deque` with current position.
         # We use a `deque` since we need to extend to the right
         # but pop from the left, i.e. its a fifo queue.
         to_visit = deque([initial])
-        # `seen` is a list of nodes we have seen already
-        # We append to right and later pop from right, so a list will do.
-        # Order is important for the back-track later on, so don't use a set.
-        seen = []
-        found = False
+        # `parents` maps every position we have seen to the position
+        # we reached it from. It is used for the back-tracking.
+        parents = {initial: None}
         while to_visit:
             current = to_visit.popleft()
-            if current in seen:
-                # This node has been seen, ignore it.
-                continue
-            elif current in targets:
-                # We found some food, break and back-track path.
-                found = True
-                break
-            else:
-                # Otherwise keep going, i.e. add adjacent nodes to seen list.
-                seen.append(current)
-                to_visit.extend(self[current])
+            if current in targets:
+                # We found some food, back-track the path.
+                return self._backtrack(parents, current)
+            for pos in self[current]:
+                if pos not in parents:
+                    parents[pos] = current
+                    to_visit.append(pos)
         # if we did not find any of the targets, raise an Exception
-        if not found:
-            raise NoPathException("BFS: No path from %r to %r."
-                    % (initial, targets))
-        # Now back-track using seen to determine how we got here.
-        # Initialise the path with current node, i.e. position of food.
-        path = [current]
-        while seen:
-            # Pop the latest node in seen
-            next_ = seen.pop()
-            # If that's adjacent to the current node
-            # it's in the path
-            if next_ in self[current]:
-                # So add it to the path
-                path.append(next_)
-                # And continue back-tracking from there
-                current = next_
-        # The last element is the current position, we don't need that in our
-        # path, so don't include it.
-        return path[:-1]
+        raise NoPathException("BFS: No path from %r to %r."
+                % (initial, targets))
 
     def a_star(self, initial, target):
         """ A* search.
@@ -257,44 +520,27 @@ def a_star(self, initial, target):
         """
         # First check that the arguments were valid.
         self._check_pos_exist([initial, target])
-        to_visit = []
-        # Seen needs to be list since we use it for backtracking.
-        # A set would make the lookup faster, but backtracking impossible.
-        seen = []
+        # `parents` maps every position we have reached to the position
+        # we reached it from, `costs` holds the length of that path.
+        parents = {initial: None}
+        costs = {initial: 0}
         # Since it's A* we use a heap queue to ensure that we always
-        # get the next node with to lowest manhattan distance to the
-        # current node.
-        heapq.heappush(to_visit, (0, (initial)))
-        found = False
+        # get the next node with the lowest estimated total cost, i.e.
+        # the cost so far plus the manhattan distance to the target.
+        to_visit = [(manhattan_dist(initial, target), 0, initial)]
         while to_visit:
-            man_dist, current = heapq.heappop(to_visit)
-            if current in seen:
+            _, cost, current = heapq.heappop(to_visit)
+            if current == target:
+                return self._backtrack(parents, current)
+            if cost > costs[current]:
+                # we have already found a shorter way to this node
                 continue
-            elif current == target:
-                found = True
-                break
-            else:
-                seen.append(current)
-                for pos in self[current]:
-                    heapq.heappush(to_visit, (manhattan_dist(target, pos), (pos)))
-
-        if not found:
-            raise NoPathException("BFS: No path from %r to %r."
-                    % (initial, target))
-
-        # Now back-track using seen to determine how we got here.
-        # Initialise the path with current node, i.e. position of food.
-        path = [current]
-        while seen:
-            # Pop the latest node in seen
-            next_ = seen.pop()
-            # If that's adjacent to the current node
-            # it's in the path
-            if next_ in self[current]:
-                # So add it to the path
-                path.append(next_)
-                # And continue back-tracking from there
-                current = next_
-        # The last element is the current position, we don't need that in our
-        # path, so don't include it.
-        return path[:-1]
+            new_cost = cost + 1
+            for pos in self[current]:
+                if new_cost < costs.get(pos, new_cost + 1):
+                    costs[pos] = new_cost
+                    parents[pos] = current
+                    heapq.heappush(to_visit, (new_cost + manhattan_dist(target, pos), new_cost, pos))
+
+        raise NoPathException("BFS: No path from %r to %r."
+                % (initial, target))
@@ -1,5 +1,10 @@
-import base64
+from collections import namedtuple
+import functools
+import mmap
+import os
 import random
+import re
+import struct
 import zlib
 
 from .containers import Mesh
@@ -7,11 +12,54 @@
 """ Maze layout parsing. """
 
 
-try:
-    from . import __layouts
-except SyntaxError as err:
-    print("Invalid syntax in __layouts module. Pelita will not be able to use built-in layouts.")
-    print(err)
+#: The entry of a layout in the layout index. `size` ("small", "normal",
+#: "big") and `dead_ends` (a bool) are taken from the name and are None
+#: if the name does not follow the usual scheme.
+LayoutInfo = namedtuple("LayoutInfo", ["name", "size", "dead_ends"])
+
+_LAYOUT_NAME = re.compile(r"layout_(?P<size>[a-z]+)_(?P<dead_ends>with|without)_dead_ends_")
+
+#: The layout pack with the built-in layouts.
+BUILTIN_LAYOUT_PACK = os.path.join(os.path.dirname(os.path.abspath(__file__)), "layouts.pack")
+
+# The packs added with `load_layout_pack`.
+_layout_packs = []
+
+@functools.lru_cache(maxsize=None)
+def _layout_index():
+    # The built-in layouts are only opened when they are first needed.
+    packs = []
+    try:
+        packs.append(LayoutPack(BUILTIN_LAYOUT_PACK))
+    except (OSError, ValueError) as err:
+        print("Could not open the built-in layouts. Pelita will not be able to use them.")
+        print(err)
+    packs.extend(_layout_packs)
+
+    layouts = {}
+    # layouts in later packs replace those with the same name
+    for pack in packs:
+        for name in pack:
+            layouts[name] = pack
+
+    index = {}
+    for name in sorted(layouts):
+        match = _LAYOUT_NAME.match(name)
+        if match:
+            info = LayoutInfo(name, match.group("size"), match.group("dead_ends") == "with")
+        else:
+            info = LayoutInfo(name, None, None)
+        index[name] = (info, layouts[name])
+    return index
+
+@functools.lru_cache(maxsize=None)
+def _layout_names(filter):
+    return tuple(name for name in _layout_index() if filter in name)
+
+@functools.lru_cache(maxsize=128)
+def _decode_layout(layout_name):
+    _info, pack = _layout_index()[layout_name]
+    return pack[layout_name]
 
 class LayoutEncodingException(Exception):
     """ Signifies a problem with the encoding of a layout. """
@@ -67,8 +115,7 @@ def get_random_layout(filter=''):
         >>> get_random_layout(filter='without_dead_ends')
 
     """
-    layouts_names = [item for item in get_available_layouts() if filter in item]
-    layout_choice = random.choice(layouts_names)
+    layout_choice = random.choice(_layout_names(filter))
     return layout_choice, get_layout_by_name(layout_choice)
 
 def get_available_layouts(filter=''):
@@ -92,9 +139,38 @@ def get_available_layouts(filter=''):
         >>> get_available_layouts(filter='without_dead_ends')
 
     """
-    # loop in layouts dictionary and look for layout strings
-    return [item for item in dir(__layouts) if item.startswith('layout_') and
-            filter in item]
+    return list(_layout_names(filter))
+
+def get_layout_info(layout_name):
+    """ Get the index entry of a layout without decoding it.
+
+    Parameters
+    ----------
+    layout_name : str
+        a valid layout name
+
+    Returns
+    -------
+    layout_info : LayoutInfo
+        the name, size and dead-end flag of the layout
+
+    Raises
+    ------
+    ValueError
+        if the layout_name is not known
+
+    Examples
+    --------
+    To get all big layouts without dead ends:
+
+        >>> [name for name in get_available_layouts()
+        ...  if get_layout_info(name).size == 'big' and not get_layout_info(name).dead_ends]
+
+    """
+    try:
+        return _layout_index()[layout_name][0]
+    except KeyError:
+        raise ValueError("Layout: '%s' is not known." % layout_name)
 
 def get_layout_by_name(layout_name):
     """ Get a layout.
@@ -118,17 +194,178 @@ def get_layout_by_name(layout_name):
     --------
     get_available_layouts
     """
-    # decode and return this layout
+    # decode and return this layout (recently used layouts are cached)
     try:
-        return zlib.decompress(base64.decodebytes(__layouts.__dict__[layout_name].encode())).decode()
+        return _decode_layout(layout_name)
     except KeyError as ke:
-        # This happens if layout_name is not a valid key in the __dict__.
+        # This happens if layout_name is not a valid key in the index.
         # I.e. if the layout_name is not available.
         # The error message would be to terse "KeyError: 'non_existing_layout'",
         # thus reraise as ValueError with appropriate error message.
         raise ValueError("Layout: '%s' is not known." % ke.args)
 
 
+#: A layout pack starts with the magic bytes, the version and the number
+#: of layouts, followed by an index entry for every layout (the length of
+#: the name, the name, and the offset and length of the layout), followed
+#: by the zlib compressed layouts. Offsets are counted from the start of
+#: the file.
+LAYOUT_PACK_MAGIC = b"PELITAPK"
+LAYOUT_PACK_VERSION = 1
+_pack_header = struct.Struct("<8sHI")
+_pack_entry = struct.Struct("<QI")
+_pack_name_length = struct.Struct("<H")
+
+def write_layout_pack(filename, layouts):
+    """ Writes layouts to a layout pack file.
+
+    Parameters
+    ----------
+    filename : str
+        the file to write
+    layouts : iterable of (str, str)
+        the names and layout strings
+
+    """
+    names = []
+    blobs = []
+    for name, layout_str in layouts:
+        names.append(name.encode("utf-8"))
+        blobs.append(zlib.compress(layout_str.encode("utf-8"), 9))
+
+    index_size = sum(_pack_name_length.size + len(name) + _pack_entry.size for name in names)
+    offset = _pack_header.size + index_size
+    with open(filename, "wb") as f:
+        f.write(_pack_header.pack(LAYOUT_PACK_MAGIC, LAYOUT_PACK_VERSION, len(names)))
+        for name, blob in zip(names, blobs):
+            f.write(_pack_name_length.pack(len(name)))
+            f.write(name)
+            f.write(_pack_entry.pack(offset, len(blob)))
+            offset += len(blob)
+        for blob in blobs:
+            f.write(blob)
+
+class LayoutPack:
+    """ The layouts in a layout pack file.
+
+    The file is memory-mapped and only the index is read when the pack
+    is opened. A layout is decompressed when it is requested.
+
+    Parameters
+    ----------
+    filename : str
+        the layout pack file
+
+    Raises
+    ------
+    ValueError
+        if the file is not a layout pack
+
+    Examples
+    --------
+    >>> pack = LayoutPack("layouts.pack")
+    >>> names = list(pack)
+    >>> layout_str = pack[names[0]]
+
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        with open(filename, "rb") as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # mmap fails for empty files
+                raise ValueError("%s is not a layout pack." % filename)
+
+        try:
+            magic, version, count = _pack_header.unpack_from(self._mmap, 0)
+        except struct.error:
+            magic, version = None, None
+        if magic != LAYOUT_PACK_MAGIC:
+            raise ValueError("%s is not a layout pack." % filename)
+        if version != LAYOUT_PACK_VERSION:
+            raise ValueError("Unsupported layout pack version %s in %s." % (version, filename))
+
+        self._index = {}
+        pos = _pack_header.size
+        for _ in range(count):
+            name_length, = _pack_name_length.unpack_from(self._mmap, pos)
+            pos += _pack_name_length.size
+            name = self._mmap[pos:pos + name_length].decode("utf-8")
+            pos += name_length
+            self._index[name] = _pack_entry.unpack_from(self._mmap, pos)
+            pos += _pack_entry.size
+
+    def __len__(self):
+        return len(self._index)
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __getitem__(self, name):
+        offset, length = self._index[name]
+        return zlib.decompress(self._mmap[offset:offset + length]).decode("utf-8")
+
+    def close(self):
+        self._mmap.close()
+
+def read_layout_pack(filename):
+    """ Reads all layouts from a layout pack file.
+
+    Parameters
+    ----------
+    filename : str
+        the layout pack file
+
+    Returns
+    -------
+    layouts : dict
+        the layout strings by name
+
+    Raises
+    ------
+    ValueError
+        if the file is not a layout pack
+
+    """
+    pack = LayoutPack(filename)
+    try:
+        return {name: pack[name] for name in pack}
+    finally:
+        pack.close()
+
+def load_layout_pack(filename):
+    """ Makes the layouts of a layout pack available by name.
+
+    Layouts with the same name as a built-in layout (or one of an
+    earlier pack) replace it.
+
+    Parameters
+    ----------
+    filename : str
+        the layout pack file
+
+    Returns
+    -------
+    layout_names : list of str
+        the names of the layouts in the pack
+
+    Raises
+    ------
+    ValueError
+        if the file is not a layout pack
+
+    """
+    pack = LayoutPack(filename)
+    _layout_packs.append(pack)
+    _layout_index.cache_clear()
+    _layout_names.cache_clear()
+    _decode_layout.cache_clear()
+    return list(pack)
+
 class Layout:
     """ Auxiliary class to parse string encodings of mazes.
 
@@ -212,18 +449,26 @@ def check_layout(layout_str, layout_chars, number_bots):
 
         """
         bot_ids = [str(i) for i in range(number_bots)]
-        existing_bots = []
         legal = layout_chars + bot_ids + ['\n']
-        for c in layout_str:
-            if c not in legal:
-                raise LayoutEncodingException(
-                    "Char: '%c' is not a legal layout character" % c)
-            if c in bot_ids:
-                if c in existing_bots:
-                    raise LayoutEncodingException(
-                        "Bot-ID: '%c' was specified twice" % c)
-                else:
-                    existing_bots.append(c)
+        # Remove all legal characters at once. Whatever is left is illegal,
+        # the first of these is reported unless a bot-id is repeated before.
+        illegal = layout_str.translate({ord(c): None for c in legal if len(c) == 1})
+        error_pos = layout_str.find(illegal[0]) if illegal else len(layout_str)
+        error = None
+        if illegal:
+            error = "Char: '%c' is not a legal layout character" % illegal[0]
+        existing_bots = []
+        for bot_id in bot_ids:
+            first = layout_str.find(bot_id)
+            if first == -1:
+                continue
+            existing_bots.append(bot_id)
+            second = layout_str.find(bot_id, first + 1)
+            if second != -1 and second < error_pos:
+                error_pos = second
+                error = "Bot-ID: '%c' was specified twice" % bot_id
+        if error is not None:
+            raise LayoutEncodingException(error)
         existing_bots.sort()
         if bot_ids != existing_bots:
             missing = [str(i) for i in set(bot_ids).difference(set(existing_bots))]
@@ -279,9 +524,48 @@ def as_mesh(self):
 
         """
         mesh = Mesh(*self.shape)
-        mesh._set_data(list(''.join(self.stripped.split('\n'))))
+        mesh._set_data(list(self.stripped.replace('\n', '')))
         return mesh
 
+    def parse(self, wall, food):
+        """ Find the walls, the food and the bots in a single pass.
+
+        This gives the same result as going through `as_mesh()` but does
+        not look at every character in Python code.
+
+        Parameters
+        ----------
+        wall : str
+            the character for walls
+        food : str
+            the character for food
+
+        Returns
+        -------
+        walls : list of bool
+            True for every wall in row-based order
+        food_positions : list of tuple of (int, int)
+            the positions of all food, in row-based order
+        bot_positions : list of tuple of (int, int)
+            the initial positions of the bots, ordered by bot-id
+
+        """
+        width = self.shape[0]
+        flat = self.stripped.replace('\n', '')
+        walls = list(map(wall.__eq__, flat))
+
+        food_positions = []
+        idx = flat.find(food)
+        while idx != -1:
+            food_positions.append((idx % width, idx // width))
+            idx = flat.find(food, idx + 1)
+
+        bot_positions = []
+        for bot_id in range(self.number_bots):
+            idx = flat.find(str(bot_id))
+            bot_positions.append((idx % width, idx // width))
+        return walls, food_positions, bot_positions
+
     @classmethod
     def from_file(cls, filename, layout_chars, number_bots):
         """ Loads a layout from file `filename`.
@@ -1,6 +1,8 @@
 """ Base classes for player implementations. """
 
 import abc
+import collections
+import collections.abc
 import pdb
 import random
 import time
@@ -169,8 +171,120 @@ def remote_game(self, remote_game):
     def __repr__(self):
         return "SimpleTeam(%r, %s)" % (self.team_name, ", ".join(repr(p) for p in self._players))
 
+def make_universe_history(policy):
+    """ Create the container which stores the previous universes of a player.
+
+    Parameters
+    ----------
+    policy : None, int or callable
+        If None, all universes are kept. If an int n, only the last n
+        universes are kept. Otherwise, `policy` is called without
+        arguments and must return an empty container with an `append`
+        method and support for (negative) indexing, e.g. `KeyframeHistory`.
+
+    Returns
+    -------
+    universe_history : container
+        the empty history
+
+    Raises
+    ------
+    ValueError
+        if less than one universe should be kept
+
+    """
+    if policy is None:
+        return []
+    if isinstance(policy, int):
+        if policy < 1:
+            raise ValueError("At least the current universe must be kept, not %r." % policy)
+        return collections.deque(maxlen=policy)
+    return policy()
+
+class KeyframeHistory(collections.abc.Sequence):
+    """ A history of universes which only logs the changes between them.
+
+    Every `keyframe_interval`-th universe is stored as a snapshot. For all
+    other universes only the bot positions, the changes in the food and the
+    scores are logged. These universes are rebuilt from the preceding
+    snapshot when they are accessed. The most recent universe is kept as is.
+
+    Parameters
+    ----------
+    keyframe_interval : int, optional, default: 100
+        the number of universes between two snapshots
+
+    Examples
+    --------
+    To use it in a player:
+
+        >>> class MyPlayer(AbstractPlayer):
+        ...     universe_history = KeyframeHistory
+
+    """
+    def __init__(self, keyframe_interval=100):
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be positive, not %r." % keyframe_interval)
+        self.keyframe_interval = keyframe_interval
+        self._keyframes = []
+        # one entry per universe, None for the keyframes
+        self._deltas = []
+        self._last = None
+
+    def append(self, universe):
+        if len(self._deltas) % self.keyframe_interval == 0:
+            self._keyframes.append(universe.snapshot())
+            self._deltas.append(None)
+        else:
+            last = self._last
+            self._deltas.append((
+                tuple((bot.current_pos, bot.noisy) for bot in universe.bots),
+                tuple(last.food - universe.food),
+                tuple(universe.food - last.food),
+                tuple(team.score for team in universe.teams)
+            ))
+        self._last = universe
+
+    @staticmethod
+    def _apply_delta(universe, delta):
+        bot_states, food_removed, food_added, scores = delta
+        for bot, (current_pos, noisy) in zip(universe.bots, bot_states):
+            bot.current_pos = current_pos
+            bot.noisy = noisy
+        universe.food.difference_update(food_removed)
+        universe.food.update(food_added)
+        for team, score in zip(universe.teams, scores):
+            team.score = score
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("KeyframeHistory index out of range")
+        if index == len(self) - 1:
+            return self._last
+
+        keyframe_index = index - index % self.keyframe_interval
+        universe = self._keyframes[keyframe_index // self.keyframe_interval].snapshot()
+        for delta in self._deltas[keyframe_index + 1:index + 1]:
+            self._apply_delta(universe, delta)
+        return universe
+
+    def __len__(self):
+        return len(self._deltas)
+
+    def __repr__(self):
+        return "KeyframeHistory(%r)" % self.keyframe_interval
+
 class AbstractPlayer(metaclass=abc.ABCMeta):
-    """ Base class for all user implemented Players. """
+    """ Base class for all user implemented Players.
+
+    By default, all universes which the player receives are kept in
+    `universe_states`. Subclasses can limit this by setting the attribute
+    `universe_history` (see `make_universe_history` for the allowed values).
+    """
 
     def _set_index(self, index):
         """ Called by SimpleTeam to set this Player's index.
@@ -198,7 +312,10 @@ def _set_initial(self, universe, game_state):
             self._store_universe = self._store_universe_copy
 
         self._current_state = game_state
-        self.universe_states = []
+        # Players may set `universe_history` to restrict the number
+        # of universes which are kept in `universe_states`.
+        self.universe_states = make_universe_history(getattr(self, "universe_history", None))
+        self._previous_pos = None
         self._store_universe(universe)
 
         # we take the bot’s index as a default value for the seed_offset
@@ -216,7 +333,9 @@ def set_initial(self):
         pass
 
     def _store_universe_copy(self, universe):
-        self.universe_states.append(universe.copy())
+        # The maze of a snapshot only shares the walls with the game
+        # until the player changes them.
+        self.universe_states.append(universe.snapshot())
 
     def _store_universe_ref(self, universe):
         self.universe_states.append(universe)
@@ -236,6 +355,7 @@ def _get_move(self, universe, game_state):
         #: Used for the `time_spent` method.
         self.__time_in_get_move = time.monotonic()
         self._current_state = game_state
+        self._previous_pos = self.current_pos
         self._store_universe(universe)
         self._say = ""
         move = self.get_move()
@@ -413,12 +533,16 @@ def current_pos(self):
     def previous_pos(self):
         """ The previous position of the bot.
 
+        This is the position of the bot in the universe which was
+        received with the last call to `get_move` (or in `set_initial`).
+
         Returns
         -------
-        previous_pos : tuple of (int, int)
-            the previous position (x, y) of this bot
+        previous_pos : tuple of (int, int) or None
+            the previous position (x, y) of this bot or None if the bot
+            has not been asked for a move yet
         """
-        return self.universe_states[-2].bots[self._index].current_pos
+        return self._previous_pos
 
     @property
     def initial_pos(self):
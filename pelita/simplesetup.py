@@ -34,7 +34,7 @@
 
 import zmq
 
-from .datamodel import CTFUniverse
+from .datamodel import Bot, CTFUniverse, Team, copy_game_state
 from .game_master import GameMaster, PlayerDisconnected, PlayerTimeout
 from .viewer import AbstractViewer
 
@@ -46,6 +46,43 @@ class DeadConnection(Exception):
 #: The timeout to use during sending
 DEAD_CONNECTION_TIMEOUT = 3.0
 
+#: The encodings for universes which we understand, in order of preference.
+#: With "compact", each universe is sent as an extra message frame
+#: (see `CTFUniverse._to_bytes`). "delta" is "compact" for the first
+#: universe and game state of a session and only sends what has changed
+#: afterwards (see `DeltaEncoder`). "json" is understood by all clients.
+ENCODINGS = ["delta", "compact", "json"]
+
+def _encode_message(message_obj, encoding):
+    """ Returns the frames for a message. The universes in "__data__"
+    are converted according to `encoding`.
+    """
+    frames = []
+    data = message_obj.get("__data__")
+    if data:
+        data = dict(data)
+        for key, value in data.items():
+            if isinstance(value, CTFUniverse):
+                if encoding in ("delta", "compact"):
+                    frames.append(value._to_bytes())
+                    data[key] = {"__frame__": len(frames)}
+                else:
+                    data[key] = value._to_json_dict()
+        message_obj = dict(message_obj, __data__=data)
+    return [json.dumps(message_obj).encode("utf-8")] + frames
+
+def _decode_message(frames, maze_cache=None):
+    """ Returns the message object for the given frames. Universes
+    which have been sent in an extra frame are converted to a CTFUniverse.
+    """
+    py_obj = json.loads(frames[0].decode("utf-8"))
+    data = py_obj.get("__data__")
+    if data and len(frames) > 1:
+        for key, value in data.items():
+            if isinstance(value, dict) and "__frame__" in value:
+                data[key] = CTFUniverse._from_bytes(frames[value["__frame__"]], maze_cache=maze_cache)
+    return py_obj
+
 def extract_port_range(address):
     """ We additionally allow for setting a port range in rectangular brackets:
         tcp://127.0.0.1:[50100:50120]
@@ -113,6 +150,11 @@ class ZMQConnection:
         uuids are discarded.
       * There is no storage of messages.
 
+    Universes in the data of a request are sent as JSON unless the
+    other side has accepted a more compact encoding. To negotiate this,
+    each request offers our `ENCODINGS`; a client which knows any of them
+    names its choice in the reply. Old clients ignore the offer.
+
     Parameters
     ----------
     socket : zmq socket
@@ -128,6 +170,8 @@ class ZMQConnection:
         Poller for outgoing connections
     last_uuid : uuid
         Uuid which the next incoming message has to match
+    encoding : string
+        the encoding which is used for universes
     """
     def __init__(self, socket):
         self.socket = socket
@@ -137,6 +181,8 @@ def __init__(self, socket):
         self.pollout.register(socket, zmq.POLLOUT)
 
         self.last_uuid = None
+        self.encoding = "json"
+        self._negotiated = False
 
     def send(self, action, data, timeout=None):
         if timeout is None:
@@ -152,9 +198,11 @@ def send(self, action, data, timeout=None):
             # race condition if a connection was closed between poll and send.
             # NOBLOCK should raise, so we can catch that
             message_obj = {"__uuid__": msg_uuid, "__action__": action, "__data__": data}
-            json_message = json.dumps(message_obj)
+            if not self._negotiated:
+                message_obj["__encodings__"] = ENCODINGS
+            frames = _encode_message(message_obj, self.encoding)
             try:
-                self.socket.send_unicode(json_message, flags=zmq.NOBLOCK)
+                self.socket.send_multipart(frames, flags=zmq.NOBLOCK)
             except zmq.ZMQError as e:
                 _logger.info("Could not send message. Assume socket is unavailable. %r", e)
                 raise DeadConnection()
@@ -175,6 +223,9 @@ def recv(self):
 
         if msg_uuid == self.last_uuid:
             self.last_uuid = None
+            if py_obj.get("__encoding__") in ENCODINGS:
+                self.encoding = py_obj["__encoding__"]
+                self._negotiated = True
             return py_obj["__return__"]
         else:
             self.last_uuid = None
@@ -210,6 +261,128 @@ def __repr__(self):
         return "ZMQConnection(%r)" % self.socket
 
 
+class DeltaEncoder:
+    """ Keeps track of the last universe and game state which have been
+    sent to a client and computes the differences to them.
+
+    Within a game, the maze never changes, and the teams and bots only
+    change their scores and positions. A delta therefore only holds the
+    food which was eaten (or added), the scores, the positions of all bots
+    and the changed entries of the game state. The state is updated with
+    every universe and game state, so that a delta is always relative to
+    the previous message; `DeltaDecoder` reverses this on the client side.
+    """
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """ Forget the last state. The next message will be complete. """
+        self.maze = None
+        self.food = None
+        self.shape = None
+        self.game_state = None
+
+    def encode(self, universe, game_state, delta=True):
+        """ Returns the universe and the game state to send.
+
+        If `delta` is False or if there is no previous state to refer to,
+        they are returned unchanged. Otherwise, each of them is replaced by
+        a dict with the key "__delta__".
+        """
+        shape = (len(universe.teams), len(universe.bots))
+        food = set(universe.food)
+        can_delta = (delta and self.maze is not None and
+                     self.shape == shape and
+                     (self.maze is universe.maze or self.maze == universe.maze))
+
+        if can_delta:
+            universe_data = {"__delta__": {
+                "food_added": list(food - self.food),
+                "food_removed": list(self.food - food),
+                "scores": [team.score for team in universe.teams],
+                "bots": [[bot.current_pos[0], bot.current_pos[1], bot.noisy] for bot in universe.bots]
+            }}
+        else:
+            universe_data = universe
+
+        last_game_state = self.game_state
+        if delta and last_game_state is not None:
+            changed = {key: value for key, value in game_state.items()
+                       if key not in last_game_state or last_game_state[key] != value}
+            removed = [key for key in last_game_state if key not in game_state]
+            game_state_data = {"__delta__": {
+                "changed": changed,
+                "removed": removed
+            }}
+            # the game master changes its game state in place,
+            # so the changed entries are copied
+            for key in removed:
+                del last_game_state[key]
+            last_game_state.update(copy_game_state(changed))
+        else:
+            game_state_data = game_state
+            self.game_state = copy_game_state(game_state)
+
+        self.maze = universe.maze
+        self.food = food
+        self.shape = shape
+        return universe_data, game_state_data
+
+class DeltaDecoder:
+    """ Rebuilds the universes and game states which have been sent by
+    a `DeltaEncoder`.
+
+    Each decoded universe and game state is a new object, so players can
+    keep old ones around and change them. The walls of the maze are only
+    copied when they are changed (see `Maze.copy`).
+    """
+    def __init__(self):
+        self.universe = None
+        self.game_state = None
+
+    def decode(self, universe, game_state):
+        """ Returns the complete universe and game state.
+
+        Parameters
+        ----------
+        universe : CTFUniverse or dict
+            a complete universe, its JSON dict or a delta
+        game_state : dict
+            a complete game state or a delta
+        """
+        if isinstance(universe, dict) and "__delta__" in universe:
+            universe = self._apply_universe_delta(universe["__delta__"])
+        elif not isinstance(universe, CTFUniverse):
+            universe = CTFUniverse._from_json_dict(universe)
+
+        # the player gets its own universe and game state, so that the
+        # changes it makes do not end up in the following ones
+        if "__delta__" in game_state:
+            delta = game_state["__delta__"]
+            self.game_state.update(copy_game_state(delta["changed"]))
+            for key in delta["removed"]:
+                del self.game_state[key]
+            game_state = copy_game_state(self.game_state)
+        else:
+            self.game_state = copy_game_state(game_state)
+
+        self.universe = universe.snapshot()
+        return universe, game_state
+
+    def _apply_universe_delta(self, delta):
+        if self.universe is None:
+            raise ValueError("Received a delta without a previous universe.")
+        last = self.universe
+        food = set(last.food)
+        food.difference_update(tuple(pos) for pos in delta["food_removed"])
+        food.update(tuple(pos) for pos in delta["food_added"])
+        teams = [Team(team.index, team.zone, score)
+                 for team, score in zip(last.teams, delta["scores"])]
+        bots = [Bot(bot.index, bot.initial_pos, bot.team_index, bot.homezone,
+                    current_pos=(x, y), noisy=noisy)
+                for bot, (x, y, noisy) in zip(last.bots, delta["bots"])]
+        return CTFUniverse(last.maze.copy(), food, teams, bots)
+
 class RemoteTeamPlayer:
     """ This class is registered server-side with the GameMaster
     and sends all requests to the attached zmq socket (to which
@@ -224,6 +397,18 @@ class RemoteTeamPlayer:
     """
     def __init__(self, socket):
         self.zmqconnection = ZMQConnection(socket)
+        self.delta_encoder = DeltaEncoder()
+
+    def _send_state(self, action, data, universe, game_state):
+        # Universe and game state are sent as deltas once the client has agreed.
+        delta = self.zmqconnection.encoding == "delta"
+        data["universe"], data["game_state"] = self.delta_encoder.encode(universe, game_state, delta=delta)
+        try:
+            self.zmqconnection.send(action, data)
+        except DeadConnection:
+            # the client has not seen this state
+            self.delta_encoder.reset()
+            raise
 
     def team_name(self):
         try:
@@ -238,9 +423,7 @@ def team_name(self):
 
     def set_initial(self, team_id, universe, game_state):
         try:
-            self.zmqconnection.send("set_initial", {"team_id": team_id,
-                                                    "universe": universe._to_json_dict(),
-                                                    "game_state": game_state})
+            self._send_state("set_initial", {"team_id": team_id}, universe, game_state)
             return self.zmqconnection.recv_timeout(game_state["timeout_length"])
         except ZMQTimeout:
             # answer did not arrive in time
@@ -250,9 +433,7 @@ def set_initial(self, team_id, universe, game_state):
 
     def get_move(self, bot_id, universe, game_state):
         try:
-            self.zmqconnection.send("get_move", {"bot_id": bot_id,
-                                                 "universe": universe._to_json_dict(),
-                                                 "game_state": game_state})
+            self._send_state("get_move", {"bot_id": bot_id}, universe, game_state)
             reply = self.zmqconnection.recv_timeout(game_state["timeout_length"])
             # make sure it is a dict
             reply = dict(reply)
@@ -424,8 +605,14 @@ def _loop(self):
         action = py_obj["__action__"]
         data = py_obj.get("__data__") or {}
 
+        try:
+            method = getattr(self, action)
+        except AttributeError:
+            _logger.warning("Unknown controller action %r.", action)
+            return
+
         # feed client actor here …
-        retval = getattr(self, action)(**data)
+        retval = method(**data)
 
         if uuid_:
             message_obj = {"__uuid__": uuid_, "__return__": retval}
@@ -454,6 +641,23 @@ def __repr__(self):
         return "SimpleController(%r, %r)" % (self.game_master, self.address)
 
 
+class ReplayController(SimpleController):
+    """ A SimpleController for a ReplayPublisher which can additionally
+    step backwards and jump to a given round. """
+
+    def step_back(self, *args, **kwargs):
+        return self.game_master.step_back(*args, **kwargs)
+
+    def round_back(self, *args, **kwargs):
+        return self.game_master.round_back(*args, **kwargs)
+
+    def jump_to_round(self, *args, **kwargs):
+        return self.game_master.jump_to_round(*args, **kwargs)
+
+    def __repr__(self):
+        return "ReplayController(%r, %r)" % (self.game_master, self.address)
+
+
 class SimpleClient:
     """ Sets up a simple Client with most settings pre-configured.
 
@@ -480,6 +684,12 @@ def __init__(self, team, team_name="", address=None):
 
         self.address = address
 
+        #: the encoding of universes agreed on with the server
+        self.encoding = "json"
+        # mazes are shared between the universes received in compact encoding
+        self._maze_cache = {}
+        self._delta_decoder = DeltaDecoder()
+
     def on_start(self):
         # We connect here because zmq likes to have its own
         # thread/process/whatever.
@@ -503,12 +713,18 @@ def _loop(self):
         """ Waits for incoming requests and tries to get a proper
         answer from the player.
         """
-        json_message = self.socket.recv_unicode()
-        py_obj = json.loads(json_message)
+        frames = self.socket.recv_multipart()
+        py_obj = _decode_message(frames, maze_cache=self._maze_cache)
         uuid_ = py_obj["__uuid__"]
         action = py_obj["__action__"]
         data = py_obj["__data__"]
 
+        reply_obj = {"__uuid__": uuid_}
+        offered = py_obj.get("__encodings__")
+        if offered:
+            self.encoding = next((enc for enc in ENCODINGS if enc in offered), "json")
+            reply_obj["__encoding__"] = self.encoding
+
         try:
             # feed client actor here …
             #
@@ -527,17 +743,20 @@ def _loop(self):
             raise
         finally:
             try:
-                message_obj = {"__uuid__": uuid_, "__return__": retval}
-                json_message = json.dumps(message_obj)
+                reply_obj["__return__"] = retval
+                json_message = json.dumps(reply_obj)
                 self.socket.send_unicode(json_message)
             except NameError:
                 pass
 
     def set_initial(self, team_id, universe, game_state):
-        return self.team.set_initial(team_id, CTFUniverse._from_json_dict(universe), game_state)
+        self._maze_cache.clear()
+        universe, game_state = self._delta_decoder.decode(universe, game_state)
+        return self.team.set_initial(team_id, universe, game_state)
 
     def get_move(self, bot_id, universe, game_state):
-        return self.team.get_move(bot_id, CTFUniverse._from_json_dict(universe), game_state)
+        universe, game_state = self._delta_decoder.decode(universe, game_state)
+        return self.team.get_move(bot_id, universe, game_state)
 
     def exit(self):
         raise ExitLoop()
@@ -584,6 +803,104 @@ def observe(self, universe, game_state):
                                 "game_state": game_state}}
         self._send(message)
 
+class ReplayPublisher:
+    """ Publishes the steps of a dumped game.
+
+    The ReplayPublisher can be controlled like a GameMaster (with
+    `set_initial`, `play_step`, `play_round` and `play`) and can
+    additionally go backwards and jump to a given round. Every change
+    of the current step is sent to the publisher.
+
+    Parameters
+    ----------
+    replay : DumpReplay
+        the dump to replay
+    publisher : SimplePublisher
+        the publisher to send the messages to
+    """
+    def __init__(self, replay, publisher):
+        self.replay = replay
+        self.publisher = publisher
+        self.step = -1
+
+    def set_initial(self):
+        """ Sends the initial universe and the current step (if any). """
+        self.replay.has_step(0)
+        if self.replay.initial is not None:
+            self.publisher._send(self.replay.initial)
+        self.update_viewers()
+
+    def update_viewers(self):
+        """ Sends the current step. """
+        if self.step >= 0:
+            self.publisher._send(self.replay.message(self.step))
+
+    def _go_to(self, step):
+        if step != self.step and step >= 0 and self.replay.has_step(step):
+            self.step = step
+            self.update_viewers()
+
+    def play_step(self):
+        """ Goes one step forward. """
+        self._go_to(self.step + 1)
+
+    def step_back(self):
+        """ Goes one step backward. """
+        self._go_to(self.step - 1)
+
+    def play_round(self):
+        """ Goes forward to the last step of the next round. """
+        step = self.step + 1
+        if not self.replay.has_step(step):
+            return
+        round_index = self.replay.round_of(step)
+        while self.replay.has_step(step + 1) and self.replay.round_of(step + 1) == round_index:
+            step += 1
+        self._go_to(step)
+
+    def round_back(self):
+        """ Goes backward to the last step of the previous round. """
+        if self.step < 0:
+            return
+        step = self.step
+        round_index = self.replay.round_of(step)
+        while step > 0 and self.replay.round_of(step) == round_index:
+            step -= 1
+        self._go_to(step)
+
+    def jump_to_round(self, round_index):
+        """ Goes to the first step of the given round.
+
+        Raises
+        ------
+        IndexError
+            if the round is not in the dump
+        """
+        self._go_to(self.replay.step_of_round(round_index))
+
+    def play(self, speed=None, initial_delay=0.0):
+        """ Plays the rest of the dump.
+
+        Parameters
+        ----------
+        speed : float, optional
+            the number of steps per second (default: as fast as possible)
+        initial_delay : float, optional
+            the number of seconds to wait after sending the initial universe
+        """
+        self.set_initial()
+        time.sleep(initial_delay)
+
+        next_time = time.monotonic()
+        while self.replay.has_step(self.step + 1):
+            self.play_step()
+            if speed:
+                next_time += 1 / speed
+                time.sleep(max(0, next_time - time.monotonic()))
+
+    def __repr__(self):
+        return "ReplayPublisher(%r, %r)" % (self.replay, self.publisher)
+
 class SimpleSubscriber(AbstractViewer):
     """ Subscribes to a given zmq socket and passes
     all incoming data to a viewer.
@@ -114,6 +114,7 @@ def __init__(self, master, geometry=None):
         self.canvas = None
 
         self.current_universe = None
+        self.drawn_food = set()
 
         self._grid_enabled = False
 
@@ -271,17 +272,16 @@ def update(self, universe, game_state):
         self.draw_universe(self.current_universe, game_state)
 
         if game_state:
-            for food_eaten in game_state["food_eaten"]:
-                food_tag = Food.food_pos_tag(tuple(food_eaten["food_pos"]))
-                self.canvas.delete(food_tag)
-
             winning_team_idx = game_state.get("team_wins")
             if winning_team_idx is not None:
                 team_name = game_state["team_name"][winning_team_idx]
                 self.game_finish_overlay = lambda: self.draw_game_over(team_name)
-
-            if game_state.get("game_draw"):
+            elif game_state.get("game_draw"):
                 self.game_finish_overlay = lambda: self.draw_game_draw()
+            else:
+                # the game is not over (anymore, if a replay went back)
+                self.game_finish_overlay = lambda: None
+                self.canvas.delete("gameover")
 
         self.game_finish_overlay()
 
@@ -461,13 +461,18 @@ def resize(self, event):
         self.size_changed = True
 
     def draw_food(self, universe):
-        if not self.size_changed:
-            return
-        self.canvas.delete("food")
-        for position in universe.food_list:
-            model_x, model_y = position
-            food_item = Food(self.mesh_graph, position=(model_x, model_y))
+        food = set(universe.food_list)
+        if self.size_changed:
+            self.canvas.delete("food")
+            self.drawn_food = set()
+        # Only the changes are drawn. Food may also come back,
+        # when a replay steps back or jumps to another round.
+        for position in self.drawn_food - food:
+            self.canvas.delete(Food.food_pos_tag(position))
+        for position in food - self.drawn_food:
+            food_item = Food(self.mesh_graph, position=position)
             food_item.draw(self.canvas)
+        self.drawn_food = food
 
     def draw_maze(self, universe):
         if not self.size_changed:
@@ -538,6 +543,8 @@ def __init__(self, master, address, controller_address=None,
         self.master.bind('<space>', lambda event: self.toggle_running())
         self.master.bind('<Return>', lambda event: self.request_step())
         self.master.bind('<Shift-Return>', lambda event: self.request_round())
+        self.master.bind('<BackSpace>', lambda event: self.request_step_back())
+        self.master.bind('<Shift-BackSpace>', lambda event: self.request_round_back())
         self.master.createcommand('exit', self.quit)
         self.master.protocol("WM_DELETE_WINDOW", self.quit)
 
@@ -605,6 +612,15 @@ def request_round(self):
         if self.controller_socket:
             self.controller_socket.send_json({"__action__": "play_round"})
 
+    # Going back is only understood by the controller of a replay.
+    def request_step_back(self):
+        if self.controller_socket:
+            self.controller_socket.send_json({"__action__": "step_back"})
+
+    def request_round_back(self):
+        if self.controller_socket:
+            self.controller_socket.send_json({"__action__": "round_back"})
+
     def observe(self, observed):
         universe = observed.get("universe")
         universe = CTFUniverse._from_json_dict(universe) if universe else None
@@ -1,12 +1,24 @@
 """ The observers. """
 
 import abc
+import gzip
 import json
 import sys
 
 import zmq
 
+from .datamodel import copy_game_state
+
 class AbstractViewer(metaclass=abc.ABCMeta):
+    #: Whether the events of a step need to be given as lists of dicts
+    #: in the game state ("bot_moved", "food_eaten" and "bot_destroyed").
+    #: Viewers which set this to False read them from `events` instead.
+    needs_event_dicts = True
+
+    #: The `EventBuffer` of the game master the viewer is registered with.
+    #: It is only set when `needs_event_dicts` is False.
+    events = None
+
     def set_initial(self, universe):
         """ This method is called when the first universe is ready.
         """
@@ -93,25 +105,448 @@ def observe(self, universe, game_state):
         self._send(message)
 
 
+#: The name of the dump format written by `DumpingViewer`.
+DUMP_FORMAT = "pelita-dump"
+
+#: The version of the dump format written by `DumpingViewer`.
+DUMP_VERSION = 2
+
 class DumpingViewer(AbstractViewer):
-    """ A viewer which dumps to a given stream.
+    """ A viewer which dumps the game to a given stream.
+
+    The dump is line-delimited JSON. The first line is a header. Then
+    follows one line per call to `set_initial` and `observe`. Only the
+    first `observe` and every `keyframe_interval`-th one after that hold the
+    complete universe and game state. All other lines only hold the bots,
+    teams and food which changed and the changed entries of the game state.
+    The maze is thus written only once per keyframe.
+
+    Use `read_dump` to get the complete messages back.
+
+    When registered with a game master, the events of a step are taken
+    from its `EventBuffer` and written as lists of dicts.
+
+    Parameters
+    ----------
+    stream : text stream
+        the stream to write to
+    keyframe_interval : int, optional, default: 1000
+        the number of steps between two complete states
     """
-    def __init__(self, stream):
+    needs_event_dicts = False
+
+    def __init__(self, stream, keyframe_interval=1000):
         self.stream = stream
+        self.keyframe_interval = keyframe_interval
+        self._steps = 0
+        self._last = None
+        self._write({"__format__": DUMP_FORMAT, "__version__": DUMP_VERSION})
 
-    def _send(self, message):
-        as_json = json.dumps(message)
-        self.stream.write(as_json)
-        self.stream.write("\x04")
+    def _write(self, record):
+        self.stream.write(json.dumps(record, separators=(',', ':')))
+        self.stream.write("\n")
 
     def set_initial(self, universe):
-        message = {"__action__": "set_initial",
-                   "__data__": {"universe": universe._to_json_dict()}}
-        self._send(message)
+        self._write({"__action__": "set_initial",
+                     "universe": universe._to_json_dict()})
 
     def observe(self, universe, game_state):
-        message = {"__action__": "observe",
-                   "__data__": {"universe": universe._to_json_dict(),
-                                "game_state": game_state}}
-        self._send(message)
+        if self.events is not None:
+            game_state = dict(game_state, **self.events.as_dict())
+        last = self._last
+        # The walls do not change during a game, so the maze object is
+        # compared instead of all of its cells.
+        keyframe = (last is None or
+                    self._steps % self.keyframe_interval == 0 or
+                    last["maze"] is not universe.maze or
+                    len(last["teams"]) != len(universe.teams) or
+                    len(last["bots"]) != len(universe.bots))
+        food = set(universe.food)
+        teams = [team._to_json_dict() for team in universe.teams]
+        bots = [bot._to_json_dict() for bot in universe.bots]
+
+        if keyframe:
+            self._write({"__action__": "observe",
+                         "universe": universe._to_json_dict(),
+                         "game_state": game_state})
+            last_game_state = copy_game_state(game_state)
+        else:
+            last_game_state = last["game_state"]
+            changed = {key: value for key, value in game_state.items()
+                       if key not in last_game_state or last_game_state[key] != value}
+            removed = [key for key in last_game_state if key not in game_state]
+            self._write({"__action__": "observe",
+                         "delta": {
+                             "food_removed": list(last["food"] - food),
+                             "food_added": list(food - last["food"]),
+                             "teams": [team for team, last_team in zip(teams, last["teams"])
+                                       if team != last_team],
+                             "bots": [bot for bot, last_bot in zip(bots, last["bots"])
+                                      if bot != last_bot],
+                             "game_state": changed,
+                             "game_state_removed": removed
+                         }})
+            # only the changed entries need to be copied
+            for key in removed:
+                del last_game_state[key]
+            last_game_state.update(copy_game_state(changed))
+
+        self._last = {
+            "maze": universe.maze,
+            "food": food,
+            "teams": teams,
+            "bots": bots,
+            "game_state": last_game_state
+        }
+        self._steps += 1
+
+def open_dump(filename, mode="r"):
+    """ Opens a dump file in text mode (or in binary mode if `mode`
+    contains 'b'). Files ending with '.gz' are compressed with gzip.
+    """
+    if "b" in mode:
+        if filename.endswith(".gz"):
+            return gzip.open(filename, mode)
+        return open(filename, mode)
+    if filename.endswith(".gz"):
+        return gzip.open(filename, mode + "t", encoding="utf-8")
+    return open(filename, mode, encoding="utf-8")
+
+def _is_versioned_dump(head):
+    # Only the new format starts with a header line.
+    newline = head.find("\n")
+    separator = head.find("\x04")
+    return not (newline < 0 or 0 <= separator < newline or not head.startswith('{"__format__"'))
+
+def _check_header(line):
+    header = json.loads(line)
+    if header.get("__format__") != DUMP_FORMAT or header.get("__version__") != DUMP_VERSION:
+        raise ValueError("Unknown dump format: %r" % header)
+
+def _iter_old_dump(stream, buffer, chunk_size=65536):
+    # The old format has JSON messages separated by \x04.
+    while True:
+        *messages, buffer = buffer.split("\x04")
+        for message in messages:
+            if message.strip():
+                yield json.loads(message)
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        buffer += chunk
+    if buffer.strip():
+        yield json.loads(buffer)
+
+def _iter_lines(stream, buffer):
+    # All lines of `buffer` followed by the lines in `stream`.
+    *lines, partial = buffer.split("\n")
+    yield from lines
+    for line in stream:
+        yield partial + line
+        partial = ""
+    if partial:
+        yield partial
+
+def read_dump(stream, chunk_size=4096):
+    """ Read a dump which has been written by a `DumpingViewer`.
+
+    The dump is read lazily. The deltas are applied on the fly and each
+    message is returned in the format which is sent to the viewers, i.e. as
+    `{"__action__": action, "__data__": {"universe": ..., "game_state": ...}}`.
+    Dumps in the old format (complete JSON messages separated by '\\x04')
+    are read as well.
+
+    Parameters
+    ----------
+    stream : text stream
+        the dump
+
+    Yields
+    ------
+    message : dict
+        the next message of the dump
+
+    Raises
+    ------
+    ValueError
+        if the dump has an unknown format or version
+    """
+    # Read until we know which format we have.
+    head = ""
+    while "\n" not in head and "\x04" not in head:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        head += chunk
+
+    if not _is_versioned_dump(head):
+        yield from _iter_old_dump(stream, head)
+        return
+
+    lines = _iter_lines(stream, head)
+    _check_header(next(lines))
+
+    decoder = DumpDecoder()
+    for line in lines:
+        if line.strip():
+            yield decoder.decode(json.loads(line))
+
+class DumpDecoder:
+    """ Rebuilds the complete messages from the records of a dump.
+
+    The decoder holds the state of the game after the last decoded
+    record. Records must be decoded in order, starting with a keyframe.
+    The state is never changed in place, so `universe` and `game_state`
+    may be kept and assigned again later to go back to that state.
+    """
+    def __init__(self):
+        self.universe = None
+        self.game_state = None
+
+    def decode(self, record):
+        """ Decode the next record of a dump and return the message. """
+        action = record["__action__"]
+        if action == "set_initial":
+            return {"__action__": action,
+                    "__data__": {"universe": record["universe"]}}
+
+        self.update(record)
+        return self.message()
+
+    def update(self, record):
+        """ Apply the next observe record without building a message. """
+        if "delta" in record:
+            if self.universe is None:
+                raise ValueError("Dump has a delta before the first complete state.")
+            self._apply_delta(record["delta"])
+        else:
+            universe = record["universe"]
+            self.universe = {
+                "maze": universe["maze"],
+                "food": set(tuple(pos) for pos in universe["food"]),
+                "teams": universe["teams"],
+                "bots": universe["bots"]
+            }
+            self.game_state = record["game_state"]
+
+    def message(self):
+        """ The observe message for the current state. """
+        universe = dict(self.universe, food=list(self.universe["food"]))
+        return {"__action__": "observe",
+                "__data__": {"universe": universe,
+                             "game_state": dict(self.game_state)}}
+
+    def _apply_delta(self, delta):
+        food = set(self.universe["food"])
+        food.difference_update(tuple(pos) for pos in delta["food_removed"])
+        food.update(tuple(pos) for pos in delta["food_added"])
+
+        teams = list(self.universe["teams"])
+        for team in delta["teams"]:
+            teams[team["index"]] = team
+        bots = list(self.universe["bots"])
+        for bot in delta["bots"]:
+            bots[bot["index"]] = bot
+
+        self.universe = dict(self.universe, food=food, teams=teams, bots=bots)
+
+        game_state = dict(self.game_state)
+        game_state.update(delta["game_state"])
+        for key in delta["game_state_removed"]:
+            del game_state[key]
+        self.game_state = game_state
+
+class DumpReplay:
+    """ Random access to the steps of a dump.
+
+    The dump is read lazily. While reading, an index with the file offset,
+    the last keyframe and the round of every step is built. Going to a step
+    which has already been indexed only decodes the records since the
+    nearest keyframe or checkpoint; stepping forward decodes a single record.
+
+    Parameters
+    ----------
+    stream : binary stream
+        a seekable stream with the dump (see `open_dump`)
+    checkpoint_interval : int, optional, default: 50
+        the number of steps between two decoded states which are kept in
+        memory to speed up going backwards
+
+    Attributes
+    ----------
+    initial : dict
+        the set_initial message of the dump (None until the first step
+        has been read)
+    """
+    def __init__(self, stream, checkpoint_interval=50, chunk_size=65536):
+        self.stream = stream
+        self.checkpoint_interval = checkpoint_interval
+        self.chunk_size = chunk_size
+        self.initial = None
+
+        # (offset, length, keyframe step, round index) for every step
+        self._steps = []
+        # round index -> first step of the round
+        self._rounds = {}
+        self._exhausted = False
+        self._keyframe = None
+        self._round_index = None
+
+        self._decoder = DumpDecoder()
+        self._decoded_step = None
+        self._checkpoints = {}
+        # the record which has just been indexed, to avoid parsing it twice
+        self._last_record = None
+
+        self.stream.seek(0)
+        head = b""
+        while b"\n" not in head and b"\x04" not in head:
+            chunk = self.stream.read(chunk_size)
+            if not chunk:
+                break
+            head += chunk
+        self._versioned = _is_versioned_dump(head.decode("utf-8", "replace"))
+        if self._versioned:
+            header = head.split(b"\n", 1)[0]
+            _check_header(header.decode("utf-8"))
+            self._scan_offset = len(header) + 1
+        else:
+            self._scan_offset = 0
+
+    def _read_record(self, offset, length):
+        self.stream.seek(offset)
+        return self._parse(self.stream.read(length))
+
+    def _parse(self, raw):
+        record = json.loads(raw.decode("utf-8"))
+        if not self._versioned:
+            # old dumps hold a complete message in each record
+            return dict(record["__data__"], __action__=record["__action__"])
+        return record
+
+    def _scan(self):
+        # Returns the offset and the raw bytes of the next record.
+        self.stream.seek(self._scan_offset)
+        if self._versioned:
+            raw = self.stream.readline()
+            offset = self._scan_offset
+            self._scan_offset += len(raw)
+            return offset, raw
+
+        raw = b""
+        start = 0
+        while True:
+            end = raw.find(b"\x04", start)
+            if end >= 0:
+                break
+            start = len(raw)
+            chunk = self.stream.read(self.chunk_size)
+            if not chunk:
+                end = len(raw)
+                break
+            raw += chunk
+        offset = self._scan_offset
+        self._scan_offset += end + 1
+        return offset, raw[:end]
+
+    def _index_next(self):
+        """ Index the next step. Returns False at the end of the dump. """
+        while not self._exhausted:
+            offset, raw = self._scan()
+            if not raw:
+                self._exhausted = True
+                break
+            if not raw.strip():
+                continue
+
+            record = self._parse(raw)
+            if record["__action__"] == "set_initial":
+                self.initial = self._decoder.decode(record)
+                continue
+
+            step = len(self._steps)
+            if "delta" in record:
+                game_state = record["delta"]["game_state"]
+            else:
+                self._keyframe = step
+                game_state = record["game_state"]
+            if self._keyframe is None:
+                raise ValueError("Dump has a delta before the first complete state.")
+            self._round_index = game_state.get("round_index", self._round_index)
+            if self._round_index is not None:
+                self._rounds.setdefault(self._round_index, step)
+
+            self._steps.append((offset, len(raw), self._keyframe, self._round_index))
+            self._last_record = (step, record)
+            return True
+        return False
+
+    def _index_until(self, step):
+        while len(self._steps) <= step and self._index_next():
+            pass
+        return 0 <= step < len(self._steps)
+
+    def __len__(self):
+        """ The number of steps. This reads the whole dump. """
+        while self._index_next():
+            pass
+        return len(self._steps)
+
+    def round_of(self, step):
+        """ The round index of the given step. """
+        if not self._index_until(step):
+            raise IndexError("Step %r is not in the dump." % step)
+        return self._steps[step][3]
+
+    def step_of_round(self, round_index):
+        """ The first step of the given round.
+
+        Raises
+        ------
+        IndexError
+            if the round is not in the dump
+        """
+        while round_index not in self._rounds and self._index_next():
+            pass
+        try:
+            return self._rounds[round_index]
+        except KeyError:
+            raise IndexError("Round %r is not in the dump." % round_index)
+
+    def has_step(self, step):
+        """ True, if the dump contains the given step. """
+        return self._index_until(step)
+
+    def message(self, step):
+        """ The complete observe message of the given step.
+
+        Raises
+        ------
+        IndexError
+            if the step is not in the dump
+        """
+        if not self._index_until(step):
+            raise IndexError("Step %r is not in the dump." % step)
+
+        # Find the nearest state from which we can decode forward.
+        keyframe = self._steps[step][2]
+        start = keyframe
+        if self._decoded_step is not None and keyframe <= self._decoded_step <= step:
+            start = self._decoded_step + 1
+        else:
+            checkpoint = step - step % self.checkpoint_interval
+            if checkpoint >= keyframe and checkpoint in self._checkpoints:
+                self._decoder.universe, self._decoder.game_state = self._checkpoints[checkpoint]
+                start = checkpoint + 1
 
+        for current in range(start, step + 1):
+            if self._last_record is not None and self._last_record[0] == current:
+                record = self._last_record[1]
+            else:
+                offset, length, _keyframe, _round_index = self._steps[current]
+                record = self._read_record(offset, length)
+            self._decoder.update(record)
+            if current % self.checkpoint_interval == 0:
+                self._checkpoints[current] = (self._decoder.universe, self._decoder.game_state)
+        self._decoded_step = step
+        return self._decoder.message()
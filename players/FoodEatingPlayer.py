@@ -6,10 +6,12 @@
 class FoodEatingPlayer(AbstractPlayer):
     def set_initial(self):
         self.adjacency = AdjacencyList(self.current_uni.reachable([self.initial_pos]))
+        # all paths are precomputed once per layout
+        self.distances = self.adjacency.distance_table
         self.next_food = None
 
     def goto_pos(self, pos):
-        return self.adjacency.a_star(self.current_pos, pos)[-1]
+        return self.distances.next_step(self.current_pos, pos)
 
     def get_move(self):
         # check, if food is still present
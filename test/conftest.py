@@ -0,0 +1,12 @@
+import os
+from unittest import mock
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def pelita_cache_dir(tmp_path_factory):
+    # keep the cached distance tables out of the user’s cache directory
+    cache_dir = str(tmp_path_factory.mktemp("pelita-cache"))
+    with mock.patch.dict(os.environ, {"PELITA_CACHE_DIR": cache_dir}):
+        yield cache_dir
@@ -0,0 +1,62 @@
+import unittest
+
+from pelita.batch import BatchGame, aggregate, make_games, play_game, run_batch
+from pelita.game_master import MazeDistanceNoiser
+from pelita.player import SimpleTeam, StoppingPlayer
+from players import SmartEatingPlayer
+
+
+def eating_team():
+    return SimpleTeam("eating", SmartEatingPlayer(), SmartEatingPlayer())
+
+def stopping_team():
+    return SimpleTeam("stopping", StoppingPlayer(), StoppingPlayer())
+
+def failing_team():
+    raise ValueError("no team")
+
+LAYOUT_NAME = "layout_normal_without_dead_ends_001"
+
+
+class TestBatch(unittest.TestCase):
+    def test_make_games(self):
+        games = make_games(["a", "b"], [1, 2, 3])
+        self.assertEqual(6, len(games))
+        self.assertEqual(BatchGame((0, 1), "a", 1), games[0])
+        games = make_games(["a"], [1], swap_sides=True)
+        self.assertEqual([BatchGame((0, 1), "a", 1), BatchGame((1, 0), "a", 1)], games)
+
+    def test_play_game_sides(self):
+        factories = [eating_team, stopping_team]
+        result = play_game(factories, BatchGame((0, 1), LAYOUT_NAME, 1), rounds=50)
+        swapped = play_game(factories, BatchGame((1, 0), LAYOUT_NAME, 1), rounds=50)
+        for res in [result, swapped]:
+            self.assertIsNone(res["error"])
+            self.assertEqual(0, res["winner"])
+            self.assertGreater(res["score"][0], 0)
+            self.assertEqual(0, res["score"][1])
+
+        # the same seed plays the same game
+        self.assertEqual(result, play_game(factories, BatchGame((0, 1), LAYOUT_NAME, 1), rounds=50))
+
+    def test_error(self):
+        result = play_game([eating_team, failing_team], BatchGame((0, 1), LAYOUT_NAME, 1))
+        self.assertIn("no team", result["error"])
+        self.assertEqual(1, aggregate([result])["errors"])
+
+    def test_run_batch(self):
+        games = make_games([LAYOUT_NAME], [1, 2], swap_sides=True)
+        factories = [eating_team, stopping_team]
+        for processes in [1, 2]:
+            results, summary = run_batch(factories, games, rounds=30, processes=processes)
+            self.assertEqual(4, len(results))
+            self.assertEqual({"games": 4, "wins": [4, 0], "draws": 0, "errors": 0,
+                              "score": [sum(r["score"][0] for r in results), 0]},
+                             summary)
+
+    def test_maze_distance_noiser(self):
+        factories = [eating_team, stopping_team]
+        game = BatchGame((0, 1), LAYOUT_NAME, 1)
+        result = play_game(factories, game, rounds=30, noiser=MazeDistanceNoiser)
+        self.assertIsNone(result["error"])
+        self.assertEqual(result, play_game(factories, game, rounds=30, noiser=MazeDistanceNoiser))
@@ -1,7 +1,8 @@
+import os
 import unittest
 
 from pelita.datamodel import *
-from pelita.layout import Layout
+from pelita.layout import Layout, LayoutEncodingException
 
 # the legal chars for a basic CTFUniverse
 # see also: CTFUniverse.create factory.
@@ -46,6 +47,16 @@ def test_get_initial_positions(self):
                 '# #####    ##### ##       #      # ###################'))
         self.assertEqual(target, mesh)
 
+    def test_copy_game_state(self):
+        game_state = {"bot_moved": [{"bot_id": 0}], "bot_error": {}, "round_index": 1}
+        copied = copy_game_state(game_state)
+        self.assertEqual(game_state, copied)
+        game_state["bot_moved"].append({"bot_id": 1})
+        game_state["bot_error"][0] = "timeout"
+        self.assertEqual({"bot_moved": [{"bot_id": 0}], "bot_error": {}, "round_index": 1}, copied)
+        # the items are shared
+        self.assertIs(game_state["bot_moved"][0], copied["bot_moved"][0])
+
 
 class TestBot(unittest.TestCase):
 
@@ -178,9 +189,92 @@ def test_eq_repr(self):
         maze = Maze(2, 1, data=[True, False])
         self.assertEqual(maze, eval(repr(maze)))
 
+    def test_legal_moves_table(self):
+        maze = Maze(3, 2, data=[True, False, False] + [False, False, True])
+        moves = [north, south, east, west, stop]
+        table = maze.legal_moves_table(moves)
+        self.assertEqual(set(maze.positions), set(table.keys()))
+        self.assertEqual(((south, (1, 1)), (east, (2, 0)), (stop, (1, 0))), table[(1, 0)])
+        self.assertEqual(((west, (1, 0)), (stop, (2, 0))), table[(2, 0)])
+        self.assertEqual(((south, (0, 1)), (east, (1, 0))), table[(0, 0)])
+        # the table is cached
+        self.assertIs(table, maze.legal_moves_table(moves))
+
+        # changing the maze invalidates the table
+        maze[0, 0] = False
+        table = maze.legal_moves_table(moves)
+        self.assertEqual(((north, (0, 0)), (east, (1, 1)), (stop, (0, 1))), table[(0, 1)])
+        maze._set_data([True] * 6)
+        self.assertEqual((), maze.legal_moves_table(moves)[(0, 1)])
+
+
+class TestFoodSet(unittest.TestCase):
+
+    def test_in_zone(self):
+        food = FoodSet([(1, 1), (2, 1), (5, 2), (6, 3)])
+        left = food.in_zone((0, 3))
+        right = food.in_zone((0, 3), inside=False)
+        self.assertEqual({(1, 1), (2, 1)}, left)
+        self.assertEqual({(5, 2), (6, 3)}, right)
+        self.assertIs(left, food.in_zone((0, 3)))
+
+        # single changes are applied to the zones
+        food.remove((1, 1))
+        food.discard((5, 2))
+        food.add((3, 2))
+        food.add((4, 2))
+        self.assertEqual({(2, 1), (3, 2)}, food.in_zone((0, 3)))
+        self.assertEqual({(4, 2), (6, 3)}, food.in_zone((0, 3), inside=False))
+        popped = food.pop()
+        self.assertNotIn(popped, food.in_zone((0, 3)) | food.in_zone((0, 3), inside=False))
+
+        # copies have their own zones
+        copied = food.copy()
+        self.assertIs(type(copied), FoodSet)
+        copied.remove((6, 3))
+        self.assertIn((6, 3), food.in_zone((0, 3), inside=False))
+
+        # other changes reset them
+        food -= {(6, 3)}
+        food.update([(0, 1), (7, 1)])
+        self.assertEqual({pos for pos in food if pos[0] <= 3}, food.in_zone((0, 3)))
+        self.assertEqual({pos for pos in food if pos[0] > 3}, food.in_zone((0, 3), inside=False))
+        food.clear()
+        self.assertEqual(set(), food.in_zone((0, 3)))
+
 
 class TestCTFUniverse(unittest.TestCase):
 
+    def test_food_bookkeeping(self):
+        test_layout = (
+        """ ##########
+            #0 .1 .  #
+            #. .  ...#
+            ########## """)
+        universe = CTFUniverse.create(test_layout, 2)
+        self.assertEqual([3, 4], [universe.team_food_count(0), universe.team_food_count(1)])
+        self.assertEqual([4, 3], [universe.enemy_food_count(0), universe.enemy_food_count(1)])
+
+        # food is removed when it is eaten
+        universe.move_bot(1, west)
+        self.assertCountEqual([(1, 2), (3, 2)], universe.enemy_food(1))
+        self.assertEqual(2, universe.enemy_food_count(1))
+        self.assertEqual(2, universe.team_food_count(0))
+        self.assertEqual(4, universe.team_food_count(1))
+
+        # snapshots are independent
+        snapshot = universe.snapshot()
+        universe.move_bot(1, south)
+        self.assertEqual(2, snapshot.enemy_food_count(1))
+        self.assertEqual(1, universe.enemy_food_count(1))
+
+        # the food may also be changed or replaced directly
+        universe.food.difference_update([(6, 1)])
+        self.assertCountEqual([(6, 2), (7, 2), (8, 2)], universe.team_food(1))
+        universe.food = {(1, 2)}
+        self.assertEqual([(1, 2)], universe.team_food(0))
+        self.assertEqual(0, universe.enemy_food_count(0))
+
     def test_factory(self):
         test_layout3 = (
         """ ##################
@@ -309,6 +403,37 @@ def test_copy(self):
         universe.food.pop()
         self.assertNotEqual(universe, uni_copy)
         self.assertEqual(universe, universe.copy())
+        self.assertIsNot(universe.maze, universe.copy().maze)
+
+    def test_snapshot(self):
+        test_layout3 = (
+        """ ##################
+            #0#.  .  # .     #
+            #1#####    #####2#
+            #     . #  .  .#3#
+            ################## """)
+        universe = CTFUniverse.create(test_layout3, 4)
+        snapshot = universe.snapshot()
+        self.assertEqual(universe, snapshot)
+        # the walls are shared until they are changed
+        self.assertIsNot(universe.maze, snapshot.maze)
+        self.assertIs(universe.maze._data, snapshot.maze._data)
+        snapshot.maze[1, 3] = True
+        self.assertFalse(universe.maze[1, 3])
+        self.assertIsNot(universe.maze._data, snapshot.maze._data)
+        universe.maze[2, 3] = True
+        self.assertFalse(snapshot.maze[2, 3])
+        snapshot.maze[1, 3] = False
+        universe.maze[2, 3] = False
+
+        universe.move_bot(2, north)
+        universe.teams[0].score += 1
+        universe.food.pop()
+        self.assertEqual((16, 2), snapshot.bots[2].current_pos)
+        self.assertEqual(0, snapshot.teams[0].score)
+        self.assertEqual(6, len(snapshot.food))
+        self.assertNotEqual(universe, snapshot)
+        self.assertEqual(universe, universe.snapshot())
 
     def test_str_compact_str(self):
         test_layout3 = (
@@ -442,6 +567,82 @@ def test_json(self):
         universe2 = CTFUniverse._from_json_dict(universe_json)
         self.assertEqual(universe, universe2)
 
+    def test_bytes(self):
+        test_layout3 = (
+        """ ##################
+            #0#.  .  # .     #
+            #1#####    #####2#
+            #     . #  .  .#3#
+            ################## """)
+        universe = CTFUniverse.create(test_layout3, 4)
+        universe.teams[1].score = 5
+        universe.bots[2].current_pos = (15, 3)
+        universe.bots[2].noisy = True
+
+        maze_cache = {}
+        universe2 = CTFUniverse._from_bytes(universe._to_bytes(), maze_cache=maze_cache)
+        self.assertEqual(universe, universe2)
+        self.assertEqual(universe._to_json_dict(), universe2._to_json_dict())
+
+        # the maze is taken from the cache
+        universe.food.pop()
+        universe3 = CTFUniverse._from_bytes(universe._to_bytes(), maze_cache=maze_cache)
+        self.assertEqual(universe, universe3)
+        self.assertIsNot(universe2.maze, universe3.maze)
+        self.assertIs(universe2.maze._data, universe3.maze._data)
+
+        # changing a decoded maze does not change the next one
+        universe3.maze[1, 3] = True
+        universe4 = CTFUniverse._from_bytes(universe._to_bytes(), maze_cache=maze_cache)
+        self.assertFalse(universe4.maze[1, 3])
+        self.assertEqual(universe.maze, universe4.maze)
+
+    def test_layout_cache(self):
+        test_layout3 = (
+        """ ##################
+            #0#.  .  # .     #
+            #1#####    #####2#
+            #     . #  .  .#3#
+            ################## """)
+        layout_cache = LayoutCache(maxsize=2)
+        CTFUniverse.layout_cache, old_cache = layout_cache, CTFUniverse.layout_cache
+        self.addCleanup(setattr, CTFUniverse, "layout_cache", old_cache)
+
+        universe = CTFUniverse.create(test_layout3, 4)
+        universe2 = CTFUniverse.create(test_layout3, 4)
+        self.assertEqual(1, len(layout_cache))
+        self.assertEqual(universe, universe2)
+        # nothing is shared which may change during a game
+        self.assertIsNot(universe.maze, universe2.maze)
+        universe.food.pop()
+        universe.bots[0].current_pos = (1, 3)
+        self.assertNotEqual(universe.food, universe2.food)
+        self.assertEqual(CTFUniverse.create(test_layout3, 4), universe2)
+        universe.maze[1, 3] = True
+        self.assertFalse(CTFUniverse.create(test_layout3, 4).maze[1, 3])
+
+        # invalid layouts are not cached
+        self.assertRaises(LayoutEncodingException, CTFUniverse.create, "#0#", 4)
+        self.assertEqual(1, len(layout_cache))
+
+        CTFUniverse.layout_cache = None
+        self.assertEqual(CTFUniverse.create(test_layout3, 4), universe2)
+
+    def test_layout_cache_directory(self):
+        import tempfile
+        test_layout3 = (
+        """ ##################
+            #0#.  .  # .     #
+            #1#####    #####2#
+            #     . #  .  .#3#
+            ################## """)
+        with tempfile.TemporaryDirectory() as directory:
+            parsed = LayoutCache(directory=directory).get(test_layout3, 4, CTFUniverse._moves)
+            self.assertEqual(1, len(os.listdir(directory)))
+            parsed2 = LayoutCache(directory=directory).get(test_layout3, 4, CTFUniverse._moves)
+        self.assertEqual(parsed, parsed2)
+        self.assertEqual(parsed.maze.legal_moves_table(CTFUniverse._moves),
+                         parsed2.maze.legal_moves_table(CTFUniverse._moves))
 
     def test_too_many_enemy_teams(self):
         test_layout3 = (
@@ -526,6 +727,12 @@ def test_legal_moves(self):
         target = {west  : (3, 3),
                   stop  : (4, 3)}
         self.assertEqual(target, legal_moves_4_3)
+        # positions outside of the maze may only move into the maze
+        legal_moves_outside = universe.legal_moves((-1, 2))
+        target = {east  : (0, 2)}
+        self.assertEqual({}, legal_moves_outside)
+        universe.maze[0, 2] = False
+        self.assertEqual(target, universe.legal_moves((-1, 2)))
 
     def test_legal_moves_or_stop(self):
         test_legal = (
@@ -796,5 +1003,33 @@ def test_double_kill(self):
         self.assertEqual(universe.teams[0].score, universe.KILLPOINTS)
         self.assertEqual(universe.teams[1].score, 0)
 
+    def test_apply_move(self):
+        test = (
+            """ ########
+                #0 . 1 #
+                #.    3#
+                #2     #
+                ######## """)
+        universe = CTFUniverse.create(test, 4)
+        events = EventBuffer()
+        universe.apply_move(1, west, events)
+        universe.apply_move(1, west, events)
+        universe.apply_move(0, east, events)
+        universe.apply_move(0, east, events)
+        self.assertEqual([BotMoved(1, (5, 1), (4, 1)), BotMoved(1, (4, 1), (3, 1)),
+                          BotMoved(0, (1, 1), (2, 1)), BotMoved(0, (2, 1), (3, 1)),
+                          BotMoved(0, (3, 1), (3, 1))],
+                         events.bot_moved)
+        self.assertEqual([FoodEaten(1, (3, 1))], events.food_eaten)
+        self.assertEqual([BotDestroyed(1, 0)], events.bot_destroyed)
+        self.assertEqual({"bot_id": 1, "destroyed_by": 0}, events.bot_destroyed[0]._to_json_dict())
+        self.assertEqual(["bot_moved", "food_eaten", "bot_destroyed"], list(events.as_dict()))
+        self.assertEqual([universe.KILLPOINTS, 1], [team.score for team in universe.teams])
+
+        # an illegal move leaves the buffer unchanged
+        events.clear()
+        self.assertRaises(IllegalMoveException, universe.apply_move, 2, west, events)
+        self.assertEqual({"bot_moved": [], "food_eaten": [], "bot_destroyed": []}, events.as_dict())
+
 if __name__ == '__main__':
     unittest.main()
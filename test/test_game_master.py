@@ -1,8 +1,8 @@
 import collections
 import unittest
 
-from pelita.datamodel import CTFUniverse
-from pelita.game_master import GameMaster, ManhattanNoiser, PlayerTimeout
+from pelita.datamodel import BotDestroyed, BotMoved, CTFUniverse
+from pelita.game_master import GameMaster, ManhattanNoiser, MazeDistanceNoiser, PlayerTimeout
 from pelita.player import AbstractPlayer, SimpleTeam, StoppingPlayer, TestPlayer
 from pelita.viewer import AbstractViewer
 
@@ -206,6 +206,102 @@ def test_noise_manhattan_failure(self):
         self.assertNotEqual(set(positions[1::2]), set(enemy_positions),
                             "Testing randomized function, may fail sometimes.")
 
+    def test_noise_candidates_manhattan(self):
+        test_layout = (
+        """ ##################
+            # #. 2.  # .     #
+            # #####    #####3#
+            #   0  . # .  .#1#
+            ################## """)
+        universe = CTFUniverse.create(test_layout, 4)
+        noiser = ManhattanNoiser(universe.copy(), seed=3)
+        for pos, _adjacent in universe.free_positions():
+            # all free positions in the box of the noise radius
+            expected = [(i, j) for i in range(pos[0] - 5, pos[0] + 5)
+                               for j in range(pos[1] - 5, pos[1] + 5)
+                        if abs(i - pos[0]) + abs(j - pos[1]) <= 5
+                           and (i, j) in universe.maze and not universe.maze[i, j]]
+            self.assertEqual(expected, list(noiser.noise_candidates(universe, pos)))
+
+        # the table is kept with the maze and shared by its copies
+        copied_universe = universe.copy()
+        self.assertIs(noiser.noise_candidates(universe, (4, 3)),
+                      noiser.noise_candidates(copied_universe, (4, 3)))
+
+        # both noisers take the universe; a position within the maze
+        # distance is always within the Manhattan distance
+        maze_noiser = MazeDistanceNoiser(universe.copy(), seed=3)
+        for pos, _adjacent in universe.free_positions():
+            for i, j in maze_noiser.noise_candidates(universe, pos):
+                self.assertLessEqual(abs(i - pos[0]) + abs(j - pos[1]), 5)
+                self.assertFalse(universe.maze[i, j])
+
+        # the same seed gives the same noise
+        noiser2 = ManhattanNoiser(universe.copy(), seed=3)
+        for i in range(20):
+            noisy = noiser.uniform_noise(universe, 1)
+            noisy2 = noiser2.uniform_noise(universe, 1)
+            self.assertEqual(noisy.bot_positions, noisy2.bot_positions)
+
+    def test_noisy_universe(self):
+        test_layout = (
+        """ ##################
+            # #. 2.  # .     #
+            # #####    ##### #
+            #   0 3. # .  .#1#
+            ################## """)
+        universe = CTFUniverse.create(test_layout, 4)
+        exact_bots = [bot.copy() for bot in universe.bots]
+        noiser = ManhattanNoiser(universe.copy(), seed=1)
+        noisy = noiser.uniform_noise(universe, 0)
+
+        # only the enemy out of sight is noisy
+        self.assertEqual([1], list(noisy.noisy_positions))
+        self.assertEqual([False, True, False, False], [bot.noisy for bot in noisy.bots])
+        self.assertEqual(noisy.noisy_positions[1], noisy.bots[1].current_pos)
+        # the universe itself is unchanged
+        self.assertEqual(exact_bots, universe.bots)
+        self.assertIs(universe.food, noisy.food)
+        self.assertIs(universe.teams, noisy.teams)
+
+        # snapshots and serialised universes are plain universes
+        snapshot = noisy.snapshot()
+        self.assertIs(type(snapshot), CTFUniverse)
+        self.assertEqual(noisy.bots, snapshot.bots)
+        self.assertEqual(snapshot, noisy)
+        self.assertEqual(noisy, snapshot)
+        self.assertEqual(snapshot, CTFUniverse._from_json_dict(noisy._to_json_dict()))
+        self.assertEqual(snapshot, CTFUniverse._from_bytes(noisy._to_bytes()))
+        universe.move_bot(0, (1, 0))
+        self.assertEqual(exact_bots[0].current_pos, snapshot.bots[0].current_pos)
+
+    def test_uniform_noise_maze_distance(self):
+        test_layout = (
+        """ ##################
+            # #.  .  # .     #
+            # #####    ##### #
+            #  0  . #  .  .#1#
+            ################## """)
+        universe = CTFUniverse.create(test_layout, 2)
+        noiser = MazeDistanceNoiser(universe.copy(), noise_radius=3, sight_distance=2)
+
+        position_bucket = collections.defaultdict(int)
+        for i in range(200):
+            new = noiser.uniform_noise(universe.copy(), 1)
+            self.assertTrue(new.bots[0].noisy)
+            position_bucket[new.bots[0].current_pos] += 1
+        # only positions within 3 steps of (3, 3), but not (3, 1) or (1, 1)
+        # which are close in Manhattan space but far in maze space
+        expected = [(1, 2), (1, 3), (2, 3), (3, 3), (4, 3),
+                    (5, 3), (6, 3)]
+        self.assertCountEqual(position_bucket, expected, position_bucket)
+
+        # the enemy is seen within the sight distance in maze space
+        universe.bots[1].current_pos = (5, 3)
+        new = noiser.uniform_noise(universe.copy(), 1)
+        self.assertFalse(new.bots[0].noisy)
+        self.assertEqual((3, 3), new.bots[0].current_pos)
+
 class TestAbstracts(unittest.TestCase):
     class BrokenViewer(AbstractViewer):
         pass
@@ -818,3 +914,40 @@ def test_kill_count(self):
         self.assertEqual(gm.game_state["times_killed"], [0, 2])
         gm.play_round()
         self.assertEqual(gm.game_state["times_killed"], [1, 2])
+
+    def test_events(self):
+        test_start = (
+            """ ######
+                #0  1#
+                #....#
+                ###### """)
+        class EventViewer(AbstractViewer):
+            def __init__(self):
+                self.events = []
+            def observe(self, universe, game_state):
+                self.events.append({key: game_state[key] for key in ["bot_moved", "food_eaten", "bot_destroyed"]})
+
+        teams = [
+            SimpleTeam(TestPlayer('>--->')),
+            SimpleTeam(TestPlayer('<<<<<'))
+        ]
+        gm = GameMaster(test_start, teams, 2, game_time=5)
+        viewer = EventViewer()
+        gm.register_viewer(viewer)
+        gm.set_initial()
+        gm.play_step()
+        gm.play_step()
+        gm.play_step()
+        gm.play_step()
+        self.assertEqual([BotMoved(1, (3, 1), (2, 1)), BotMoved(1, (2, 1), (4, 1))], gm.events.bot_moved)
+        self.assertEqual([BotDestroyed(1, 0)], gm.events.bot_destroyed)
+        # the viewers get the events as dicts
+        self.assertEqual([
+            {"bot_moved": [{"bot_id": 0, "old_pos": (1, 1), "new_pos": (2, 1)}], "food_eaten": [], "bot_destroyed": []},
+            {"bot_moved": [{"bot_id": 1, "old_pos": (4, 1), "new_pos": (3, 1)}], "food_eaten": [], "bot_destroyed": []},
+            {"bot_moved": [{"bot_id": 0, "old_pos": (2, 1), "new_pos": (2, 1)}], "food_eaten": [], "bot_destroyed": []},
+            {"bot_moved": [{"bot_id": 1, "old_pos": (3, 1), "new_pos": (2, 1)},
+                           {"bot_id": 1, "old_pos": (2, 1), "new_pos": (4, 1)}],
+             "food_eaten": [], "bot_destroyed": [{"bot_id": 1, "destroyed_by": 0}]}
+        ], viewer.events)
+        self.assertEqual([0, 1], gm.game_state["times_killed"])
@@ -1,8 +1,11 @@
+import os
+import tempfile
 import unittest
+from unittest import mock
 
 from pelita.datamodel import CTFUniverse, east, north, south, stop, west
-from pelita.graph import (AdjacencyList, NoPathException, diff_pos, iter_adjacencies,
-                          manhattan_dist, move_pos)
+from pelita.graph import (AdjacencyList, DistanceTable, NoPathException, diff_pos,
+                          get_distance_table, iter_adjacencies, manhattan_dist, move_pos)
 
 
 class TestStaticmethods(unittest.TestCase):
@@ -196,6 +199,36 @@ def test_a_star(self):
         # just a simple smoke test
         self.assertEqual(14, len(al.a_star((1, 1), (3, 1))))
 
+    def test_a_star_shortest_path(self):
+        test_layout = (
+        """ ##################
+            #0#.  .  # .     #
+            #2#### #   #####1#
+            #     . #  .  .#3#
+            ################## """)
+        universe = CTFUniverse.create(test_layout, 4)
+        al = AdjacencyList(universe.free_positions())
+        for initial in al:
+            for target in al:
+                path = al.a_star(initial, target)
+                self.assertEqual(len(al.bfs(initial, [target])), len(path))
+                for pos, next_pos in zip([initial] + path[::-1], path[::-1]):
+                    self.assertIn(next_pos, al[pos])
+
+    def test_bfs_multiple_targets(self):
+        test_layout = (
+        """ ##################
+            #0#.  .  # .     #
+            #2#####    #####1#
+            #     . #  .  .#3#
+            ################## """)
+        universe = CTFUniverse.create(test_layout, 4)
+        al = AdjacencyList(universe.free_positions())
+        path = al.bfs((1, 1), [(6, 3), (16, 1)])
+        self.assertEqual([(6, 3), (5, 3), (4, 3), (3, 3), (2, 3), (1, 3), (1, 2)], path)
+        # any iterable is accepted
+        self.assertEqual(path, al.bfs((1, 1), {(6, 3), (16, 1)}))
+
     def test_path_to_same_position(self):
         test_layout = (
         """ ##################
@@ -230,3 +263,134 @@ def test_a_star_exceptions(self):
         self.assertRaises(NoPathException, al.a_star, (1, 1), (10, 1))
         self.assertRaises(NoPathException, al.a_star, (0, 1), (10, 1))
         self.assertRaises(NoPathException, al.a_star, (1, 1), (11, 1))
+
+
+class TestDistanceTable(unittest.TestCase):
+    test_layout = (
+        """ ##################
+            #0#.  .  # .     #
+            #2#####    #####1#
+            #     . #  .  .#3#
+            ################## """)
+
+    def test_distances_and_paths(self):
+        universe = CTFUniverse.create(self.test_layout, 4)
+        al = AdjacencyList(universe.free_positions())
+        table = DistanceTable.from_adjacency(al)
+        for initial in al:
+            for target in al:
+                bfs_path = al.bfs(initial, [target])
+                path = table.path(initial, target)
+                self.assertEqual(len(bfs_path), table.distance(initial, target))
+                self.assertEqual(len(bfs_path), len(path))
+                # the path must be connected and end in target
+                for pos, next_pos in zip([initial] + path[::-1], path[::-1]):
+                    self.assertIn(next_pos, al[pos])
+                if path:
+                    self.assertEqual(target, path[0])
+                    self.assertEqual(path[-1], table.next_step(initial, target))
+                else:
+                    self.assertEqual(initial, table.next_step(initial, target))
+
+        self.assertEqual(14, table.distance((1, 1), (3, 1)))
+        self.assertRaises(NoPathException, table.distance, (0, 0), (1, 1))
+        self.assertRaises(NoPathException, table.path, (1, 1), (0, 0))
+
+    def test_no_path(self):
+        test_layout = (
+        """ ############
+            #0.     #.1#
+            ############ """)
+        universe = CTFUniverse.create(test_layout, 2)
+        table = DistanceTable.from_adjacency(AdjacencyList(universe.free_positions()))
+        self.assertEqual(1, table.distance((10, 1), (9, 1)))
+        self.assertRaises(NoPathException, table.distance, (1, 1), (10, 1))
+        self.assertRaises(NoPathException, table.next_step, (1, 1), (10, 1))
+        self.assertRaises(NoPathException, table.path, (1, 1), (10, 1))
+
+    def test_save_load(self):
+        universe = CTFUniverse.create(self.test_layout, 4)
+        table = DistanceTable.from_adjacency(AdjacencyList(universe.free_positions()))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "table.bin")
+            table.save(filename)
+            loaded = DistanceTable.load(filename)
+        self.assertEqual(table.positions, loaded.positions)
+        self.assertEqual(table.distances, loaded.distances)
+        self.assertEqual(table.next_hops, loaded.next_hops)
+
+    def test_cache(self):
+        universe = CTFUniverse.create(self.test_layout, 4)
+        al = AdjacencyList(universe.free_positions())
+        with tempfile.TemporaryDirectory() as tmpdir, \
+                mock.patch.dict("pelita.graph._distance_tables", clear=True):
+            table = get_distance_table(al, cache_dir=tmpdir)
+            self.assertIs(table, get_distance_table(al, cache_dir=tmpdir))
+            self.assertEqual(1, len(os.listdir(tmpdir)))
+
+            # the same graph with a different order has the same table
+            reordered = AdjacencyList(reversed([(pos, adj[::-1]) for pos, adj in al.items()]))
+            self.assertIs(table, get_distance_table(reordered, cache_dir=tmpdir))
+
+            # a new process loads the table from disk
+            import pelita.graph
+            pelita.graph._distance_tables.clear()
+            loaded = get_distance_table(al, cache_dir=tmpdir)
+            self.assertIsNot(table, loaded)
+            self.assertEqual(table.distances, loaded.distances)
+
+            with mock.patch.dict(os.environ, {"PELITA_CACHE_DIR": tmpdir}):
+                self.assertIs(loaded, al.distance_table)
+                self.assertIs(loaded, universe.distance_table)
+                self.assertIs(loaded, universe.distance_table)
+
+    def test_cache_limits(self):
+        import pelita.graph
+        universe = CTFUniverse.create(self.test_layout, 4)
+        al = AdjacencyList(universe.free_positions())
+        # the cache directory of the test run, if any
+        cache_dir = os.environ.get("PELITA_CACHE_DIR")
+        def cached_files(directory):
+            if not directory or not os.path.isdir(directory):
+                return set()
+            return {name for name in os.listdir(directory) if name.startswith("distances-")}
+
+        with tempfile.TemporaryDirectory() as tmpdir, \
+                mock.patch.dict("pelita.graph._distance_tables", clear=True), \
+                mock.patch.dict(os.environ, {"PELITA_CACHE_DIR": ""}), \
+                mock.patch("pelita.graph.DISTANCE_TABLE_CACHE_SIZE", 2):
+            # without a cache directory, nothing is written
+            # (a graph which is used nowhere else)
+            unused = AdjacencyList({(0, 0): [(99, 1)], (99, 1): [(0, 0)]})
+            files = cached_files(cache_dir)
+            with mock.patch.object(DistanceTable, "save") as save:
+                get_distance_table(unused)
+            save.assert_not_called()
+            self.assertEqual(files, cached_files(cache_dir))
+
+            # with one, the table is written
+            pelita.graph._distance_tables.clear()
+            get_distance_table(unused, cache_dir=tmpdir)
+            self.assertEqual(1, len(cached_files(tmpdir)))
+            pelita.graph._distance_tables.clear()
+
+            table = get_distance_table(al)
+
+            # only the most recently used tables are kept in memory
+            graphs = [AdjacencyList({(0, 0): [(i, 1)], (i, 1): [(0, 0)]}) for i in range(1, 4)]
+            get_distance_table(graphs[0])
+            self.assertIs(table, get_distance_table(al))
+            get_distance_table(graphs[1])
+            self.assertEqual(2, len(pelita.graph._distance_tables))
+            self.assertIs(table, get_distance_table(al))
+            get_distance_table(graphs[2])
+            get_distance_table(graphs[1])
+            self.assertIsNot(table, get_distance_table(al))
+
+            # the universe only keeps a weak reference to its table
+            table = universe.distance_table
+            self.assertIs(table, universe.distance_table)
+            pelita.graph._distance_tables.clear()
+            del table
+            self.assertIsNone(universe.maze._cache["distance_table"]())
+            self.assertEqual(1, universe.distance_table.distance((1, 1), (1, 2)))
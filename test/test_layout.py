@@ -48,6 +48,58 @@ def test_get_random_layout_returns_correct_layout(self):
         layout2 = get_layout_by_name(name)
         self.assertEqual(layout, layout2)
 
+    def test_get_layout_info(self):
+        info = get_layout_info('layout_normal_with_dead_ends_001')
+        self.assertEqual(info, LayoutInfo('layout_normal_with_dead_ends_001', 'normal', True))
+        info = get_layout_info('layout_small_without_dead_ends_001')
+        self.assertEqual(info.size, 'small')
+        self.assertFalse(info.dead_ends)
+        self.assertRaises(ValueError, get_layout_info, 'no_such_layout')
+        for name in get_available_layouts():
+            self.assertEqual(get_layout_info(name).name, name)
+
+    def test_layout_pack(self):
+        import os, tempfile
+        layouts = [(name, get_layout_by_name(name)) for name in get_available_layouts()[:5]]
+        layouts.append(("täst", "#0 .1#\n"))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "test.pack")
+            write_layout_pack(filename, layouts)
+            self.assertEqual(dict(layouts), read_layout_pack(filename))
+
+            with open(filename, "r+b") as f:
+                f.write(b"NOTAPACK")
+            self.assertRaises(ValueError, read_layout_pack, filename)
+
+    def test_load_layout_pack(self):
+        import os, shutil, tempfile
+        from pelita import layout as layout_module
+        def unload():
+            for pack in layout_module._layout_packs:
+                pack.close()
+            layout_module._layout_packs.clear()
+            layout_module._layout_index.cache_clear()
+            layout_module._layout_names.cache_clear()
+            layout_module._decode_layout.cache_clear()
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        self.addCleanup(unload)
+
+        builtin_names = get_available_layouts()
+        filename = os.path.join(tmpdir, "test.pack")
+        write_layout_pack(filename, [("my_layout", "#0 .1#\n"),
+                                     ("layout_normal_with_dead_ends_001", "#0 .1#\n")])
+        self.assertEqual(["my_layout", "layout_normal_with_dead_ends_001"], load_layout_pack(filename))
+        self.assertEqual("#0 .1#\n", get_layout_by_name("my_layout"))
+        self.assertEqual("#0 .1#\n", get_layout_by_name("layout_normal_with_dead_ends_001"))
+        self.assertEqual(LayoutInfo("my_layout", None, None), get_layout_info("my_layout"))
+        self.assertEqual(sorted(builtin_names + ["my_layout"]), get_available_layouts())
+        self.assertEqual(["my_layout"], get_available_layouts(filter="my_"))
+
+    def test_unknown_layout(self):
+        self.assertRaises(ValueError, get_layout_by_name, 'no_such_layout')
+        self.assertRaises(ValueError, load_layout, layout_name='no_such_layout')
+
 
 class TestLayoutChecks(unittest.TestCase):
     layout_chars = maze_components
@@ -100,6 +152,19 @@ def test_too_many_bots(self):
                 Layout.strip_layout(too_many_bots),
                 TestLayoutChecks.layout_chars, 3)
 
+    def test_error_messages(self):
+        # the first problem in the layout is reported
+        for layout_str, number_bots, message in [
+            ("#c 0#\n#f 0#", 1, "Char: 'c' is not a legal layout character"),
+            ("#0 0#\n#f  #", 1, "Bot-ID: '0' was specified twice"),
+            ("#0  #\n#1 1#", 2, "Bot-ID: '1' was specified twice"),
+            ("#0 1#\n# 3 #", 4, "The following IDs were missing: ['2']"),
+            ("#0 1#\n#3  #", 6, "The following IDs were missing: ['2', '4', '5']"),
+        ]:
+            with self.assertRaises(LayoutEncodingException) as cm:
+                Layout.check_layout(layout_str, TestLayoutChecks.layout_chars, number_bots)
+            self.assertIn(message, str(cm.exception))
+
     def test_wrong_shape(self):
         wrong_shape = (
             """ #######
@@ -189,6 +254,18 @@ def test_as_mesh(self):
         target = Mesh(4, 3, data = list('#####. #####'))
         self.assertEqual(target, mesh)
 
+    def test_parse(self):
+        simple_layout = (
+            """ ######
+                #0. .#
+                #.1 .#
+                ###### """)
+        layout = Layout(simple_layout, TestLayoutChecks.layout_chars, 2)
+        walls, food, bots = layout.parse('#', '.')
+        self.assertEqual(walls, [c == '#' for c in '#######0. .##.1 .#######'])
+        self.assertEqual(food, [(2, 1), (4, 1), (1, 2), (4, 2)])
+        self.assertEqual(bots, [(1, 1), (2, 2)])
+
     def test_mesh_shape(self):
         simple_layout = (
             """ ####
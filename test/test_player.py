@@ -1,6 +1,6 @@
 import unittest
 
-from pelita.datamodel import CTFUniverse, east, stop, west
+from pelita.datamodel import CTFUniverse, east, north, south, stop, west
 from pelita.game_master import GameMaster
 from pelita.player import *
 from players import NQRandomPlayer, RandomPlayer
@@ -144,6 +144,28 @@ def get_move(self):
         gm = GameMaster(test_layout, team, 2, 1)
         gm.play()
 
+    def test_maze_is_not_shared_with_the_game(self):
+        class WallBuildingPlayer(AbstractPlayer):
+            def get_move(self):
+                # try to block the way of the enemy
+                self.current_uni.maze[4, 1] = True
+                return stop
+
+        test_layout = (
+        """ ############
+            #0 #.  .# 1#
+            ############ """)
+        team = [
+            SimpleTeam(WallBuildingPlayer()),
+            SimpleTeam(StoppingPlayer())
+        ]
+        gm = GameMaster(test_layout, team, 2, 2, noise=False)
+        walls = list(gm.universe.maze._data)
+        gm.play()
+        self.assertFalse(gm.universe.maze[4, 1])
+        self.assertEqual(walls, gm.universe.maze._data)
+        self.assertTrue(team[0]._players[0].current_uni.maze[4, 1])
+
     def test_rnd(self):
         outer = self
 
@@ -191,6 +213,65 @@ def get_move(self):
         gm.play()
 
 
+class TestUniverseHistory(unittest.TestCase):
+    test_layout = (
+        """ ##########
+            #0  .. .1#
+            #2 .  ..3#
+            ########## """)
+
+    def test_make_universe_history(self):
+        self.assertEqual([], make_universe_history(None))
+        history = make_universe_history(2)
+        for i in range(5):
+            history.append(i)
+        self.assertEqual([3, 4], list(history))
+        self.assertRaises(ValueError, make_universe_history, 0)
+        self.assertIsInstance(make_universe_history(KeyframeHistory), KeyframeHistory)
+
+    def test_bounded_history(self):
+        class BoundedPlayer(RandomPlayer):
+            universe_history = 1
+
+        bounded = BoundedPlayer()
+        teams = [
+            SimpleTeam(bounded, StoppingPlayer()),
+            SimpleTeam(StoppingPlayer(), StoppingPlayer())
+        ]
+        gm = GameMaster(self.test_layout, teams, 4, 10, noise=False)
+        gm.set_initial()
+        self.assertEqual(None, bounded.previous_pos)
+        for i in range(3):
+            current_pos = bounded.current_pos
+            gm.play_round()
+            self.assertEqual(1, len(bounded.universe_states))
+            self.assertEqual(current_pos, bounded.previous_pos)
+
+    def test_keyframe_history(self):
+        universe = CTFUniverse.create(self.test_layout, 4)
+        states = []
+        history = KeyframeHistory(keyframe_interval=3)
+        moves = [east, east, south, east, north, east, west, stop]
+        for move in moves:
+            universe.move_bot(0, move)
+            universe.bots[1].current_pos = (7, 1)
+            universe.bots[1].noisy = move == east
+            states.append(universe.snapshot())
+            history.append(states[-1])
+
+        self.assertEqual(len(states), len(history))
+        self.assertIs(states[-1], history[-1])
+        for idx in range(-len(states), len(states)):
+            self.assertEqual(states[idx], history[idx])
+        self.assertEqual(states[2:5], history[2:5])
+        self.assertRaises(IndexError, history.__getitem__, len(states))
+        self.assertRaises(ValueError, KeyframeHistory, 0)
+
+        # rebuilt universes may be modified without changing the history
+        history[1].food.clear()
+        self.assertEqual(states[1], history[1])
+
+
 class TestTestPlayer(unittest.TestCase):
     def test_test_players(self):
         test_layout = (
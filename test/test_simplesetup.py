@@ -1,3 +1,6 @@
+import io
+import json
+import threading
 import unittest
 import uuid
 
@@ -5,7 +8,11 @@
 
 import pelita
 from pelita.player import AbstractPlayer, SimpleTeam, TestPlayer
-from pelita.simplesetup import SimpleClient, SimpleServer, bind_socket, extract_port_range
+from pelita.datamodel import CTFUniverse, west
+from pelita.game_master import GameMaster
+from pelita.simplesetup import (DeltaDecoder, DeltaEncoder, RemoteTeamPlayer, ReplayPublisher, SimpleClient, SimpleServer,
+                                bind_socket, extract_port_range)
+from pelita.viewer import DumpingViewer, DumpReplay
 from players import RandomPlayer
 
 
@@ -170,6 +177,120 @@ def get_move(self):
 
         pelita.simplesetup.DEAD_CONNECTION_TIMEOUT = old_timeout
 
+    def test_encoding_negotiation(self):
+        layout = """
+        ##########
+        #        #
+        #0  ..  1#
+        ##########
+        """
+        universe = CTFUniverse.create(layout, 2)
+        game_state = {"timeout_length": 3, "round_index": None}
+        context = zmq.Context()
+        self.addCleanup(context.destroy, linger=0)
+
+        class RecordingTeam:
+            received = []
+            def set_initial(self, team_id, universe, game_state):
+                self.received.append((universe, game_state))
+                return "team"
+            def get_move(self, bot_id, universe, game_state):
+                self.received.append((universe, game_state))
+                return {"move": (0, 0)}
+
+        # a new client agrees on sending deltas
+        address = "ipc:///tmp/pelita-test-encoding-%s" % uuid.uuid4()
+        socket = context.socket(zmq.PAIR)
+        socket.bind(address)
+        team_player = RemoteTeamPlayer(socket)
+        team = RecordingTeam()
+        client = SimpleClient(team, address=address)
+        client_thread = threading.Thread(target=client.run)
+        client_thread.start()
+
+        sent = []
+        self.assertEqual("team", team_player.set_initial(0, universe, dict(game_state, seed=1)))
+        sent.append((universe.copy(), dict(game_state, seed=1)))
+        self.assertEqual("delta", team_player.zmqconnection.encoding)
+
+        for round_index, move in enumerate([(1, 0)] * 4):
+            universe.move_bot(0, move)
+            game_state["round_index"] = round_index
+            universe.bots[1].noisy = not universe.bots[1].noisy
+            self.assertEqual({"move": (0, 0)}, team_player.get_move(0, universe, game_state))
+            sent.append((universe.copy(), dict(game_state)))
+        team_player._exit()
+        client_thread.join()
+
+        self.assertEqual(len(sent), len(team.received))
+        for (sent_universe, sent_game_state), (received_universe, received_game_state) in zip(sent, team.received):
+            self.assertEqual(sent_universe, received_universe)
+            self.assertEqual(sent_game_state, received_game_state)
+        # the food has been eaten on the way
+        self.assertEqual(1, len(team.received[-1][0].food))
+        # the universes have their own mazes, which share the walls
+        self.assertIsNot(team.received[0][0].maze, team.received[-1][0].maze)
+        self.assertIs(team.received[0][0].maze._data, team.received[-1][0].maze._data)
+
+        # an old client ignores the offer and only gets JSON
+        address = "ipc:///tmp/pelita-test-encoding-%s" % uuid.uuid4()
+        socket = context.socket(zmq.PAIR)
+        socket.bind(address)
+        team_player = RemoteTeamPlayer(socket)
+        old_client = context.socket(zmq.PAIR)
+        old_client.connect(address)
+
+        for _ in range(2):
+            team_player.zmqconnection.send("get_move", {"bot_id": 0, "universe": universe,
+                                                        "game_state": game_state})
+            request = json.loads(old_client.recv_unicode())
+            self.assertEqual(universe, CTFUniverse._from_json_dict(request["__data__"]["universe"]))
+            old_client.send_unicode(json.dumps({"__uuid__": request["__uuid__"],
+                                                "__return__": {"move": [0, 0]}}))
+            self.assertEqual({"move": [0, 0]}, team_player.zmqconnection.recv_timeout(3))
+            self.assertEqual("json", team_player.zmqconnection.encoding)
+
+    def test_delta_encoder(self):
+        universe = CTFUniverse.create("""
+            ########
+            #0 .1. #
+            ########
+            """, 2)
+        game_state = {"round_index": 0, "team_time": [0, 0], "bot_talk": ["", ""]}
+        encoder = DeltaEncoder()
+        decoder = DeltaDecoder()
+        self.assertEqual((universe, game_state), encoder.encode(universe, game_state))
+        decoder.decode(universe, dict(game_state))
+
+        # changes in place are found, and only the changed entries are sent
+        universe.move_bot(1, west)
+        game_state["round_index"] = 1
+        game_state["team_time"][1] += 1
+        universe_data, game_state_data = encoder.encode(universe, game_state)
+        self.assertEqual({"changed": {"round_index": 1, "team_time": [0, 1]}, "removed": []},
+                         game_state_data["__delta__"])
+        self.assertEqual([(3, 1)], universe_data["__delta__"]["food_removed"])
+        decoded_universe, decoded_state = decoder.decode(universe_data, game_state_data)
+        self.assertEqual(universe, decoded_universe)
+        self.assertEqual(game_state, decoded_state)
+
+        # the encoder keeps its own copy
+        game_state["team_time"][1] += 1
+        del game_state["bot_talk"]
+        universe_data, game_state_data = encoder.encode(universe, game_state)
+        self.assertEqual({"changed": {"team_time": [0, 2]}, "removed": ["bot_talk"]},
+                         game_state_data["__delta__"])
+
+        # changes which the player makes do not reach the next state
+        decoded_state["team_time"].append(99)
+        decoded_state["round_index"] = 99
+        decoded_universe.maze[2, 1] = True
+        decoded_universe.bots[0].current_pos = (6, 1)
+        next_universe, next_state = decoder.decode(universe_data, game_state_data)
+        self.assertEqual(game_state, next_state)
+        self.assertEqual(universe, next_universe)
+        self.assertFalse(next_universe.maze[2, 1])
+
     def test_extract_port_range(self):
         test_cases = [
             ("tcp://*",                     dict(addr="tcp://*")),
@@ -186,5 +307,74 @@ def test_extract_port_range(self):
             extracted = extract_port_range(test[0])
             self.assertEqual(extracted, test[1])
 
+
+class TestReplayPublisher(unittest.TestCase):
+    class CollectingPublisher:
+        def __init__(self):
+            self.messages = []
+
+        def _send(self, message):
+            self.messages.append(message)
+
+    def make_replay(self):
+        layout = (
+            """ ##########
+                #0  .. .1#
+                #2 .  ..3#
+                ########## """)
+        teams = [
+            SimpleTeam(TestPlayer('>-v>>>'), TestPlayer('<<-<<<')),
+            SimpleTeam(TestPlayer('<^-<<<'), TestPlayer('>>->>>'))
+        ]
+        stream = io.StringIO()
+        gm = GameMaster(layout, teams, 4, 5)
+        gm.register_viewer(DumpingViewer(stream, keyframe_interval=3))
+        gm.play()
+        replay = DumpReplay(io.BytesIO(stream.getvalue().encode("utf-8")))
+        publisher = self.CollectingPublisher()
+        return ReplayPublisher(replay, publisher), publisher
+
+    def position(self, publisher):
+        game_state = publisher.messages[-1]["__data__"]["game_state"]
+        return game_state["round_index"], game_state["bot_id"]
+
+    def test_stepping(self):
+        replay_publisher, publisher = self.make_replay()
+        replay_publisher.set_initial()
+        self.assertEqual("set_initial", publisher.messages[-1]["__action__"])
+
+        replay_publisher.play_step()
+        replay_publisher.play_step()
+        self.assertEqual((0, 1), self.position(publisher))
+        replay_publisher.step_back()
+        self.assertEqual((0, 0), self.position(publisher))
+        replay_publisher.play_round()
+        self.assertEqual((0, 3), self.position(publisher))
+        replay_publisher.play_round()
+        self.assertEqual((1, 3), self.position(publisher))
+        replay_publisher.round_back()
+        self.assertEqual((0, 3), self.position(publisher))
+        replay_publisher.jump_to_round(3)
+        self.assertEqual((3, 0), self.position(publisher))
+        self.assertRaises(IndexError, replay_publisher.jump_to_round, 100)
+
+        # at the beginning nothing happens when going back
+        replay_publisher.jump_to_round(0)
+        num_messages = len(publisher.messages)
+        replay_publisher.step_back()
+        replay_publisher.round_back()
+        self.assertEqual(num_messages, len(publisher.messages))
+
+    def test_play(self):
+        replay_publisher, publisher = self.make_replay()
+        replay_publisher.play()
+        self.assertEqual(1 + len(replay_publisher.replay), len(publisher.messages))
+        self.assertTrue(publisher.messages[-1]["__data__"]["game_state"]["finished"])
+
+        # nothing left to play
+        replay_publisher.play_step()
+        replay_publisher.play_round()
+        self.assertEqual(1 + len(replay_publisher.replay), len(publisher.messages))
+
 if __name__ == '__main__':
     unittest.main()
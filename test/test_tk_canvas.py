@@ -0,0 +1,90 @@
+import unittest
+from unittest import mock
+
+from pelita.datamodel import CTFUniverse
+from pelita.game_master import GameMaster
+from pelita.player import SimpleTeam, TestPlayer
+from pelita.ui.tk_canvas import MeshGraph, UiCanvas
+from pelita.ui.tk_sprites import Food
+
+
+class FakeCanvas(mock.MagicMock):
+    """ Keeps track of the food which has been drawn. """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.food = set()
+
+    def create_oval(self, *args, tag=(), **kwargs):
+        if "food" in tag:
+            self.food.add(tag[1])
+
+    def delete(self, tag):
+        if tag == "food":
+            self.food.clear()
+        self.food.discard(tag)
+
+
+class TestUiCanvas(unittest.TestCase):
+    test_layout = (
+        """ ##########
+            #0 ..  .1#
+            #. .  . .#
+            ########## """)
+
+    def play(self):
+        # bot 1 eats two pellets, then bot 0 gets it
+        teams = [
+            SimpleTeam(TestPlayer('-->>')),
+            SimpleTeam(TestPlayer('<<<<'))
+        ]
+        gm = GameMaster(self.test_layout, teams, 2, 4, noise=False)
+        states = []
+        class Collector:
+            def set_initial(self, universe):
+                pass
+            def observe(self, universe, game_state):
+                states.append((universe.copy(), dict(game_state)))
+        gm.register_viewer(Collector())
+        gm.play()
+        return states
+
+    def make_ui_canvas(self, universe):
+        ui = UiCanvas(master=None)
+        ui.canvas = FakeCanvas()
+        ui.score = mock.MagicMock()
+        ui.draw_status_info = mock.Mock()
+        ui.draw_title = mock.Mock()
+        ui.mesh_graph = MeshGraph(universe.maze.width, universe.maze.height, 200, 60)
+        ui.bot_sprites = {}
+        ui.init_bots(universe)
+        return ui
+
+    def drawn_food(self, universe):
+        return {Food.food_pos_tag(pos) for pos in universe.food}
+
+    def test_step_back(self):
+        states = self.play()
+        first_universe, first_state = states[0]
+        last_universe, last_state = states[-1]
+        self.assertLess(len(last_universe.food), len(first_universe.food))
+        self.assertIsNotNone(last_state["team_wins"])
+
+        ui = self.make_ui_canvas(first_universe)
+        with mock.patch.object(ui, "draw_game_over") as draw_game_over:
+            for universe, game_state in states:
+                ui.update(universe, game_state)
+                self.assertEqual(self.drawn_food(universe), ui.canvas.food)
+            self.assertTrue(draw_game_over.called)
+
+            # going back brings back the food and removes the overlay
+            ui.canvas.delete = mock.Mock(wraps=ui.canvas.delete)
+            draw_game_over.reset_mock()
+            ui.update(first_universe, first_state)
+            self.assertEqual(self.drawn_food(first_universe), ui.canvas.food)
+            ui.canvas.delete.assert_any_call("gameover")
+            self.assertFalse(draw_game_over.called)
+
+            # and forward again
+            ui.update(last_universe, last_state)
+            self.assertEqual(self.drawn_food(last_universe), ui.canvas.food)
+            self.assertTrue(draw_game_over.called)
@@ -0,0 +1,177 @@
+import copy
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from pelita.datamodel import CTFUniverse
+from pelita.game_master import GameMaster
+from pelita.player import SimpleTeam, SpeakingPlayer
+from pelita.viewer import AbstractViewer, DumpingViewer, DumpReplay, open_dump, read_dump
+
+
+class MessageCollector(AbstractViewer):
+    """ Collects the messages which a DumpingViewer should reproduce. """
+    def __init__(self):
+        self.messages = []
+
+    def set_initial(self, universe):
+        self.messages.append({"__action__": "set_initial",
+                              "__data__": {"universe": universe._to_json_dict()}})
+
+    def observe(self, universe, game_state):
+        self.messages.append({"__action__": "observe",
+                              "__data__": {"universe": universe._to_json_dict(),
+                                           "game_state": copy.deepcopy(game_state)}})
+
+def normalized(message):
+    # make the messages comparable: JSON types and sorted food
+    message = json.loads(json.dumps(message))
+    message["__data__"]["universe"]["food"].sort()
+    return message
+
+
+class TestDumpingViewer(unittest.TestCase):
+    test_layout = (
+        """ ##########
+            #0  .. .1#
+            #2 .  ..3#
+            ########## """)
+
+    def play_game(self, viewer=None):
+        teams = [
+            SimpleTeam(SpeakingPlayer(), SpeakingPlayer()),
+            SimpleTeam(SpeakingPlayer(), SpeakingPlayer())
+        ]
+        gm = GameMaster(self.test_layout, teams, 4, 20, seed=20)
+        collector = MessageCollector()
+        if viewer is not None:
+            gm.register_viewer(viewer)
+        gm.register_viewer(collector)
+        gm.play()
+        return collector.messages
+
+    def test_roundtrip(self):
+        for keyframe_interval in [1, 7, 1000]:
+            stream = io.StringIO()
+            expected = self.play_game(DumpingViewer(stream, keyframe_interval=keyframe_interval))
+
+            stream.seek(0)
+            messages = list(read_dump(stream))
+            self.assertEqual(len(expected), len(messages))
+            for exp, msg in zip(expected, messages):
+                self.assertEqual(normalized(exp), normalized(msg))
+                # the universe can be rebuilt
+                CTFUniverse._from_json_dict(msg["__data__"]["universe"])
+
+    def test_events_without_dict_viewers(self):
+        stream = io.StringIO()
+        self.play_game(DumpingViewer(stream))
+
+        # without any viewer which needs them, the game master does not
+        # fill in the event lists, but the dump holds the same events
+        teams = [
+            SimpleTeam(SpeakingPlayer(), SpeakingPlayer()),
+            SimpleTeam(SpeakingPlayer(), SpeakingPlayer())
+        ]
+        gm = GameMaster(self.test_layout, teams, 4, 20, seed=20)
+        only_dump = io.StringIO()
+        gm.register_viewer(DumpingViewer(only_dump))
+        gm.play()
+        self.assertEqual([], gm.game_state["bot_moved"])
+        stream.seek(0)
+        only_dump.seek(0)
+        messages = list(read_dump(stream))
+        only_dump_messages = list(read_dump(only_dump))
+        self.assertEqual(len(messages), len(only_dump_messages))
+        for msg, only_dump_msg in zip(messages[1:], only_dump_messages[1:]):
+            for key in ["bot_moved", "food_eaten", "bot_destroyed"]:
+                self.assertEqual(msg["__data__"]["game_state"][key],
+                                 only_dump_msg["__data__"]["game_state"][key])
+
+    def test_maze_is_written_once(self):
+        stream = io.StringIO()
+        self.play_game(DumpingViewer(stream))
+        stream.seek(0)
+        lines = stream.read().splitlines()
+        self.assertEqual(2, sum(1 for line in lines if '"maze"' in line))
+
+    def test_old_format(self):
+        expected = []
+        stream = io.StringIO()
+        for message in self.play_game():
+            stream.write(json.dumps(message))
+            stream.write("\x04")
+            expected.append(message)
+        stream.seek(0)
+        messages = list(read_dump(stream, chunk_size=100))
+        self.assertEqual([normalized(m) for m in expected],
+                         [normalized(m) for m in messages])
+
+    def test_unknown_version(self):
+        stream = io.StringIO('{"__format__":"pelita-dump","__version__":99}\n')
+        self.assertRaises(ValueError, list, read_dump(stream))
+
+    def test_gzip(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "game.dump.gz")
+            with open_dump(filename, "w") as f:
+                expected = self.play_game(DumpingViewer(f))
+            with open_dump(filename) as f:
+                messages = list(read_dump(f))
+        self.assertEqual([normalized(m) for m in expected],
+                         [normalized(m) for m in messages])
+
+
+class TestDumpReplay(unittest.TestCase):
+    def dump(self, keyframe_interval=1000, old_format=False):
+        collector = MessageCollector()
+        teams = [
+            SimpleTeam(SpeakingPlayer(), SpeakingPlayer()),
+            SimpleTeam(SpeakingPlayer(), SpeakingPlayer())
+        ]
+        gm = GameMaster(TestDumpingViewer.test_layout, teams, 4, 20, seed=20)
+        stream = io.StringIO()
+        if not old_format:
+            gm.register_viewer(DumpingViewer(stream, keyframe_interval=keyframe_interval))
+        gm.register_viewer(collector)
+        gm.play()
+        if old_format:
+            for message in collector.messages:
+                stream.write(json.dumps(message))
+                stream.write("\x04")
+        return io.BytesIO(stream.getvalue().encode("utf-8")), collector.messages
+
+    def test_random_access(self):
+        for keyframe_interval, old_format in [(1000, False), (7, False), (1000, True)]:
+            stream, expected = self.dump(keyframe_interval, old_format)
+            replay = DumpReplay(stream, checkpoint_interval=5)
+            observed = expected[1:]
+
+            self.assertTrue(replay.has_step(0))
+            self.assertEqual(normalized(expected[0]), normalized(replay.initial))
+            # forward, backward and random access all give the same messages
+            steps = list(range(len(observed))) + list(reversed(range(len(observed)))) + [17, 3, 40, 12, 12]
+            for step in steps:
+                self.assertEqual(normalized(observed[step]), normalized(replay.message(step)))
+            self.assertEqual(len(observed), len(replay))
+            self.assertRaises(IndexError, replay.message, len(observed))
+
+    def test_rounds(self):
+        stream, expected = self.dump()
+        observed = expected[1:]
+        replay = DumpReplay(stream)
+        for round_index in range(21):
+            step = replay.step_of_round(round_index)
+            self.assertEqual(round_index, observed[step]["__data__"]["game_state"]["round_index"])
+            self.assertEqual(round_index, replay.round_of(step))
+            if step > 0:
+                self.assertNotEqual(round_index, observed[step - 1]["__data__"]["game_state"]["round_index"])
+        self.assertRaises(IndexError, replay.step_of_round, 100)
+
+    def test_lazy_index(self):
+        stream, expected = self.dump()
+        replay = DumpReplay(stream)
+        replay.message(3)
+        self.assertEqual(4, len(replay._steps))
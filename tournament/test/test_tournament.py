@@ -264,4 +264,34 @@ def mock_print(str="", *args, **kwargs):
             sorted_ranking = komode.sort_ranks(rr_ranking)
 
         winner = tournament.round2(config, sorted_ranking, state)
-        self.assertEqual(winner, 'group1')
\ No newline at end of file
+        self.assertEqual(winner, 'group1')
+
+    def test_parallel_round1(self):
+        stdout = []
+
+        def mock_print(str="", *args, **kwargs):
+            stdout.append(str)
+
+        c = {
+            "location": None,
+            "date": None,
+            "bonusmatch": None,
+            "teams": [
+                {"id": "group0", "spec": "StoppingPlayer", "members": []},
+                {"id": "group1", "spec": "SmartEatingPlayer", "members": []},
+                {"id": "group2", "spec": "StoppingPlayer", "members": []},
+            ],
+            "filter": "small",
+            "parallel": 3,
+        }
+        config = tournament.Config(c)
+        config.print = mock_print
+        config.viewer = 'null'
+        config.state = None
+        config.tournament_log_folder = None
+
+        state = tournament.State(config)
+        rr_ranking = tournament.round1(config, state)
+        self.assertEqual(state.round1["unplayed"], [])
+        self.assertEqual(len(state.round1["played"]), 3)
+        self.assertEqual(rr_ranking[0], "group1")
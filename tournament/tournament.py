@@ -177,6 +177,9 @@ def escape(str):
     parser.add_argument('--rounds', '-r',
                         help='maximum number of rounds to play per match',
                         type=int)
+    parser.add_argument('--parallel', '-j',
+                        help='number of matches in the first round to play at the same time',
+                        type=int)
     parser.add_argument('--viewer', '-v',
                         type=str, help='the pelita viewer to use (default: tk)')
     parser.add_argument('--config', help='tournament data',
@@ -220,6 +223,7 @@ def escape(str):
         config_data['statefile'] = ARGS.state
         config_data['speak'] = libpelita.firstNN(ARGS.speak, config_data.get('speak'))
         config_data['speaker'] = ARGS.speaker or config_data.get('speaker')
+        config_data['parallel'] = ARGS.parallel or config_data.get('parallel')
 
         config = Config(config_data)
 
@@ -2,16 +2,19 @@
 # -*- coding:utf-8 -*-
 
 import builtins
+import concurrent.futures
 import io
 import json
 import os
 import random
 import re
 import shlex
+import shutil
 import subprocess
 import sys
 import tempfile
 import time
+import uuid
 
 import yaml
 import zmq
@@ -59,6 +62,9 @@ def __init__(self, config):
         self.rounds = config.get("rounds")
         self.filter = config.get("filter")
 
+        #: Number of matches of the first round which are played at the same time.
+        self.parallel = config.get("parallel") or 1
+
         self.viewer = config.get("viewer")
         self.interactive = config.get("interactive")
         self.statefile = config.get("statefile")
@@ -229,93 +235,113 @@ def set_name(team):
         raise
 
 
-def run_match(config, teams):
+def run_match(config, teams, seed=None):
+    """ Runs a match in a pelitagame subprocess and returns the final
+    game state together with the output of the process.
+
+    Each call uses its own reply socket, so that several matches may run
+    at the same time (in different threads). If no `seed` is given, it is
+    drawn from the global random number generator.
+    """
     team1, team2 = teams
+    if seed is None:
+        seed = random.randint(0, sys.maxsize)
 
+    match_id = "{pid}-{uuid}".format(pid=os.getpid(), uuid=uuid.uuid4().hex[:8])
+
+    # zmq does not remove the ipc file of the socket,
+    # so it is put into a directory of its own
+    reply_dir = tempfile.mkdtemp(prefix="pelita-tournament-")
     ctx = zmq.Context()
-    reply_addr = "ipc://tournament-reply#{pid}".format(pid=os.getpid())
     reply_sock = ctx.socket(zmq.PAIR)
-    reply_sock.bind(reply_addr)
-
-    rounds = ['--rounds', str(config.rounds)] if config.rounds else []
-    filter = ['--filter', config.filter] if config.filter else []
-    viewer = ['--' + config.viewer] if config.viewer else []
-    if config.tournament_log_folder:
-        dumpfile = os.path.join(config.tournament_log_folder, "dump-{time}".format(time=time.strftime('%Y%m%d-%H%M%S')))
-        dump = ['--dump', dumpfile]
-    else:
-        dump = []
-
-    cmd = [libpelita.get_python_process()] + ["./pelitagame"] + [config.team_spec(team1), config.team_spec(team2),
-                              '--reply-to', reply_addr,
-                              '--seed', str(random.randint(0, sys.maxsize)),
-                              *dump,
-                              *filter,
-                              *rounds,
-                              *viewer]
-
-    _logger.debug("Executing: {}".format(libpelita.shlex_unsplit(cmd)))
-
-    # We use the environment variable PYTHONUNBUFFERED here to retrieve stdout without buffering
-    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                            universal_newlines=True, env=dict(os.environ, PYTHONUNBUFFERED='x'))
-
-
-    #if ARGS.dry_run:
-    #    print("Would run: {cmd}".format(cmd=cmd))
-    #    print("Choosing winner at random.")
-    #    return random.choice([0, 1, 2])
-
-
-    poll = zmq.Poller()
-    poll.register(reply_sock, zmq.POLLIN)
-    poll.register(proc.stdout.fileno(), zmq.POLLIN)
-    poll.register(proc.stderr.fileno(), zmq.POLLIN)
-
-    with io.StringIO() as stdout_buf, io.StringIO() as stderr_buf:
-        final_game_state = None
-
-        while True:
-            evts = dict(poll.poll(1000))
-
-            if not evts and proc.poll() is not None:
-                # no more events and proc has finished.
-                # we give up
-                break
-
-            stdout_ready = (not proc.stdout.closed) and evts.get(proc.stdout.fileno(), False)
-            if stdout_ready:
-                line = proc.stdout.readline()
-                if line:
-                    print(line, end='', file=stdout_buf)
-                else:
-                    poll.unregister(proc.stdout.fileno())
-                    proc.stdout.close()
-            stderr_ready = (not proc.stderr.closed) and evts.get(proc.stderr.fileno(), False)
-            if stderr_ready:
-                line = proc.stderr.readline()
-                if line:
-                    print(line, end='', file=stderr_buf)
-                else:
-                    poll.unregister(proc.stderr.fileno())
-                    proc.stderr.close()
-            socket_ready = evts.get(reply_sock, False)
-            if socket_ready:
-                try:
-                    pelita_status = json.loads(reply_sock.recv_string())
-                    game_state = pelita_status['__data__']['game_state']
-                    finished = game_state.get("finished", None)
-                    team_wins = game_state.get("team_wins", None)
-                    game_draw = game_state.get("game_draw", None)
-                    if finished:
-                        final_game_state = game_state
-                        break
-                except json.JSONDecodeError:
-                    pass
-                except KeyError:
-                    pass
-
-        return (final_game_state, stdout_buf.getvalue(), stderr_buf.getvalue())
+    try:
+        reply_addr = "ipc://{path}".format(path=os.path.join(reply_dir, "reply"))
+        reply_sock.bind(reply_addr)
+
+        rounds = ['--rounds', str(config.rounds)] if config.rounds else []
+        filter = ['--filter', config.filter] if config.filter else []
+        viewer = ['--' + config.viewer] if config.viewer else []
+        if config.tournament_log_folder:
+            dumpfile = os.path.join(config.tournament_log_folder, "dump-{time}-{match_id}".format(time=time.strftime('%Y%m%d-%H%M%S'),
+                                                                                                   match_id=match_id))
+            dump = ['--dump', dumpfile]
+        else:
+            dump = []
+
+        cmd = [libpelita.get_python_process()] + ["./pelitagame"] + [config.team_spec(team1), config.team_spec(team2),
+                                  '--reply-to', reply_addr,
+                                  '--seed', str(seed),
+                                  *dump,
+                                  *filter,
+                                  *rounds,
+                                  *viewer]
+
+        _logger.debug("Executing: {}".format(libpelita.shlex_unsplit(cmd)))
+
+        # We use the environment variable PYTHONUNBUFFERED here to retrieve stdout without buffering
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                universal_newlines=True, env=dict(os.environ, PYTHONUNBUFFERED='x'))
+
+
+        #if ARGS.dry_run:
+        #    print("Would run: {cmd}".format(cmd=cmd))
+        #    print("Choosing winner at random.")
+        #    return random.choice([0, 1, 2])
+
+
+        poll = zmq.Poller()
+        poll.register(reply_sock, zmq.POLLIN)
+        poll.register(proc.stdout.fileno(), zmq.POLLIN)
+        poll.register(proc.stderr.fileno(), zmq.POLLIN)
+
+        with io.StringIO() as stdout_buf, io.StringIO() as stderr_buf:
+            final_game_state = None
+
+            while True:
+                evts = dict(poll.poll(1000))
+
+                if not evts and proc.poll() is not None:
+                    # no more events and proc has finished.
+                    # we give up
+                    break
+
+                stdout_ready = (not proc.stdout.closed) and evts.get(proc.stdout.fileno(), False)
+                if stdout_ready:
+                    line = proc.stdout.readline()
+                    if line:
+                        print(line, end='', file=stdout_buf)
+                    else:
+                        poll.unregister(proc.stdout.fileno())
+                        proc.stdout.close()
+                stderr_ready = (not proc.stderr.closed) and evts.get(proc.stderr.fileno(), False)
+                if stderr_ready:
+                    line = proc.stderr.readline()
+                    if line:
+                        print(line, end='', file=stderr_buf)
+                    else:
+                        poll.unregister(proc.stderr.fileno())
+                        proc.stderr.close()
+                socket_ready = evts.get(reply_sock, False)
+                if socket_ready:
+                    try:
+                        pelita_status = json.loads(reply_sock.recv_string())
+                        game_state = pelita_status['__data__']['game_state']
+                        finished = game_state.get("finished", None)
+                        team_wins = game_state.get("team_wins", None)
+                        game_draw = game_state.get("game_draw", None)
+                        if finished:
+                            final_game_state = game_state
+                            break
+                    except json.JSONDecodeError:
+                        pass
+                    except KeyError:
+                        pass
+
+            return (final_game_state, stdout_buf.getvalue(), stderr_buf.getvalue())
+    finally:
+        reply_sock.close(linger=0)
+        ctx.term()
+        shutil.rmtree(reply_dir, ignore_errors=True)
 
 
 def start_match(config, teams):
@@ -331,6 +357,14 @@ def start_match(config, teams):
     config.wait_for_keypress()
 
     (final_state, stdout, stderr) = run_match(config, teams)
+    return match_result(config, teams, final_state, stdout, stderr)
+
+
+def match_result(config, teams, final_state, stdout, stderr):
+    """Print the outcome of a match. Return the team that won, False if
+    there was a draw and None if the outcome could not be found.
+    """
+    team1, team2 = teams
     try:
         game_draw = final_state['game_draw']
         team_wins = final_state['team_wins']
@@ -462,6 +496,10 @@ def round1(config, state):
     if not rr_unplayed:
         pp_round1_results(config, rr_played, rr_unplayed)
 
+    if config.parallel > 1 and rr_unplayed:
+        round1_parallel(config, state)
+
+    # Matches which failed in parallel are re-played (or decided) here.
     while rr_unplayed:
         match = rr_unplayed.pop()
 
@@ -479,6 +517,51 @@ def round1(config, state):
     return [team_id for team_id, p in round1_ranking(config, rr_played)]
 
 
+def round1_parallel(config, state):
+    """Play the unplayed matches of the first round, `config.parallel` at a time.
+
+    A match stays in the list of unplayed matches until its result is
+    recorded in the state, which is saved after every match. Matches
+    without a proper result are left in the list of unplayed matches.
+    """
+    rr_unplayed = state.round1["unplayed"]
+    rr_played = state.round1["played"]
+
+    config.print("Playing {n} matches, {parallel} at a time.".format(n=len(rr_unplayed),
+                                                                    parallel=config.parallel))
+    config.wait_for_keypress()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=config.parallel) as executor:
+        futures = {}
+        # Same order as in the sequential round. The seeds are drawn here,
+        # so that they do not depend on the order in which the matches finish.
+        for match in reversed(rr_unplayed):
+            seed = random.randint(0, sys.maxsize)
+            futures[executor.submit(run_match, config, match, seed)] = match
+
+        for future in concurrent.futures.as_completed(futures):
+            match = futures[future]
+            team1, team2 = match
+            config.print()
+            config.print('Finished match: ' + config.team_name(team1) + ' vs ' + config.team_name(team2))
+            try:
+                (final_state, stdout, stderr) = future.result()
+            except Exception as e:
+                config.print("*** ERROR: Could not run the match: {}".format(e))
+                continue
+
+            winner = match_result(config, match, final_state, stdout, stderr)
+            if winner is None:
+                continue
+
+            rr_unplayed.remove(match)
+            rr_played.append({ "match": match, "winner": winner })
+
+            pp_round1_results(config, rr_played, rr_unplayed, highlight=match)
+
+            state.save(config.statefile)
+
+
 def recur_match_winner(match):
     """ Returns the team id of the unambiguous winner.
 